@@ -18,7 +18,7 @@ from numba.core import types, errors
 
 # Re-export typeof
 from numba.misc.special import (
-    typeof, prange, pndindex, gdb, gdb_breakpoint, gdb_init,
+    typeof, prange, pndindex, reduction, gdb, gdb_breakpoint, gdb_init,
     literally, literal_unroll
 )
 
@@ -42,6 +42,9 @@ from numba.np.ufunc import (vectorize, guvectorize, threading_layer,
 # Re-export Numpy helpers
 from numba.np.numpy_support import carray, farray, from_dtype
 
+# Re-export the atomic operations on array elements
+from numba.np import atomic
+
 # Re-export experimental
 from numba import experimental
 
@@ -144,6 +147,7 @@ else:
 
 
 __all__ = """
+    atomic
     cfunc
     from_dtype
     guvectorize
@@ -155,6 +159,7 @@ __all__ = """
     jitclass
     typeof
     prange
+    reduction
     gdb
     gdb_breakpoint
     gdb_init
@@ -611,3 +611,154 @@ def find_literally_calls(func_ir, argtypes):
         if not isinstance(argtypes[pos], types.Literal):
             loc = first_loc[pos]
             raise errors.ForceLiteralArg(marked_args, loc=loc)
+
+
+#
+# Analysis related to reference counting
+#
+
+# NumPy functions that always return a newly allocated array
+_fresh_array_functions = frozenset([
+    'empty', 'zeros', 'ones', 'full', 'empty_like', 'zeros_like',
+    'ones_like', 'full_like', 'arange', 'linspace', 'identity', 'eye',
+    'copy', 'array',
+])
+
+# Array methods that always return a newly allocated array
+_fresh_array_methods = frozenset(['array.copy', 'array.astype'])
+
+
+def find_thread_local_refct_vars(func_ir, typemap, datamodel_manager):
+    """
+    Find the variables holding NRT managed objects that can only ever be
+    referenced from the thread executing the function. Their reference
+    counts can be updated without atomic operations.
+
+    A variable qualifies if every object it may refer to is allocated in
+    this function, and no object of its alias class escapes the function.
+    Objects escape by being returned, yielded, raised, captured in a
+    closure, passed to an external function or to object mode, or by being
+    used by a statement this analysis does not understand (e.g. a parfor,
+    whose body runs on other threads). The analysis is conservative:
+    variables whose values may be related are merged in one alias class,
+    and an alias class that is reachable from an argument, a global or an
+    unknown source is never considered local.
+
+    Returns a set of variable names.
+    """
+    import numpy as np
+
+    if func_ir.generator_info is not None:
+        # the variables live in the generator state across yields
+        return set()
+
+    def holds_ref(name):
+        ty = typemap.get(name)
+        if ty is None:
+            return False
+        return datamodel_manager.lookup(ty).contains_nrt_meminfo()
+
+    # union-find over variable names
+    parent = {}
+
+    def find(name):
+        parent.setdefault(name, name)
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    def union(*names):
+        roots = [find(n) for n in names]
+        for r in roots[1:]:
+            parent[r] = roots[0]
+
+    fresh = set()
+    tainted = set()
+    escaped = set()
+
+    def is_fresh_call(expr):
+        fnty = typemap.get(expr.func.name)
+        if isinstance(fnty, types.Function):
+            key = fnty.typing_key
+            if isinstance(key, np.ufunc):
+                # no explicit output argument
+                return not expr.kws and len(expr.args) == key.nin
+            return (getattr(np, getattr(key, '__name__', ''), None) is key
+                    and key.__name__ in _fresh_array_functions)
+        if isinstance(fnty, types.BoundFunction):
+            return fnty.typing_key in _fresh_array_methods
+        return False
+
+    def is_known_callee(fnty):
+        if isinstance(fnty, (types.ExternalFunction, types.ObjModeDispatcher,
+                             types.ExternalFunctionPointer)):
+            return False
+        return isinstance(fnty, (types.Function, types.BoundFunction,
+                                 types.Dispatcher, types.NumberClass))
+
+    def refs(names):
+        return [n for n in names if holds_ref(n)]
+
+    for blk in func_ir.blocks.values():
+        for stmt in blk.body:
+            if isinstance(stmt, ir.Assign):
+                lhs = stmt.target.name
+                value = stmt.value
+                is_ref = holds_ref(lhs)
+                if is_ref:
+                    find(lhs)
+                if isinstance(value, ir.Var):
+                    if is_ref:
+                        union(lhs, value.name)
+                elif isinstance(value, ir.Expr):
+                    operands = refs(v.name for v in value.list_vars())
+                    if ((value.op == 'call' and
+                            not is_known_callee(typemap.get(value.func.name)))
+                            or value.op == 'make_function'):
+                        escaped.update(operands)
+                        tainted.add(lhs)
+                    elif value.op == 'arrayexpr':
+                        fresh.add(lhs)
+                    elif value.op in ('binop', 'unary') and is_ref:
+                        opnds = [typemap[v.name] for v in value.list_vars()]
+                        if (isinstance(typemap[lhs], types.Array) and
+                                all(isinstance(t, (types.Array, types.Number))
+                                    for t in opnds)):
+                            fresh.add(lhs)
+                        else:
+                            union(lhs, *operands)
+                    elif value.op == 'call' and is_fresh_call(value):
+                        fresh.add(lhs)
+                    elif value.op in ('build_list', 'build_set', 'build_map'):
+                        fresh.add(lhs)
+                        union(lhs, *operands)
+                    elif is_ref:
+                        if operands:
+                            union(lhs, *operands)
+                        else:
+                            tainted.add(lhs)
+                    elif value.op == 'call' and operands:
+                        # the callee may store an argument into another
+                        union(*operands)
+                elif isinstance(value, ir.Yield):
+                    escaped.update(refs([value.value.name]))
+                    tainted.add(lhs)
+                elif is_ref:
+                    # ir.Arg, ir.Const, ir.Global, ir.FreeVar
+                    tainted.add(lhs)
+            elif isinstance(stmt, (ir.SetItem, ir.StaticSetItem, ir.SetAttr)):
+                operands = refs(v.name for v in stmt.list_vars())
+                if operands:
+                    union(*operands)
+            elif isinstance(stmt, (ir.Del, ir.Jump, ir.Branch, ir.Print,
+                                   ir.StaticRaise)):
+                pass
+            else:
+                # ir.Return, ir.Raise and anything unknown
+                escaped.update(refs(v.name for v in stmt.list_vars()))
+
+    bad_roots = set(find(n) for n in tainted | escaped)
+    fresh_roots = set(find(n) for n in fresh)
+    return set(n for n in list(parent)
+               if holds_ref(n) and find(n) in fresh_roots - bad_roots)
@@ -282,7 +282,8 @@ class BaseContext(object):
                                    iterators, numbers, rangeobj)
         from numba.core import optional
         from numba.misc import gdb_hook, literal
-        from numba.np import linalg, polynomial, arraymath
+        from numba.np import linalg, polynomial, arraymath, fft, ufuncmethods
+        from numba.np.random import generator_methods
 
         try:
             from numba.np import npdatetime
@@ -19,6 +19,11 @@ def box_bool(typ, val, c):
     longval = c.builder.zext(val, c.pyapi.long)
     return c.pyapi.bool_from_long(longval)
 
+@box(types.BooleanLiteral)
+def box_literal_boolean(typ, val, c):
+    val = c.context.cast(c.builder, val, typ, typ.literal_type)
+    return c.box(typ.literal_type, val)
+
 @unbox(types.Boolean)
 def unbox_boolean(typ, obj, c):
     istrue = c.pyapi.object_istrue(obj)
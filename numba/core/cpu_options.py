@@ -14,6 +14,9 @@ class FastMathOptions(object):
             'fast',
             'nnan', 'ninf', 'nsz', 'arcp',
             'contract', 'afn', 'reassoc',
+            # Not a LLVM flag: only allows array reductions (e.g. np.sum)
+            # to reassociate floating point operations.
+            'reassoc_reductions',
         }
 
         if value is True:
@@ -34,8 +37,19 @@ class FastMathOptions(object):
             msg = "Expected fastmath option(s) to be either a bool, dict or set"
             raise ValueError(msg)
 
+        self.reassoc_reductions = 'reassoc_reductions' in self.flags
+        self.flags = self.flags - {'reassoc_reductions'}
+
+    @property
+    def reductions_can_reassociate(self):
+        """
+        Whether array reductions may reassociate floating point operations.
+        """
+        return bool(self.reassoc_reductions or
+                    self.flags & {'fast', 'reassoc'})
+
     def __bool__(self):
-        return bool(self.flags)
+        return bool(self.flags) or self.reassoc_reductions
 
     __nonzero__ = __bool__
 
@@ -55,6 +69,7 @@ class ParallelOptions(object):
             self.stencil = value
             self.fusion = value
             self.prange = value
+            self.collapse = value
         elif isinstance(value, dict):
             self.enabled = True
             self.comprehension = value.pop('comprehension', True)
@@ -64,6 +79,7 @@ class ParallelOptions(object):
             self.stencil = value.pop('stencil', True)
             self.fusion = value.pop('fusion', True)
             self.prange = value.pop('prange', True)
+            self.collapse = value.pop('collapse', True)
             self.gen_spirv = value.pop('offload', False)
             if value:
                 msg = "Unrecognized parallel options: %s" % value.keys()
@@ -39,6 +39,8 @@ def rewrite_module(mod, options):
     Rewrite the given LLVM module to use fastmath everywhere.
     """
     flags = options.flags
+    if not flags:
+        return
     FastFloatBinOpVisitor(flags).visit(mod)
     FastFloatCallVisitor(flags).visit(mod)
 
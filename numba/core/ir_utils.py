@@ -1260,8 +1260,8 @@ def simplify_CFG(blocks):
 
 
 arr_math = ['min', 'max', 'sum', 'prod', 'mean', 'var', 'std',
-            'cumsum', 'cumprod', 'argmin', 'argmax', 'argsort',
-            'nonzero', 'ravel']
+            'cumsum', 'cumprod', 'argmin', 'argmax', 'nonzero', 'ravel',
+            'any', 'all']
 
 
 def canonicalize_array_math(func_ir, typemap, calltypes, typingctx):
@@ -1317,6 +1317,57 @@ def canonicalize_array_math(func_ir, typemap, calltypes, typingctx):
     return
 
 
+def _is_blas_product(atyp, btyp):
+    return (atyp.dtype == btyp.dtype and
+            isinstance(atyp.dtype, (types.Float, types.Complex)))
+
+
+def canonicalize_matmul(func_ir, typemap, calltypes, typingctx):
+    """
+    Replace the products of stacks of matrices, or of matrices of dtypes
+    not handled by BLAS, with '@' by np.matmul() calls, which are matched
+    like the other Numpy functions.
+    """
+    for block in func_ir.blocks.values():
+        new_body = []
+        for stmt in block.body:
+            if (isinstance(stmt, ir.Assign) and
+                    isinstance(stmt.value, ir.Expr) and
+                    stmt.value.op == 'binop' and
+                    stmt.value.fn == operator.matmul):
+                rhs = stmt.value
+                argtyps = [typemap[rhs.lhs.name], typemap[rhs.rhs.name]]
+                if (all(isinstance(t, types.npytypes.Array) for t in argtyps)
+                        and (max(t.ndim for t in argtyps) > 2 or
+                             not _is_blas_product(*argtyps))):
+                    scope = stmt.target.scope
+                    loc = stmt.loc
+                    # g_np_var = Global(numpy)
+                    g_np_var = ir.Var(scope, mk_unique_var("$np_g_var"), loc)
+                    typemap[g_np_var.name] = types.misc.Module(numpy)
+                    g_np = ir.Global('np', numpy, loc)
+                    new_body.append(ir.Assign(g_np, g_np_var, loc))
+                    func_ir._definitions[g_np_var.name] = [g_np]
+                    # func_var = getattr(g_np_var, 'matmul')
+                    func_var = ir.Var(scope, mk_unique_var("$matmul_attr"),
+                                      loc)
+                    func_typ = get_np_ufunc_typ(numpy.matmul)
+                    typemap[func_var.name] = func_typ
+                    attr = ir.Expr.getattr(g_np_var, 'matmul', loc)
+                    new_body.append(ir.Assign(attr, func_var, loc))
+                    func_ir._definitions[func_var.name] = [attr]
+                    # lhs = func_var(a, b)
+                    call = ir.Expr.call(func_var, [rhs.lhs, rhs.rhs], (), loc)
+                    calltypes.pop(rhs)
+                    calltypes[call] = func_typ.get_call_type(typingctx,
+                                                             argtyps, {})
+                    defs = func_ir._definitions[stmt.target.name]
+                    defs[:] = [call if d is rhs else d for d in defs]
+                    stmt.value = call
+            new_body.append(stmt)
+        block.body = new_body
+
+
 # format: {type:function}
 array_accesses_extensions = {}
 
@@ -8,6 +8,7 @@ from llvmlite.llvmpy.core import Constant, Type, Builder
 from numba import _dynfunc
 from numba.core import (typing, utils, types, ir, debuginfo, funcdesc,
                         generators, config, ir_utils, cgutils, removerefctpass)
+from numba.core.analysis import find_thread_local_refct_vars
 from numba.core.errors import (LoweringError, new_error_context, TypingError,
                                LiteralTypingError, UnsupportedError)
 from numba.core.funcdesc import default_mangler
@@ -328,6 +329,20 @@ class Lower(BaseLower):
         from numba.parfors import parfor
         lower_extensions[parfor.Parfor] = _lower_parfor_parallel
 
+    def pre_lower(self):
+        super(Lower, self).pre_lower()
+        # Variables whose objects never leave the current thread use
+        # non-atomic reference counting
+        if self.context.enable_nrt:
+            self._thread_local_vars = find_thread_local_refct_vars(
+                self.func_ir, self.fndesc.typemap,
+                self.context.data_model_manager)
+        else:
+            self._thread_local_vars = set()
+
+    def _is_thread_local(self, name):
+        return name in getattr(self, '_thread_local_vars', ())
+
     def pre_block(self, block):
         from numba.core.unsafe import eh
 
@@ -558,7 +573,8 @@ class Lower(BaseLower):
             val = self.loadvar(value.name)
             oty = self.typeof(value.name)
             res = self.context.cast(self.builder, val, oty, ty)
-            self.incref(ty, res)
+            self.incref(ty, res,
+                        local=self._is_thread_local(inst.target.name))
             return res
 
         elif isinstance(value, ir.Arg):
@@ -1314,7 +1330,7 @@ class Lower(BaseLower):
 
         # Clean up existing value stored in the variable
         old = self.loadvar(name)
-        self.decref(fetype, old)
+        self.decref(fetype, old, local=self._is_thread_local(name))
 
         # Store variable
         ptr = self.getvar(name)
@@ -1339,7 +1355,8 @@ class Lower(BaseLower):
         self._alloca_var(name, fetype)
 
         ptr = self.getvar(name)
-        self.decref(fetype, self.builder.load(ptr))
+        self.decref(fetype, self.builder.load(ptr),
+                    local=self._is_thread_local(name))
         # Zero-fill variable to avoid double frees on subsequent dels
         self.builder.store(Constant.null(ptr.type.pointee), ptr)
 
@@ -1361,17 +1378,17 @@ class Lower(BaseLower):
                                          loc=self.loc)
         return aptr
 
-    def incref(self, typ, val):
+    def incref(self, typ, val, local=False):
         if not self.context.enable_nrt:
             return
 
-        self.context.nrt.incref(self.builder, typ, val)
+        self.context.nrt.incref(self.builder, typ, val, local=local)
 
-    def decref(self, typ, val):
+    def decref(self, typ, val, local=False):
         if not self.context.enable_nrt:
             return
 
-        self.context.nrt.decref(self.builder, typ, val)
+        self.context.nrt.decref(self.builder, typ, val, local=local)
 
 
 def _lit_or_omitted(value):
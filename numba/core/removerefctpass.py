@@ -10,7 +10,8 @@ from numba.core import types
 
 class _MarkNrtCallVisitor(CallVisitor):
     """
-    A pass to mark all NRT_incref and NRT_decref.
+    A pass to mark all NRT_incref and NRT_decref (and their thread-local
+    variants).
     """
     def __init__(self):
         self.marked = set()
@@ -31,7 +32,8 @@ def _rewrite_function(function):
                 bb.instructions.remove(inst)
 
 
-_accepted_nrtfns = 'NRT_incref', 'NRT_decref'
+_accepted_nrtfns = ('NRT_incref', 'NRT_decref', 'NRT_incref_local',
+                    'NRT_decref_local')
 
 
 def _legalize(module, dmm, fndesc):
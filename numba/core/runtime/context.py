@@ -211,17 +211,23 @@ class NRTContext(object):
             fn.args[0].add_attribute("nocapture")
             builder.call(fn, [mi])
 
-    def incref(self, builder, typ, value):
+    def incref(self, builder, typ, value, local=False):
         """
         Recursively incref the given *value* and its members.
+        If *local* is true, the value must only ever be referenced from the
+        current thread and a non-atomic increment is used.
         """
-        self._call_incref_decref(builder, typ, value, "NRT_incref")
+        funcname = "NRT_incref_local" if local else "NRT_incref"
+        self._call_incref_decref(builder, typ, value, funcname)
 
-    def decref(self, builder, typ, value):
+    def decref(self, builder, typ, value, local=False):
         """
         Recursively decref the given *value* and its members.
+        If *local* is true, the value must only ever be referenced from the
+        current thread and a non-atomic decrement is used.
         """
-        self._call_incref_decref(builder, typ, value, "NRT_decref")
+        funcname = "NRT_decref_local" if local else "NRT_decref"
+        self._call_incref_decref(builder, typ, value, funcname)
 
     def get_nrt_api(self, builder):
         """Calls NRT_get_api(), which returns the NRT API function table.
@@ -40,12 +40,12 @@ def _define_nrt_meminfo_data(module):
     builder.ret(data_ptr)
 
 
-def _define_nrt_incref(module, atomic_incr):
+def _define_nrt_incref(module, atomic_incr, name="NRT_incref"):
     """
-    Implement NRT_incref in the module
+    Implement NRT_incref (or the variant called *name*) in the module
     """
     fn_incref = module.get_or_insert_function(incref_decref_ty,
-                                              name="NRT_incref")
+                                              name=name)
     # Cannot inline this for refcount pruning to work
     fn_incref.attributes.add('noinline')
     builder = ir.IRBuilder(fn_incref.append_basic_block())
@@ -61,16 +61,18 @@ def _define_nrt_incref(module, atomic_incr):
     builder.ret_void()
 
 
-def _define_nrt_decref(module, atomic_decr):
+def _define_nrt_decref(module, atomic_decr, name="NRT_decref", fences=True):
     """
-    Implement NRT_decref in the module
+    Implement NRT_decref (or the variant called *name*) in the module.
+    Memory fences are only needed if other threads may hold references.
     """
     fn_decref = module.get_or_insert_function(incref_decref_ty,
-                                              name="NRT_decref")
+                                              name=name)
     # Cannot inline this for refcount pruning to work
     fn_decref.attributes.add('noinline')
-    calldtor = module.add_function(ir.FunctionType(ir.VoidType(), [_pointer_type]),
-                                   name="NRT_MemInfo_call_dtor")
+    calldtor = module.get_or_insert_function(
+        ir.FunctionType(ir.VoidType(), [_pointer_type]),
+        name="NRT_MemInfo_call_dtor")
 
     builder = ir.IRBuilder(fn_decref.append_basic_block())
     [ptr] = fn_decref.args
@@ -86,7 +88,8 @@ def _define_nrt_decref(module, atomic_decr):
 
     # A release fence is used before the relevant write operation.
     # No-op on x86.  On POWER, it lowers to lwsync.
-    builder.fence("release")
+    if fences:
+        builder.fence("release")
     newrefct = builder.call(atomic_decr,
                             [builder.bitcast(ptr, atomic_decr.args[0].type)])
 
@@ -95,7 +98,8 @@ def _define_nrt_decref(module, atomic_decr):
     with cgutils.if_unlikely(builder, refct_eq_0):
         # An acquire fence is used after the relevant read operation.
         # No-op on x86.  On POWER, it lowers to lwsync.
-        builder.fence("acquire")
+        if fences:
+            builder.fence("acquire")
         builder.call(calldtor, [ptr])
     builder.ret_void()
 
@@ -132,6 +136,27 @@ def _define_atomic_inc_dec(module, op, ordering):
     return fn_atomic
 
 
+def _define_nonatomic_inc_dec(module, op):
+    """Define a llvm function for non-atomic increment/decrement to the given
+    module.  Argument ``op`` is the operation "add"/"sub".  The generated
+    function returns the new value.  This is only correct for memory that no
+    other thread may access concurrently.
+    """
+    ftype = ir.FunctionType(_word_type, [_word_type.as_pointer()])
+    fn = ir.Function(module, ftype, name="nrt_nonatomic_{0}".format(op))
+
+    [ptr] = fn.args
+    bb = fn.append_basic_block()
+    builder = ir.IRBuilder(bb)
+    ONE = ir.Constant(_word_type, 1)
+    oldval = builder.load(ptr)
+    newval = getattr(builder, op)(oldval, ONE)
+    builder.store(newval, ptr)
+    builder.ret(newval)
+
+    return fn
+
+
 def _define_atomic_cas(module, ordering):
     """Define a llvm function for atomic compare-and-swap.
     The generated function is a direct wrapper of the LLVM cmpxchg with the
@@ -194,6 +219,13 @@ def create_nrt_module(ctx):
     _define_nrt_incref(ir_mod, atomic_inc)
     _define_nrt_decref(ir_mod, atomic_dec)
 
+    # Variants for objects only ever referenced from a single thread
+    nonatomic_inc = _define_nonatomic_inc_dec(ir_mod, "add")
+    nonatomic_dec = _define_nonatomic_inc_dec(ir_mod, "sub")
+    _define_nrt_incref(ir_mod, nonatomic_inc, name="NRT_incref_local")
+    _define_nrt_decref(ir_mod, nonatomic_dec, name="NRT_decref_local",
+                       fences=False)
+
     _define_nrt_unresolved_abort(ctx, ir_mod)
 
     return ir_mod, library
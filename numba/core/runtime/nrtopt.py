@@ -6,8 +6,10 @@ from collections import defaultdict, deque
 from llvmlite import binding as ll
 from numba.core import cgutils
 
-_regex_incref = re.compile(r'\s*(?:tail)?\s*call void @NRT_incref\((.*)\)')
-_regex_decref = re.compile(r'\s*(?:tail)?\s*call void @NRT_decref\((.*)\)')
+_regex_incref = re.compile(
+    r'\s*(?:tail)?\s*call void @NRT_incref(?:_local)?\((.*)\)')
+_regex_decref = re.compile(
+    r'\s*(?:tail)?\s*call void @NRT_decref(?:_local)?\((.*)\)')
 _regex_bb = re.compile(
     r'|'.join([
         # unamed BB is just a plain number
@@ -20,30 +22,101 @@ _regex_bb = re.compile(
         r'^;\s*<label>',
     ])
 )
+_regex_label_def = re.compile(
+    r'^(?:("[^"]+"|[-a-zA-Z$._0-9]+):|;\s*<label>:([0-9]+))')
+_regex_label_use = re.compile(r'label %("[^"]+"|[-a-zA-Z$._0-9]+)')
+_regex_call = re.compile(r'(?:^|\s)(?:call|invoke)\s')
+_regex_safe_call = re.compile(
+    r'.*@(?:llvm\.[-a-zA-Z$._0-9]+|NRT_incref(?:_local)?)\(')
+_regex_bad_terminator = re.compile(r'^\s*(?:indirectbr|callbr|invoke)\s')
+
+
+class RefPruneStats(object):
+    """
+    Counts of the reference count operations removed by the NRT pruning
+    passes in this module.
+    """
+
+    def __init__(self, basicblock=0, diamond=0):
+        self.basicblock = basicblock
+        self.diamond = diamond
+
+    @property
+    def total(self):
+        return self.basicblock + self.diamond
+
+    def __repr__(self):
+        return "RefPruneStats(basicblock=%d, diamond=%d)" % (
+            self.basicblock, self.diamond)
+
+
+_refprune_stats = RefPruneStats()
+
+
+def get_refprune_stats():
+    """
+    Return a snapshot of the number of refct operations removed so far by
+    `remove_redundant_nrt_refct`, as a `RefPruneStats` instance.
+    """
+    return RefPruneStats(_refprune_stats.basicblock, _refprune_stats.diamond)
+
+
+def reset_refprune_stats():
+    """
+    Reset the counters returned by `get_refprune_stats`.
+    """
+    _refprune_stats.basicblock = 0
+    _refprune_stats.diamond = 0
+
+
+def _extract_functions(module):
+    cur = []
+    for line in str(module).splitlines():
+        if line.startswith('define'):
+            # start of function
+            assert not cur
+            cur.append(line)
+        elif line.startswith('}'):
+            # end of function
+            assert cur
+            cur.append(line)
+            yield True, cur
+            cur = []
+        elif cur:
+            cur.append(line)
+        else:
+            yield False, [line]
+
+
+def _extract_basic_blocks(func_lines):
+    assert func_lines[0].startswith('define')
+    assert func_lines[-1].startswith('}')
+    yield False, [func_lines[0]]
+
+    cur = []
+    for ln in func_lines[1:-1]:
+        m = _regex_bb.match(ln)
+        if m is not None:
+            # line is a basic block separator
+            yield True, cur
+            cur = []
+            yield False, [ln]
+        elif ln:
+            cur.append(ln)
+
+    yield True, cur
+    yield False, [func_lines[-1]]
+
+
+def _count_refct_ops(lines):
+    return sum(1 for ln in lines
+               if _regex_incref.match(ln) or _regex_decref.match(ln))
 
 
 def _remove_redundant_nrt_refct(llvmir):
     # Note: As soon as we have better utility in analyzing materialized LLVM
     #       module in llvmlite, we can redo this without so much string
     #       processing.
-    def _extract_functions(module):
-        cur = []
-        for line in str(module).splitlines():
-            if line.startswith('define'):
-                # start of function
-                assert not cur
-                cur.append(line)
-            elif line.startswith('}'):
-                # end of function
-                assert cur
-                cur.append(line)
-                yield True, cur
-                cur = []
-            elif cur:
-                cur.append(line)
-            else:
-                yield False, [line]
-
     def _process_function(func_lines):
         out = []
         for is_bb, bb_lines in _extract_basic_blocks(func_lines):
@@ -52,25 +125,6 @@ def _remove_redundant_nrt_refct(llvmir):
             out += bb_lines
         return out
 
-    def _extract_basic_blocks(func_lines):
-        assert func_lines[0].startswith('define')
-        assert func_lines[-1].startswith('}')
-        yield False, [func_lines[0]]
-
-        cur = []
-        for ln in func_lines[1:-1]:
-            m = _regex_bb.match(ln)
-            if m is not None:
-                # line is a basic block separator
-                yield True, cur
-                cur = []
-                yield False, [ln]
-            elif ln:
-                cur.append(ln)
-
-        yield True, cur
-        yield False, [func_lines[-1]]
-
     def _process_basic_block(bb_lines):
         bb_lines = _move_and_group_decref_after_all_increfs(bb_lines)
         bb_lines = _prune_redundant_refct_ops(bb_lines)
@@ -156,6 +210,207 @@ def _remove_redundant_nrt_refct(llvmir):
     return '\n'.join(processed)
 
 
+def _prune_refct_across_blocks(llvmir):
+    """
+    Remove NRT_incref/NRT_decref pairs on the same value that live in
+    different basic blocks of a function. A pair (incref in block A, decref
+    in block B) is removed only when:
+
+    - A dominates B and B post-dominates A;
+    - A and B execute in lockstep, i.e. A cannot be re-entered without going
+      through B, and B cannot be re-entered without going through A;
+    - no code that may decref runs between the two operations. Any
+      NRT_decref and any call to a function that is not an LLVM intrinsic
+      is considered to possibly decref an alias of the value.
+
+    This is meant to run after `_remove_redundant_nrt_refct`, which handles
+    the pairs within a single block. Returns a 2-tuple of the new IR text
+    and the number of refct operations removed.
+    """
+    removed = 0
+    processed = []
+    for is_func, lines in _extract_functions(llvmir):
+        if is_func:
+            lines, ct = _prune_function_across_blocks(lines)
+            removed += ct
+        processed += lines
+    return '\n'.join(processed), removed
+
+
+def _is_unsafe_between(ln):
+    """
+    Is the instruction *ln* able to decref a value it does not own?
+    """
+    if _regex_decref.match(ln) is not None:
+        return True
+    if _regex_call.search(ln) is not None:
+        return _regex_safe_call.match(ln) is None
+    return False
+
+
+def _prune_function_across_blocks(func_lines):
+    # Split the function into [label, header lines, body lines] entries
+    blocks = []
+    header = []
+    for is_bb, lines in _extract_basic_blocks(func_lines):
+        if not is_bb:
+            header = lines
+            continue
+        if lines is not None and header:
+            if not blocks:
+                # the entry block cannot be the target of a branch
+                label = None
+            else:
+                m = _regex_label_def.match(header[0])
+                if m is None:
+                    # unknown label format, don't touch this function
+                    return func_lines, 0
+                label = m.group(1) or m.group(2)
+            blocks.append([label, header, lines])
+            header = []
+    trailer = header
+
+    index = {}
+    for i, (label, _, _) in enumerate(blocks):
+        if label is not None:
+            index[label] = i
+    succs = []
+    for label, _, body in blocks:
+        targets = set()
+        for ln in body:
+            if _regex_bad_terminator.match(ln) is not None:
+                return func_lines, 0
+            for target in _regex_label_use.findall(ln):
+                if target not in index:
+                    return func_lines, 0
+                targets.add(index[target])
+        succs.append(targets)
+    exits = set(i for i, s in enumerate(succs) if not s)
+    if len(blocks) < 2:
+        return func_lines, 0
+    # With an explicit entry label the first block is an empty placeholder
+    entry = 0 if blocks[0][2] else 1
+    preds = [set() for _ in blocks]
+    for bi, targets in enumerate(succs):
+        for target in targets:
+            preds[target].add(bi)
+
+    def reachable(starts, avoid, edges=succs):
+        seen = set()
+        stack = [s for s in starts if s != avoid]
+        while stack:
+            node = stack.pop()
+            if node not in seen:
+                seen.add(node)
+                stack.extend(s for s in edges[node]
+                             if s != avoid and s not in seen)
+        return seen
+
+    def refct_ops(kind_regex):
+        ops = defaultdict(list)
+        for bi, (_, _, body) in enumerate(blocks):
+            for li, ln in enumerate(body):
+                m = kind_regex.match(ln)
+                if m is not None and m.group(1) != 'i8* null':
+                    ops[m.group(1)].append((bi, li))
+        return ops
+
+    def dominators(roots, edges_in, edges_out):
+        # Iterative data-flow: a block is dominated by itself and by the
+        # blocks dominating all its predecessors.  Blocks that are not
+        # reached from the roots are only dominated by themselves.
+        nodes = set(range(len(blocks)))
+        fixed = set(roots) | (nodes - reachable(roots, None, edges_out))
+        dom = [set([b]) if b in fixed else set(nodes)
+               for b in range(len(blocks))]
+        changed = True
+        while changed:
+            changed = False
+            for b in nodes - fixed:
+                new = set.intersection(*[dom[p] for p in edges_in[b]])
+                new.add(b)
+                if new != dom[b]:
+                    dom[b] = new
+                    changed = True
+        return dom
+
+    # The dominators, and the post-dominators on the reversed graph, are
+    # computed once for the whole function
+    dom = dominators([entry], preds, succs)
+    pdom = dominators(exits, succs, preds)
+
+    # Positions of the instructions that may decref, per block
+    unsafe = [[li for li, ln in enumerate(body) if _is_unsafe_between(ln)]
+              for _, _, body in blocks]
+
+    regions = {}
+
+    def region(inc_blk, dec_blk):
+        # The blocks run between A and B, or None when A can be re-entered
+        # before B or B before A
+        key = inc_blk, dec_blk
+        if key not in regions:
+            between = reachable(succs[inc_blk], dec_blk)
+            if (inc_blk in between or between & exits or
+                    dec_blk in reachable(succs[dec_blk], inc_blk)):
+                between = None
+            regions[key] = between
+        return regions[key]
+
+    def may_decref(bi, start=0, stop=None):
+        stop = len(blocks[bi][2]) if stop is None else stop
+        return any(start <= li < stop and (bi, li) not in to_remove
+                   for li in unsafe[bi])
+
+    def can_prune(inc_blk, inc_pos, dec_blk, dec_pos):
+        # A dominates B and B post-dominates A
+        if inc_blk not in dom[dec_blk] or dec_blk not in pdom[inc_blk]:
+            return False
+        between = region(inc_blk, dec_blk)
+        if between is None:
+            return False
+        # Nothing that may decref in between
+        return not (may_decref(inc_blk, start=inc_pos + 1) or
+                    may_decref(dec_blk, stop=dec_pos) or
+                    any(may_decref(bi) for bi in between))
+
+    # The operations are marked for removal, so the positions stay valid. A
+    # pair can only be blocked by a decref that a later pair removes, hence
+    # the sweep is repeated while it finds pairs, without redoing the
+    # analyses above.
+    increfs = refct_ops(_regex_incref)
+    decrefs = refct_ops(_regex_decref)
+    to_remove = set()
+    changed = True
+    while changed:
+        changed = False
+        for var, incops in increfs.items():
+            for inc in incops:
+                if inc in to_remove:
+                    continue
+                for dec in decrefs.get(var, ()):
+                    if dec[0] == inc[0] or dec in to_remove:
+                        continue
+                    if can_prune(inc[0], inc[1], dec[0], dec[1]):
+                        to_remove.update((inc, dec))
+                        changed = True
+                        break
+    removed = len(to_remove)
+    for bi, block in enumerate(blocks):
+        block[2] = [ln for li, ln in enumerate(block[2])
+                    if (bi, li) not in to_remove]
+
+    if not removed:
+        return func_lines, 0
+
+    out = []
+    for _, header, body in blocks:
+        out += header
+        out += body
+    out += trailer
+    return out, removed
+
+
 def remove_redundant_nrt_refct(ll_module):
     """
     Remove redundant reference count operations from the
@@ -163,20 +418,35 @@ def remove_redundant_nrt_refct(ll_module):
     line by line to remove the unnecessary nrt refct pairs within each block.
     Decref calls are moved after the last incref call in the block to avoid
     temporarily decref'ing to zero (which can happen due to hidden decref from
-    alias).
+    alias). Pairs spanning several blocks of a function (including the code of
+    inlined callees) are then removed when it is provably safe to do so, see
+    `_prune_refct_across_blocks`.
+
+    The number of removed operations is accumulated and can be queried with
+    `get_refprune_stats`.
 
     Note: non-threadsafe due to usage of global LLVMcontext
     """
     # Early escape if NRT_incref is not used
-    try:
-        ll_module.get_function('NRT_incref')
-    except NameError:
+    for fname in ('NRT_incref', 'NRT_incref_local'):
+        try:
+            ll_module.get_function(fname)
+        except NameError:
+            continue
+        break
+    else:
         return ll_module
 
     # the optimisation pass loses the name of module as it operates on
     # strings, so back it up and reset it on completion
     name = ll_module.name
-    newll = _remove_redundant_nrt_refct(str(ll_module))
+    oldll = str(ll_module)
+    newll = _remove_redundant_nrt_refct(oldll)
+    before = _count_refct_ops(oldll.splitlines())
+    after = _count_refct_ops(newll.splitlines())
+    _refprune_stats.basicblock += before - after
+    newll, removed = _prune_refct_across_blocks(newll)
+    _refprune_stats.diamond += removed
     new_mod = ll.parse_assembly(newll)
     new_mod.name = cgutils.normalize_ir_text(name)
     return new_mod
@@ -557,3 +557,43 @@ class NestedArray(Array):
     @property
     def key(self):
         return self.dtype, self.shape
+
+
+class NumPyRandomBitGeneratorType(Type):
+    """
+    The type of a NumPy random bit generator (e.g. np.random.PCG64).
+    *kind* is the name of the bit generator class.  The generator state is
+    held in a native array shared by all copies of the value and is
+    reflected back to the original Python object, if any.
+    """
+    mutable = True
+    reflected = True
+
+    def __init__(self, kind):
+        self.kind = kind
+        name = "NumPyRandomBitGeneratorType(%s)" % (kind,)
+        super(NumPyRandomBitGeneratorType, self).__init__(name)
+
+    @property
+    def key(self):
+        return self.kind
+
+
+class NumPyRandomGeneratorType(Type):
+    """
+    The type of a np.random.Generator wrapping a bit generator of type
+    *bit_generator*.  Generators passed in from Python have their state
+    reflected back to the original object when the function returns.
+    """
+    mutable = True
+    reflected = True
+
+    def __init__(self, bit_generator):
+        assert isinstance(bit_generator, NumPyRandomBitGeneratorType)
+        self.bit_generator = bit_generator
+        name = "NumPyRandomGeneratorType(%s)" % (bit_generator.kind,)
+        super(NumPyRandomGeneratorType, self).__init__(name)
+
+    @property
+    def key(self):
+        return self.bit_generator
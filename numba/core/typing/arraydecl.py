@@ -404,28 +404,6 @@ class ArrayAttribute(AttributeTemplate):
             retty = ary.copy(ndim=len(args))
             return signature(retty, *args)
 
-    @bound_function("array.sort")
-    def resolve_sort(self, ary, args, kws):
-        assert not args
-        assert not kws
-        if ary.ndim == 1:
-            return signature(types.none)
-
-    @bound_function("array.argsort")
-    def resolve_argsort(self, ary, args, kws):
-        assert not args
-        kwargs = dict(kws)
-        kind = kwargs.pop('kind', types.StringLiteral('quicksort'))
-        if kwargs:
-            msg = "Unsupported keywords: {!r}"
-            raise TypingError(msg.format([k for k in kwargs.keys()]))
-        if ary.ndim == 1:
-            def argsort_stub(kind='quicksort'):
-                pass
-            pysig = utils.pysignature(argsort_stub)
-            sig = signature(types.Array(types.intp, 1, 'C'), kind).replace(pysig=pysig)
-            return sig
-
     @bound_function("array.view")
     def resolve_view(self, ary, args, kws):
         from .npydecl import parse_dtype
@@ -628,75 +606,6 @@ def generic_expand(self, args, kws):
     return signature(_expand_integer(self.this.dtype), recvr=self.this)
 
 
-def sum_expand(self, args, kws):
-    """
-    sum can be called with or without an axis parameter, and with or without
-    a dtype parameter
-    """
-    pysig = None
-    if 'axis' in kws and 'dtype' not in kws:
-        def sum_stub(axis):
-            pass
-        pysig = utils.pysignature(sum_stub)
-        # rewrite args
-        args = list(args) + [kws['axis']]
-    elif 'dtype' in kws and 'axis' not in kws:
-        def sum_stub(dtype):
-            pass
-        pysig = utils.pysignature(sum_stub)
-        # rewrite args
-        args = list(args) + [kws['dtype']]
-    elif 'dtype' in kws and 'axis' in kws:
-        def sum_stub(axis, dtype):
-            pass
-        pysig = utils.pysignature(sum_stub)
-        # rewrite args
-        args = list(args) + [kws['axis'], kws['dtype']]
-
-    args_len = len(args)
-    assert args_len <= 2
-    if args_len == 0:
-        # No axis or dtype parameter so the return type of the summation is a scalar
-        # of the type of the array.
-        out = signature(_expand_integer(self.this.dtype), *args,
-                        recvr=self.this)
-    elif args_len == 1 and 'dtype' not in kws:
-        # There is an axis parameter, either arg or kwarg
-        if self.this.ndim == 1:
-            # 1d reduces to a scalar
-            return_type = self.this.dtype
-        else:
-            # the return type of this summation is  an array of dimension one
-            # less than the input array.
-            return_type = types.Array(dtype=_expand_integer(self.this.dtype),
-                                    ndim=self.this.ndim-1, layout='C')
-        out = signature(return_type, *args, recvr=self.this)
-
-    elif args_len == 1 and 'dtype' in kws:
-        # No axis parameter so the return type of the summation is a scalar
-        # of the dtype parameter.
-        from .npydecl import parse_dtype
-        dtype, = args
-        dtype = parse_dtype(dtype)
-        out = signature(dtype, *args, recvr=self.this)
-
-    elif args_len == 2:
-        # There is an axis and dtype parameter, either arg or kwarg
-        from .npydecl import parse_dtype
-        dtype = parse_dtype(args[1])
-        return_type = dtype
-        if self.this.ndim != 1:
-            # 1d reduces to a scalar, 2d and above reduce dim by 1
-            # the return type of this summation is  an array of dimension one
-            # less than the input array.
-            return_type = types.Array(dtype=return_type,
-                                    ndim=self.this.ndim-1, layout='C')
-        out = signature(return_type, *args, recvr=self.this)
-    else:
-        pass
-    return out.replace(pysig=pysig)
-
-
 def generic_expand_cumulative(self, args, kws):
     assert not args
     assert not kws
@@ -735,13 +644,125 @@ def install_array_method(name, generic):
 
     setattr(ArrayAttribute, "resolve_" + name, array_attribute_attachment)
 
+# Reductions along axes.  The stubs give the arguments accepted in
+# addition to the array, numpy's *out* argument is not supported.
+
+def _sum_stub(axis=None, dtype=None, keepdims=False):
+    pass
+
+def _reduce_stub(axis=None, keepdims=False):
+    pass
+
+def _argreduce_stub(axis=None):
+    pass
+
+
+def reduced_axes_count(ary, axis):
+    """
+    Return the number of axes of the array type *ary* reduced by the
+    *axis* argument type: None (all the axes), an integer or a tuple of
+    integers.
+    """
+    if axis is None or isinstance(axis, (types.NoneType, types.Omitted)):
+        return ary.ndim
+    if ary.ndim == 0:
+        raise TypingError("axis is out of bounds for a 0-d array")
+    if isinstance(axis, types.Integer):
+        return 1
+    if (isinstance(axis, types.BaseTuple) and
+            all(isinstance(ty, types.Integer) for ty in axis)):
+        if len(axis) > ary.ndim:
+            raise TypingError("too many values in 'axis'")
+        return len(axis)
+    raise TypingError("axis must be None, an integer or a tuple of integers, "
+                      "got {}".format(axis))
+
+
+def literal_flag(flag, name):
+    """
+    Return the value of the boolean argument type *flag*, which must be
+    omitted or a constant.  Overloads see omitted arguments as their
+    default value.
+    """
+    if flag is None:
+        return False
+    if isinstance(flag, bool):
+        return flag
+    if isinstance(flag, types.Omitted):
+        return bool(flag.value)
+    if isinstance(flag, types.BooleanLiteral):
+        return flag.literal_value
+    raise TypingError("{} must be a constant boolean, got {}"
+                      .format(name, flag))
+
+
+def reduction_return_type(ary, dtype, axis, keepdims):
+    """
+    Return the type of a reduction of the array type *ary* to elements of
+    type *dtype* along *axis*.  The result is a scalar when all the axes
+    are reduced and *keepdims* is False.
+    """
+    nreduced = reduced_axes_count(ary, axis)
+    if keepdims:
+        return types.Array(dtype, ary.ndim, 'C')
+    if nreduced == ary.ndim:
+        return dtype
+    return types.Array(dtype, ary.ndim - nreduced, 'C')
+
+
+def axis_reduction(generic, stub, real_only=False, tuple_axis=True):
+    """
+    Extend *generic*, the typing of the reduction of a whole array, to the
+    optional arguments of *stub*.  If *real_only* is true, the reduction
+    along axes is only supported for boolean, integer and float arrays.
+    """
+    pysig = utils.pysignature(stub)
+
+    def generic_axis(self, args, kws):
+        if not args and not kws:
+            return generic(self, args, kws)
+        ary = self.this
+        bound = pysig.bind(*args, **kws)
+        if real_only:
+            if not isinstance(ary.dtype, (types.Boolean, types.Integer,
+                                          types.Float)):
+                raise TypingError("reduction along an axis is not supported "
+                                  "for arrays of {}".format(ary.dtype))
+        if not tuple_axis:
+            if isinstance(bound.arguments.get('axis'), types.BaseTuple):
+                raise TypingError("axis must be None or an integer")
+        params = {}
+        for name, param in pysig.parameters.items():
+            params[name] = bound.arguments.get(name,
+                                               types.Omitted(param.default))
+        dtype = generic(self, (), {}).return_type
+        if not isinstance(params.get('dtype'), (types.Omitted, types.NoneType,
+                                               type(None))):
+            from .npydecl import parse_dtype
+            dtype = parse_dtype(params['dtype'])
+            if dtype is None:
+                raise TypingError("dtype must be a data type, got {}"
+                                  .format(params['dtype']))
+        axis = params['axis']
+        keepdims = literal_flag(params.get('keepdims'), 'keepdims')
+        return_type = reduction_return_type(ary, dtype, axis, keepdims)
+        if isinstance(axis, types.BaseTuple) and len(axis):
+            # Heterogeneous tuples of literal axes are made uniform
+            params['axis'] = types.UniTuple(types.intp, len(axis))
+        sig = signature(return_type, *params.values(), recvr=ary)
+        return sig.replace(pysig=pysig)
+
+    return generic_axis
+
+
 # Functions that return the same type as the array
 for fname in ["min", "max"]:
-    install_array_method(fname, generic_homog)
+    install_array_method(fname, axis_reduction(generic_homog, _reduce_stub,
+                                               real_only=True))
 
 # Functions that return a machine-width type, to avoid overflows
-install_array_method("prod", generic_expand)
-install_array_method("sum", sum_expand)
+install_array_method("prod", axis_reduction(generic_expand, _reduce_stub))
+install_array_method("sum", axis_reduction(generic_expand, _sum_stub))
 
 # Functions that return a machine-width type, to avoid overflows
 for fname in ["cumsum", "cumprod"]:
@@ -749,17 +770,22 @@ for fname in ["cumsum", "cumprod"]:
 
 # Functions that require integer arrays get promoted to float64 return
 for fName in ["mean"]:
-    install_array_method(fName, generic_hetero_real)
+    install_array_method(fName, axis_reduction(generic_hetero_real,
+                                               _reduce_stub))
 
 # var and std by definition return in real space and int arrays
 # get promoted to float64 return
 for fName in ["var", "std"]:
-    install_array_method(fName, generic_hetero_always_real)
+    install_array_method(fName, axis_reduction(generic_hetero_always_real,
+                                               _reduce_stub))
 
 
 # Functions that return an index (intp)
-install_array_method("argmin", generic_index)
-install_array_method("argmax", generic_index)
+for fname in ["argmin", "argmax"]:
+    install_array_method(fname, axis_reduction(generic_index,
+                                               _argreduce_stub,
+                                               real_only=True,
+                                               tuple_axis=False))
 
 
 @infer_global(operator.eq)
@@ -1,3 +1,4 @@
+import inspect
 import warnings
 
 import numpy as np
@@ -368,28 +369,9 @@ class Numpy_method_redirection(AbstractTemplate):
     """
 
     def generic(self, args, kws):
-        pysig = None
-        if kws:
-            if self.method_name == 'sum':
-                if 'axis' in kws and 'dtype' not in kws:
-                    def sum_stub(arr, axis):
-                        pass
-                    pysig = utils.pysignature(sum_stub)
-                elif 'dtype' in kws and 'axis' not in kws:
-                    def sum_stub(arr, dtype):
-                        pass
-                    pysig = utils.pysignature(sum_stub)
-                elif 'dtype' in kws and 'axis' in kws:
-                    def sum_stub(arr, axis, dtype):
-                        pass
-                    pysig = utils.pysignature(sum_stub)
-            elif self.method_name == 'argsort':
-                def argsort_stub(arr, kind='quicksort'):
-                    pass
-                pysig = utils.pysignature(argsort_stub)
-            else:
-                fmt = "numba doesn't support kwarg for {}"
-                raise TypingError(fmt.format(self.method_name))
+        if kws and self.method_name not in _reduction_methods:
+            fmt = "numba doesn't support kwarg for {}"
+            raise TypingError(fmt.format(self.method_name))
 
         arr = args[0]
         # This will return a BoundFunction
@@ -397,9 +379,21 @@ class Numpy_method_redirection(AbstractTemplate):
         # Resolve arguments on the bound function
         meth_sig = self.context.resolve_function_type(meth_ty, args[1:], kws)
         if meth_sig is not None:
+            pysig = meth_sig.pysig
+            if pysig is not None:
+                # The array is the first argument of the function
+                arr_param = inspect.Parameter(
+                    'a', inspect.Parameter.POSITIONAL_OR_KEYWORD)
+                params = [arr_param] + list(pysig.parameters.values())
+                pysig = pysig.replace(parameters=params)
             return meth_sig.as_function().replace(pysig=pysig)
 
 
+# The methods taking an axis and other keyword arguments
+_reduction_methods = frozenset(['min', 'max', 'sum', 'prod', 'mean', 'var',
+                                'std', 'argmin', 'argmax'])
+
+
 # Function to glue attributes onto the numpy-esque object
 def _numpy_redirect(fname):
     numpy_function = getattr(np, fname)
@@ -408,8 +402,7 @@ def _numpy_redirect(fname):
     infer_global(numpy_function, types.Function(cls))
 
 for func in ['min', 'max', 'sum', 'prod', 'mean', 'var', 'std',
-             'cumsum', 'cumprod', 'argmin', 'argmax', 'argsort',
-             'nonzero', 'ravel']:
+             'cumsum', 'cumprod', 'argmin', 'argmax', 'nonzero', 'ravel']:
     _numpy_redirect(func)
 
 
@@ -674,17 +667,6 @@ class NdFromBuffer(CallableTemplate):
         return typer
 
 
-@infer_global(np.sort)
-class NdSort(CallableTemplate):
-
-    def generic(self):
-        def typer(a):
-            if isinstance(a, types.Array) and a.ndim == 1:
-                return a
-
-        return typer
-
-
 @infer_global(np.asfortranarray)
 class AsFortranArray(CallableTemplate):
 
@@ -913,18 +895,35 @@ class NdColumnStack(CallableTemplate):
 
 class MatMulTyperMixin(object):
 
+    # Whether N-D arrays are multiplied as stacks of matrices, as
+    # np.matmul() does
+    batched = False
+
     def matmul_typer(self, a, b, out=None):
         """
         Typer function for Numpy matrix multiplication.
         """
         if not isinstance(a, types.Array) or not isinstance(b, types.Array):
             return
-        if not all(x.ndim in (1, 2) for x in (a, b)):
+        batched = self.batched and max(a.ndim, b.ndim) > 2
+        if batched:
+            if min(a.ndim, b.ndim) < 1:
+                raise TypingError("%s not supported on 0-d arrays"
+                                  % (self.func_name, ))
+            if out is not None:
+                raise TypingError("%s does not support an explicit output "
+                                  "for N-D arrays" % (self.func_name, ))
+        elif not all(x.ndim in (1, 2) for x in (a, b)):
             raise TypingError("%s only supported on 1-D and 2-D arrays"
                               % (self.func_name, ))
         # Output dimensionality
         ndims = set([a.ndim, b.ndim])
-        if ndims == set([2]):
+        if batched:
+            # The stacks of matrices are broadcast together, vector
+            # operands are promoted to matrices then their dimension removed
+            out_ndim = (max(a.ndim - 2, b.ndim - 2, 0) + (a.ndim > 1) +
+                        (b.ndim > 1))
+        elif ndims == set([2]):
             # M * M
             out_ndim = 2
         elif ndims == set([1, 2]):
@@ -950,19 +949,30 @@ class MatMulTyperMixin(object):
             msg = ("%s is faster on contiguous arrays, called on %s" %
                    (self.func_name, (a, b)))
             warnings.warn(NumbaPerformanceWarning(msg))
-        if not all(x.dtype == a.dtype for x in all_args):
-            raise TypingError("%s arguments must all have "
-                              "the same dtype" % (self.func_name,))
-        if not isinstance(a.dtype, (types.Float, types.Complex)):
+        if out is not None:
+            # The explicit output form is only provided by BLAS
+            if not all(x.dtype == a.dtype for x in all_args):
+                raise TypingError("%s arguments must all have "
+                                  "the same dtype" % (self.func_name,))
+            if not isinstance(a.dtype, (types.Float, types.Complex)):
+                raise TypingError("%s only supported on "
+                                  "float and complex arrays"
+                                  % (self.func_name,))
+            return out
+
+        # Other products follow Numpy's type promotion, integer and
+        # mixed products not handled by BLAS are computed by Numba
+        if not all(isinstance(x.dtype, (types.Boolean, types.Number))
+                   for x in all_args):
             raise TypingError("%s only supported on "
-                              "float and complex arrays"
+                              "boolean and numeric arrays"
                               % (self.func_name,))
-        if out:
-            return out
-        elif out_ndim > 0:
-            return types.Array(a.dtype, out_ndim, 'C')
+        dtype = from_dtype(np.result_type(*[as_dtype(x.dtype)
+                                            for x in all_args]))
+        if out_ndim > 0:
+            return types.Array(dtype, out_ndim, 'C')
         else:
-            return a.dtype
+            return dtype
 
 
 @infer_global(np.dot)
@@ -1001,10 +1011,23 @@ class VDot(CallableTemplate):
         return typer
 
 
+@infer_global(np.matmul)
+class NpMatMul(MatMulTyperMixin, CallableTemplate):
+    func_name = "np.matmul()"
+    batched = True
+
+    def generic(self):
+        def typer(a, b):
+            return self.matmul_typer(a, b)
+
+        return typer
+
+
 @infer_global(operator.matmul)
 class MatMul(MatMulTyperMixin, AbstractTemplate):
     key = operator.matmul
     func_name = "'@'"
+    batched = True
 
     def generic(self, args, kws):
         assert not kws
@@ -222,6 +222,32 @@ def _typeof_ndarray(val, c):
     return types.Array(dtype, val.ndim, layout, readonly=readonly)
 
 
+# Bit generators whose algorithm is implemented natively, see
+# numba/np/random/generator_core.py
+_supported_bit_generators = ('PCG64', 'Philox')
+
+
+def _typeof_bit_generator(val):
+    kind = type(val).__name__
+    if (kind in _supported_bit_generators and
+            type(val) is getattr(np.random, kind)):
+        return types.NumPyRandomBitGeneratorType(kind)
+
+
+if hasattr(np.random, 'Generator'):
+    @typeof_impl.register(np.random.Generator)
+    def _typeof_numpy_random_generator(val, c):
+        bit_generator = _typeof_bit_generator(val.bit_generator)
+        if bit_generator is not None:
+            return types.NumPyRandomGeneratorType(bit_generator)
+
+
+if hasattr(np.random, 'BitGenerator'):
+    @typeof_impl.register(np.random.BitGenerator)
+    def _typeof_numpy_random_bit_generator(val, c):
+        return _typeof_bit_generator(val)
+
+
 @typeof_impl.register(types.NumberClass)
 def typeof_number_class(val, c):
     return val
@@ -1311,6 +1311,15 @@ def boolean_to_any(context, builder, fromty, toty, val):
     return context.cast(builder, asint, types.int32, toty)
 
 
+@lower_cast(types.BooleanLiteral, types.Boolean)
+def literal_bool_to_boolean(context, builder, fromty, toty, val):
+    return context.get_constant_generic(
+        builder,
+        fromty.literal_type,
+        fromty.literal_value,
+        )
+
+
 @lower_cast(types.IntegerLiteral, types.Boolean)
 def literal_int_to_boolean(context, builder, fromty, toty, val):
     lit = context.get_constant_generic(
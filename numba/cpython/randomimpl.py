@@ -11,13 +11,14 @@ import numpy as np
 
 from llvmlite import ir
 
-from numba.core.extending import overload, register_jitable
+from numba.core.extending import intrinsic, overload, register_jitable
 from numba.core.imputils import (Registry, impl_ret_untracked,
                                     impl_ret_new_ref)
 from numba.core.typing import signature
 from numba import _helperlib
 from numba.core import types, utils, cgutils
 from numba.np import arrayobj
+from numba.np.numpy_support import carray
 
 POST_PY38 = utils.PYVERSION >= (3, 8)
 
@@ -1245,6 +1246,200 @@ def permutation_impl(x):
     return permutation_impl
 
 
+# ------------------------------------------------------------------------
+# Bulk generation for array-producing variants.
+#
+# Sized draws of the simplest distributions take the raw words directly
+# from the Numpy state, a whole block at a time, and convert them in
+# separate branch-free loops.  The values drawn are the same as with
+# repeated scalar calls.
+
+@intrinsic
+def _np_state_words(typingctx):
+    """
+    Get a pointer to the Mersenne Twister words of the Numpy state.
+    """
+    def codegen(context, builder, sig, args):
+        state_ptr = get_np_state_ptr(context, builder)
+        array_ptr = get_array_ptr(builder, state_ptr)
+        return builder.bitcast(array_ptr, int32_t.as_pointer())
+    return signature(types.CPointer(types.uint32)), codegen
+
+@intrinsic
+def _np_state_index(typingctx):
+    def codegen(context, builder, sig, args):
+        state_ptr = get_np_state_ptr(context, builder)
+        idx = builder.load(get_index_ptr(builder, state_ptr))
+        return builder.zext(idx, context.get_value_type(types.intp))
+    return signature(types.intp), codegen
+
+@intrinsic
+def _np_set_state_index(typingctx, idx):
+    def codegen(context, builder, sig, args):
+        state_ptr = get_np_state_ptr(context, builder)
+        idx = context.cast(builder, args[0], sig.args[0], types.int32)
+        builder.store(idx, get_index_ptr(builder, state_ptr))
+        return context.get_dummy_value()
+    return signature(types.none, types.intp), codegen
+
+@intrinsic
+def _np_shuffle(typingctx):
+    """
+    Regenerate all the N words of the Numpy state.
+    """
+    def codegen(context, builder, sig, args):
+        state_ptr = get_np_state_ptr(context, builder)
+        builder.call(get_rnd_shuffle(builder), (state_ptr,))
+        return context.get_dummy_value()
+    return signature(types.none), codegen
+
+@intrinsic
+def _np_get_gauss(typingctx):
+    """
+    Get the (has_gauss, gauss) pair cached in the Numpy state.
+    """
+    retty = types.Tuple((types.boolean, types.float64))
+    def codegen(context, builder, sig, args):
+        state_ptr = get_np_state_ptr(context, builder)
+        has_gauss = builder.load(get_has_gauss_ptr(builder, state_ptr))
+        has_gauss = cgutils.is_true(builder, has_gauss)
+        gauss = builder.load(get_gauss_ptr(builder, state_ptr))
+        return context.make_tuple(builder, retty, (has_gauss, gauss))
+    return signature(retty), codegen
+
+@intrinsic
+def _np_clear_gauss(typingctx):
+    def codegen(context, builder, sig, args):
+        state_ptr = get_np_state_ptr(context, builder)
+        builder.store(const_int(0), get_has_gauss_ptr(builder, state_ptr))
+        return context.get_dummy_value()
+    return signature(types.none), codegen
+
+
+# Number of doubles converted at a time
+_BULK_BLOCK = 512
+
+@register_jitable
+def _fill_np_words(out):
+    """
+    Fill the uint32 array *out* with the next words of the Numpy state.
+    Whole runs of the state are tempered at once, and the state is
+    regenerated N words at a time when exhausted.
+    """
+    mt = carray(_np_state_words(), N)
+    n = out.size
+    i = 0
+    while i < n:
+        idx = _np_state_index()
+        if idx >= N:
+            _np_shuffle()
+            idx = 0
+        m = min(N - idx, n - i)
+        for j in range(m):
+            y = np.int64(mt[idx + j])
+            y ^= y >> 11
+            y ^= (y << 7) & 0x9d2c5680
+            y ^= (y << 15) & 0xefc60000
+            y ^= y >> 18
+            out[i + j] = y
+        _np_set_state_index(idx + m)
+        i += m
+
+@register_jitable
+def _fill_np_doubles(out):
+    """
+    Fill the 1d float64 array *out* as by repeated np.random.random() calls.
+    """
+    n = out.size
+    words = np.empty(2 * _BULK_BLOCK, np.uint32)
+    for start in range(0, n, _BULK_BLOCK):
+        m = min(_BULK_BLOCK, n - start)
+        _fill_np_words(words[:2 * m])
+        for k in range(m):
+            a = np.float64(words[2 * k] >> 5)
+            b = np.float64(words[2 * k + 1] >> 6)
+            out[start + k] = (a * 67108864.0 + b) / 9007199254740992.0
+
+@register_jitable
+def _fill_np_standard_normal(out):
+    """
+    Fill the 1d float64 array *out* as by repeated
+    np.random.standard_normal() calls.
+    """
+    n = out.size
+    i = 0
+    has_gauss, gauss = _np_get_gauss()
+    if has_gauss and n > 0:
+        out[0] = gauss
+        _np_clear_gauss()
+        i = 1
+    npairs = (n - i) // 2
+    u = np.empty(2 * _BULK_BLOCK, np.float64)
+    while npairs > 0:
+        # Draw no more candidate pairs than could be accepted, so that
+        # the state ends up exactly where the scalar loop would leave it.
+        m = min(npairs, _BULK_BLOCK)
+        candidates = u[:2 * m]
+        _fill_np_doubles(candidates)
+        for k in range(m):
+            x1 = 2.0 * candidates[2 * k] - 1.0
+            x2 = 2.0 * candidates[2 * k + 1] - 1.0
+            r2 = x1 * x1 + x2 * x2
+            if r2 < 1.0 and r2 != 0.0:
+                f = math.sqrt(-2.0 * math.log(r2) / r2)
+                out[i] = f * x2
+                out[i + 1] = f * x1
+                i += 2
+                npairs -= 1
+    if i < n:
+        # The scalar variant caches the other value of the pair
+        out[i] = np.random.standard_normal()
+
+def _bulk_random(out):
+    _fill_np_doubles(out.reshape(out.size))
+
+def _bulk_uniform(out, low, high):
+    flat = out.reshape(out.size)
+    _fill_np_doubles(flat)
+    width = high - low
+    for i in range(flat.size):
+        flat[i] = low + width * flat[i]
+
+def _bulk_standard_normal(out):
+    _fill_np_standard_normal(out.reshape(out.size))
+
+def _bulk_normal(out, loc, scale):
+    flat = out.reshape(out.size)
+    _fill_np_standard_normal(flat)
+    for i in range(flat.size):
+        flat[i] = loc + scale * flat[i]
+
+def _bulk_standard_exponential(out):
+    flat = out.reshape(out.size)
+    _fill_np_doubles(flat)
+    for i in range(flat.size):
+        flat[i] = -math.log(1.0 - flat[i])
+
+def _bulk_exponential(out, scale):
+    flat = out.reshape(out.size)
+    _fill_np_doubles(flat)
+    for i in range(flat.size):
+        flat[i] = -math.log(1.0 - flat[i]) * scale
+
+# (typing key, number of scalar arguments) -> bulk implementation
+_bulk_array_impls = {
+    ("np.random.random", 0): _bulk_random,
+    ("np.random.random_sample", 0): _bulk_random,
+    ("np.random.sample", 0): _bulk_random,
+    ("np.random.ranf", 0): _bulk_random,
+    ("np.random.uniform", 2): _bulk_uniform,
+    ("np.random.standard_normal", 0): _bulk_standard_normal,
+    ("np.random.normal", 2): _bulk_normal,
+    ("np.random.standard_exponential", 0): _bulk_standard_exponential,
+    ("np.random.exponential", 1): _bulk_exponential,
+}
+
+
 # ------------------------------------------------------------------------
 # Array-producing variants of scalar random functions
 
@@ -1299,11 +1494,17 @@ for typing_key, arity in [
         arr = arrayobj._empty_nd_impl(context, builder, arrty, shapes)
 
         # ... and populate it in natural order
-        scalar_impl = context.get_function(typing_key, scalar_sig)
-        with cgutils.for_range(builder, arr.nitems) as loop:
-            val = scalar_impl(builder, scalar_args)
-            ptr = cgutils.gep(builder, arr.data, loop.index)
-            arrayobj.store_item(context, builder, arrty, val, ptr)
+        bulk_impl = _bulk_array_impls.get((typing_key, len(scalar_args)))
+        if bulk_impl is not None and dtype == types.float64:
+            fill_sig = signature(types.none, arrty, *scalar_sig.args)
+            context.compile_internal(builder, bulk_impl, fill_sig,
+                                     [arr._getvalue()] + list(scalar_args))
+        else:
+            scalar_impl = context.get_function(typing_key, scalar_sig)
+            with cgutils.for_range(builder, arr.nitems) as loop:
+                val = scalar_impl(builder, scalar_args)
+                ptr = cgutils.gep(builder, arr.data, loop.index)
+                arrayobj.store_item(context, builder, arrty, val, ptr)
 
         return impl_ret_new_ref(context, builder, sig.return_type, arr._getvalue())
 
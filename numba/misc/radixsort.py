@@ -0,0 +1,192 @@
+"""
+A stable LSD radix sort for boolean, integer and floating-point arrays.
+Values are first mapped to unsigned 64-bit keys which compare in the same
+order as the values; the keys are then sorted one byte at a time, carrying
+a payload (the values themselves, or their indices for argsort) along.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from numba.core import types
+from numba.core.extending import intrinsic, overload, register_jitable
+
+
+# Array size smaller than this will be sorted by insertion sort
+SMALL_RADIXSORT = 64
+
+_U8 = np.uint64(8)
+_UMASK8 = np.uint64(0xFF)
+
+
+RadixsortImplementation = namedtuple('RadixsortImplementation', [
+    'run_radixsort',
+])
+
+
+@intrinsic
+def _float_bits(typingctx, x):
+    """
+    Reinterpret the float *x* as an unsigned integer of the same width.
+    """
+    if isinstance(x, types.Float):
+        ity = types.uint64 if x.bitwidth == 64 else types.uint32
+        sig = ity(x)
+
+        def codegen(context, builder, signature, args):
+            return builder.bitcast(args[0], context.get_value_type(ity))
+
+        return sig, codegen
+
+
+def radix_key(x):
+    """
+    Return an unsigned 64-bit key of the scalar *x* such that keys compare
+    like the values do.  NaNs compare greater than everything else and
+    -0.0 compares equal to 0.0, as in the sorts of floats.
+    """
+    raise NotImplementedError
+
+
+@overload(radix_key)
+def _ol_radix_key(x):
+    if isinstance(x, types.Boolean):
+        def impl(x):
+            return np.uint64(x)
+    elif isinstance(x, types.Integer) and x.signed:
+        # Flip the sign bit so that negative values come first
+        mask = np.uint64((1 << x.bitwidth) - 1)
+        sign = np.uint64(1 << (x.bitwidth - 1))
+
+        def impl(x):
+            return (np.uint64(np.int64(x)) & mask) ^ sign
+    elif isinstance(x, types.Integer):
+        def impl(x):
+            return np.uint64(x)
+    elif isinstance(x, types.Float) and x.bitwidth in (32, 64):
+        # Negative values have all their bits flipped, so that they order
+        # backwards, while positive values only have the sign bit set
+        mask = np.uint64((1 << x.bitwidth) - 1)
+        sign = np.uint64(1 << (x.bitwidth - 1))
+
+        def impl(x):
+            if math.isnan(x):
+                return mask
+            if x == 0:
+                return sign
+            bits = np.uint64(_float_bits(x))
+            if bits & sign:
+                return ~bits & mask
+            return bits | sign
+    else:
+        return None
+    return impl
+
+
+def is_radix_sortable(dtype):
+    """
+    Whether arrays of the Numba type *dtype* can be radix sorted.
+    """
+    return (isinstance(dtype, (types.Boolean, types.Integer)) or
+            (isinstance(dtype, types.Float) and dtype.bitwidth in (32, 64)))
+
+
+@register_jitable
+def _insertion_sort_pairs(keys, payload):
+    for i in range(1, keys.size):
+        k = keys[i]
+        v = payload[i]
+        j = i
+        while j > 0 and k < keys[j - 1]:
+            keys[j] = keys[j - 1]
+            payload[j] = payload[j - 1]
+            j -= 1
+        keys[j] = k
+        payload[j] = v
+
+
+@register_jitable
+def radixsort_pairs(keys, payload):
+    """
+    Sort the uint64 *keys* inplace, applying the same permutation to
+    *payload*.  The sort is stable.
+    """
+    n = keys.size
+    if n <= SMALL_RADIXSORT:
+        _insertion_sort_pairs(keys, payload)
+        return
+
+    # Histograms of the eight digits, computed in a single pass
+    counts = np.zeros((8, 256), np.intp)
+    for i in range(n):
+        k = keys[i]
+        for b in range(8):
+            counts[b, np.intp(k & _UMASK8)] += 1
+            k >>= _U8
+
+    src_keys = keys
+    src_payload = payload
+    dst_keys = np.empty(n, np.uint64)
+    dst_payload = np.empty(n, payload.dtype)
+    swapped = False
+    offsets = np.empty(256, np.intp)
+    shift = np.uint64(0)
+    for b in range(8):
+        # Skip the digits which are the same for all keys, such as the
+        # high bytes of small integers
+        first = np.intp((src_keys[0] >> shift) & _UMASK8)
+        if counts[b, first] != n:
+            total = 0
+            for d in range(256):
+                offsets[d] = total
+                total += counts[b, d]
+            for i in range(n):
+                k = src_keys[i]
+                d = np.intp((k >> shift) & _UMASK8)
+                j = offsets[d]
+                dst_keys[j] = k
+                dst_payload[j] = src_payload[i]
+                offsets[d] = j + 1
+            src_keys, dst_keys = dst_keys, src_keys
+            src_payload, dst_payload = dst_payload, src_payload
+            swapped = not swapped
+        shift += _U8
+
+    if swapped:
+        for i in range(n):
+            keys[i] = src_keys[i]
+            payload[i] = src_payload[i]
+
+
+@register_jitable
+def make_radix_keys(A):
+    keys = np.empty(A.size, np.uint64)
+    for i in range(A.size):
+        keys[i] = radix_key(A[i])
+    return keys
+
+
+def make_radixsort_impl(wrap, is_argsort=False):
+
+    @wrap
+    def radixsort(A):
+        "Inplace"
+        radixsort_pairs(make_radix_keys(A), A)
+        return A
+
+    @wrap
+    def argradixsort(A):
+        "Out-of-place"
+        idxs = np.arange(A.size)
+        radixsort_pairs(make_radix_keys(A), idxs)
+        return idxs
+
+    return RadixsortImplementation(
+        run_radixsort=(argradixsort if is_argsort else radixsort)
+    )
+
+
+def make_jit_radixsort(*args, **kwargs):
+    return make_radixsort_impl((lambda f: register_jitable(f)),
+                               *args, **kwargs)
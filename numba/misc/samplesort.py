@@ -0,0 +1,214 @@
+"""
+A parallel sample sort for boolean, integer and floating-point arrays.
+
+The array is cut into as many chunks as there are buckets.  Splitters
+chosen from a regular sample of the keys assign every element to a bucket,
+the chunks are scattered to their buckets in parallel, and the buckets
+are then radix sorted in parallel.  The scatter preserves the order of the
+chunks and the radix sort is stable, so the sort as a whole is stable.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from numba.core.extending import register_jitable
+from numba.misc.radixsort import radix_key, radixsort_pairs
+
+
+# Array size smaller than this will be sorted serially
+SMALL_SAMPLESORT = 1 << 16
+
+# Number of buckets per thread, so that uneven buckets balance out
+BUCKETS_PER_THREAD = 4
+
+# Bucket indices are stored as uint16
+MAX_BUCKETS = 4096
+
+# Average bucket size under which there are fewer buckets than the above
+MIN_BUCKET_SIZE = 1024
+
+# Number of sampled keys per bucket when choosing the splitters
+OVERSAMPLING = 64
+
+
+SamplesortImplementation = namedtuple('SamplesortImplementation', [
+    'run_samplesort',
+])
+
+
+@register_jitable
+def choose_splitters(keys, nbuckets):
+    """
+    Choose the ``nbuckets - 1`` splitters of the uint64 *keys* from a
+    regular sample.
+    """
+    nsamples = nbuckets * OVERSAMPLING
+    step = keys.size // nsamples
+    sample = np.empty(nsamples, np.uint64)
+    for i in range(nsamples):
+        sample[i] = keys[i * step + step // 2]
+    sample.sort()
+    splitters = np.empty(nbuckets - 1, np.uint64)
+    for i in range(nbuckets - 1):
+        splitters[i] = sample[(i + 1) * OVERSAMPLING]
+    return splitters
+
+
+@register_jitable
+def find_bucket(splitters, key):
+    """
+    Return the bucket of *key*, i.e. the number of splitters <= key.
+    """
+    lo = 0
+    hi = splitters.size
+    while lo < hi:
+        mid = (lo + hi) >> 1
+        if key < splitters[mid]:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+@register_jitable
+def bucket_starts(counts):
+    """
+    Given the (chunk, bucket) element *counts*, return where each chunk
+    starts writing in each bucket, and the bounds of the buckets.
+    """
+    nchunks, nbuckets = counts.shape
+    starts = np.empty((nchunks, nbuckets), np.intp)
+    bounds = np.empty(nbuckets + 1, np.intp)
+    total = 0
+    for b in range(nbuckets):
+        bounds[b] = total
+        for c in range(nchunks):
+            starts[c, b] = total
+            total += counts[c, b]
+    bounds[nbuckets] = total
+    return starts, bounds
+
+
+def make_samplesort_impl(wrap, prange, get_num_threads, is_argsort=False):
+
+    # Two subroutines to make the core algorithm generic wrt. argsort
+    # or normal sorting, as in quicksort.py
+    if is_argsort:
+        @register_jitable
+        def make_payload(A):
+            return np.empty(A.size, np.intp)
+
+        @register_jitable
+        def GET(A, i):
+            return i
+
+        @register_jitable
+        def WRITE_BACK(A, out, lo, hi):
+            pass
+
+    else:
+        @register_jitable
+        def make_payload(A):
+            return np.empty(A.size, A.dtype)
+
+        @register_jitable
+        def GET(A, i):
+            return A[i]
+
+        @register_jitable
+        def WRITE_BACK(A, out, lo, hi):
+            for i in range(lo, hi):
+                A[i] = out[i]
+
+    @wrap
+    def samplesort_inner(A, keys, payload):
+        """Sort *payload* by *keys*, returning the sorted payload.
+
+        Parameters
+        ----------
+        A : array [read+write]
+            The array being sorted.  Unchanged for argsort.
+        keys : array [readonly]
+            The radix keys of the elements of A.
+        payload : array [readonly]
+            The elements to sort.  For argsort, these are the indices.
+        """
+        n = keys.size
+        nbuckets = min(get_num_threads() * BUCKETS_PER_THREAD, MAX_BUCKETS,
+                       n // MIN_BUCKET_SIZE)
+        splitters = choose_splitters(keys, nbuckets)
+        chunk = (n + nbuckets - 1) // nbuckets
+
+        # Count the elements of each chunk going to each bucket
+        buckets = np.empty(n, np.uint16)
+        counts = np.zeros((nbuckets, nbuckets), np.intp)
+        for c in prange(nbuckets):
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                b = find_bucket(splitters, keys[i])
+                buckets[i] = b
+                counts[c, b] += 1
+        starts, bounds = bucket_starts(counts)
+
+        # Scatter the chunks to their buckets, in order
+        out_keys = np.empty(n, np.uint64)
+        out = np.empty(n, payload.dtype)
+        for c in prange(nbuckets):
+            pos = starts[c].copy()
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                b = buckets[i]
+                j = pos[b]
+                out_keys[j] = keys[i]
+                out[j] = payload[i]
+                pos[b] = j + 1
+
+        # Sort each bucket
+        for b in prange(nbuckets):
+            lo = bounds[b]
+            hi = bounds[b + 1]
+            radixsort_pairs(out_keys[lo:hi], out[lo:hi])
+            WRITE_BACK(A, out, lo, hi)
+        return out
+
+    # The top-level entry points
+
+    @wrap
+    def samplesort(A):
+        "Inplace"
+        n = A.size
+        keys = np.empty(n, np.uint64)
+        payload = make_payload(A)
+        for i in prange(n):
+            keys[i] = radix_key(A[i])
+            payload[i] = GET(A, i)
+        if n < SMALL_SAMPLESORT:
+            radixsort_pairs(keys, payload)
+            WRITE_BACK(A, payload, 0, n)
+        else:
+            samplesort_inner(A, keys, payload)
+        return A
+
+    @wrap
+    def argsamplesort(A):
+        "Out-of-place"
+        n = A.size
+        keys = np.empty(n, np.uint64)
+        payload = make_payload(A)
+        for i in prange(n):
+            keys[i] = radix_key(A[i])
+            payload[i] = GET(A, i)
+        if n < SMALL_SAMPLESORT:
+            radixsort_pairs(keys, payload)
+            return payload
+        return samplesort_inner(A, keys, payload)
+
+    return SamplesortImplementation(
+        run_samplesort=(argsamplesort if is_argsort else samplesort)
+    )
+
+
+def make_jit_samplesort(*args, **kwargs):
+    from numba import njit, prange, get_num_threads
+    # NOTE: wrap with njit(parallel=True) so that the prange loops run
+    #       on the threading layer, whatever the caller's options are
+    return make_samplesort_impl(njit(parallel=True), prange, get_num_threads,
+                                *args, **kwargs)
@@ -1,6 +1,6 @@
 import numpy as np
 
-from numba.core.typing.typeof import typeof
+from numba.core.typing.typeof import typeof, typeof_impl
 
 
 def pndindex(*args):
@@ -18,6 +18,32 @@ class prange(object):
         return range(*args)
 
 
+class reduction(object):
+    """ Defines a reduction for prange loops from the identity value *init*
+    of the reduction and an associative function *combine(a, b)* of two
+    partial results, e.g. tuples of statistics.  In a prange loop, the
+    statement ``acc = red(acc, value)`` accumulates *value* into the
+    reduction variable *acc*: each thread accumulates into its own copy of
+    *acc*, starting from *init*, and the copies are combined into *acc* when
+    the loop completes.  Elsewhere, calling the reduction calls *combine*,
+    which is compiled with njit if it is not already jitted.
+    """
+    def __init__(self, init, combine):
+        from numba.core.decorators import njit
+        from numba.core.extending import is_jitted
+        self.init = init
+        self.combine = combine if is_jitted(combine) else njit(combine)
+
+    def __call__(self, a, b):
+        return self.combine(a, b)
+
+
+@typeof_impl.register(reduction)
+def _typeof_reduction(val, c):
+    # Calls of the reduction are calls of its combine function
+    return typeof_impl(val.combine, c)
+
+
 def _gdb_python_call_gen(func_name, *args):
     # generates a call to a function containing a compiled in gdb command,
     # this is to make `numba.gdb*` work in the interpreter.
@@ -94,6 +120,7 @@ __all__ = [
     'typeof',
     'prange',
     'pndindex',
+    'reduction',
     'gdb',
     'gdb_breakpoint',
     'gdb_init',
@@ -0,0 +1,260 @@
+"""
+Grouping of the equal elements of an array, as needed by np.unique().
+
+Boolean and integer arrays are grouped with an open-addressing hash
+table, so that only the distinct values need sorting.  For large arrays,
+the elements are first scattered to partitions by the high bits of their
+hash, as in samplesort.py, and the partitions are then grouped in
+parallel.  Other arrays are grouped by a stable argsort.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from numba.core.extending import register_jitable
+from numba.misc.radixsort import radix_key
+from numba.misc.samplesort import bucket_starts
+
+
+# Array size smaller than this will be grouped in a single partition
+SMALL_HASHUNIQUE = 1 << 16
+
+# Number of partitions per thread, so that uneven partitions balance out
+PARTITIONS_PER_THREAD = 4
+
+# Partition indices are stored as uint16
+MAX_PARTITIONS = 4096
+
+# Average partition size under which there are fewer partitions
+MIN_PARTITION_SIZE = 1024
+
+# Multiplier of Fibonacci hashing, whose high bits are well mixed
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+_U64 = np.uint64(64)
+
+
+UniqueImplementation = namedtuple('UniqueImplementation', [
+    'run_hashunique',
+    'run_sortunique',
+])
+
+
+def is_hashable(dtype):
+    """
+    Whether arrays of the Numba type *dtype* are grouped by hashing.
+    """
+    from numba.core import types
+    return isinstance(dtype, (types.Boolean, types.Integer))
+
+
+@register_jitable
+def hash_groups(vals, hashes, pbits):
+    """
+    Group the equal elements of *vals*, whose *hashes* have the same
+    *pbits* high bits.  Return the group of each element, and the value,
+    the first element and the size of each group, by order of first
+    appearance.
+    """
+    n = vals.size
+    bits = 1
+    while (1 << bits) < 2 * n:
+        bits += 1
+    mask = (1 << bits) - 1
+    shift = _U64 - np.uint64(bits)
+    upbits = np.uint64(pbits)
+    slots = np.full(1 << bits, -1, np.intp)
+    keys = np.empty(1 << bits, vals.dtype)
+    groups = np.empty(n, np.intp)
+    first = np.empty(n, np.intp)
+    counts = np.zeros(n, np.intp)
+    ngroups = 0
+    for i in range(n):
+        v = vals[i]
+        s = np.intp((hashes[i] << upbits) >> shift)
+        while True:
+            g = slots[s]
+            if g < 0:
+                g = ngroups
+                ngroups += 1
+                slots[s] = g
+                keys[s] = v
+                first[g] = i
+                break
+            if keys[s] == v:
+                break
+            s = (s + 1) & mask
+        groups[i] = g
+        counts[g] += 1
+    first = first[:ngroups]
+    return groups, vals[first], first, counts[:ngroups]
+
+
+@register_jitable
+def _ranks(order):
+    ranks = np.empty(order.size, np.intp)
+    for r in range(order.size):
+        ranks[order[r]] = r
+    return ranks
+
+
+def make_unique_impl(wrap, prange, get_num_threads, argsort):
+    """
+    Make the np.unique() kernels, sorting with the stable *argsort*.
+    Each kernel returns the unique values of a 1-D array, the indices of
+    their first occurrences, the group of each element (only if
+    *need_inverse* is true, otherwise an empty array) and the group sizes.
+    """
+
+    @wrap
+    def hashunique_partitioned(vals, hashes, need_inverse):
+        n = vals.size
+        nparts = 2
+        pbits = 1
+        limit = min(get_num_threads() * PARTITIONS_PER_THREAD,
+                    MAX_PARTITIONS, n // MIN_PARTITION_SIZE)
+        while nparts * 2 <= limit:
+            nparts *= 2
+            pbits += 1
+        pshift = _U64 - np.uint64(pbits)
+        chunk = (n + nparts - 1) // nparts
+
+        # Count the elements of each chunk going to each partition
+        parts = np.empty(n, np.uint16)
+        pcounts = np.zeros((nparts, nparts), np.intp)
+        for c in prange(nparts):
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                p = np.intp(hashes[i] >> pshift)
+                parts[i] = p
+                pcounts[c, p] += 1
+        starts, bounds = bucket_starts(pcounts)
+
+        # Scatter the chunks to their partitions, in order, so that the
+        # first element of a group in a partition is its first occurrence
+        pvals = np.empty(n, vals.dtype)
+        phashes = np.empty(n, np.uint64)
+        pidx = np.empty(n, np.intp)
+        for c in prange(nparts):
+            pos = starts[c].copy()
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                p = parts[i]
+                j = pos[p]
+                pvals[j] = vals[i]
+                phashes[j] = hashes[i]
+                pidx[j] = i
+                pos[p] = j + 1
+
+        # Group each partition, the groups of partition p being stored
+        # from bounds[p]
+        pgroups = np.empty(n, np.intp)
+        gvals = np.empty(n, vals.dtype)
+        gfirst = np.empty(n, np.intp)
+        gcounts = np.empty(n, np.intp)
+        ngroups = np.empty(nparts, np.intp)
+        for p in prange(nparts):
+            lo = bounds[p]
+            hi = bounds[p + 1]
+            groups, uvals, first, counts = hash_groups(pvals[lo:hi],
+                                                       phashes[lo:hi], pbits)
+            ng = uvals.size
+            ngroups[p] = ng
+            pgroups[lo:hi] = groups
+            gvals[lo:lo + ng] = uvals
+            gcounts[lo:lo + ng] = counts
+            for g in range(ng):
+                gfirst[lo + g] = pidx[lo + first[g]]
+
+        # Compact the groups of all the partitions
+        offsets = np.empty(nparts + 1, np.intp)
+        total = 0
+        for p in range(nparts):
+            offsets[p] = total
+            total += ngroups[p]
+        offsets[nparts] = total
+        uvals = np.empty(total, vals.dtype)
+        first = np.empty(total, np.intp)
+        counts = np.empty(total, np.intp)
+        for p in prange(nparts):
+            lo = bounds[p]
+            ng = ngroups[p]
+            off = offsets[p]
+            uvals[off:off + ng] = gvals[lo:lo + ng]
+            first[off:off + ng] = gfirst[lo:lo + ng]
+            counts[off:off + ng] = gcounts[lo:lo + ng]
+
+        order = np.argsort(uvals)
+        if need_inverse:
+            ranks = _ranks(order)
+            inverse = np.empty(n, np.intp)
+            for p in prange(nparts):
+                off = offsets[p]
+                for j in range(bounds[p], bounds[p + 1]):
+                    inverse[pidx[j]] = ranks[off + pgroups[j]]
+        else:
+            inverse = np.empty(0, np.intp)
+        return uvals[order], first[order], inverse, counts[order]
+
+    @wrap
+    def hashunique(vals, need_inverse):
+        n = vals.size
+        hashes = np.empty(n, np.uint64)
+        for i in prange(n):
+            hashes[i] = radix_key(vals[i]) * _GOLDEN
+        if n >= SMALL_HASHUNIQUE and get_num_threads() > 1:
+            return hashunique_partitioned(vals, hashes, need_inverse)
+
+        groups, uvals, first, counts = hash_groups(vals, hashes, 0)
+        order = np.argsort(uvals)
+        if need_inverse:
+            ranks = _ranks(order)
+            inverse = np.empty(n, np.intp)
+            for i in prange(n):
+                inverse[i] = ranks[groups[i]]
+        else:
+            inverse = np.empty(0, np.intp)
+        return uvals[order], first[order], inverse, counts[order]
+
+    @wrap
+    def sortunique(vals, need_inverse):
+        n = vals.size
+        order = argsort(vals)
+        svals = vals[order]
+        starts = np.empty(n + 1, np.intp)
+        ngroups = 0
+        for i in range(n):
+            if i == 0 or svals[i] != svals[i - 1]:
+                starts[ngroups] = i
+                ngroups += 1
+        starts[ngroups] = n
+        heads = starts[:ngroups]
+        counts = np.empty(ngroups, np.intp)
+        for g in range(ngroups):
+            counts[g] = starts[g + 1] - starts[g]
+        if need_inverse:
+            inverse = np.empty(n, np.intp)
+            for g in prange(ngroups):
+                for i in range(starts[g], starts[g + 1]):
+                    inverse[order[i]] = g
+        else:
+            inverse = np.empty(0, np.intp)
+        return svals[heads], order[heads], inverse, counts
+
+    return UniqueImplementation(run_hashunique=hashunique,
+                                run_sortunique=sortunique)
+
+
+@register_jitable
+def _one_thread():
+    return 1
+
+
+def make_py_unique(argsort):
+    return make_unique_impl(register_jitable, range, _one_thread, argsort)
+
+
+def make_jit_unique(argsort):
+    from numba import njit, prange, get_num_threads
+    # NOTE: wrap with njit(parallel=True) so that the prange loops run
+    #       on the threading layer, whatever the caller's options are
+    return make_unique_impl(njit(parallel=True), prange, get_num_threads,
+                            argsort)
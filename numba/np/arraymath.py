@@ -12,7 +12,7 @@ import numpy as np
 
 import llvmlite.llvmpy.core as lc
 
-from numba import generated_jit
+from numba import generated_jit, literal_unroll
 from numba.core import types, cgutils
 from numba.core.extending import overload, overload_method, register_jitable
 from numba.np.numpy_support import as_dtype, type_can_asarray
@@ -21,11 +21,13 @@ from numba.np.numpy_support import is_nonelike
 from numba.core.imputils import (lower_builtin, impl_ret_borrowed,
                                  impl_ret_new_ref, impl_ret_untracked)
 from numba.core.typing import signature
+from numba.core.typing.arraydecl import literal_flag, reduction_return_type
 from numba.np.arrayobj import make_array, load_item, store_item, _empty_nd_impl
 from numba.np.linalg import ensure_blas
+from numba.np.unsafe.ndarray import to_fixed_tuple
 
 from numba.core.extending import intrinsic
-from numba.core.errors import RequireLiteralValue, TypingError
+from numba.core.errors import TypingError
 
 
 def _check_blas():
@@ -40,311 +42,172 @@ def _check_blas():
 _HAVE_BLAS = _check_blas()
 
 
-@intrinsic
-def _create_tuple_result_shape(tyctx, shape_list, shape_tuple):
-    """
-    This routine converts shape list where the axis dimension has already
-    been popped to a tuple for indexing of the same size.  The original shape
-    tuple is also required because it contains a length field at compile time
-    whereas the shape list does not.
-    """
-
-    # The new tuple's size is one less than the original tuple since axis
-    # dimension removed.
-    nd = len(shape_tuple) - 1
-    # The return type of this intrinsic is an int tuple of length nd.
-    tupty = types.UniTuple(types.intp, nd)
-    # The function signature for this intrinsic.
-    function_sig = tupty(shape_list, shape_tuple)
+#----------------------------------------------------------------------------
+# Basic stats and aggregates
 
-    def codegen(cgctx, builder, signature, args):
-        lltupty = cgctx.get_value_type(tupty)
-        # Create an empty int tuple.
-        tup = cgutils.get_null_value(lltupty)
+# Floating point sums use pairwise summation like NumPy: the error grows
+# as O(log n) instead of O(n), and the eight independent partial sums of
+# each block can be vectorized without reassociating any addition.
+PW_BLOCKSIZE = 128
 
-        # Get the shape list from the args and we don't need shape tuple.
-        [in_shape, _] = args
 
-        def array_indexer(a, i):
-            return a[i]
+@register_jitable
+def _pairwise_sum_block(a, start, n, zero):
+    """
+    Sum the *n* <= PW_BLOCKSIZE elements of the 1d array *a* starting at
+    *start*.
+    """
+    if n < 8:
+        res = zero
+        for i in range(start, start + n):
+            res += a[i]
+        return res
+    r0 = a[start]
+    r1 = a[start + 1]
+    r2 = a[start + 2]
+    r3 = a[start + 3]
+    r4 = a[start + 4]
+    r5 = a[start + 5]
+    r6 = a[start + 6]
+    r7 = a[start + 7]
+    stop = start + n - n % 8
+    for i in range(start + 8, stop, 8):
+        r0 += a[i]
+        r1 += a[i + 1]
+        r2 += a[i + 2]
+        r3 += a[i + 3]
+        r4 += a[i + 4]
+        r5 += a[i + 5]
+        r6 += a[i + 6]
+        r7 += a[i + 7]
+    res = ((r0 + r1) + (r2 + r3)) + ((r4 + r5) + (r6 + r7))
+    for i in range(stop, start + n):
+        res += a[i]
+    return res
 
-        # loop to fill the tuple
-        for i in range(nd):
-            dataidx = cgctx.get_constant(types.intp, i)
-            # compile and call array_indexer
-            data = cgctx.compile_internal(builder, array_indexer,
-                                          types.intp(shape_list, types.intp),
-                                          [in_shape, dataidx])
-            tup = builder.insert_value(tup, data, i)
-        return tup
 
-    return function_sig, codegen
+@register_jitable
+def _pairwise_push(partials, depth, nblocks, s):
+    """
+    Push the sum *s* of the block number *nblocks* on the stack *partials*
+    of *depth* partial sums and return the new depth.  The block sums are
+    combined as a binary tree: the partial sum at depth d of the stack
+    covers twice as many blocks as the one at depth d + 1.
+    """
+    k = nblocks
+    while k & 1:
+        depth -= 1
+        s = partials[depth] + s
+        k >>= 1
+    partials[depth] = s
+    return depth + 1
 
 
-@intrinsic
-def _gen_index_tuple(tyctx, shape_tuple, value, axis):
+@register_jitable
+def _pairwise_pop(partials, depth, zero):
     """
-    Generates a tuple that can be used to index a specific slice from an
-    array for sum with axis.  shape_tuple is the size of the dimensions of
-    the input array.  'value' is the value to put in the indexing tuple
-    in the axis dimension and 'axis' is that dimension.  For this to work,
-    axis has to be a const.
+    Return the sum of the *depth* partial sums on the stack *partials*.
     """
-    if not isinstance(axis, types.Literal):
-        raise RequireLiteralValue('axis argument must be a constant')
-    # Get the value of the axis constant.
-    axis_value = axis.literal_value
-    # The length of the indexing tuple to be output.
-    nd = len(shape_tuple)
-
-    # If the axis value is impossible for the given size array then
-    # just fake it like it was for axis 0.  This will stop compile errors
-    # when it looks like it could be called from array_sum_axis but really
-    # can't because that routine checks the axis mismatch and raise an
-    # exception.
-    if axis_value >= nd:
-        axis_value = 0
-
-    # Calculate the type of the indexing tuple.  All the non-axis
-    # dimensions have slice2 type and the axis dimension has int type.
-    before = axis_value
-    after = nd - before - 1
-
-    types_list = []
-    types_list += [types.slice2_type] * before
-    types_list += [types.intp]
-    types_list += [types.slice2_type] * after
-
-    # Creates the output type of the function.
-    tupty = types.Tuple(types_list)
-    # Defines the signature of the intrinsic.
-    function_sig = tupty(shape_tuple, value, axis)
-
-    def codegen(cgctx, builder, signature, args):
-        lltupty = cgctx.get_value_type(tupty)
-        # Create an empty indexing tuple.
-        tup = cgutils.get_null_value(lltupty)
-
-        # We only need value of the axis dimension here.
-        # The rest are constants defined above.
-        [_, value_arg, _] = args
-
-        def create_full_slice():
-            return slice(None, None)
-
-        # loop to fill the tuple with slice(None,None) before
-        # the axis dimension.
-
-        # compile and call create_full_slice
-        slice_data = cgctx.compile_internal(builder, create_full_slice,
-                                            types.slice2_type(),
-                                            [])
-        for i in range(0, axis_value):
-            tup = builder.insert_value(tup, slice_data, i)
-
-        # Add the axis dimension 'value'.
-        tup = builder.insert_value(tup, value_arg, axis_value)
-
-        # loop to fill the tuple with slice(None,None) after
-        # the axis dimension.
-        for i in range(axis_value + 1, nd):
-            tup = builder.insert_value(tup, slice_data, i)
-        return tup
-
-    return function_sig, codegen
-
+    res = zero
+    while depth > 0:
+        depth -= 1
+        res = partials[depth] + res
+    return res
 
-#----------------------------------------------------------------------------
-# Basic stats and aggregates
 
-@lower_builtin(np.sum, types.Array)
-@lower_builtin("array.sum", types.Array)
-def array_sum(context, builder, sig, args):
-    zero = sig.return_type(0)
+@register_jitable
+def pairwise_sum(a, zero):
+    """
+    Sum the elements of the 1d array *a* using pairwise summation.
+    """
+    n = len(a)
+    if n <= PW_BLOCKSIZE:
+        return _pairwise_sum_block(a, 0, n, zero)
+    partials = np.empty(64, dtype=a.dtype)
+    depth = 0
+    nblocks = 0
+    for start in range(0, n, PW_BLOCKSIZE):
+        s = _pairwise_sum_block(a, start, min(PW_BLOCKSIZE, n - start), zero)
+        depth = _pairwise_push(partials, depth, nblocks, s)
+        nblocks += 1
+    return _pairwise_pop(partials, depth, zero)
 
-    def array_sum_impl(arr):
-        c = zero
-        for v in np.nditer(arr):
-            c += v.item()
-        return c
 
-    res = context.compile_internal(builder, array_sum_impl, sig, args,
-                                   locals=dict(c=sig.return_type))
-    return impl_ret_borrowed(context, builder, sig.return_type, res)
+@intrinsic
+def _reassoc_add(typingctx, acc, val):
+    """
+    Floating point addition which LLVM may reassociate, so that a loop
+    accumulating with it can be vectorized.
+    """
+    if isinstance(acc, types.Float) and acc == val:
+        def codegen(context, builder, sig, args):
+            return builder.fadd(*args, flags=('reassoc',))
+        return signature(acc, acc, val), codegen
 
 
 @register_jitable
-def _array_sum_axis_nop(arr, v):
-    return arr
+def reassoc_sum(a, zero):
+    """
+    Sum the elements of the 1d float array *a* in any order.
+    """
+    c = zero
+    for i in range(len(a)):
+        c = _reassoc_add(c, a[i])
+    return c
 
 
-def gen_sum_axis_impl(is_axis_const, const_axis_val, op, zero):
-    def inner(arr, axis):
-        """
-        function that performs sums over one specific axis
+@generated_jit
+def _contiguous_1d_view(arr):
+    """
+    Return a 1d view of the contiguous array *arr*.
+    """
+    if arr.ndim == 1:
+        return lambda arr: arr
+    elif arr.layout == 'C':
+        return lambda arr: arr.reshape(arr.size)
+    else:
+        return lambda arr: arr.T.reshape(arr.size)
 
-        The third parameter to gen_index_tuple that generates the indexing
-        tuples has to be a const so we can't just pass "axis" through since
-        that isn't const.  We can check for specific values and have
-        different instances that do take consts.  Supporting axis summation
-        only up to the fourth dimension for now.
 
-        typing/arraydecl.py:sum_expand defines the return type for sum with
-        axis. It is one dimension less than the input array.
-        """
-        ndim = arr.ndim
-
-        if not is_axis_const:
-            # Catch where axis is negative or greater than 3.
-            if axis < 0 or axis > 3:
-                raise ValueError("Numba does not support sum with axis "
-                                 "parameter outside the range 0 to 3.")
-
-        # Catch the case where the user misspecifies the axis to be
-        # more than the number of the array's dimensions.
-        if axis >= ndim:
-            raise ValueError("axis is out of bounds for array")
-
-        # Convert the shape of the input array to a list.
-        ashape = list(arr.shape)
-        # Get the length of the axis dimension.
-        axis_len = ashape[axis]
-        # Remove the axis dimension from the list of dimensional lengths.
-        ashape.pop(axis)
-        # Convert this shape list back to a tuple using above intrinsic.
-        ashape_without_axis = _create_tuple_result_shape(ashape, arr.shape)
-        # Tuple needed here to create output array with correct size.
-        result = np.full(ashape_without_axis, zero, type(zero))
-
-        # Iterate through the axis dimension.
-        for axis_index in range(axis_len):
-            if is_axis_const:
-                # constant specialized version works for any valid axis value
-                index_tuple_generic = _gen_index_tuple(arr.shape, axis_index,
-                                                       const_axis_val)
-                result += arr[index_tuple_generic]
-            else:
-                # Generate a tuple used to index the input array.
-                # The tuple is ":" in all dimensions except the axis
-                # dimension where it is "axis_index".
-                if axis == 0:
-                    index_tuple1 = _gen_index_tuple(arr.shape, axis_index, 0)
-                    result += arr[index_tuple1]
-                elif axis == 1:
-                    index_tuple2 = _gen_index_tuple(arr.shape, axis_index, 1)
-                    result += arr[index_tuple2]
-                elif axis == 2:
-                    index_tuple3 = _gen_index_tuple(arr.shape, axis_index, 2)
-                    result += arr[index_tuple3]
-                elif axis == 3:
-                    index_tuple4 = _gen_index_tuple(arr.shape, axis_index, 3)
-                    result += arr[index_tuple4]
-        return op(result, 0)
-    return inner
-
-
-@lower_builtin(np.sum, types.Array, types.intp, types.DTypeSpec)
-@lower_builtin(np.sum, types.Array, types.IntegerLiteral, types.DTypeSpec)
-@lower_builtin("array.sum", types.Array, types.intp, types.DTypeSpec)
-@lower_builtin("array.sum", types.Array, types.IntegerLiteral, types.DTypeSpec)
-def array_sum_axis_dtype(context, builder, sig, args):
-    retty = sig.return_type
-    zero = getattr(retty, 'dtype', retty)(0)
-    # if the return is scalar in type then "take" the 0th element of the
-    # 0d array accumulator as the return value
-    if getattr(retty, 'ndim', None) is None:
-        op = np.take
-    else:
-        op = _array_sum_axis_nop
-    [ty_array, ty_axis, ty_dtype] = sig.args
-    is_axis_const = False
-    const_axis_val = 0
-    if isinstance(ty_axis, types.Literal):
-        # this special-cases for constant axis
-        const_axis_val = ty_axis.literal_value
-        # fix negative axis
-        if const_axis_val < 0:
-            const_axis_val = ty_array.ndim + const_axis_val
-        if const_axis_val < 0 or const_axis_val > ty_array.ndim:
-            raise ValueError("'axis' entry is out of bounds")
-
-        ty_axis = context.typing_context.resolve_value_type(const_axis_val)
-        axis_val = context.get_constant(ty_axis, const_axis_val)
-        # rewrite arguments
-        args = args[0], axis_val, args[2]
-        # rewrite sig
-        sig = sig.replace(args=[ty_array, ty_axis, ty_dtype])
-        is_axis_const = True
-
-    gen_impl = gen_sum_axis_impl(is_axis_const, const_axis_val, op, zero)
-    compiled = register_jitable(gen_impl)
-
-    def array_sum_impl_axis(arr, axis, dtype):
-        return compiled(arr, axis)
-
-    res = context.compile_internal(builder, array_sum_impl_axis, sig, args)
-    return impl_ret_new_ref(context, builder, sig.return_type, res)
+def _get_float_sum_impl(context, arrty, retty):
+    """
+    Return a function summing the elements of a 1d array of type *arrty*
+    to a *retty* float or complex number, or None if the array must be
+    iterated with np.nditer() instead.
+    """
+    if not (isinstance(retty, (types.Float, types.Complex)) and
+            arrty.dtype == retty):
+        return None
+    if arrty.ndim != 1 and arrty.layout not in 'CF':
+        return None
+    fastmath = context.fastmath
+    if (isinstance(retty, types.Float) and fastmath and
+            fastmath.reductions_can_reassociate):
+        return reassoc_sum
+    return pairwise_sum
 
 
-@lower_builtin(np.sum, types.Array,  types.DTypeSpec)
-@lower_builtin("array.sum", types.Array, types.DTypeSpec)
-def array_sum_dtype(context, builder, sig, args):
+@lower_builtin(np.sum, types.Array)
+@lower_builtin("array.sum", types.Array)
+def array_sum(context, builder, sig, args):
     zero = sig.return_type(0)
+    float_sum = _get_float_sum_impl(context, sig.args[0], sig.return_type)
 
-    def array_sum_impl(arr, dtype):
-        c = zero
-        for v in np.nditer(arr):
-            c += v.item()
-        return c
+    if float_sum is not None:
+        def array_sum_impl(arr):
+            return float_sum(_contiguous_1d_view(arr), zero)
+    else:
+        def array_sum_impl(arr):
+            c = zero
+            for v in np.nditer(arr):
+                c += v.item()
+            return c
 
     res = context.compile_internal(builder, array_sum_impl, sig, args,
                                    locals=dict(c=sig.return_type))
     return impl_ret_borrowed(context, builder, sig.return_type, res)
 
 
-@lower_builtin(np.sum, types.Array, types.intp)
-@lower_builtin(np.sum, types.Array, types.IntegerLiteral)
-@lower_builtin("array.sum", types.Array, types.intp)
-@lower_builtin("array.sum", types.Array, types.IntegerLiteral)
-def array_sum_axis(context, builder, sig, args):
-    retty = sig.return_type
-    zero = getattr(retty, 'dtype', retty)(0)
-    # if the return is scalar in type then "take" the 0th element of the
-    # 0d array accumulator as the return value
-    if getattr(retty, 'ndim', None) is None:
-        op = np.take
-    else:
-        op = _array_sum_axis_nop
-    [ty_array, ty_axis] = sig.args
-    is_axis_const = False
-    const_axis_val = 0
-    if isinstance(ty_axis, types.Literal):
-        # this special-cases for constant axis
-        const_axis_val = ty_axis.literal_value
-        # fix negative axis
-        if const_axis_val < 0:
-            const_axis_val = ty_array.ndim + const_axis_val
-        if const_axis_val < 0 or const_axis_val > ty_array.ndim:
-            raise ValueError("'axis' entry is out of bounds")
-
-        ty_axis = context.typing_context.resolve_value_type(const_axis_val)
-        axis_val = context.get_constant(ty_axis, const_axis_val)
-        # rewrite arguments
-        args = args[0], axis_val
-        # rewrite sig
-        sig = sig.replace(args=[ty_array, ty_axis])
-        is_axis_const = True
-
-    gen_impl = gen_sum_axis_impl(is_axis_const, const_axis_val, op, zero)
-    compiled = register_jitable(gen_impl)
-
-    def array_sum_impl_axis(arr, axis):
-        return compiled(arr, axis)
-
-    res = context.compile_internal(builder, array_sum_impl_axis, sig, args)
-    return impl_ret_new_ref(context, builder, sig.return_type, res)
-
-
 @lower_builtin(np.prod, types.Array)
 @lower_builtin("array.prod", types.Array)
 def array_prod(context, builder, sig, args):
@@ -403,14 +266,19 @@ def array_cumprod(context, builder, sig, args):
 @lower_builtin("array.mean", types.Array)
 def array_mean(context, builder, sig, args):
     zero = sig.return_type(0)
+    float_sum = _get_float_sum_impl(context, sig.args[0], sig.return_type)
 
-    def array_mean_impl(arr):
-        # Can't use the naive `arr.sum() / arr.size`, as it would return
-        # a wrong result on integer sum overflow.
-        c = zero
-        for v in np.nditer(arr):
-            c += v.item()
-        return c / arr.size
+    if float_sum is not None:
+        def array_mean_impl(arr):
+            return float_sum(_contiguous_1d_view(arr), zero) / arr.size
+    else:
+        def array_mean_impl(arr):
+            # Can't use the naive `arr.sum() / arr.size`, as it would return
+            # a wrong result on integer sum overflow.
+            c = zero
+            for v in np.nditer(arr):
+                c += v.item()
+            return c / arr.size
 
     res = context.compile_internal(builder, array_mean_impl, sig, args,
                                    locals=dict(c=sig.return_type))
@@ -773,10 +641,530 @@ def array_argmax(context, builder, sig, args):
     return impl_ret_untracked(context, builder, sig.return_type, res)
 
 
+#----------------------------------------------------------------------------
+# Reductions along axes
+#
+# The array is reduced as a 1d C-contiguous buffer with an (outer, n, inner)
+# shape, the n elements along the middle axis being reduced together.  When
+# inner == 1 each result reduces a contiguous run of the buffer; otherwise
+# the results are updated a row of the buffer at a time, so that both the
+# buffer and the results are walked in memory order.  The results are split
+# into tasks of consecutive elements, which run in parallel in the parallel
+# variants.
+
+# Number of results updated together by a task when inner > 1
+REDUCE_BLOCKSIZE = 1024
+
+
+@register_jitable
+def _normalize_reduce_axis(ndim, axis):
+    if axis < -ndim or axis >= ndim:
+        raise ValueError("axis is out of bounds for array")
+    if axis < 0:
+        axis += ndim
+    return axis
+
+
+def _reduced_axes(ndim, axis):
+    """
+    Return a boolean array flagging which of the *ndim* axes are reduced
+    along *axis*: None, an integer or a tuple of integers.
+    """
+    raise NotImplementedError
+
+
+@overload(_reduced_axes)
+def _ol_reduced_axes(ndim, axis):
+    if is_nonelike(axis):
+        def impl(ndim, axis):
+            return np.ones(ndim, np.bool_)
+    elif isinstance(axis, types.Integer):
+        def impl(ndim, axis):
+            reduced = np.zeros(ndim, np.bool_)
+            reduced[_normalize_reduce_axis(ndim, axis)] = True
+            return reduced
+    elif isinstance(axis, types.BaseTuple) and len(axis) == 0:
+        def impl(ndim, axis):
+            return np.zeros(ndim, np.bool_)
+    elif isinstance(axis, types.BaseTuple):
+        def impl(ndim, axis):
+            reduced = np.zeros(ndim, np.bool_)
+            for ax in literal_unroll(axis):
+                ax = _normalize_reduce_axis(ndim, ax)
+                if reduced[ax]:
+                    raise ValueError("duplicate value in 'axis'")
+                reduced[ax] = True
+            return reduced
+    else:
+        return None
+    return impl
+
+
+def _reduction_lanes(a, reduced):
+    """
+    Return a 1d C-contiguous array of the elements of *a* whose
+    (outer, n, inner) reshaping has the axes flagged in *reduced* along its
+    middle axis, followed by outer, n and inner.  *a* is only copied if it
+    is not C-contiguous or if the reduced axes are not consecutive.
+    """
+    raise NotImplementedError
+
+
+@overload(_reduction_lanes)
+def _ol_reduction_lanes(a, reduced):
+    ndim = a.ndim
+
+    @register_jitable
+    def consecutive_lanes(a, reduced):
+        shape = a.shape
+        outer = 1
+        n = 1
+        inner = 1
+        after = False
+        for i in range(ndim):
+            if reduced[i]:
+                n *= shape[i]
+                after = True
+            elif after:
+                inner *= shape[i]
+            else:
+                outer *= shape[i]
+        src = np.ascontiguousarray(a)
+        return src.reshape(src.size), outer, n, inner
+
+    if ndim < 3:
+        # The reduced axes are always consecutive
+        return consecutive_lanes
+
+    def impl(a, reduced):
+        # Count the runs of consecutive reduced axes
+        nruns = 0
+        for i in range(ndim):
+            if reduced[i] and (i == 0 or not reduced[i - 1]):
+                nruns += 1
+        if nruns <= 1:
+            return consecutive_lanes(a, reduced)
+        # Move the reduced axes last, which needs a copy
+        shape = a.shape
+        perm = np.empty(ndim, np.intp)
+        outer = 1
+        n = 1
+        k = 0
+        for i in range(ndim):
+            if not reduced[i]:
+                perm[k] = i
+                outer *= shape[i]
+                k += 1
+        for i in range(ndim):
+            if reduced[i]:
+                perm[k] = i
+                n *= shape[i]
+                k += 1
+        src = np.ascontiguousarray(a.transpose(to_fixed_tuple(perm, ndim)))
+        return src.reshape(src.size), outer, n, 1
+
+    return impl
+
+
+@register_jitable
+def _reduction_shape(shape, reduced, keepdims):
+    """
+    Return the shape of the reduction along the *reduced* axes of an array
+    of the given *shape*, as an array.
+    """
+    res = np.empty(len(shape), np.intp)
+    k = 0
+    for i in range(len(shape)):
+        if not reduced[i]:
+            res[k] = shape[i]
+            k += 1
+        elif keepdims:
+            res[k] = 1
+            k += 1
+    return res[:k]
+
+
+def _make_reduce_kernel(init, combine, final, reduce_run, wrap, prange):
+    """
+    Make a function reducing the (outer, n, inner) lanes of a 1d buffer
+    into *out*, an array of outer * inner results.  *init()* returns the
+    initial accumulator, *combine(acc, v)* accumulates an element into it
+    and *final(acc, n)* makes the result from it.  *reduce_run(src, start,
+    stop)*, if given, returns the accumulator of a contiguous run.
+    """
+    if reduce_run is None:
+        @register_jitable
+        def reduce_run(src, start, stop):
+            acc = init()
+            for i in range(start, stop):
+                acc = combine(acc, src[i])
+            return acc
+
+    @wrap
+    def reduce_lanes(src, outer, n, inner, out):
+        nblocks = (inner + REDUCE_BLOCKSIZE - 1) // REDUCE_BLOCKSIZE
+        for t in prange(outer * nblocks):
+            o = t // nblocks
+            lo = o * inner + (t - o * nblocks) * REDUCE_BLOCKSIZE
+            hi = min(lo + REDUCE_BLOCKSIZE, (o + 1) * inner)
+            # The k-th element reduced into out[j] is src[base + k * inner + j]
+            base = o * (n - 1) * inner
+            if inner == 1:
+                out[lo] = final(reduce_run(src, base + lo, base + lo + n), n)
+            else:
+                for j in range(lo, hi):
+                    out[j] = init()
+                for k in range(n):
+                    row = base + k * inner
+                    for j in range(lo, hi):
+                        out[j] = combine(out[j], src[row + j])
+                for j in range(lo, hi):
+                    out[j] = final(out[j], n)
+
+    return reduce_lanes
+
+
+def _make_var_kernel(zero, finish, wrap, prange):
+    """
+    Make a function computing the variances of the (outer, n, inner) lanes
+    of a 1d buffer into *out*.  *zero* is the zero of the type of the means
+    and *finish* is applied to the variances.
+    """
+    @wrap
+    def var_lanes(src, outer, n, inner, out):
+        nblocks = (inner + REDUCE_BLOCKSIZE - 1) // REDUCE_BLOCKSIZE
+        for t in prange(outer * nblocks):
+            o = t // nblocks
+            lo = o * inner + (t - o * nblocks) * REDUCE_BLOCKSIZE
+            hi = min(lo + REDUCE_BLOCKSIZE, (o + 1) * inner)
+            base = o * (n - 1) * inner
+            if n == 0:
+                for j in range(lo, hi):
+                    out[j] = np.nan
+            elif inner == 1:
+                start = base + lo
+                m = zero
+                for i in range(start, start + n):
+                    m += src[i]
+                m /= n
+                ssd = 0.0
+                for i in range(start, start + n):
+                    d = src[i] - m
+                    ssd += np.real(d * np.conj(d))
+                out[lo] = finish(ssd / n)
+            else:
+                means = np.full(hi - lo, zero)
+                for k in range(n):
+                    row = base + k * inner
+                    for j in range(lo, hi):
+                        means[j - lo] += src[row + j]
+                for j in range(lo, hi):
+                    means[j - lo] /= n
+                    out[j] = 0
+                for k in range(n):
+                    row = base + k * inner
+                    for j in range(lo, hi):
+                        d = src[row + j] - means[j - lo]
+                        out[j] += np.real(d * np.conj(d))
+                for j in range(lo, hi):
+                    out[j] = finish(out[j] / n)
+
+    return var_lanes
+
+
+def _make_argreduce_kernel(better, wrap, prange):
+    """
+    Make a function writing into *out* the position along the middle axis
+    of the best element of each of the (outer, n > 0, inner) lanes of a 1d
+    buffer, the first one of equally good elements.  *better(v, best)*
+    tells whether v is better than best.
+    """
+    @wrap
+    def argreduce_lanes(src, outer, n, inner, out):
+        nblocks = (inner + REDUCE_BLOCKSIZE - 1) // REDUCE_BLOCKSIZE
+        for t in prange(outer * nblocks):
+            o = t // nblocks
+            lo = o * inner + (t - o * nblocks) * REDUCE_BLOCKSIZE
+            hi = min(lo + REDUCE_BLOCKSIZE, (o + 1) * inner)
+            base = o * (n - 1) * inner
+            if inner == 1:
+                start = base + lo
+                best = src[start]
+                idx = 0
+                for k in range(1, n):
+                    v = src[start + k]
+                    if better(v, best):
+                        best = v
+                        idx = k
+                out[lo] = idx
+            else:
+                bests = src[base + lo:base + hi].copy()
+                for j in range(lo, hi):
+                    out[j] = 0
+                for k in range(1, n):
+                    row = base + k * inner
+                    for j in range(lo, hi):
+                        v = src[row + j]
+                        if better(v, bests[j - lo]):
+                            bests[j - lo] = v
+                            out[j] = k
+
+    return argreduce_lanes
+
+
+def _axis_reduction_kernel(name, arrty, dtype, wrap, prange):
+    """
+    Return the kernel of the reduction *name* of arrays of type *arrty*
+    to elements of type *dtype*.
+    """
+    isnan = get_isnan(arrty.dtype)
+
+    if name in ('argmin', 'argmax'):
+        if name == 'argmin':
+            @register_jitable
+            def better(v, best):
+                return v < best or (isnan(v) and not isnan(best))
+        else:
+            @register_jitable
+            def better(v, best):
+                return v > best or (isnan(v) and not isnan(best))
+        return _make_argreduce_kernel(better, wrap, prange)
+
+    if name in ('var', 'std'):
+        if isinstance(arrty.dtype, types.Complex):
+            zero = arrty.dtype(0)
+        else:
+            zero = dtype(0)
+        if name == 'std':
+            @register_jitable
+            def finish(v):
+                return np.sqrt(v)
+        else:
+            @register_jitable
+            def finish(v):
+                return v
+        return _make_var_kernel(zero, finish, wrap, prange)
+
+    if name == 'mean':
+        @register_jitable
+        def final(acc, n):
+            if n == 0:
+                return acc * np.nan
+            return acc / n
+    else:
+        @register_jitable
+        def final(acc, n):
+            return acc
+
+    reduce_run = None
+    if name in ('sum', 'mean'):
+        zero = dtype(0)
+
+        @register_jitable
+        def init():
+            return zero
+
+        @register_jitable
+        def combine(acc, v):
+            return acc + v
+
+        if (isinstance(dtype, (types.Float, types.Complex)) and
+                arrty.dtype == dtype):
+            # Same accuracy as the sums of whole arrays
+            @register_jitable
+            def pairwise_run(src, start, stop):
+                return pairwise_sum(src[start:stop], zero)
+
+            reduce_run = pairwise_run
+
+    elif name == 'prod':
+        one = dtype(1)
+
+        @register_jitable
+        def init():
+            return one
+
+        @register_jitable
+        def combine(acc, v):
+            return acc * v
+
+    elif name in ('min', 'max'):
+        # NaNs propagate, so that the start value can be an infinity
+        if isinstance(dtype, types.Float):
+            start = dtype(np.inf if name == 'min' else -np.inf)
+        elif isinstance(dtype, types.Boolean):
+            start = dtype(name == 'min')
+        else:
+            start = dtype(dtype.maxval if name == 'min' else dtype.minval)
+
+        @register_jitable
+        def init():
+            return start
+
+        if name == 'min':
+            @register_jitable
+            def combine(acc, v):
+                if v < acc or isnan(v):
+                    return v
+                return acc
+        else:
+            @register_jitable
+            def combine(acc, v):
+                if v > acc or isnan(v):
+                    return v
+                return acc
+
+    elif name == 'any':
+        @register_jitable
+        def init():
+            return False
+
+        @register_jitable
+        def combine(acc, v):
+            return acc or v != 0
+
+    elif name == 'all':
+        @register_jitable
+        def init():
+            return True
+
+        @register_jitable
+        def combine(acc, v):
+            return acc and v != 0
+
+    else:
+        raise ValueError("unknown reduction {!r}".format(name))
+
+    return _make_reduce_kernel(init, combine, final, reduce_run, wrap,
+                               prange)
+
+
+_empty_reduction_msgs = {
+    'min': zero_dim_msg('minimum'),
+    'max': zero_dim_msg('maximum'),
+    'argmin': "attempt to get argmin of an empty sequence",
+    'argmax': "attempt to get argmax of an empty sequence",
+}
+
+_axis_reductions = {}
+
+
+def get_axis_reduction(name, arrty, return_type, parallel=False):
+    """
+    Return a function computing the reduction *name* (e.g. 'sum') of an
+    array of type *arrty* along an axis argument: None, an integer or a
+    tuple of integers.  *return_type* tells the type of the elements of the
+    result, and whether the reduced axes are kept.  If *parallel* is true,
+    the results are computed in parallel.
+    """
+    dtype = getattr(return_type, 'dtype', return_type)
+    out_ndim = getattr(return_type, 'ndim', 0)
+    keepdims = out_ndim == arrty.ndim
+    key = name, arrty.dtype, dtype, out_ndim, keepdims, parallel
+    try:
+        return _axis_reductions[key]
+    except KeyError:
+        pass
+
+    if parallel:
+        from numba import njit, prange
+        # NOTE: wrap with njit(parallel=True) so that the prange loop runs
+        #       on the threading layer, whatever the caller's options are
+        kernel = _axis_reduction_kernel(name, arrty, dtype,
+                                        njit(parallel=True), prange)
+    else:
+        kernel = _axis_reduction_kernel(name, arrty, dtype,
+                                        register_jitable, range)
+    np_dtype = as_dtype(dtype)
+    check_empty = name in _empty_reduction_msgs
+    empty_msg = _empty_reduction_msgs.get(name, "")
+
+    @register_jitable
+    def reduce_into(a, axis):
+        reduced = _reduced_axes(a.ndim, axis)
+        src, outer, n, inner = _reduction_lanes(a, reduced)
+        if check_empty and n == 0:
+            raise ValueError(empty_msg)
+        out = np.empty(outer * inner, np_dtype)
+        kernel(src, outer, n, inner, out)
+        return out, reduced
+
+    if out_ndim == 0:
+        @register_jitable
+        def reduce_axis(a, axis):
+            out, reduced = reduce_into(a, axis)
+            return out[0]
+    else:
+        @register_jitable
+        def reduce_axis(a, axis):
+            out, reduced = reduce_into(a, axis)
+            shape = _reduction_shape(a.shape, reduced, keepdims)
+            return out.reshape(to_fixed_tuple(shape, out_ndim))
+
+    _axis_reductions[key] = reduce_axis
+    return reduce_axis
+
+
+def _lower_axis_reduction(name):
+    def array_reduce_axis(context, builder, sig, args):
+        arrty, axisty = sig.args[:2]
+        if isinstance(axisty, types.IntegerLiteral):
+            # A constant axis is checked at compile time
+            axis = axisty.literal_value
+            if axis < -arrty.ndim or axis >= arrty.ndim:
+                raise ValueError("'axis' entry is out of bounds")
+        reduce_axis = get_axis_reduction(name, arrty, sig.return_type)
+        # The other arguments only determine the return type
+        sig = signature(sig.return_type, arrty, axisty)
+        if is_nonelike(axisty):
+            def impl(a, axis):
+                return reduce_axis(a, None)
+        else:
+            def impl(a, axis):
+                return reduce_axis(a, axis)
+        res = context.compile_internal(builder, impl, sig, args[:2])
+        return impl_ret_new_ref(context, builder, sig.return_type, res)
+
+    return array_reduce_axis
+
+
+def _install_axis_reduction(name, nargs):
+    argtys = (types.Array,) + (types.Any,) * nargs
+    impl = _lower_axis_reduction(name)
+    lower_builtin(getattr(np, name), *argtys)(impl)
+    lower_builtin("array." + name, *argtys)(impl)
+
+
+# The number of arguments after the array, see arraydecl.axis_reduction()
+_install_axis_reduction('sum', 3)
+for _name in ('prod', 'mean', 'var', 'std', 'min', 'max'):
+    _install_axis_reduction(_name, 2)
+for _name in ('argmin', 'argmax'):
+    _install_axis_reduction(_name, 1)
+
+
+def _any_all_axis(name, a, axis, keepdims):
+    if not isinstance(a, types.Array):
+        raise TypingError("np.{}() with an axis requires an array".format(name))
+    return_type = reduction_return_type(a, types.boolean, axis,
+                                        literal_flag(keepdims, 'keepdims'))
+    reduce_axis = get_axis_reduction(name, a, return_type)
+    if is_nonelike(axis):
+        def impl(a, axis=None, keepdims=False):
+            return reduce_axis(a, None)
+    else:
+        def impl(a, axis=None, keepdims=False):
+            return reduce_axis(a, axis)
+    return impl
+
+
 @overload(np.all)
 @overload_method(types.Array, "all")
-def np_all(a):
-    def flat_all(a):
+def np_all(a, axis=None, keepdims=False):
+    if not is_nonelike(axis) or literal_flag(keepdims, 'keepdims'):
+        return _any_all_axis('all', a, axis, keepdims)
+
+    def flat_all(a, axis=None, keepdims=False):
         for v in np.nditer(a):
             if not v.item():
                 return False
@@ -787,8 +1175,11 @@ def np_all(a):
 
 @overload(np.any)
 @overload_method(types.Array, "any")
-def np_any(a):
-    def flat_any(a):
+def np_any(a, axis=None, keepdims=False):
+    if not is_nonelike(axis) or literal_flag(keepdims, 'keepdims'):
+        return _any_all_axis('any', a, axis, keepdims)
+
+    def flat_any(a, axis=None, keepdims=False):
         for v in np.nditer(a):
             if v.item():
                 return True
@@ -1210,6 +1601,58 @@ _select = register_jitable(_select_factory(_partition))
 _select_w_nan = register_jitable(_select_factory(_partition_w_nan))
 
 
+def _argpartition_factory(pivotimpl):
+    def _argpartition(A, I, low, high):
+        """
+        As _partition(), but on the indices I[low:high + 1] of the values
+        of A.
+        """
+        mid = (low + high) >> 1
+        if pivotimpl(A[I[mid]], A[I[low]]):
+            I[low], I[mid] = I[mid], I[low]
+        if pivotimpl(A[I[high]], A[I[mid]]):
+            I[high], I[mid] = I[mid], I[high]
+        if pivotimpl(A[I[mid]], A[I[low]]):
+            I[low], I[mid] = I[mid], I[low]
+        pivot = A[I[mid]]
+
+        I[high], I[mid] = I[mid], I[high]
+        i = low
+        j = high - 1
+        while True:
+            while i < high and pivotimpl(A[I[i]], pivot):
+                i += 1
+            while j >= low and pivotimpl(pivot, A[I[j]]):
+                j -= 1
+            if i >= j:
+                break
+            I[i], I[j] = I[j], I[i]
+            i += 1
+            j -= 1
+        I[i], I[high] = I[high], I[i]
+        return i
+    return _argpartition
+
+
+_argpartition_w_nan = register_jitable(
+    _argpartition_factory(nan_aware_less_than))
+
+
+@register_jitable
+def _argselect_w_nan(A, I, k, low, high):
+    """
+    Move the index of the k'th smallest element of A to I[k], considering
+    the indices I[low:high + 1].
+    """
+    i = _argpartition_w_nan(A, I, low, high)
+    while i != k:
+        if i < k:
+            low = i + 1
+        else:
+            high = i - 1
+        i = _argpartition_w_nan(A, I, low, high)
+
+
 @register_jitable
 def _select_two(arry, k, low, high):
     """
@@ -1516,6 +1959,25 @@ def valid_kths(a, kth):
     return np.unique(out)
 
 
+@register_jitable
+def np_argpartition_impl_inner(a, kth_array):
+    out = np.empty(a.shape, np.intp)
+
+    idx = np.ndindex(a.shape[:-1])  # Numpy default partition axis is -1
+    for s in idx:
+        arry = a[s]
+        indices = np.arange(len(arry))
+        low = 0
+        high = len(arry) - 1
+
+        for kth in kth_array:
+            _argselect_w_nan(arry, indices, kth, low, high)
+            low = kth  # narrow span of subsequent partition
+
+        out[s] = indices
+    return out
+
+
 @overload(np.partition)
 def np_partition(a, kth):
 
@@ -1541,6 +2003,31 @@ def np_partition(a, kth):
     return np_partition_impl
 
 
+@overload(np.argpartition)
+def np_argpartition(a, kth):
+
+    if not isinstance(a, (types.Array, types.Sequence, types.Tuple)):
+        raise TypeError('The first argument must be an array-like')
+
+    if isinstance(a, types.Array) and a.ndim == 0:
+        raise TypeError('The first argument must be at least 1-D (found 0-D)')
+
+    kthdt = getattr(kth, 'dtype', kth)
+    if not isinstance(kthdt, (types.Boolean, types.Integer)):
+        # bool gets cast to int subsequently
+        raise TypeError('Partition index must be integer')
+
+    def np_argpartition_impl(a, kth):
+        a_tmp = _asarray(a)
+        if a_tmp.size == 0:
+            return np.empty(a_tmp.shape, np.intp)
+        else:
+            kth_array = valid_kths(a_tmp, kth)
+            return np_argpartition_impl_inner(a_tmp, kth_array)
+
+    return np_argpartition_impl
+
+
 #----------------------------------------------------------------------------
 # Building matrices
 
@@ -3442,58 +3929,6 @@ def validate_1d_array_like(func_name, seq):
                         .format(func_name))
 
 
-@overload(np.bincount)
-def np_bincount(a, weights=None):
-    validate_1d_array_like("bincount", a)
-    if not isinstance(a.dtype, types.Integer):
-        return
-
-    if weights not in (None, types.none):
-        validate_1d_array_like("bincount", weights)
-        # weights is promoted to double in C impl
-        # https://github.com/numpy/numpy/blob/maintenance/1.16.x/numpy/core/src/multiarray/compiled_base.c#L93-L95    # noqa: E501
-        out_dtype = np.float64
-
-        @register_jitable
-        def validate_inputs(a, weights):
-            if len(a) != len(weights):
-                raise ValueError("bincount(): weights and list don't have "
-                                 "the same length")
-
-        @register_jitable
-        def count_item(out, idx, val, weights):
-            out[val] += weights[idx]
-
-    else:
-        out_dtype = types.intp
-
-        @register_jitable
-        def validate_inputs(a, weights):
-            pass
-
-        @register_jitable
-        def count_item(out, idx, val, weights):
-            out[val] += 1
-
-    def bincount_impl(a, weights=None):
-        validate_inputs(a, weights)
-        n = len(a)
-
-        a_max = a[0] if n > 0 else -1
-        for i in range(1, n):
-            if a[i] < 0:
-                raise ValueError("bincount(): first argument must be "
-                                 "non-negative")
-            a_max = max(a_max, a[i])
-
-        out = np.zeros(a_max + 1, out_dtype)
-        for i in range(n):
-            count_item(out, i, a[i], weights)
-        return out
-
-    return bincount_impl
-
-
 def _searchsorted(func):
     def searchsorted_inner(a, v):
         n = len(a)
@@ -3688,92 +4123,710 @@ def np_digitize(x, bins, right=False):
         return digitize_impl
 
 
+#----------------------------------------------------------------------------
+# Histograms
+
+# Array size smaller than this is binned by a single thread
+SMALL_HISTOGRAM = 1 << 14
+
+
+HistogramImplementation = namedtuple('HistogramImplementation', [
+    'bin_counts',
+    'bincount_size',
+    'bin_integers',
+])
+
+
+def _hist_weight(weights, i):
+    """
+    Return the weight of the *i*-th element, which is 1 without *weights*.
+    """
+    raise NotImplementedError
+
+
+@overload(_hist_weight)
+def _ol_hist_weight(weights, i):
+    if is_nonelike(weights):
+        def impl(weights, i):
+            return 1
+    else:
+        def impl(weights, i):
+            return weights[i]
+    return impl
+
+
+@register_jitable
+def _locate_bin(v, edges, uniform):
+    """
+    Return the bin of the value *v* given the bin *edges*, or -1 if *v* is
+    out of the bins or NaN.  The last bin includes its right edge.  With
+    *uniform* edges, the bin is computed directly and then adjusted for
+    the rounding of the edges, as Numpy does.
+    """
+    nbins = len(edges) - 1
+    if nbins <= 0:
+        return -1
+    first = edges[0]
+    last = edges[nbins]
+    if not first <= v <= last:
+        return -1
+    if uniform:
+        b = min(int((v - first) * (nbins / (last - first))), nbins - 1)
+        if v < edges[b]:
+            b -= 1
+        elif b < nbins - 1 and v >= edges[b + 1]:
+            b += 1
+        return b
+    # Bisect in edges[:-1]
+    lo = 0
+    hi = nbins - 1
+    while lo < hi:
+        # Note the `+ 1` is necessary to avoid an infinite
+        # loop where mid = lo => lo = mid
+        mid = (lo + hi + 1) >> 1
+        if v < edges[mid]:
+            hi = mid - 1
+        else:
+            lo = mid
+    return lo
+
+
+def _make_histogram_impl(wrap, prange, get_num_threads):
+    """
+    Make the binning kernels.  Each thread bins a chunk of the elements in
+    private bins, which are summed at the end, so that threads never
+    update the same bins.
+    """
+
+    @register_jitable
+    def num_chunks(n, nbins):
+        # The private bins take no more memory than the elements
+        return max(1, min(get_num_threads(),
+                          n // max(nbins, SMALL_HISTOGRAM)))
+
+    @wrap
+    def merge_bins(private, out):
+        nchunks, nbins = private.shape
+        for b in prange(nbins):
+            acc = out[b]
+            for c in range(nchunks):
+                acc += private[c, b]
+            out[b] = acc
+        return out
+
+    @wrap
+    def bin_counts(coords, edges, uniform, weights, hist):
+        """
+        Add the (weighted) counts of the points whose coordinates along
+        each dimension d are in coords[d] to the bins delimited by
+        edges[d], the flat *hist* being in C order.
+        """
+        ndim = len(coords)
+        n = coords[0].size
+        nbins = hist.size
+        strides = np.empty(ndim, np.intp)
+        stride = 1
+        for d in range(ndim - 1, -1, -1):
+            strides[d] = stride
+            stride *= len(edges[d]) - 1
+
+        nchunks = num_chunks(n, nbins)
+        chunk = (n + nchunks - 1) // nchunks
+        private = np.zeros((nchunks, nbins), hist.dtype)
+        for c in prange(nchunks):
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                flat = 0
+                for d in range(ndim):
+                    b = _locate_bin(coords[d][i], edges[d], uniform[d])
+                    if b < 0:
+                        flat = -1
+                        break
+                    flat += b * strides[d]
+                if flat >= 0:
+                    private[c, flat] += _hist_weight(weights, i)
+        return merge_bins(private, hist)
+
+    @wrap
+    def bincount_size(a, minlength):
+        """
+        Return the number of bins of np.bincount(a, minlength=minlength).
+        """
+        n = a.size
+        nchunks = num_chunks(n, 1)
+        chunk = (n + nchunks - 1) // nchunks
+        maxes = np.empty(nchunks, np.intp)
+        negative = np.zeros(nchunks, np.bool_)
+        for c in prange(nchunks):
+            m = -1
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                v = np.intp(a[i])
+                if v < 0:
+                    negative[c] = True
+                elif v > m:
+                    m = v
+            maxes[c] = m
+        if negative.any():
+            raise ValueError("bincount(): first argument must be "
+                             "non-negative")
+        return max(maxes.max() + 1, minlength)
+
+    @wrap
+    def bin_integers(a, weights, out):
+        n = a.size
+        nchunks = num_chunks(n, out.size)
+        chunk = (n + nchunks - 1) // nchunks
+        private = np.zeros((nchunks, out.size), out.dtype)
+        for c in prange(nchunks):
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                private[c, a[i]] += _hist_weight(weights, i)
+        return merge_bins(private, out)
+
+    return HistogramImplementation(bin_counts=bin_counts,
+                                   bincount_size=bincount_size,
+                                   bin_integers=bin_integers)
+
+
+@register_jitable
+def _single_thread():
+    return 1
+
+
+_histogram_kernels = {}
+
+
+def get_histogram_kernels(parallel=False):
+    """
+    Return the binning kernels, which bin in parallel if *parallel* is
+    true.
+    """
+    try:
+        return _histogram_kernels[parallel]
+    except KeyError:
+        pass
+    if parallel:
+        from numba import njit, prange, get_num_threads
+        # NOTE: wrap with njit(parallel=True) so that the prange loops run
+        #       on the threading layer, whatever the caller's options are
+        kernels = _make_histogram_impl(njit(parallel=True), prange,
+                                       get_num_threads)
+    else:
+        kernels = _make_histogram_impl(register_jitable, range,
+                                       _single_thread)
+    _histogram_kernels[parallel] = kernels
+    return kernels
+
+
+def _unomitted(ty):
+    return ty.value if isinstance(ty, types.Omitted) else ty
+
+
+def _density_flag(density):
+    density = _unomitted(density)
+    return not is_nonelike(density) and literal_flag(density, 'density')
+
+
+_bincount_impls = {}
+
+
+def get_bincount_impl(a, weights, parallel=False):
+    """
+    Return a function computing np.bincount(a, weights, minlength) for the
+    argument types *a* and *weights*, or None if they are not supported.
+    """
+    validate_1d_array_like("bincount", a)
+    if not isinstance(a.dtype, types.Integer):
+        return None
+    has_weights = not is_nonelike(_unomitted(weights))
+    if has_weights:
+        validate_1d_array_like("bincount", weights)
+    key = has_weights, parallel
+    try:
+        return _bincount_impls[key]
+    except KeyError:
+        pass
+
+    if has_weights:
+        # weights is promoted to double in C impl
+        # https://github.com/numpy/numpy/blob/maintenance/1.16.x/numpy/core/src/multiarray/compiled_base.c#L93-L95    # noqa: E501
+        out_dtype = np.float64
+
+        @register_jitable
+        def as_weights(a, weights):
+            if len(a) != len(weights):
+                raise ValueError("bincount(): weights and list don't have "
+                                 "the same length")
+            return np.asarray(weights)
+
+    else:
+        out_dtype = np.intp
+
+        @register_jitable
+        def as_weights(a, weights):
+            return None
+
+    kernels = get_histogram_kernels(parallel)
+    bincount_size = kernels.bincount_size
+    bin_integers = kernels.bin_integers
+
+    @register_jitable
+    def bincount_impl(a, weights=None, minlength=0):
+        w = as_weights(a, weights)
+        if minlength < 0:
+            raise ValueError("bincount(): minlength must be non-negative")
+        arr = np.asarray(a)
+        out = np.zeros(bincount_size(arr, minlength), out_dtype)
+        return bin_integers(arr, w, out)
+
+    _bincount_impls[key] = bincount_impl
+    return bincount_impl
+
+
+@overload(np.bincount)
+def np_bincount(a, weights=None, minlength=0):
+    bincount_impl = get_bincount_impl(a, weights)
+    if bincount_impl is None:
+        return
+
+    def np_bincount_impl(a, weights=None, minlength=0):
+        return bincount_impl(a, weights, minlength)
+    return np_bincount_impl
+
+
 _range = range
 
 
-@overload(np.histogram)
-def np_histogram(a, bins=10, range=None):
-    if isinstance(bins, (int, types.Integer)):
-        # With a uniform distribution of bins, use a fast algorithm
-        # independent of the number of bins
+@register_jitable
+def _autorange(a):
+    """
+    Return the range of the non-NaN values of the array *a*, or (0, 1) if
+    there are none.
+    """
+    bin_min = np.inf
+    bin_max = -np.inf
+    for view in np.nditer(a):
+        v = view.item()
+        if bin_min > v:
+            bin_min = v
+        if bin_max < v:
+            bin_max = v
+    if bin_min > bin_max:
+        return 0.0, 1.0
+    return bin_min, bin_max
+
+
+@register_jitable
+def _uniform_edges(bins, bin_min, bin_max):
+    """
+    Return the edges of *bins* equal bins between *bin_min* and *bin_max*,
+    the range being widened if empty.
+    """
+    if bins <= 0:
+        raise ValueError("histogram(): `bins` should be a "
+                         "positive integer")
+    if not bin_min <= bin_max:
+        raise ValueError("histogram(): max must be larger than "
+                         "min in range parameter")
+    first = float(bin_min)
+    last = float(bin_max)
+    if not (math.isfinite(first) and math.isfinite(last)):
+        raise ValueError("histogram(): range is not finite")
+    if first == last:
+        first -= 0.5
+        last += 0.5
+    return np.linspace(first, last, bins + 1)
 
-        if range in (None, types.none):
-            inf = float('inf')
 
-            def histogram_impl(a, bins=10, range=None):
-                bin_min = inf
-                bin_max = -inf
-                for view in np.nditer(a):
-                    v = view.item()
-                    if bin_min > v:
-                        bin_min = v
-                    if bin_max < v:
-                        bin_max = v
-                return np.histogram(a, bins, (bin_min, bin_max))
+@register_jitable
+def _check_edges(bins):
+    for i in _range(len(bins) - 1):
+        # Note this also catches NaNs
+        if not bins[i] <= bins[i + 1]:
+            raise ValueError("histogram(): bins must increase "
+                             "monotonically")
+    return bins
+
 
+@register_jitable
+def _density_nd(hist, edges):
+    """
+    Return the density of the flat C-ordered *hist* of the bins delimited
+    by the tuple of *edges*.
+    """
+    total = hist.sum()
+    out = np.empty(hist.size)
+    for k in _range(hist.size):
+        width = 1.0
+        rem = k
+        for d in _range(len(edges) - 1, -1, -1):
+            nbins = len(edges[d]) - 1
+            b = rem % nbins
+            rem //= nbins
+            width *= edges[d][b + 1] - edges[d][b]
+        out[k] = hist[k] / width / total
+    return out
+
+
+_histogram_impls = {}
+
+
+def get_histogram_impl(a, bins, range, density, weights, parallel=False):
+    """
+    Return a function computing np.histogram() for the argument types
+    *a*, *bins*, *range*, *density* and *weights*, or None if they are
+    not supported.  If *parallel* is true, the elements are binned in
+    parallel.
+    """
+    if not isinstance(a, types.Array):
+        return None
+    bins = _unomitted(bins)
+    range = _unomitted(range)
+    weights = _unomitted(weights)
+    density = _density_flag(density)
+    uniform = isinstance(bins, (int, types.Integer))
+    if not uniform and not (isinstance(bins, types.Array) and
+                            bins.ndim == 1):
+        raise TypingError("histogram(): bins should be an integer or a "
+                          "1-D array")
+    if is_nonelike(weights):
+        hist_dtype = np.intp
+    elif isinstance(weights, types.Array) and weights.ndim == a.ndim:
+        hist_dtype = as_dtype(weights.dtype)
+    else:
+        raise TypingError("histogram(): weights should be an array of "
+                          "the same shape as a")
+    key = uniform, is_nonelike(range), hist_dtype, density, parallel
+    try:
+        return _histogram_impls[key]
+    except KeyError:
+        pass
+
+    if uniform:
+        # With a uniform distribution of bins, use a fast algorithm
+        # independent of the number of bins
+        if is_nonelike(range):
+            @register_jitable
+            def get_edges(a, bins, range):
+                bin_min, bin_max = _autorange(a)
+                return _uniform_edges(bins, bin_min, bin_max), True
         else:
-            def histogram_impl(a, bins=10, range=None):
-                if bins <= 0:
-                    raise ValueError("histogram(): `bins` should be a "
-                                     "positive integer")
+            @register_jitable
+            def get_edges(a, bins, range):
                 bin_min, bin_max = range
-                if not bin_min <= bin_max:
-                    raise ValueError("histogram(): max must be larger than "
-                                     "min in range parameter")
-
-                hist = np.zeros(bins, np.intp)
-                if bin_max > bin_min:
-                    bin_ratio = bins / (bin_max - bin_min)
-                    for view in np.nditer(a):
-                        v = view.item()
-                        b = math.floor((v - bin_min) * bin_ratio)
-                        if 0 <= b < bins:
-                            hist[int(b)] += 1
-                        elif v == bin_max:
-                            hist[bins - 1] += 1
-
-                bins_array = np.linspace(bin_min, bin_max, bins + 1)
-                return hist, bins_array
-
+                return _uniform_edges(bins, bin_min, bin_max), True
     else:
         # With a custom bins array, use a bisection search
+        @register_jitable
+        def get_edges(a, bins, range):
+            return _check_edges(bins), False
 
-        def histogram_impl(a, bins=10, range=None):
-            nbins = len(bins) - 1
-            for i in _range(nbins):
-                # Note this also catches NaNs
-                if not bins[i] <= bins[i + 1]:
-                    raise ValueError("histogram(): bins must increase "
-                                     "monotonically")
-
-            bin_min = bins[0]
-            bin_max = bins[nbins]
-            hist = np.zeros(nbins, np.intp)
-
-            if nbins > 0:
-                for view in np.nditer(a):
-                    v = view.item()
-                    if not bin_min <= v <= bin_max:
-                        # Value is out of bounds, ignore (also catches NaNs)
-                        continue
-                    # Bisect in bins[:-1]
-                    lo = 0
-                    hi = nbins - 1
-                    while lo < hi:
-                        # Note the `+ 1` is necessary to avoid an infinite
-                        # loop where mid = lo => lo = mid
-                        mid = (lo + hi + 1) >> 1
-                        if v < bins[mid]:
-                            hi = mid - 1
-                        else:
-                            lo = mid
-                    hist[lo] += 1
-
-            return hist, bins
+    if hist_dtype is np.intp:
+        @register_jitable
+        def flat_weights(a, weights):
+            return None
+    else:
+        @register_jitable
+        def flat_weights(a, weights):
+            if weights.shape != a.shape:
+                raise ValueError("histogram(): weights should have the "
+                                 "same shape as a")
+            return weights.ravel()
 
+    if density:
+        @register_jitable
+        def finish(hist, edges):
+            return hist / np.diff(edges) / hist.sum()
+    else:
+        @register_jitable
+        def finish(hist, edges):
+            return hist
+
+    bin_counts = get_histogram_kernels(parallel).bin_counts
+
+    @register_jitable
+    def histogram_impl(a, bins=10, range=None, density=None, weights=None):
+        edges, is_uniform = get_edges(a, bins, range)
+        hist = np.zeros(len(edges) - 1, hist_dtype)
+        bin_counts((a.ravel(),), (edges,), (is_uniform,),
+                   flat_weights(a, weights), hist)
+        return finish(hist, edges), edges
+
+    _histogram_impls[key] = histogram_impl
     return histogram_impl
 
 
+@overload(np.histogram)
+def np_histogram(a, bins=10, range=None, density=None, weights=None):
+    histogram_impl = get_histogram_impl(a, bins, range, density, weights)
+    if histogram_impl is None:
+        return
+
+    def np_histogram_impl(a, bins=10, range=None, density=None,
+                          weights=None):
+        return histogram_impl(a, bins, range, density, weights)
+    return np_histogram_impl
+
+
+_histogramdd_impls = {}
+
+
+def get_histogramdd_impl(sample, bins, range, density, weights,
+                         parallel=False):
+    """
+    Return a function computing np.histogramdd() for the argument types
+    *sample*, *bins*, *range*, *density* and *weights*, or None if they
+    are not supported.  If *parallel* is true, the points are binned in
+    parallel.  The bin edges are returned as a tuple of arrays.
+    """
+    bins = _unomitted(bins)
+    range = _unomitted(range)
+    weights = _unomitted(weights)
+    density = _density_flag(density)
+    key = sample, bins, range, density, weights, parallel
+    try:
+        return _histogramdd_impls[key]
+    except KeyError:
+        pass
+
+    # The number of dimensions must be known at compile time
+    if isinstance(sample, types.Array):
+        if sample.ndim != 2:
+            raise TypingError("histogramdd(): sample should be a 2-D array "
+                              "or a tuple of 1-D arrays")
+        if isinstance(bins, types.BaseTuple):
+            ndim = len(bins)
+        elif isinstance(range, types.BaseTuple):
+            ndim = len(range)
+        else:
+            raise TypingError("histogramdd(): the number of dimensions of "
+                              "a sample array must be given by a tuple of "
+                              "bins or ranges")
+        coords = ["sample[:, %d]" % d for d in _range(ndim)]
+    elif isinstance(sample, types.BaseTuple) and len(sample) > 0:
+        ndim = len(sample)
+        if not all(isinstance(ty, types.Array) and ty.ndim == 1
+                   for ty in sample):
+            raise TypingError("histogramdd(): sample should be a 2-D array "
+                              "or a tuple of 1-D arrays")
+        if isinstance(sample, types.UniTuple):
+            coords = ["sample[%d]" % d for d in _range(ndim)]
+        else:
+            # The coordinates must have the same type to be indexed at
+            # runtime
+            coords = ["sample[%d].astype(np.float64)" % d
+                      for d in _range(ndim)]
+    else:
+        return None
+
+    if isinstance(bins, types.BaseTuple):
+        if len(bins) != ndim:
+            raise TypingError("histogramdd(): the dimension of bins must "
+                              "be equal to the dimension of the sample")
+        bin_types = list(bins)
+        bin_exprs = ["bins[%d]" % d for d in _range(ndim)]
+    elif isinstance(bins, types.Array):
+        # Like in NumPy, an array holds one bins specification per dimension:
+        # the numbers of bins or the rows of edges
+        if bins.ndim == 1 and isinstance(bins.dtype, types.Integer):
+            bin_types = [bins.dtype] * ndim
+        elif bins.ndim == 2:
+            bin_types = [bins.copy(ndim=1, layout='A')] * ndim
+        else:
+            raise TypingError("histogramdd(): bins should be an integer "
+                              "or a sequence of integers or of 1-D arrays")
+        bin_exprs = ["bins[%d]" % d for d in _range(ndim)]
+    else:
+        bin_types = [bins] * ndim
+        bin_exprs = ["bins"] * ndim
+    if is_nonelike(range):
+        range_types = [None] * ndim
+    elif isinstance(range, types.BaseTuple) and len(range) == ndim:
+        range_types = list(range)
+    else:
+        raise TypingError("histogramdd(): range should be None or a tuple "
+                          "of a (min, max) pair per dimension")
+    if not (is_nonelike(weights) or
+            (isinstance(weights, types.Array) and weights.ndim == 1 and
+             isinstance(weights.dtype, (types.Boolean, types.Integer,
+                                        types.Float)))):
+        raise TypingError("histogramdd(): weights should be a 1-D array "
+                          "of real numbers")
+
+    src = ["def histogramdd_impl(sample, bins=10, range=None, density=None,",
+           "                     weights=None):"]
+    for d in _range(ndim):
+        src.append("    x%d = %s" % (d, coords[d]))
+        if d > 0 and isinstance(sample, types.BaseTuple):
+            src.append("    if x%d.size != x0.size:" % d)
+            src.append("        raise ValueError('histogramdd(): the sample "
+                       "arrays should have the same size')")
+    if isinstance(sample, types.Array):
+        src.append("    if sample.shape[1] != %d:" % ndim)
+        src.append("        raise ValueError('histogramdd(): the dimension "
+                   "of bins must be equal to the dimension of the sample')")
+    if isinstance(bins, types.Array):
+        src.append("    if bins.shape[0] != %d:" % ndim)
+        src.append("        raise ValueError('histogramdd(): the dimension "
+                   "of bins must be equal to the dimension of the sample')")
+    src.append("    uniform = np.zeros(%d, np.bool_)" % ndim)
+    for d in _range(ndim):
+        bin_ty = _unomitted(bin_types[d])
+        if isinstance(bin_ty, (int, types.Integer)):
+            if is_nonelike(range_types[d]):
+                src.append("    lo%d, hi%d = _autorange(x%d)" % (d, d, d))
+            else:
+                src.append("    lo%d, hi%d = range[%d]" % (d, d, d))
+            src.append("    e%d = _uniform_edges(%s, lo%d, hi%d)"
+                       % (d, bin_exprs[d], d, d))
+            src.append("    uniform[%d] = True" % d)
+        elif isinstance(bin_ty, types.Array) and bin_ty.ndim == 1:
+            src.append("    e%d = _check_edges(%s).astype(np.float64)"
+                       % (d, bin_exprs[d]))
+        else:
+            raise TypingError("histogramdd(): bins should be integers or "
+                              "1-D arrays")
+    edges = "".join("e%d, " % d for d in _range(ndim))
+    coords = "".join("x%d, " % d for d in _range(ndim))
+    shape = "".join("len(e%d) - 1, " % d for d in _range(ndim))
+    src.append("    edges = (%s)" % edges)
+    src.append("    shape = (%s)" % shape)
+    src.append("    size = 1")
+    src.append("    for s in shape:")
+    src.append("        size *= s")
+    src.append("    hist = np.zeros(size, np.float64)")
+    src.append("    bin_counts((%s), edges, uniform,"
+               " flat_weights(weights, x0.size), hist)" % coords)
+    src.append("    return finish(hist, edges).reshape(shape), edges")
+
+    if is_nonelike(weights):
+        @register_jitable
+        def flat_weights(weights, n):
+            return None
+    else:
+        @register_jitable
+        def flat_weights(weights, n):
+            if weights.size != n:
+                raise ValueError("histogramdd(): weights should have one "
+                                 "value per point")
+            return weights
+
+    if density:
+        finish = _density_nd
+    else:
+        @register_jitable
+        def finish(hist, edges):
+            return hist
+
+    glbls = {'np': np, '_autorange': _autorange,
+             '_uniform_edges': _uniform_edges, '_check_edges': _check_edges,
+             'bin_counts': get_histogram_kernels(parallel).bin_counts,
+             'flat_weights': flat_weights, 'finish': finish}
+    exec("\n".join(src), glbls)
+    histogramdd_impl = register_jitable(glbls['histogramdd_impl'])
+
+    _histogramdd_impls[key] = histogramdd_impl
+    return histogramdd_impl
+
+
+@overload(np.histogramdd)
+def np_histogramdd(sample, bins=10, range=None, density=None, weights=None):
+    histogramdd_impl = get_histogramdd_impl(sample, bins, range, density,
+                                            weights)
+    if histogramdd_impl is None:
+        return
+
+    def np_histogramdd_impl(sample, bins=10, range=None, density=None,
+                            weights=None):
+        return histogramdd_impl(sample, bins, range, density, weights)
+    return np_histogramdd_impl
+
+
+_histogram2d_impls = {}
+
+
+def get_histogram2d_impl(x, y, bins, range, density, weights,
+                         parallel=False):
+    """
+    Return a function computing np.histogram2d() for the argument types
+    *x*, *y*, *bins*, *range*, *density* and *weights*, or None if they
+    are not supported.  If *parallel* is true, the points are binned in
+    parallel.
+    """
+    if not (isinstance(x, types.Array) and isinstance(y, types.Array)):
+        return None
+    if x.ndim != 1 or y.ndim != 1:
+        raise TypingError("histogram2d(): x and y should be 1-D arrays")
+    bins = _unomitted(bins)
+    key = x, y, bins, _unomitted(range), _unomitted(weights), \
+        _density_flag(density), parallel
+    try:
+        return _histogram2d_impls[key]
+    except KeyError:
+        pass
+
+    xy = types.BaseTuple.from_types([x, y])
+    if not (isinstance(bins, types.Array) and bins.ndim == 1):
+        # A 2-D array holds the edges of each dimension, like a tuple
+        histogramdd_impl = get_histogramdd_impl(xy, bins, range, density,
+                                                weights, parallel)
+
+        @register_jitable
+        def histogram2d_impl(x, y, bins=10, range=None, density=None,
+                             weights=None):
+            hist, edges = histogramdd_impl((x, y), bins, range, density,
+                                           weights)
+            return hist, edges[0], edges[1]
+
+    elif isinstance(bins.dtype, types.Integer):
+        # Like in NumPy, a 1-D array of length 2 gives the number of bins
+        # of each dimension, and any other 1-D array the edges along both
+        edges_impl = get_histogramdd_impl(xy, types.UniTuple(bins, 2), range,
+                                          density, weights, parallel)
+        counts_impl = get_histogramdd_impl(xy, types.UniTuple(bins.dtype, 2),
+                                           range, density, weights, parallel)
+
+        @register_jitable
+        def histogram2d_impl(x, y, bins=10, range=None, density=None,
+                             weights=None):
+            if bins.shape[0] == 2:
+                hist, edges = counts_impl((x, y), (bins[0], bins[1]), range,
+                                          density, weights)
+            else:
+                hist, edges = edges_impl((x, y), (bins, bins), range,
+                                         density, weights)
+            return hist, edges[0], edges[1]
+
+    else:
+        # A pair of non-integer numbers of bins is rejected like in NumPy
+        edges_impl = get_histogramdd_impl(xy, types.UniTuple(bins, 2), range,
+                                          density, weights, parallel)
+
+        @register_jitable
+        def histogram2d_impl(x, y, bins=10, range=None, density=None,
+                             weights=None):
+            if bins.shape[0] == 2:
+                raise ValueError("histogram2d(): the number of bins of each "
+                                 "dimension should be an integer")
+            hist, edges = edges_impl((x, y), (bins, bins), range, density,
+                                     weights)
+            return hist, edges[0], edges[1]
+
+    _histogram2d_impls[key] = histogram2d_impl
+    return histogram2d_impl
+
+
+@overload(np.histogram2d)
+def np_histogram2d(x, y, bins=10, range=None, density=None, weights=None):
+    histogram2d_impl = get_histogram2d_impl(x, y, bins, range, density,
+                                            weights)
+    if histogram2d_impl is None:
+        return
+
+    def np_histogram2d_impl(x, y, bins=10, range=None, density=None,
+                            weights=None):
+        return histogram2d_impl(x, y, bins, range, density, weights)
+    return np_histogram2d_impl
+
+
 # Create np.finfo, np.iinfo and np.MachAr
 # machar
 _mach_ar_supported = ('ibeta', 'it', 'machep', 'eps', 'negep', 'epsneg',
@@ -14,7 +14,7 @@ from llvmlite.llvmpy.core import Constant
 
 import numpy as np
 
-from numba import pndindex
+from numba import pndindex, prange, literal_unroll
 from numba.core import types, utils, typing, errors, cgutils, extending
 from numba.np.numpy_support import (as_dtype, carray, farray, is_contiguous,
                                     is_fortran)
@@ -27,9 +27,10 @@ from numba.core.imputils import (lower_builtin, lower_getattr,
                                  impl_ret_new_ref, impl_ret_untracked,
                                  RefType)
 from numba.core.typing import signature
+from numba.core.typing.arraydecl import literal_flag
 from numba.core.extending import (register_jitable, overload, overload_method,
                                   intrinsic)
-from numba.misc import quicksort, mergesort
+from numba.misc import quicksort, mergesort, radixsort, samplesort, unique
 from numba.cpython import slicing
 from numba.cpython.unsafe.tuple import tuple_setitem
 
@@ -1912,13 +1913,68 @@ def np_shape(a):
 # ------------------------------------------------------------------------------
 
 
+_unique_impls = {}
+
+
+def get_unique_impl(arrty, flags, parallel=False):
+    """
+    Return a function computing np.unique() of an array of type *arrty*,
+    with the extra outputs selected by the (return_index, return_inverse,
+    return_counts) *flags*.  If *parallel* is true, the elements are
+    grouped in parallel.
+    """
+    key = arrty.dtype, flags, parallel
+    try:
+        return _unique_impls[key]
+    except KeyError:
+        pass
+
+    # Boolean and integer arrays are grouped by hashing, the others by a
+    # stable argsort, so that the first occurrences are found
+    is_float = isinstance(arrty.dtype, types.Float)
+    if parallel and radixsort.is_radix_sortable(arrty.dtype):
+        argsort = get_sort_func('parallel', is_float, is_argsort=True)
+    else:
+        argsort = get_sort_func('mergesort', is_float, is_argsort=True)
+    if parallel:
+        kernels = unique.make_jit_unique(argsort)
+    else:
+        kernels = unique.make_py_unique(argsort)
+    if unique.is_hashable(arrty.dtype):
+        run = kernels.run_hashunique
+    else:
+        run = kernels.run_sortunique
+
+    # The kernels return (values, index, inverse, counts)
+    outputs = [0] + [i + 1 for i, flag in enumerate(flags) if flag]
+    if len(outputs) == 1:
+        ret = "res[0]"
+    else:
+        ret = "(%s)" % ", ".join("res[%d]" % i for i in outputs)
+    src = ("def unique_impl(ar):\n"
+           "    res = run(ar.ravel(), need_inverse)\n"
+           "    return %s\n" % ret)
+    glbls = {'run': run, 'need_inverse': flags[1]}
+    exec(src, glbls)
+    unique_impl = register_jitable(glbls['unique_impl'])
+
+    _unique_impls[key] = unique_impl
+    return unique_impl
+
+
 @overload(np.unique)
-def np_unique(a):
-    def np_unique_impl(a):
-        b = np.sort(a.ravel())
-        head = list(b[:1])
-        tail = [x for i, x in enumerate(b[1:]) if b[i] != x]
-        return np.array(head + tail)
+def np_unique(ar, return_index=False, return_inverse=False,
+              return_counts=False):
+    if not isinstance(ar, types.Array):
+        return
+    flags = (literal_flag(return_index, 'return_index'),
+             literal_flag(return_inverse, 'return_inverse'),
+             literal_flag(return_counts, 'return_counts'))
+    unique_impl = get_unique_impl(ar, flags)
+
+    def np_unique_impl(ar, return_index=False, return_inverse=False,
+                       return_counts=False):
+        return unique_impl(ar)
     return np_unique_impl
 
 
@@ -4968,6 +5024,11 @@ def np_flip(a):
 # Sorting
 
 _sorts = {}
+_lane_sorts = {}
+
+# The sort kinds, 'radixsort' and 'parallel' being Numba extensions for
+# boolean, integer and float arrays
+sort_kinds = ('quicksort', 'mergesort', 'stable', 'radixsort', 'parallel')
 
 
 def lt_floats(a, b):
@@ -4992,49 +5053,275 @@ def get_sort_func(kind, is_float, is_argsort=False):
                 lt=lt_floats if is_float else None,
                 is_argsort=is_argsort)
             func = sort.run_mergesort
+        elif kind == 'radixsort':
+            sort = radixsort.make_jit_radixsort(is_argsort=is_argsort)
+            func = sort.run_radixsort
+        elif kind == 'parallel':
+            sort = samplesort.make_jit_samplesort(is_argsort=is_argsort)
+            func = sort.run_samplesort
+        else:
+            raise ValueError("unsupported sort kind: {!r}".format(kind))
         _sorts[key] = func
         return func
 
 
-@lower_builtin("array.sort", types.Array)
-def array_sort(context, builder, sig, args):
-    arytype = sig.args[0]
-    sort_func = get_sort_func(kind='quicksort',
-                              is_float=isinstance(arytype.dtype, types.Float))
+def _make_lane_sort(sort_func, is_argsort, wrap):
 
-    def array_sort_impl(arr):
-        # Note we clobber the return value
-        sort_func(arr)
+    if is_argsort:
+        @wrap
+        def argsort_lanes(a, axis):
+            "Out-of-place"
+            outer, n, inner = _lane_shape(a.shape, axis)
+            src = np.ascontiguousarray(a).reshape((outer, n, inner))
+            res = np.empty((outer, n, inner), np.intp)
+            for k in prange(outer * inner):
+                o = k // inner
+                i = k - o * inner
+                res[o, :, i] = sort_func(src[o, :, i].copy())
+            return res.reshape(a.shape)
 
-    return context.compile_internal(builder, array_sort_impl, sig, args)
+        return argsort_lanes
 
+    else:
+        @wrap
+        def sort_lanes(a, axis):
+            "Inplace, *a* must be C-contiguous"
+            outer, n, inner = _lane_shape(a.shape, axis)
+            view = a.reshape((outer, n, inner))
+            for k in prange(outer * inner):
+                o = k // inner
+                i = k - o * inner
+                # Sort a contiguous copy of the lane
+                lane = view[o, :, i].copy()
+                sort_func(lane)
+                view[o, :, i] = lane
 
-@lower_builtin(np.sort, types.Array)
-def np_sort(context, builder, sig, args):
+        return sort_lanes
+
+
+def get_lane_sort_func(kind, is_float, is_argsort=False, parallel=False):
+    """
+    Get an implementation sorting an array along the given axis, one 1D lane
+    at a time with the sort of the given kind.  The lanes are sorted on the
+    threading layer if *parallel* is true.
+    """
+    key = kind, is_float, is_argsort, parallel
+    try:
+        return _lane_sorts[key]
+    except KeyError:
+        sort_func = get_sort_func(kind, is_float, is_argsort)
+        if parallel:
+            from numba import njit
+            wrap = njit(parallel=True)
+        else:
+            wrap = register_jitable
+        func = _make_lane_sort(sort_func, is_argsort, wrap)
+        _lane_sorts[key] = func
+        return func
 
-    def np_sort_impl(a):
-        res = a.copy()
-        res.sort()
-        return res
 
-    return context.compile_internal(builder, np_sort_impl, sig, args)
+@register_jitable
+def _lane_shape(shape, axis):
+    """
+    Return the (outer, n, inner) shape viewing a C-contiguous array of the
+    given shape as lanes of length n along *axis*.
+    """
+    ndim = len(shape)
+    if axis < -ndim or axis >= ndim:
+        raise ValueError("axis is out of bounds for the array")
+    if axis < 0:
+        axis += ndim
+    outer = 1
+    for i in range(axis):
+        outer *= shape[i]
+    inner = 1
+    for i in range(axis + 1, ndim):
+        inner *= shape[i]
+    return outer, shape[axis], inner
+
+
+def _sort_kind(func_name, ary, kind):
+    """
+    Check the *kind* argument of a sort of the array type *ary*, returning
+    the kind of sort implementation to use.
+    """
+    if is_nonelike(kind):
+        return 'quicksort'
+    if not isinstance(kind, types.StringLiteral):
+        msg = "{}(): kind must be a constant string, got {}"
+        raise errors.TypingError(msg.format(func_name, kind))
+    kind = kind.literal_value
+    if kind not in sort_kinds:
+        raise errors.TypingError("Unsupported sort kind: {!r}".format(kind))
+    is_numeric = radixsort.is_radix_sortable(ary.dtype)
+    if kind in ('radixsort', 'parallel') and not is_numeric:
+        msg = "Sort kind {!r} is not supported for arrays of {}"
+        raise errors.TypingError(msg.format(kind, ary.dtype))
+    if kind == 'stable':
+        # Both are stable, the radix sort is the faster
+        return 'radixsort' if is_numeric else 'mergesort'
+    return kind
+
+
+def _sort_flattened(func_name, axis):
+    """
+    Check the *axis* argument of a sort, returning whether the flattened
+    array is sorted.
+    """
+    if isinstance(axis, types.Omitted):
+        axis = axis.value
+    if axis is None or isinstance(axis, types.NoneType):
+        return True
+    if not isinstance(axis, (int, types.Integer)):
+        msg = "{}(): axis must be an integer or None, got {}"
+        raise errors.TypingError(msg.format(func_name, axis))
+    return False
 
 
-@lower_builtin("array.argsort", types.Array, types.StringLiteral)
-@lower_builtin(np.argsort, types.Array, types.StringLiteral)
-def array_argsort(context, builder, sig, args):
-    arytype, kind = sig.args
-    sort_func = get_sort_func(kind=kind.literal_value,
-                              is_float=isinstance(arytype.dtype, types.Float),
-                              is_argsort=True)
+def _lane_sort_kind(kind):
+    # The lanes of a parallel sort are radix sorted in parallel
+    return 'radixsort' if kind == 'parallel' else kind
+
+
+@overload(np.sort)
+def np_sort(a, axis=-1, kind=None):
+    if not isinstance(a, types.Array):
+        return
+    sort_kind = _sort_kind('np.sort', a, kind)
+    is_float = isinstance(a.dtype, types.Float)
 
-    def array_argsort_impl(arr):
-        return sort_func(arr)
+    if _sort_flattened('np.sort', axis):
+        sort_func = get_sort_func(sort_kind, is_float)
+
+        def np_sort_impl(a, axis=-1, kind=None):
+            res = a.flatten()
+            sort_func(res)
+            return res
+
+    elif a.ndim == 1:
+        sort_func = get_sort_func(sort_kind, is_float)
+
+        def np_sort_impl(a, axis=-1, kind=None):
+            _lane_shape(a.shape, axis)
+            res = a.copy()
+            sort_func(res)
+            return res
+
+    else:
+        sort_lanes = get_lane_sort_func(_lane_sort_kind(sort_kind), is_float,
+                                        parallel=sort_kind == 'parallel')
+
+        def np_sort_impl(a, axis=-1, kind=None):
+            res = a.copy()
+            sort_lanes(res, axis)
+            return res
+
+    return np_sort_impl
+
+
+@overload_method(types.Array, 'sort')
+def array_sort(a, axis=-1, kind=None):
+    sort_kind = _sort_kind('sort', a, kind)
+    is_float = isinstance(a.dtype, types.Float)
+    if _sort_flattened('sort', axis):
+        raise errors.TypingError("sort(): axis must be an integer")
+
+    if a.ndim == 1:
+        sort_func = get_sort_func(sort_kind, is_float)
+
+        def array_sort_impl(a, axis=-1, kind=None):
+            _lane_shape(a.shape, axis)
+            sort_func(a)
+
+    else:
+        sort_lanes = get_lane_sort_func(_lane_sort_kind(sort_kind), is_float,
+                                        parallel=sort_kind == 'parallel')
+        if a.layout == 'C':
+            def array_sort_impl(a, axis=-1, kind=None):
+                sort_lanes(a, axis)
+        else:
+            def array_sort_impl(a, axis=-1, kind=None):
+                tmp = a.copy()
+                sort_lanes(tmp, axis)
+                a[...] = tmp
+
+    return array_sort_impl
+
+
+def _argsort_impl(func_name, a, axis, kind):
+    sort_kind = _sort_kind(func_name, a, kind)
+    is_float = isinstance(a.dtype, types.Float)
+
+    if _sort_flattened(func_name, axis):
+        argsort_func = get_sort_func(sort_kind, is_float, is_argsort=True)
+
+        def argsort_impl(a, axis=-1, kind=None):
+            return argsort_func(a.flatten())
+
+    elif a.ndim == 1:
+        argsort_func = get_sort_func(sort_kind, is_float, is_argsort=True)
+
+        def argsort_impl(a, axis=-1, kind=None):
+            _lane_shape(a.shape, axis)
+            return argsort_func(a)
+
+    else:
+        argsort_lanes = get_lane_sort_func(_lane_sort_kind(sort_kind),
+                                           is_float, is_argsort=True,
+                                           parallel=sort_kind == 'parallel')
+
+        def argsort_impl(a, axis=-1, kind=None):
+            return argsort_lanes(a, axis)
+
+    return argsort_impl
+
+
+@overload(np.argsort)
+def np_argsort(a, axis=-1, kind=None):
+    if isinstance(a, types.Array):
+        return _argsort_impl('np.argsort', a, axis, kind)
+
+
+@overload_method(types.Array, 'argsort')
+def array_argsort(a, axis=-1, kind=None):
+    return _argsort_impl('argsort', a, axis, kind)
+
+
+@overload(np.lexsort)
+def np_lexsort(keys):
+    # Sort by each key in turn, the last one being the primary key, with
+    # stable argsorts
+    if isinstance(keys, types.Array):
+        if keys.ndim == 1:
+            def np_lexsort_impl(keys):
+                return np.argsort(keys, kind='stable')
+        elif keys.ndim == 2:
+            def np_lexsort_impl(keys):
+                res = np.arange(keys.shape[1])
+                for i in range(keys.shape[0]):
+                    res = res[np.argsort(keys[i][res], kind='stable')]
+                return res
+        else:
+            raise errors.TypingError("np.lexsort(): keys must be a 1D or "
+                                     "2D array or a tuple of 1D arrays")
+
+    elif isinstance(keys, types.BaseTuple) and len(keys) > 0:
+        if not all(isinstance(k, types.Array) and k.ndim == 1 for k in keys):
+            raise errors.TypingError("np.lexsort(): keys must be 1D arrays")
+
+        def np_lexsort_impl(keys):
+            n = len(keys[0])
+            res = np.arange(n)
+            for k in literal_unroll(keys):
+                if len(k) != n:
+                    raise ValueError("all keys need to be the same shape")
+                res = res[np.argsort(k[res], kind='stable')]
+            return res
+
+    else:
+        return
 
-    innersig = sig.replace(args=sig.args[:1])
-    innerargs = args[:1]
-    return context.compile_internal(builder, array_argsort_impl,
-                                    innersig, innerargs)
+    return np_lexsort_impl
 
 
 # ------------------------------------------------------------------------------
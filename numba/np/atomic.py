@@ -0,0 +1,199 @@
+"""
+Atomic operations on array elements for the CPU target, e.g. to accumulate
+into arrays from the iterations of a ``prange`` loop.
+
+The functions update the element *ary[idx]* and return its previous value.
+When called from the interpreter they are not atomic.
+"""
+
+from llvmlite import ir
+
+from numba.core import cgutils, types
+from numba.core.errors import TypingError
+from numba.core.extending import intrinsic, overload
+from numba.core.typing import signature
+
+
+def add(ary, idx, val):
+    """
+    Perform ``ary[idx] += val`` atomically and return the previous value
+    of ``ary[idx]``.
+    """
+    old = ary[idx]
+    ary[idx] = old + val
+    return old
+
+
+def max(ary, idx, val):
+    """
+    Perform ``ary[idx] = max(ary[idx], val)`` atomically and return the
+    previous value of ``ary[idx]``.
+    """
+    old = ary[idx]
+    if val > old:
+        ary[idx] = val
+    return old
+
+
+def min(ary, idx, val):
+    """
+    Perform ``ary[idx] = min(ary[idx], val)`` atomically and return the
+    previous value of ``ary[idx]``.
+    """
+    old = ary[idx]
+    if val < old:
+        ary[idx] = val
+    return old
+
+
+def cas(ary, idx, old, val):
+    """
+    Store *val* into ``ary[idx]`` if it is equal to *old*, atomically, and
+    return the previous value of ``ary[idx]``.  Only arrays of integers are
+    supported.
+    """
+    prev = ary[idx]
+    if prev == old:
+        ary[idx] = val
+    return prev
+
+
+def _check_args(name, ary, idx, vals):
+    if not isinstance(ary, types.Array):
+        raise TypingError("atomic.%s() needs an array, got %s" % (name, ary))
+    if not ary.mutable:
+        raise TypingError("atomic.%s() cannot update a read-only array"
+                          % (name,))
+    if not isinstance(ary.dtype, (types.Integer, types.Float)):
+        raise TypingError("atomic.%s() only supports arrays of integers "
+                          "and floats, got %s" % (name, ary.dtype))
+    if isinstance(idx, types.Integer):
+        nidx = 1
+    elif (isinstance(idx, types.BaseTuple) and
+          all(isinstance(t, types.Integer) for t in idx)):
+        nidx = len(idx)
+    else:
+        raise TypingError("atomic.%s(): the index must be an integer or a "
+                          "tuple of integers, got %s" % (name, idx))
+    if nidx != ary.ndim:
+        raise TypingError("atomic.%s(): %d indices given for an array of "
+                          "%d dimensions" % (name, nidx, ary.ndim))
+    for val in vals:
+        if not isinstance(val, (types.Number, types.Boolean)):
+            raise TypingError("atomic.%s() needs numeric values, got %s"
+                              % (name, val))
+
+
+def _item_pointer(context, builder, aryty, ary, idxty, idx):
+    if isinstance(idxty, types.Integer):
+        idxtys, idxs = [idxty], [idx]
+    else:
+        idxtys = list(idxty)
+        idxs = cgutils.unpack_tuple(builder, idx, len(idxty))
+    inds = [context.cast(builder, i, ty, types.intp)
+            for i, ty in zip(idxs, idxtys)]
+    lary = context.make_array(aryty)(context, builder, ary)
+    return cgutils.get_item_pointer(context, builder, aryty, lary, inds,
+                                    wraparound=True, boundscheck=True)
+
+
+def _float_rmw(builder, op, ptr, val):
+    # There is no atomicrmw for every float operation: retry a
+    # compare-and-swap of the bits of the element until it succeeds
+    ity = ir.IntType(32 if isinstance(val.type, ir.FloatType) else 64)
+    iptr = builder.bitcast(ptr, ity.as_pointer())
+    init = builder.load_atomic(iptr, 'monotonic', ity.width // 8)
+    entry = builder.basic_block
+    loop = builder.append_basic_block('atomic.loop')
+    done = builder.append_basic_block('atomic.done')
+    builder.branch(loop)
+    with builder.goto_block(loop):
+        iold = builder.phi(ity)
+        iold.add_incoming(init, entry)
+        old = builder.bitcast(iold, val.type)
+        if op == 'add':
+            new = builder.fadd(old, val)
+        elif op == 'max':
+            new = builder.select(builder.fcmp_ordered('>', val, old), val, old)
+        else:
+            new = builder.select(builder.fcmp_ordered('<', val, old), val, old)
+        res = builder.cmpxchg(iptr, iold, builder.bitcast(new, ity),
+                              'monotonic')
+        iold.add_incoming(builder.extract_value(res, 0), loop)
+        builder.cbranch(builder.extract_value(res, 1), done, loop)
+    builder.position_at_end(done)
+    return old
+
+
+def _make_rmw(name, op, signed_op, unsigned_op):
+
+    def rmw(typingctx, ary, idx, val):
+        _check_args(name, ary, idx, (val,))
+
+        def codegen(context, builder, sig, args):
+            aryty, idxty, valty = sig.args
+            dtype = aryty.dtype
+            ptr = _item_pointer(context, builder, aryty, args[0], idxty,
+                                args[1])
+            val = context.cast(builder, args[2], valty, dtype)
+            if isinstance(dtype, types.Integer):
+                rmw_op = signed_op if dtype.signed else unsigned_op
+                return builder.atomic_rmw(rmw_op, ptr, val, 'monotonic')
+            return _float_rmw(builder, op, ptr, val)
+
+        return signature(ary.dtype, ary, idx, val), codegen
+
+    rmw.__name__ = '_atomic_%s' % (name,)
+    return intrinsic(rmw)
+
+
+_atomic_add = _make_rmw('add', 'add', 'add', 'add')
+_atomic_max = _make_rmw('max', 'max', 'max', 'umax')
+_atomic_min = _make_rmw('min', 'min', 'min', 'umin')
+
+
+@intrinsic
+def _atomic_cas(typingctx, ary, idx, old, val):
+    _check_args('cas', ary, idx, (old, val))
+    if not isinstance(ary.dtype, types.Integer):
+        raise TypingError("atomic.cas() only supports arrays of integers, "
+                          "got %s" % (ary.dtype,))
+
+    def codegen(context, builder, sig, args):
+        aryty, idxty, oldty, valty = sig.args
+        dtype = aryty.dtype
+        ptr = _item_pointer(context, builder, aryty, args[0], idxty, args[1])
+        old = context.cast(builder, args[2], oldty, dtype)
+        val = context.cast(builder, args[3], valty, dtype)
+        res = builder.cmpxchg(ptr, old, val, 'monotonic')
+        return builder.extract_value(res, 0)
+
+    return signature(ary.dtype, ary, idx, old, val), codegen
+
+
+@overload(add)
+def ol_add(ary, idx, val):
+    def impl(ary, idx, val):
+        return _atomic_add(ary, idx, val)
+    return impl
+
+
+@overload(max)
+def ol_max(ary, idx, val):
+    def impl(ary, idx, val):
+        return _atomic_max(ary, idx, val)
+    return impl
+
+
+@overload(min)
+def ol_min(ary, idx, val):
+    def impl(ary, idx, val):
+        return _atomic_min(ary, idx, val)
+    return impl
+
+
+@overload(cas)
+def ol_cas(ary, idx, old, val):
+    def impl(ary, idx, old, val):
+        return _atomic_cas(ary, idx, old, val)
+    return impl
@@ -0,0 +1,681 @@
+"""
+Implementation of the np.fft module.
+
+Transforms are computed in complex128, as Numpy does, by a mixed-radix
+Stockham FFT: the sizes whose prime factors are all small are split into
+radix-4, radix-2, radix-3 and generic odd radix passes, while the sizes
+having a large prime factor use Bluestein's algorithm, which turns them
+into a convolution of a power of two size.
+
+The plan of a size (its passes, roots of unity and Bluestein chirp) is
+computed once per call and shared by all the 1-D transforms of a batch,
+which are distributed across threads by the parallel implementations.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.core.extending import overload, register_jitable
+from numba.cpython.unsafe.tuple import tuple_setitem
+from numba.np.numpy_support import is_nonelike
+
+
+# Sizes with a prime factor larger than this use Bluestein's algorithm
+BLUESTEIN_MIN_PRIME = 64
+
+# Number of the 1-D transforms of a batch done by each task
+BATCH_CHUNK = 16
+
+_SIN_PI_3 = math.sqrt(3.0) / 2.0
+
+
+FFTPlan = namedtuple('FFTPlan', [
+    'n',            # the size of the transform
+    'factors',      # the radices of the passes
+    'roots',        # the roots of unity exp(-2j pi k / n)
+    'chirp',        # Bluestein: exp(-1j pi k**2 / n), empty otherwise
+    'chirp_fft',    # Bluestein: the transform of the convolution kernel
+    'inner_factors',    # Bluestein: the plan of the convolution size
+    'inner_roots',
+])
+
+
+FFTImplementation = namedtuple('FFTImplementation', [
+    'fft', 'ifft', 'rfft', 'irfft', 'fftn', 'ifftn', 'fft2', 'ifft2',
+])
+
+
+# ------------------------------------------------------------------------
+# Plans
+
+@register_jitable
+def _factorize(n):
+    """
+    Return the radices of the passes of a transform of size *n*, and its
+    largest prime factor.
+    """
+    factors = []
+    largest = 1
+    while n % 4 == 0:
+        factors.append(4)
+        largest = 2
+        n //= 4
+    if n % 2 == 0:
+        factors.append(2)
+        largest = 2
+        n //= 2
+    p = 3
+    while p * p <= n:
+        while n % p == 0:
+            factors.append(p)
+            largest = p
+            n //= p
+        p += 2
+    if n > 1:
+        factors.append(n)
+        largest = max(largest, n)
+    res = np.empty(len(factors), np.intp)
+    for i in range(len(factors)):
+        res[i] = factors[i]
+    return res, largest
+
+
+@register_jitable
+def _roots(n):
+    roots = np.empty(n, np.complex128)
+    for k in range(n):
+        angle = -2.0 * math.pi * k / n
+        roots[k] = complex(math.cos(angle), math.sin(angle))
+    return roots
+
+
+@register_jitable
+def make_plan(n):
+    """
+    Return the FFTPlan of the transforms of size *n*.
+    """
+    factors, largest = _factorize(n)
+    empty = np.empty(0, np.complex128)
+    if largest <= BLUESTEIN_MIN_PRIME:
+        return FFTPlan(n, factors, _roots(n), empty, empty,
+                       np.empty(0, np.intp), empty)
+
+    # Bluestein's algorithm, with a convolution of a power of two size
+    m = 1
+    while m < 2 * n - 1:
+        m *= 2
+    inner_factors, _ = _factorize(m)
+    inner_roots = _roots(m)
+    chirp = np.empty(n, np.complex128)
+    for k in range(n):
+        # k**2 is reduced modulo 2n to keep the angle accurate
+        angle = -math.pi * ((k * k) % (2 * n)) / n
+        chirp[k] = complex(math.cos(angle), math.sin(angle))
+    kernel = np.zeros(m, np.complex128)
+    kernel[0] = 1.0
+    for k in range(1, n):
+        kernel[k] = kernel[m - k] = chirp[k].conjugate()
+    chirp_fft, _ = _stockham(kernel, np.empty(m, np.complex128),
+                             inner_factors, inner_roots)
+    return FFTPlan(n, factors, empty, chirp, chirp_fft, inner_factors,
+                   inner_roots)
+
+
+@register_jitable
+def _plan_buffer_size(plan):
+    if plan.chirp.size:
+        return plan.chirp_fft.size
+    return plan.n
+
+
+# ------------------------------------------------------------------------
+# Stockham passes
+
+# Each pass of radix r transforms the x array of sub-sequences of length
+# m * r interleaved with a stride s, storing into y the sub-sequences of
+# length m with a stride s * r, in natural order.
+
+@register_jitable
+def _pass2(x, y, m, s, roots):
+    for p in range(m):
+        w = roots[p * s]
+        for q in range(s):
+            a0 = x[q + s * p]
+            a1 = x[q + s * (p + m)]
+            y[q + s * 2 * p] = a0 + a1
+            y[q + s * (2 * p + 1)] = (a0 - a1) * w
+
+
+@register_jitable
+def _pass3(x, y, m, s, roots):
+    c = complex(0.0, -_SIN_PI_3)
+    for p in range(m):
+        w1 = roots[p * s]
+        w2 = roots[2 * p * s]
+        for q in range(s):
+            a0 = x[q + s * p]
+            a1 = x[q + s * (p + m)]
+            a2 = x[q + s * (p + 2 * m)]
+            t1 = a1 + a2
+            t2 = a0 - 0.5 * t1
+            t3 = (a1 - a2) * c
+            y[q + s * 3 * p] = a0 + t1
+            y[q + s * (3 * p + 1)] = (t2 + t3) * w1
+            y[q + s * (3 * p + 2)] = (t2 - t3) * w2
+
+
+@register_jitable
+def _pass4(x, y, m, s, roots):
+    for p in range(m):
+        w1 = roots[p * s]
+        w2 = roots[2 * p * s]
+        w3 = roots[3 * p * s]
+        for q in range(s):
+            a0 = x[q + s * p]
+            a1 = x[q + s * (p + m)]
+            a2 = x[q + s * (p + 2 * m)]
+            a3 = x[q + s * (p + 3 * m)]
+            t0 = a0 + a2
+            t1 = a0 - a2
+            t2 = a1 + a3
+            # (a1 - a3) * -1j
+            d = a1 - a3
+            t3 = complex(d.imag, -d.real)
+            y[q + s * 4 * p] = t0 + t2
+            y[q + s * (4 * p + 1)] = (t1 + t3) * w1
+            y[q + s * (4 * p + 2)] = (t0 - t2) * w2
+            y[q + s * (4 * p + 3)] = (t1 - t3) * w3
+
+
+@register_jitable
+def _pass_generic(x, y, m, s, r, roots):
+    n = x.size
+    step = n // r
+    a = np.empty(r, np.complex128)
+    for p in range(m):
+        for q in range(s):
+            for v in range(r):
+                a[v] = x[q + s * (p + v * m)]
+            for u in range(r):
+                acc = a[0]
+                for v in range(1, r):
+                    acc += a[v] * roots[((u * v) % r) * step]
+                y[q + s * (r * p + u)] = acc * roots[p * u * s]
+
+
+@register_jitable
+def _stockham(x, y, factors, roots):
+    """
+    Compute the forward transform of the complex128 *x*, using *y* as
+    work space.  Return the array holding the result and the other one.
+    """
+    s = 1
+    m = x.size
+    for r in factors:
+        m //= r
+        if r == 4:
+            _pass4(x, y, m, s, roots)
+        elif r == 2:
+            _pass2(x, y, m, s, roots)
+        elif r == 3:
+            _pass3(x, y, m, s, roots)
+        else:
+            _pass_generic(x, y, m, s, r, roots)
+        x, y = y, x
+        s *= r
+    return x, y
+
+
+@register_jitable
+def execute_plan(plan, x, work):
+    """
+    Compute the forward transform of the first plan.n elements of *x*,
+    using *x* and *work*, of the plan's buffer size, as work space.
+    Return the transform, a view of one of them.
+    """
+    n = plan.n
+    if plan.chirp.size == 0:
+        res, _ = _stockham(x[:n], work[:n], plan.factors, plan.roots)
+        return res
+
+    # Bluestein: convolve x * chirp with the conjugate chirp, the inverse
+    # transform being computed as conj(fft(conj(...)))
+    chirp = plan.chirp
+    chirp_fft = plan.chirp_fft
+    m = chirp_fft.size
+    for k in range(n):
+        x[k] *= chirp[k]
+    x[n:] = 0
+    a, b = _stockham(x, work, plan.inner_factors, plan.inner_roots)
+    for k in range(m):
+        a[k] = (a[k] * chirp_fft[k]).conjugate()
+    a, b = _stockham(a, b, plan.inner_factors, plan.inner_roots)
+    scale = 1.0 / m
+    for k in range(n):
+        a[k] = a[k].conjugate() * scale * chirp[k]
+    return a[:n]
+
+
+# ------------------------------------------------------------------------
+# Argument handling
+
+def _norm_scale(norm, n, forward):
+    """
+    Return the scaling of the transform of size *n* for *norm*.
+    """
+    raise NotImplementedError
+
+
+@overload(_norm_scale)
+def _norm_scale_impl(norm, n, forward):
+    if is_nonelike(norm):
+        def impl(norm, n, forward):
+            return 1.0 if forward else 1.0 / n
+    else:
+        def impl(norm, n, forward):
+            if norm == "backward":
+                return 1.0 if forward else 1.0 / n
+            elif norm == "ortho":
+                return 1.0 / math.sqrt(n)
+            elif norm == "forward":
+                return 1.0 / n if forward else 1.0
+            raise ValueError("Invalid norm value, should be None, "
+                             "'backward', 'ortho' or 'forward'")
+    return impl
+
+
+@register_jitable
+def _normalize_axis(axis, ndim):
+    if axis < -ndim or axis >= ndim:
+        raise ValueError("np.fft: axis out of bounds")
+    if axis < 0:
+        axis += ndim
+    return axis
+
+
+@register_jitable
+def _check_size(n):
+    if n < 1:
+        raise ValueError("Invalid number of FFT data points specified")
+    return n
+
+
+def _size_or_default(n, default):
+    """
+    Return the size *n*, or *default* if it is None.
+    """
+    raise NotImplementedError
+
+
+@overload(_size_or_default)
+def _size_or_default_impl(n, default):
+    if is_nonelike(n):
+        def impl(n, default):
+            return _check_size(default)
+    else:
+        def impl(n, default):
+            return _check_size(n)
+    return impl
+
+
+def _fftn_sizes_axes(a, s, axes):
+    """
+    Return as arrays the sizes of the transforms of np.fft.fftn(a, s, axes)
+    and their axes.
+    """
+    raise NotImplementedError
+
+
+@overload(_fftn_sizes_axes)
+def _fftn_sizes_axes_impl(a, s, axes):
+    ndim = a.ndim
+    if is_nonelike(s) and is_nonelike(axes):
+        def impl(a, s, axes):
+            res_axes = np.arange(ndim)
+            sizes = np.empty(ndim, np.intp)
+            for i in range(ndim):
+                sizes[i] = a.shape[i]
+            return sizes, res_axes
+    elif is_nonelike(axes):
+        def impl(a, s, axes):
+            if len(s) > ndim:
+                raise ValueError("np.fft: shape has more dimensions than "
+                                 "the array")
+            sizes = np.empty(len(s), np.intp)
+            res_axes = np.empty(len(s), np.intp)
+            for i in range(len(s)):
+                sizes[i] = s[i]
+                res_axes[i] = ndim - len(s) + i
+            return sizes, res_axes
+    elif is_nonelike(s):
+        def impl(a, s, axes):
+            sizes = np.empty(len(axes), np.intp)
+            res_axes = np.empty(len(axes), np.intp)
+            for i in range(len(axes)):
+                res_axes[i] = _normalize_axis(axes[i], ndim)
+                sizes[i] = a.shape[res_axes[i]]
+            return sizes, res_axes
+    else:
+        def impl(a, s, axes):
+            if len(s) != len(axes):
+                raise ValueError("Shape and axes have different lengths.")
+            sizes = np.empty(len(axes), np.intp)
+            res_axes = np.empty(len(axes), np.intp)
+            for i in range(len(axes)):
+                res_axes[i] = _normalize_axis(axes[i], ndim)
+                sizes[i] = s[i]
+            return sizes, res_axes
+    return impl
+
+
+def _as_numeric(a):
+    """
+    Return the array *a*, with booleans converted to floats.
+    """
+    raise NotImplementedError
+
+
+@overload(_as_numeric)
+def _as_numeric_impl(a):
+    if isinstance(a.dtype, types.Boolean):
+        def impl(a):
+            return a.astype(np.float64)
+    else:
+        def impl(a):
+            return a
+    return impl
+
+
+# ------------------------------------------------------------------------
+# Transforms
+
+def make_fft_impl(wrap, prange):
+
+    @wrap
+    def c2c_batch(a, out, plan, forward, scale):
+        """Transform the 3-D *a* along its second axis into *out*.
+
+        The transforms of size plan.n of the (outer, inner) sequences of
+        *a* are truncated to the size of the second axis of *out*, which
+        may be smaller for rfft(), and scaled by *scale*.  Sequences
+        shorter than plan.n are zero-padded.
+        """
+        outer, na, inner = a.shape
+        n = plan.n
+        nout = out.shape[1]
+        ncopy = min(na, n)
+        nbatch = outer * inner
+        size = _plan_buffer_size(plan)
+        nchunks = (nbatch + BATCH_CHUNK - 1) // BATCH_CHUNK
+        for c in prange(nchunks):
+            x = np.empty(size, np.complex128)
+            work = np.empty(size, np.complex128)
+            for t in range(c * BATCH_CHUNK, min((c + 1) * BATCH_CHUNK,
+                                                nbatch)):
+                i = t // inner
+                j = t % inner
+                for k in range(ncopy):
+                    x[k] = a[i, k, j]
+                x[ncopy:n] = 0
+                if forward:
+                    res = execute_plan(plan, x, work)
+                    for k in range(nout):
+                        out[i, k, j] = res[k] * scale
+                else:
+                    # The inverse transform is conj(fft(conj(x)))
+                    for k in range(n):
+                        x[k] = x[k].conjugate()
+                    res = execute_plan(plan, x, work)
+                    for k in range(nout):
+                        out[i, k, j] = res[k].conjugate() * scale
+
+    @wrap
+    def c2r_batch(a, out, plan, scale):
+        """Inverse transform the 3-D *a* along its second axis into the
+        real *out*.
+
+        The sequences of *a* hold the first half of Hermitian-symmetric
+        spectra of size plan.n, they are truncated or zero-padded to it.
+        """
+        outer, na, inner = a.shape
+        n = plan.n
+        ncopy = min(na, n // 2 + 1)
+        nbatch = outer * inner
+        size = _plan_buffer_size(plan)
+        nchunks = (nbatch + BATCH_CHUNK - 1) // BATCH_CHUNK
+        for c in prange(nchunks):
+            x = np.empty(size, np.complex128)
+            work = np.empty(size, np.complex128)
+            for t in range(c * BATCH_CHUNK, min((c + 1) * BATCH_CHUNK,
+                                                nbatch)):
+                i = t // inner
+                j = t % inner
+                for k in range(ncopy):
+                    x[k] = a[i, k, j].conjugate()
+                x[ncopy:n] = 0
+                for k in range(n // 2 + 1, n):
+                    x[k] = x[n - k].conjugate()
+                res = execute_plan(plan, x, work)
+                for k in range(n):
+                    out[i, k, j] = res[k].real * scale
+
+    @register_jitable
+    def as_3d(a, axis):
+        shape = a.shape
+        outer = 1
+        for d in range(axis):
+            outer *= shape[d]
+        inner = 1
+        for d in range(axis + 1, a.ndim):
+            inner *= shape[d]
+        a = np.ascontiguousarray(_as_numeric(a))
+        return a.reshape((outer, shape[axis], inner))
+
+    @register_jitable
+    def from_3d(out, shape, axis):
+        return out.reshape(tuple_setitem(shape, axis, out.shape[1]))
+
+    @register_jitable
+    def c2c_axis(a, plan, nout, axis, forward, scale):
+        a3 = as_3d(a, axis)
+        out = np.empty((a3.shape[0], nout, a3.shape[2]), np.complex128)
+        c2c_batch(a3, out, plan, forward, scale)
+        return from_3d(out, a.shape, axis)
+
+    @register_jitable
+    def c2r_axis(a, plan, axis, scale):
+        a3 = as_3d(a, axis)
+        out = np.empty((a3.shape[0], plan.n, a3.shape[2]), np.float64)
+        c2r_batch(a3, out, plan, scale)
+        return from_3d(out, a.shape, axis)
+
+    @register_jitable
+    def c2c_axes(a, s, axes, forward, norm):
+        sizes, res_axes = _fftn_sizes_axes(a, s, axes)
+        if sizes.size == 0:
+            raise ValueError("np.fft: no axes to transform")
+        # The axes are transformed in reverse order, as Numpy does, and
+        # the plan is reused as long as the size is the same
+        last = sizes.size - 1
+        plan = make_plan(_check_size(sizes[last]))
+        out = c2c_axis(a, plan, plan.n, res_axes[last], forward,
+                       _norm_scale(norm, plan.n, forward))
+        for i in range(last - 1, -1, -1):
+            if sizes[i] != plan.n:
+                plan = make_plan(_check_size(sizes[i]))
+            out = c2c_axis(out, plan, plan.n, res_axes[i], forward,
+                           _norm_scale(norm, plan.n, forward))
+        return out
+
+    # The top-level entry points
+
+    @register_jitable
+    def fft(a, n=None, axis=-1, norm=None):
+        axis = _normalize_axis(axis, a.ndim)
+        plan = make_plan(_size_or_default(n, a.shape[axis]))
+        return c2c_axis(a, plan, plan.n, axis, True,
+                        _norm_scale(norm, plan.n, True))
+
+    @register_jitable
+    def ifft(a, n=None, axis=-1, norm=None):
+        axis = _normalize_axis(axis, a.ndim)
+        plan = make_plan(_size_or_default(n, a.shape[axis]))
+        return c2c_axis(a, plan, plan.n, axis, False,
+                        _norm_scale(norm, plan.n, False))
+
+    @register_jitable
+    def rfft(a, n=None, axis=-1, norm=None):
+        axis = _normalize_axis(axis, a.ndim)
+        plan = make_plan(_size_or_default(n, a.shape[axis]))
+        return c2c_axis(a, plan, plan.n // 2 + 1, axis, True,
+                        _norm_scale(norm, plan.n, True))
+
+    @register_jitable
+    def irfft(a, n=None, axis=-1, norm=None):
+        axis = _normalize_axis(axis, a.ndim)
+        plan = make_plan(_size_or_default(n, 2 * (a.shape[axis] - 1)))
+        return c2r_axis(a, plan, axis, _norm_scale(norm, plan.n, False))
+
+    @register_jitable
+    def fftn(a, s=None, axes=None, norm=None):
+        return c2c_axes(a, s, axes, True, norm)
+
+    @register_jitable
+    def ifftn(a, s=None, axes=None, norm=None):
+        return c2c_axes(a, s, axes, False, norm)
+
+    @register_jitable
+    def fft2(a, s=None, axes=(-2, -1), norm=None):
+        return c2c_axes(a, s, axes, True, norm)
+
+    @register_jitable
+    def ifft2(a, s=None, axes=(-2, -1), norm=None):
+        return c2c_axes(a, s, axes, False, norm)
+
+    return FFTImplementation(fft=fft, ifft=ifft, rfft=rfft, irfft=irfft,
+                             fftn=fftn, ifftn=ifftn, fft2=fft2, ifft2=ifft2)
+
+
+_serial_impl = make_fft_impl(register_jitable, range)
+_parallel_impl = None
+
+
+def get_fft_impl(parallel=False):
+    """
+    Return the FFTImplementation whose batched transforms run in parallel
+    if *parallel* is true.
+    """
+    global _parallel_impl
+    if not parallel:
+        return _serial_impl
+    if _parallel_impl is None:
+        from numba import njit, prange
+        # NOTE: wrap with njit(parallel=True) so that the prange loops run
+        #       on the threading layer, whatever the caller's options are
+        _parallel_impl = make_fft_impl(njit(parallel=True), prange)
+    return _parallel_impl
+
+
+# ------------------------------------------------------------------------
+# Typing of the arguments
+
+def _check_array(a, fname, real=False):
+    if not isinstance(a, types.Array) or a.ndim == 0:
+        raise TypingError("np.fft.%s() requires an array of at least one "
+                          "dimension, got %s" % (fname, a))
+    kinds = (types.Boolean, types.Integer, types.Float)
+    if not real:
+        kinds += (types.Complex,)
+    if not isinstance(a.dtype, kinds):
+        raise TypingError("np.fft.%s() not supported on %s arrays"
+                          % (fname, a.dtype))
+
+
+def _check_int(arg, name, fname):
+    if not isinstance(arg, (int, types.Integer, types.Omitted)):
+        raise TypingError("np.fft.%s(): %s must be an integer, got %s"
+                          % (fname, name, arg))
+
+
+def _check_norm(norm, fname):
+    if not (is_nonelike(norm) or isinstance(norm, (str, types.UnicodeType,
+                                                   types.StringLiteral))):
+        raise TypingError("np.fft.%s(): norm must be None or a string, "
+                          "got %s" % (fname, norm))
+
+
+def _check_ints_tuple(arg, name, fname):
+    if is_nonelike(arg):
+        return
+    if (isinstance(arg, types.UniTuple) and
+            isinstance(arg.dtype, types.Integer)):
+        return
+    raise TypingError("np.fft.%s(): %s must be None or a tuple of "
+                      "integers, got %s" % (fname, name, arg))
+
+
+def _check_1d_args(fname, a, n, axis, norm, real=False):
+    _check_array(a, fname, real=real)
+    if not is_nonelike(n):
+        _check_int(n, 'n', fname)
+    _check_int(axis, 'axis', fname)
+    _check_norm(norm, fname)
+
+
+def _check_nd_args(fname, a, s, axes, norm):
+    _check_array(a, fname)
+    _check_ints_tuple(s, 's', fname)
+    _check_ints_tuple(axes, 'axes', fname)
+    _check_norm(norm, fname)
+
+
+@overload(np.fft.fft)
+def np_fft(a, n=None, axis=-1, norm=None):
+    _check_1d_args('fft', a, n, axis, norm)
+    return _serial_impl.fft
+
+
+@overload(np.fft.ifft)
+def np_ifft(a, n=None, axis=-1, norm=None):
+    _check_1d_args('ifft', a, n, axis, norm)
+    return _serial_impl.ifft
+
+
+@overload(np.fft.rfft)
+def np_rfft(a, n=None, axis=-1, norm=None):
+    _check_1d_args('rfft', a, n, axis, norm, real=True)
+    return _serial_impl.rfft
+
+
+@overload(np.fft.irfft)
+def np_irfft(a, n=None, axis=-1, norm=None):
+    _check_1d_args('irfft', a, n, axis, norm)
+    return _serial_impl.irfft
+
+
+@overload(np.fft.fftn)
+def np_fftn(a, s=None, axes=None, norm=None):
+    _check_nd_args('fftn', a, s, axes, norm)
+    return _serial_impl.fftn
+
+
+@overload(np.fft.ifftn)
+def np_ifftn(a, s=None, axes=None, norm=None):
+    _check_nd_args('ifftn', a, s, axes, norm)
+    return _serial_impl.ifftn
+
+
+@overload(np.fft.fft2)
+def np_fft2(a, s=None, axes=(-2, -1), norm=None):
+    _check_nd_args('fft2', a, s, axes, norm)
+    return _serial_impl.fft2
+
+
+@overload(np.fft.ifft2)
+def np_ifft2(a, s=None, axes=(-2, -1), norm=None):
+    _check_nd_args('ifft2', a, s, axes, norm)
+    return _serial_impl.ifft2
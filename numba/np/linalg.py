@@ -4,6 +4,7 @@ Implementation of linear algebra operations.
 
 
 import contextlib
+from collections import namedtuple
 
 from llvmlite import ir
 
@@ -18,6 +19,7 @@ from numba.core import types, cgutils
 from numba.core.errors import TypingError
 from .arrayobj import make_array, _empty_nd_impl, array_copy
 from numba.np import numpy_support as np_support
+from numba.np.unsafe.ndarray import to_fixed_tuple
 
 ll_char = ir.IntType(8)
 ll_char_p = ll_char.as_pointer()
@@ -520,6 +522,11 @@ def dot_2(context, builder, sig, args):
     np.dot(a, b)
     a @ b
     """
+    if not is_blas_product(*sig.args):
+        impl = get_generic_dot_impl(*sig.args)
+        res = context.compile_internal(builder, impl, sig, args)
+        return impl_ret_new_ref(context, builder, sig.return_type, res)
+
     ensure_blas()
 
     with make_contiguous(context, builder, sig, args) as (sig, args):
@@ -536,9 +543,6 @@ def dot_2(context, builder, sig, args):
             assert 0
 
 
-lower_builtin(operator.matmul, types.Array, types.Array)(dot_2)
-
-
 @lower_builtin(np.vdot, types.Array, types.Array)
 def vdot(context, builder, sig, args):
     """
@@ -712,6 +716,466 @@ def dot_3(context, builder, sig, args):
         else:
             assert 0
 
+
+# -----------------------------------------------------------------------------
+# Products of non-BLAS dtypes
+
+# Blocking of the generic matrix product: a (GEMM_KC, GEMM_NC) panel of b
+# is packed to stay in the L2 cache while it is multiplied with the
+# (GEMM_MC, GEMM_KC) blocks of a, whose rows are processed in parallel
+GEMM_MC = 64
+GEMM_KC = 128
+GEMM_NC = 256
+
+# Columns of the generic vector * matrix product computed by each task
+GEVM_NC = 4096
+
+
+def is_blas_product(*arrtys):
+    """
+    Whether the product of arrays of Numba types *arrtys* is computed by
+    BLAS, i.e. whether they have the same float or complex dtype.
+    """
+    dtype = arrtys[0].dtype
+    return dtype in _blas_kinds and all(x.dtype == dtype for x in arrtys)
+
+
+def _accumulator_dtype(dtype):
+    """
+    Return the dtype in which products of result *dtype* are summed.
+    Integer products are summed in 64 bits: the result wraps around as if
+    summed in the result dtype once cast back.
+    """
+    if dtype.kind in 'fc':
+        return dtype
+    elif dtype.kind == 'u':
+        return np.dtype(np.uint64)
+    else:
+        return np.dtype(np.int64)
+
+
+_GenericDotKernels = namedtuple('_GenericDotKernels', [
+    'gemm', 'gemv', 'gevm', 'dotvv',
+])
+
+
+def _make_generic_dot_kernels(wrap, prange):
+    """
+    Make the kernels adding the product of the arrays *a* and *b* of any
+    numeric dtypes into the *acc* array of the accumulator dtype.  The
+    operands are converted to the accumulator dtype once, when packed, so
+    that the innermost loops are over contiguous data of a single dtype
+    and can be vectorized.
+    """
+    @wrap
+    def gemm(a, b, acc):
+        m, k = a.shape
+        n = b.shape[1]
+        nblocks = (m + GEMM_MC - 1) // GEMM_MC
+        bpack = np.empty((GEMM_KC, GEMM_NC), acc.dtype)
+        for j0 in range(0, n, GEMM_NC):
+            nc = min(GEMM_NC, n - j0)
+            for p0 in range(0, k, GEMM_KC):
+                kc = min(GEMM_KC, k - p0)
+                for p in range(kc):
+                    for j in range(nc):
+                        bpack[p, j] = b[p0 + p, j0 + j]
+                for ib in prange(nblocks):
+                    i0 = ib * GEMM_MC
+                    mc = min(GEMM_MC, m - i0)
+                    apack = np.empty((GEMM_MC, GEMM_KC), acc.dtype)
+                    for i in range(mc):
+                        for p in range(kc):
+                            apack[i, p] = a[i0 + i, p0 + p]
+                    for i in range(mc):
+                        row = acc[i0 + i, j0:j0 + nc]
+                        for p in range(kc):
+                            aip = apack[i, p]
+                            bp = bpack[p]
+                            for j in range(nc):
+                                row[j] += aip * bp[j]
+
+    @wrap
+    def gemv(a, x, acc):
+        m, k = a.shape
+        xpack = np.empty(k, acc.dtype)
+        for p in range(k):
+            xpack[p] = x[p]
+        for i in prange(m):
+            s = acc[i]
+            for p in range(k):
+                s += a[i, p] * xpack[p]
+            acc[i] = s
+
+    @wrap
+    def gevm(x, b, acc):
+        k, n = b.shape
+        nblocks = (n + GEVM_NC - 1) // GEVM_NC
+        xpack = np.empty(k, acc.dtype)
+        for p in range(k):
+            xpack[p] = x[p]
+        for jb in prange(nblocks):
+            j0 = jb * GEVM_NC
+            nc = min(GEVM_NC, n - j0)
+            row = acc[j0:j0 + nc]
+            for p in range(k):
+                xp = xpack[p]
+                for j in range(nc):
+                    row[j] += xp * b[p, j0 + j]
+
+    @wrap
+    def dotvv(x, y, acc):
+        k = x.shape[0]
+        xpack = np.empty(k, acc.dtype)
+        for p in prange(k):
+            xpack[p] = x[p]
+        s = acc[0]
+        for p in prange(k):
+            s += xpack[p] * y[p]
+        acc[0] = s
+
+    return _GenericDotKernels(gemm=gemm, gemv=gemv, gevm=gevm, dotvv=dotvv)
+
+
+_generic_dot_kernels = _make_generic_dot_kernels(register_jitable, range)
+
+_generic_dot_impls = {}
+
+
+def get_generic_dot_impl(aty, bty, parallel=False):
+    """
+    Return a function computing np.dot() of the 1-D or 2-D arrays of types
+    *aty* and *bty*, whose product is not computed by BLAS.  Mixed float
+    and complex products still go through BLAS after converting the
+    operands, other products run blocked loops, in parallel if *parallel*
+    is true.
+    """
+    key = aty.ndim, bty.ndim, aty.dtype, bty.dtype, parallel
+    try:
+        return _generic_dot_impls[key]
+    except KeyError:
+        pass
+
+    dtype = np.result_type(np_support.as_dtype(aty.dtype),
+                           np_support.as_dtype(bty.dtype))
+    acc_dtype = _accumulator_dtype(dtype)
+
+    if dtype.kind in 'fc':
+        try:
+            ensure_blas()
+        except ImportError:
+            use_blas = False
+        else:
+            use_blas = True
+    else:
+        use_blas = False
+
+    if use_blas:
+        # Only convert the operands which are not of the result dtype
+        res_ty = np_support.from_dtype(dtype)
+        casts = []
+        for ty in (aty, bty):
+            if ty.dtype == res_ty:
+                @register_jitable
+                def cast(x):
+                    return x
+            else:
+                @register_jitable
+                def cast(x):
+                    return x.astype(dtype)
+            casts.append(cast)
+        cast_a, cast_b = casts
+
+        @register_jitable
+        def dot_impl(a, b):
+            return np.dot(cast_a(a), cast_b(b))
+
+        _generic_dot_impls[key] = dot_impl
+        return dot_impl
+
+    if parallel:
+        from numba import njit, prange
+        # NOTE: wrap with njit(parallel=True) so that the prange loops run
+        #       on the threading layer, whatever the caller's options are
+        kernels = _make_generic_dot_kernels(njit(parallel=True), prange)
+    else:
+        kernels = _generic_dot_kernels
+    gemm, gemv, gevm, dotvv = kernels
+
+    if acc_dtype == dtype:
+        @register_jitable
+        def finish(acc):
+            return acc
+    else:
+        @register_jitable
+        def finish(acc):
+            return acc.astype(dtype)
+
+    ndims = aty.ndim, bty.ndim
+    if ndims == (2, 2):
+        @register_jitable
+        def dot_impl(a, b):
+            m, k = a.shape
+            _k, n = b.shape
+            if k != _k:
+                raise ValueError("incompatible array sizes for np.dot(a, b) "
+                                 "(matrix * matrix)")
+            acc = np.zeros((m, n), acc_dtype)
+            gemm(a, b, acc)
+            return finish(acc)
+    elif ndims == (2, 1):
+        @register_jitable
+        def dot_impl(a, b):
+            m, k = a.shape
+            _k, = b.shape
+            if k != _k:
+                raise ValueError("incompatible array sizes for np.dot(a, b) "
+                                 "(matrix * vector)")
+            acc = np.zeros(m, acc_dtype)
+            gemv(a, b, acc)
+            return finish(acc)
+    elif ndims == (1, 2):
+        @register_jitable
+        def dot_impl(a, b):
+            k, = a.shape
+            _k, n = b.shape
+            if k != _k:
+                raise ValueError("incompatible array sizes for np.dot(a, b) "
+                                 "(vector * matrix)")
+            acc = np.zeros(n, acc_dtype)
+            gevm(a, b, acc)
+            return finish(acc)
+    elif ndims == (1, 1):
+        @register_jitable
+        def dot_impl(a, b):
+            k, = a.shape
+            _k, = b.shape
+            if k != _k:
+                raise ValueError("incompatible array sizes for np.dot(a, b) "
+                                 "(vector * vector)")
+            acc = np.zeros(1, acc_dtype)
+            dotvv(a, b, acc)
+            return finish(acc)[0]
+    else:
+        assert 0
+
+    _generic_dot_impls[key] = dot_impl
+    return dot_impl
+
+
+def _dot_into(a, b, out):
+    """
+    Store into the 2-D *out* the matrix product of the 2-D arrays *a* and
+    *b*, whose inner dimension is not zero.
+    """
+    raise NotImplementedError
+
+
+@overload(_dot_into)
+def _dot_into_impl(a, b, out):
+    if is_blas_product(a, b, out):
+        def impl(a, b, out):
+            np.dot(a, b, out)
+    else:
+        gemm = _generic_dot_kernels.gemm
+        acc_dtype = _accumulator_dtype(np_support.as_dtype(out.dtype))
+        if acc_dtype == np_support.as_dtype(out.dtype):
+            def impl(a, b, out):
+                out[...] = 0
+                gemm(a, b, out)
+        else:
+            def impl(a, b, out):
+                acc = np.zeros(out.shape, acc_dtype)
+                gemm(a, b, acc)
+                out[...] = acc
+    return impl
+
+
+# -----------------------------------------------------------------------------
+# Stacks of matrices
+
+@register_jitable
+def _matmul_batch_shape(ashape, bshape):
+    """
+    Return the broadcast of the *ashape* and *bshape* arrays of batch
+    dimensions.
+    """
+    na = len(ashape)
+    nb = len(bshape)
+    n = max(na, nb)
+    res = np.empty(n, np.intp)
+    for i in range(n):
+        da = ashape[i - n + na] if i >= n - na else 1
+        db = bshape[i - n + nb] if i >= n - nb else 1
+        if da != db and da != 1 and db != 1:
+            raise ValueError("matmul: the stacks of matrices could not be "
+                             "broadcast together")
+        res[i] = db if da == 1 else da
+    return res
+
+
+@register_jitable
+def _matmul_batch_indices(shape, batch_shape):
+    """
+    Return the position in a stack of the batch dimensions *shape* of each
+    matrix of the broadcast stack of dimensions *batch_shape*.
+    """
+    nbatch = 1
+    for d in batch_shape:
+        nbatch *= d
+    lead = len(batch_shape) - len(shape)
+    res = np.empty(nbatch, np.intp)
+    for t in range(nbatch):
+        rem = t
+        pos = 0
+        stride = 1
+        for i in range(len(batch_shape) - 1, lead - 1, -1):
+            c = rem % batch_shape[i]
+            rem //= batch_shape[i]
+            d = shape[i - lead]
+            if d != 1:
+                pos += c * stride
+            stride *= d
+        res[t] = pos
+    return res
+
+
+def _make_matmul_kernel(wrap, prange):
+    """
+    Make a function storing into the 3-D *out* the products of the
+    matrices of the 3-D stacks *a* and *b* at the positions given by the
+    *ia* and *ib* arrays.
+    """
+    @wrap
+    def matmul_stacks(a, b, ia, ib, out):
+        if a.shape[2] == 0:
+            out[...] = 0
+            return
+        for t in prange(out.shape[0]):
+            _dot_into(a[ia[t]], b[ib[t]], out[t])
+
+    return matmul_stacks
+
+
+@register_jitable
+def _stack_shape(shape, ndim):
+    res = np.empty(max(ndim - 2, 0), np.intp)
+    for i in range(ndim - 2):
+        res[i] = shape[i]
+    return res
+
+
+_matmul_impls = {}
+
+
+def get_matmul_impl(aty, bty, parallel=False):
+    """
+    Return a function multiplying the stacks of matrices of types *aty*
+    and *bty* as np.matmul() does.  If *parallel* is true, the products of
+    the matrices are computed in parallel.
+    """
+    key = aty.ndim, bty.ndim, aty.dtype, bty.dtype, parallel
+    try:
+        return _matmul_impls[key]
+    except KeyError:
+        pass
+
+    if parallel:
+        from numba import njit, prange
+        # NOTE: wrap with njit(parallel=True) so that the prange loop runs
+        #       on the threading layer, whatever the caller's options are
+        kernel = _make_matmul_kernel(njit(parallel=True), prange)
+    else:
+        kernel = _make_matmul_kernel(register_jitable, range)
+
+    a_ndim = aty.ndim
+    b_ndim = bty.ndim
+    out_ndim = max(a_ndim - 2, b_ndim - 2, 0) + (a_ndim > 1) + (b_ndim > 1)
+    dtype = np.result_type(np_support.as_dtype(aty.dtype),
+                           np_support.as_dtype(bty.dtype))
+
+    def make_convert(ty):
+        # Mixed float and complex operands are converted to the result
+        # dtype for BLAS, other products are done by the generic kernel
+        if dtype.kind in 'fc' and ty.dtype != np_support.from_dtype(dtype):
+            @register_jitable
+            def convert(x):
+                return x.astype(dtype)
+        else:
+            @register_jitable
+            def convert(x):
+                return np.ascontiguousarray(x)
+        return convert
+
+    convert_a = make_convert(aty)
+    convert_b = make_convert(bty)
+
+    # Vectors are promoted to a matrix with a single row (for a) or
+    # column (for b)
+    if a_ndim == 1:
+        @register_jitable
+        def as_stack_a(a, nbatch):
+            return convert_a(a).reshape((1, 1, a.shape[0]))
+    else:
+        @register_jitable
+        def as_stack_a(a, nbatch):
+            a = convert_a(a)
+            return a.reshape((nbatch, a.shape[-2], a.shape[-1]))
+    if b_ndim == 1:
+        @register_jitable
+        def as_stack_b(b, nbatch):
+            return convert_b(b).reshape((1, b.shape[0], 1))
+    else:
+        @register_jitable
+        def as_stack_b(b, nbatch):
+            b = convert_b(b)
+            return b.reshape((nbatch, b.shape[-2], b.shape[-1]))
+
+    @register_jitable
+    def matmul_impl(a, b):
+        a_batch = _stack_shape(a.shape, a_ndim)
+        b_batch = _stack_shape(b.shape, b_ndim)
+        batch = _matmul_batch_shape(a_batch, b_batch)
+        a3 = as_stack_a(a, np.prod(a_batch))
+        b3 = as_stack_b(b, np.prod(b_batch))
+        m, k = a3.shape[1:]
+        _k, n = b3.shape[1:]
+        if k != _k:
+            raise ValueError("matmul: mismatch in the core dimension of "
+                             "the operands")
+        ia = _matmul_batch_indices(a_batch, batch)
+        ib = _matmul_batch_indices(b_batch, batch)
+        out = np.empty((ia.size, m, n), dtype)
+        kernel(a3, b3, ia, ib, out)
+
+        shape = np.empty(out_ndim, np.intp)
+        shape[:batch.size] = batch
+        if a_ndim > 1:
+            shape[batch.size] = m
+        if b_ndim > 1:
+            shape[out_ndim - 1] = n
+        return out.reshape(to_fixed_tuple(shape, out_ndim))
+
+    _matmul_impls[key] = matmul_impl
+    return matmul_impl
+
+
+@lower_builtin(operator.matmul, types.Array, types.Array)
+@lower_builtin(np.matmul, types.Array, types.Array)
+def matmul_2(context, builder, sig, args):
+    """
+    a @ b
+    np.matmul(a, b)
+    """
+    if all(x.ndim <= 2 for x in sig.args):
+        return dot_2(context, builder, sig, args)
+
+    if isinstance(sig.return_type.dtype, (types.Float, types.Complex)):
+        ensure_blas()
+    impl = get_matmul_impl(*sig.args)
+    res = context.compile_internal(builder, impl, sig, args)
+    return impl_ret_new_ref(context, builder, sig.return_type, res)
+
 fatal_error_sig = types.intc()
 fatal_error_func = types.ExternalFunction("numba_fatal_error", fatal_error_sig)
 
@@ -2781,3 +3245,387 @@ def kron_impl(a, b):
         return ret_c(a, b, C)
 
     return kron_impl
+
+
+# -----------------------------------------------------------------------------
+# Tensor contractions
+
+def _dot_2d(a, b):
+    """
+    Return the matrix product of the 2-D arrays *a* and *b* of any numeric
+    dtypes.
+    """
+    raise NotImplementedError
+
+
+@overload(_dot_2d)
+def _dot_2d_impl(a, b):
+    if is_blas_product(a, b):
+        def impl(a, b):
+            if a.shape[1] == 0:
+                return np.zeros((a.shape[0], b.shape[1]), a.dtype)
+            return np.dot(a, b)
+    else:
+        impl = get_generic_dot_impl(a, b)
+    return impl
+
+
+@register_jitable
+def _normalize_tensordot_axis(axis, ndim):
+    if axis < -ndim or axis >= ndim:
+        raise ValueError("np.tensordot(): axis out of bounds")
+    if axis < 0:
+        axis += ndim
+    return axis
+
+
+def _get_tensordot_impl(a_ndim, b_ndim, naxes):
+    out_ndim = a_ndim + b_ndim - 2 * naxes
+
+    @register_jitable
+    def tensordot_axes(a, b, axes_a, axes_b):
+        summed_a = np.zeros(a_ndim, np.bool_)
+        summed_b = np.zeros(b_ndim, np.bool_)
+        perm_a = np.empty(a_ndim, np.intp)
+        perm_b = np.empty(b_ndim, np.intp)
+        k = 1
+        for i in range(naxes):
+            ax = _normalize_tensordot_axis(axes_a[i], a_ndim)
+            bx = _normalize_tensordot_axis(axes_b[i], b_ndim)
+            if summed_a[ax] or summed_b[bx]:
+                raise ValueError("np.tensordot(): repeated axis")
+            if a.shape[ax] != b.shape[bx]:
+                raise ValueError("np.tensordot(): shape-mismatch for sum")
+            summed_a[ax] = True
+            summed_b[bx] = True
+            # The summed axes come last in a, first in b
+            perm_a[a_ndim - naxes + i] = ax
+            perm_b[i] = bx
+            k *= a.shape[ax]
+
+        shape = np.empty(out_ndim, np.intp)
+        m = 1
+        j = 0
+        for i in range(a_ndim):
+            if not summed_a[i]:
+                perm_a[j] = i
+                shape[j] = a.shape[i]
+                m *= a.shape[i]
+                j += 1
+        n = 1
+        for i in range(b_ndim):
+            if not summed_b[i]:
+                perm_b[naxes + j - (a_ndim - naxes)] = i
+                shape[j] = b.shape[i]
+                n *= b.shape[i]
+                j += 1
+
+        a2 = np.ascontiguousarray(a.transpose(to_fixed_tuple(perm_a, a_ndim)))
+        b2 = np.ascontiguousarray(b.transpose(to_fixed_tuple(perm_b, b_ndim)))
+        res = _dot_2d(a2.reshape((m, k)), b2.reshape((k, n)))
+        return res.reshape(to_fixed_tuple(shape, out_ndim))
+
+    return tensordot_axes
+
+
+@overload(np.tensordot)
+def tensordot_impl(a, b, axes=2):
+    if not isinstance(a, types.Array) or not isinstance(b, types.Array):
+        raise TypingError("np.tensordot() only supported on arrays")
+
+    def check_naxes(naxes):
+        if naxes < 0 or naxes > min(a.ndim, b.ndim):
+            raise TypingError("np.tensordot(): axes out of bounds")
+
+    if isinstance(axes, (int, types.IntegerLiteral, types.Omitted)):
+        # The last *axes* axes of a are summed with the first ones of b
+        if isinstance(axes, types.IntegerLiteral):
+            naxes = axes.literal_value
+        else:
+            naxes = getattr(axes, 'value', axes)
+        check_naxes(naxes)
+        axes_a = tuple(range(a.ndim - naxes, a.ndim))
+        axes_b = tuple(range(naxes))
+        tensordot_axes = _get_tensordot_impl(a.ndim, b.ndim, naxes)
+
+        def impl(a, b, axes=2):
+            return tensordot_axes(a, b, axes_a, axes_b)
+        return impl
+
+    if isinstance(axes, types.BaseTuple) and len(axes) == 2:
+        if all(isinstance(x, types.Integer) for x in axes):
+            check_naxes(1)
+            tensordot_axes = _get_tensordot_impl(a.ndim, b.ndim, 1)
+
+            def impl(a, b, axes=2):
+                return tensordot_axes(a, b, (axes[0],), (axes[1],))
+            return impl
+
+        if (all(isinstance(x, types.UniTuple) and
+                isinstance(x.dtype, types.Integer) for x in axes) and
+                len(axes[0]) == len(axes[1])):
+            naxes = len(axes[0])
+            check_naxes(naxes)
+            tensordot_axes = _get_tensordot_impl(a.ndim, b.ndim, naxes)
+
+            def impl(a, b, axes=2):
+                return tensordot_axes(a, b, axes[0], axes[1])
+            return impl
+
+    raise TypingError("np.tensordot(): axes must be a constant integer or a "
+                      "pair of integers or of same-length tuples of "
+                      "integers, got %s" % (axes,))
+
+
+def _parse_einsum_subscripts(subscripts, ndims):
+    """
+    Parse the einsum *subscripts* of operands of dimensions *ndims*,
+    returning the labels of each operand and of the output.
+    """
+    subscripts = subscripts.replace(' ', '')
+    if '.' in subscripts:
+        raise TypingError("np.einsum(): ellipses in subscripts are not "
+                          "supported")
+    if '->' in subscripts:
+        inputs, output = subscripts.split('->')
+    else:
+        inputs = subscripts
+        # Implicit mode: the labels appearing once, in alphabetical order
+        output = ''.join(sorted(c for c in set(inputs)
+                                if c.isalpha() and inputs.count(c) == 1))
+    inputs = inputs.split(',')
+    if len(inputs) != len(ndims):
+        raise TypingError("np.einsum(): %d operands given but the subscripts "
+                          "describe %d" % (len(ndims), len(inputs)))
+    for i, (labels, ndim) in enumerate(zip(inputs, ndims)):
+        if not all(c.isalpha() for c in labels):
+            raise TypingError("np.einsum(): invalid subscripts %r"
+                              % (subscripts,))
+        if len(labels) != ndim:
+            raise TypingError("np.einsum(): operand %d has %d dimensions but "
+                              "its subscripts have %d labels"
+                              % (i, ndim, len(labels)))
+    for c in output:
+        if not c.isalpha() or output.count(c) > 1:
+            raise TypingError("np.einsum(): invalid output subscripts %r"
+                              % (output,))
+        if not any(c in labels for labels in inputs):
+            raise TypingError("np.einsum(): output label %r does not appear "
+                              "in the inputs" % (c,))
+    return inputs, output
+
+
+def _plan_einsum(inputs, output):
+    """
+    Return the steps computing the einsum of operands labelled *inputs*
+    into *output*: ('loops', [i], labels) reduces operand i with loops,
+    ('pair', [i, j], labels) contracts operands i and j.  The result of a
+    step is appended to the operands, which the later steps refer to.
+
+    The operand pairs are chosen greedily, the smallest result first.
+    The dimensions are only known at runtime, so that the sizes are
+    estimated from the number of labels.
+    """
+    ops = list(inputs)
+    live = list(range(len(ops)))
+    steps = []
+
+    def needed(exclude):
+        labels = set(output)
+        for k in live:
+            if k not in exclude:
+                labels.update(ops[k])
+        return labels
+
+    def add_step(kind, args, labels):
+        steps.append((kind, args, labels))
+        ops.append(labels)
+        live[:] = [k for k in live if k not in args] + [len(ops) - 1]
+
+    if len(ops) > 1:
+        # Take the diagonals and sum the labels private to an operand first
+        for i in range(len(inputs)):
+            keep = needed([i])
+            labels = ''.join(c for j, c in enumerate(ops[i])
+                             if c in keep and c not in ops[i][:j])
+            if labels != ops[i]:
+                add_step('loops', [i], labels)
+
+    while len(live) > 1:
+        best = None
+        for x in range(len(live)):
+            for y in range(x + 1, len(live)):
+                keep = needed([live[x], live[y]])
+                # Prefer the order of the operands giving the output
+                for i, j in [(live[x], live[y]), (live[y], live[x])]:
+                    a, b = ops[i], ops[j]
+                    batch = [c for c in a if c in b and c in keep]
+                    labels = ''.join(batch + [c for c in a if c not in b] +
+                                     [c for c in b if c not in a])
+                    cost = (len(labels), len(set(a) | set(b)),
+                            labels != output)
+                    if best is None or cost < best[0]:
+                        best = cost, [i, j], labels
+        add_step('pair', best[1], best[2])
+
+    if not steps or ops[live[0]] != output:
+        add_step('loops', live[:1], output)
+    return steps
+
+
+def _einsum_loops_source(name, inputs, output):
+    """
+    Return the source of a function *name* computing the einsum of its
+    operands labelled *inputs* into the *output* array with a loop nest.
+    """
+    args = ['op%d' % i for i in range(len(inputs))]
+    lines = ['def %s(%s):' % (name, ', '.join(args))]
+    summed = []
+    for labels_i in inputs:
+        summed.extend(c for c in labels_i
+                      if c not in output and c not in summed)
+    seen = set()
+    for arg, labels_i in zip(args, inputs):
+        for j, c in enumerate(labels_i):
+            if c in seen:
+                lines.append('    if %s.shape[%d] != d_%s:' % (arg, j, c))
+                lines.append('        raise ValueError("np.einsum(): '
+                             'operands could not be broadcast together")')
+            else:
+                lines.append('    d_%s = %s.shape[%d]' % (c, arg, j))
+                seen.add(c)
+
+    def index(labels_i):
+        return ', '.join(labels_i) or '()'
+
+    lines.append('    out = np.empty((%s), dtype)'
+                 % ''.join('d_%s, ' % c for c in output))
+    # The labels summed over come innermost, accumulating in a scalar
+    indent = '    '
+    for c in output:
+        lines.append(indent + 'for %s in range(d_%s):' % (c, c))
+        indent += '    '
+    lines.append(indent + 'acc = zero')
+    inner = indent
+    for c in summed:
+        lines.append(inner + 'for %s in range(d_%s):' % (c, c))
+        inner += '    '
+    product = ' * '.join('%s[%s]' % (arg, index(labels_i))
+                         for arg, labels_i in zip(args, inputs))
+    lines.append(inner + 'acc += %s' % (product,))
+    lines.append(indent + 'out[%s] = acc' % (index(output),))
+    lines.append('    return out')
+    return '\n'.join(lines)
+
+
+def _einsum_pair_source(name, a, b, labels):
+    """
+    Return the source of a function *name* contracting operands labelled
+    *a* and *b*, without repeated labels, into *labels* with a product of
+    (stacks of) matrices.
+    """
+    batch = [c for c in labels if c in a and c in b]
+    a_free = [c for c in a if c not in b]
+    b_free = [c for c in b if c not in a]
+    summed = [c for c in a if c in b and c not in batch]
+    lines = ['def %s(a, b):' % (name,)]
+    for c in a:
+        lines.append('    d_%s = a.shape[%d]' % (c, a.index(c)))
+    for c in b:
+        if c in a:
+            lines.append('    if b.shape[%d] != d_%s:' % (b.index(c), c))
+            lines.append('        raise ValueError("np.einsum(): operands '
+                         'could not be broadcast together")')
+        else:
+            lines.append('    d_%s = b.shape[%d]' % (c, b.index(c)))
+
+    def transposed(arg, labels_i, order):
+        perm = [labels_i.index(c) for c in order]
+        if perm == sorted(perm):
+            return 'np.ascontiguousarray(%s)' % (arg,)
+        return ('np.ascontiguousarray(%s.transpose((%s,)))'
+                % (arg, ', '.join(map(str, perm))))
+
+    def size(labels_i):
+        return ' * '.join('d_' + c for c in labels_i) or '1'
+
+    lines.append('    a3 = %s.reshape((%s, %s, %s))'
+                 % (transposed('a', a, batch + a_free + summed),
+                    size(batch), size(a_free), size(summed)))
+    lines.append('    b3 = %s.reshape((%s, %s, %s))'
+                 % (transposed('b', b, batch + summed + b_free),
+                    size(batch), size(summed), size(b_free)))
+    lines.append('    out = np.empty(a3.shape[:2] + b3.shape[2:], dtype)')
+    lines.append('    matmul_stacks(a3, b3, np.arange(a3.shape[0]), '
+                 'np.arange(b3.shape[0]), out)')
+    lines.append('    return out.reshape((%s))'
+                 % ''.join('d_%s, ' % c for c in labels))
+    return '\n'.join(lines)
+
+
+_einsum_impls = {}
+
+
+def get_einsum_impl(subscripts, operands):
+    """
+    Return a function computing the einsum of the *operands*, a tuple of
+    array types, as described by the constant *subscripts*.
+    """
+    key = subscripts, operands
+    try:
+        return _einsum_impls[key]
+    except KeyError:
+        pass
+
+    inputs, output = _parse_einsum_subscripts(subscripts,
+                                              [op.ndim for op in operands])
+    dtype = np.result_type(*[np_support.as_dtype(op.dtype)
+                             for op in operands])
+    use_blas = dtype.kind in 'fc'
+    if use_blas:
+        try:
+            ensure_blas()
+        except ImportError:
+            use_blas = False
+    ns = {'np': np, 'dtype': dtype, 'zero': dtype.type(0),
+          'matmul_stacks': _make_matmul_kernel(register_jitable, range)}
+
+    ops = list(inputs)
+    body = ['def einsum_impl(subscripts, *operands):']
+    names = []
+    for i in range(len(inputs)):
+        names.append('v%d' % i)
+        body.append('    v%d = operands[%d]' % (i, i))
+        if use_blas and operands[i].dtype != np_support.from_dtype(dtype):
+            body.append('    v%d = v%d.astype(dtype)' % (i, i))
+    for n, (kind, args, labels) in enumerate(_plan_einsum(inputs, output)):
+        step = 'step%d' % n
+        if kind == 'pair' and use_blas:
+            src = _einsum_pair_source(step, ops[args[0]], ops[args[1]],
+                                      labels)
+        else:
+            src = _einsum_loops_source(step, [ops[i] for i in args], labels)
+        exec(src, ns)
+        ns[step] = register_jitable(ns[step])
+        names.append('v%d' % len(ops))
+        body.append('    %s = %s(%s)' % (names[-1], step,
+                                         ', '.join(names[i] for i in args)))
+        ops.append(labels)
+    if output:
+        body.append('    return %s' % (names[-1],))
+    else:
+        body.append('    return %s[()]' % (names[-1],))
+    exec('\n'.join(body), ns)
+    impl = ns['einsum_impl']
+    _einsum_impls[key] = impl
+    return impl
+
+
+@overload(np.einsum)
+def einsum_impl(subscripts, *operands):
+    if not isinstance(subscripts, types.StringLiteral):
+        raise TypingError("np.einsum() requires constant subscripts")
+    if not operands or not all(isinstance(op, types.Array)
+                               for op in operands):
+        raise TypingError("np.einsum() only supported on arrays")
+    return get_einsum_impl(subscripts.literal_value, tuple(operands))
@@ -71,7 +71,8 @@ class _ScalarHelper(object):
         intpty = ctxt.get_value_type(types.intp)
         self.shape = [lc.Constant.int(intpty, 1)]
 
-        lty = ctxt.get_data_type(ty) if ty != types.boolean else lc.Type.int(1)
+        lty = (ctxt.get_data_type(ty) if not isinstance(ty, types.Boolean)
+               else lc.Type.int(1))
         self._ptr = cgutils.alloca_once(bld, lty)
 
     def create_iter_indices(self):
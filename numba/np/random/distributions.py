@@ -0,0 +1,202 @@
+"""
+Sampling algorithms for np.random.Generator, following NumPy's
+distributions.c.  Each sampler is specialized for a bit generator by the
+make_*() factories, given the bit generator's BitGeneratorImpl.
+"""
+
+import math
+
+import numpy as np
+
+from numba.core.extending import register_jitable
+from numba.np.random.generator_core import mulhilo64
+
+
+_U1 = np.uint64(1)
+_U3 = np.uint64(3)
+_U8 = np.uint64(8)
+_U32 = np.uint64(32)
+_UMASK8 = np.uint64(0xFF)
+_UMASK32 = np.uint64(0xFFFFFFFF)
+_UMASK52 = np.uint64(0x000FFFFFFFFFFFFF)
+_UMAX64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+# ------------------------------------------------------------------------
+# Ziggurat tables for the standard normal distribution (256 layers)
+
+ZIGGURAT_NOR_R = 3.6541528853610088
+ZIGGURAT_NOR_INV_R = 1.0 / ZIGGURAT_NOR_R
+ZIGGURAT_NOR_V = 0.00492867323399
+
+
+def ziggurat_normal_tables(nbits):
+    """
+    Compute the (ki, wi, fi) ziggurat tables for the standard normal
+    distribution when drawing *nbits* random bits for the abscissa, as in
+    Marsaglia & Tsang's zigset().
+    """
+    m = float(2 ** nbits)
+    ki = np.zeros(256, dtype=np.uint64)
+    wi = np.zeros(256, dtype=np.float64)
+    fi = np.zeros(256, dtype=np.float64)
+    dn = tn = ZIGGURAT_NOR_R
+    q = ZIGGURAT_NOR_V / math.exp(-0.5 * dn * dn)
+    ki[0] = int((dn / q) * m)
+    ki[1] = 0
+    wi[0] = q / m
+    wi[255] = dn / m
+    fi[0] = 1.0
+    fi[255] = math.exp(-0.5 * dn * dn)
+    for i in range(254, 0, -1):
+        dn = math.sqrt(-2.0 * math.log(ZIGGURAT_NOR_V / dn +
+                                       math.exp(-0.5 * dn * dn)))
+        ki[i + 1] = int((dn / tn) * m)
+        tn = dn
+        fi[i] = math.exp(-0.5 * dn * dn)
+        wi[i] = dn / m
+    return ki, wi, fi
+
+
+_NOR_KI, _NOR_WI, _NOR_FI = ziggurat_normal_tables(52)
+
+
+def make_standard_normal(impl):
+    next_uint64 = impl.next_uint64
+    next_double = impl.next_double
+
+    @register_jitable
+    def standard_normal(state):
+        while True:
+            r = next_uint64(state)
+            idx = np.intp(r & _UMASK8)
+            r >>= _U8
+            rabs = (r >> _U1) & _UMASK52
+            x = np.float64(rabs) * _NOR_WI[idx]
+            if r & _U1:
+                x = -x
+            if rabs < _NOR_KI[idx]:
+                # Fast path, ~99.3% of the draws
+                return x
+            if idx == 0:
+                # Tail: use 1 - U to avoid log(0)
+                while True:
+                    xx = -ZIGGURAT_NOR_INV_R * math.log1p(-next_double(state))
+                    yy = -math.log1p(-next_double(state))
+                    if yy + yy > xx * xx:
+                        if (rabs >> _U8) & _U1:
+                            return -(ZIGGURAT_NOR_R + xx)
+                        return ZIGGURAT_NOR_R + xx
+            else:
+                if ((_NOR_FI[idx - 1] - _NOR_FI[idx]) * next_double(state) +
+                        _NOR_FI[idx]) < math.exp(-0.5 * x * x):
+                    return x
+
+    return standard_normal
+
+
+# ------------------------------------------------------------------------
+# Ziggurat tables for the standard exponential distribution (256 layers)
+
+ZIGGURAT_EXP_R = 7.6971174701310497
+ZIGGURAT_EXP_V = 3.9496598225815571993e-3
+
+
+def ziggurat_exponential_tables(nbits):
+    """
+    Compute the (ke, we, fe) ziggurat tables for the standard exponential
+    distribution when drawing *nbits* random bits, as in Marsaglia & Tsang's
+    zigset().
+    """
+    m = float(2 ** nbits)
+    ke = np.zeros(256, dtype=np.uint64)
+    we = np.zeros(256, dtype=np.float64)
+    fe = np.zeros(256, dtype=np.float64)
+    de = te = ZIGGURAT_EXP_R
+    q = ZIGGURAT_EXP_V / math.exp(-de)
+    ke[0] = int((de / q) * m)
+    ke[1] = 0
+    we[0] = q / m
+    we[255] = de / m
+    fe[0] = 1.0
+    fe[255] = math.exp(-de)
+    for i in range(254, 0, -1):
+        de = -math.log(ZIGGURAT_EXP_V / de + math.exp(-de))
+        ke[i + 1] = int((de / te) * m)
+        te = de
+        fe[i] = math.exp(-de)
+        we[i] = de / m
+    return ke, we, fe
+
+
+_EXP_KE, _EXP_WE, _EXP_FE = ziggurat_exponential_tables(53)
+
+
+def make_standard_exponential(impl):
+    next_uint64 = impl.next_uint64
+    next_double = impl.next_double
+
+    @register_jitable
+    def standard_exponential(state):
+        while True:
+            ri = next_uint64(state) >> _U3
+            idx = np.intp(ri & _UMASK8)
+            ri >>= _U8
+            x = np.float64(ri) * _EXP_WE[idx]
+            if ri < _EXP_KE[idx]:
+                # Fast path, ~98.9% of the draws
+                return x
+            if idx == 0:
+                return ZIGGURAT_EXP_R - math.log1p(-next_double(state))
+            if ((_EXP_FE[idx - 1] - _EXP_FE[idx]) * next_double(state) +
+                    _EXP_FE[idx]) < math.exp(-x):
+                return x
+
+    return standard_exponential
+
+
+# ------------------------------------------------------------------------
+# Bounded integers, using Lemire's multiply-and-reject method
+
+def make_bounded_uint64(impl):
+    next_uint64 = impl.next_uint64
+    next_uint32 = impl.next_uint32
+
+    @register_jitable
+    def bounded_lemire_uint32(state, rng):
+        rng_excl = rng + _U1
+        m = next_uint32(state) * rng_excl
+        leftover = m & _UMASK32
+        if leftover < rng_excl:
+            threshold = (_UMASK32 - rng) % rng_excl
+            while leftover < threshold:
+                m = next_uint32(state) * rng_excl
+                leftover = m & _UMASK32
+        return m >> _U32
+
+    @register_jitable
+    def bounded_lemire_uint64(state, rng):
+        rng_excl = rng + _U1
+        hi, lo = mulhilo64(next_uint64(state), rng_excl)
+        if lo < rng_excl:
+            threshold = (_UMAX64 - rng) % rng_excl
+            while lo < threshold:
+                hi, lo = mulhilo64(next_uint64(state), rng_excl)
+        return hi
+
+    @register_jitable
+    def bounded_uint64(state, rng):
+        """
+        A random integer in the closed interval [0, rng].
+        """
+        if rng == 0:
+            return rng
+        elif rng <= _UMASK32:
+            if rng == _UMASK32:
+                return next_uint32(state)
+            return bounded_lemire_uint32(state, rng)
+        elif rng == _UMAX64:
+            return next_uint64(state)
+        return bounded_lemire_uint64(state, rng)
+
+    return bounded_uint64
@@ -0,0 +1,729 @@
+"""
+Native support for NumPy's np.random.Generator and its bit generators.
+
+The PCG64 and Philox algorithms and the SeedSequence hashing used to seed
+them are reimplemented here so that streams drawn in nopython mode are
+identical to the ones drawn from the same generator in the interpreter.
+
+A bit generator is represented natively by two small arrays:
+
+* ``state`` (uint64) holds the algorithm state words, see the layouts below;
+* ``seed`` (uint32) holds the SeedSequence material needed for spawning:
+  ``[n_children_spawned, n_entropy, entropy..., spawn_key...]``, or is
+  empty when the bit generator was not seeded from a SeedSequence.
+
+Objects passed in from Python keep a reference to their original, which
+receives the updated state when the compiled function returns.
+"""
+
+import collections
+
+import numpy as np
+
+from numba.core import cgutils, types
+from numba.core.extending import (box, intrinsic, make_attribute_wrapper,
+                                  models, reflect, register_jitable,
+                                  register_model, unbox, NativeValue)
+
+
+state_array_type = types.Array(types.uint64, 1, 'C')
+seed_array_type = types.Array(types.uint32, 1, 'C')
+
+
+@register_model(types.NumPyRandomBitGeneratorType)
+@register_model(types.NumPyRandomGeneratorType)
+class NumPyRandomGeneratorModel(models.StructModel):
+    def __init__(self, dmm, fe_type):
+        members = [
+            ('state', state_array_type),
+            ('seed', seed_array_type),
+            ('parent', types.pyobject),
+        ]
+        super(NumPyRandomGeneratorModel, self).__init__(dmm, fe_type, members)
+
+
+make_attribute_wrapper(types.NumPyRandomBitGeneratorType, 'state', '_state')
+make_attribute_wrapper(types.NumPyRandomBitGeneratorType, 'seed', '_seed')
+make_attribute_wrapper(types.NumPyRandomGeneratorType, 'state', '_state')
+make_attribute_wrapper(types.NumPyRandomGeneratorType, 'seed', '_seed')
+
+
+# ------------------------------------------------------------------------
+# Conversion between the Python objects and the native state words.
+# These helpers run in the interpreter and are called from the boxing code.
+
+_MASK32 = (1 << 32) - 1
+_MASK64 = (1 << 64) - 1
+
+
+def _int_to_words(n):
+    if n < 0:
+        raise ValueError("expected non-negative integer")
+    words = [n & _MASK32]
+    n >>= 32
+    while n > 0:
+        words.append(n & _MASK32)
+        n >>= 32
+    return words
+
+
+def _coerce_to_words(x):
+    # Same interpretation of entropy and spawn keys as SeedSequence
+    if isinstance(x, (int, np.integer)):
+        return _int_to_words(int(x))
+    words = []
+    for v in x:
+        words.extend(_coerce_to_words(v))
+    return words
+
+
+def _words_to_entropy(words):
+    words = [int(w) for w in words]
+    if len(words) == 1 or words[-1] != 0:
+        # Canonical form, an integer gives back the same words
+        return sum(w << (32 * i) for i, w in enumerate(words))
+    return words
+
+
+def _get_seed_seq(bit_generator):
+    seed_seq = getattr(bit_generator, 'seed_seq', None)
+    if seed_seq is None:
+        seed_seq = getattr(bit_generator, '_seed_seq', None)
+    if (isinstance(seed_seq, np.random.SeedSequence) and
+            seed_seq.pool_size == _POOL_SIZE):
+        return seed_seq
+
+
+def _get_state_words(bit_generator):
+    st = bit_generator.state
+    if st['bit_generator'] == 'PCG64':
+        state, inc = st['state']['state'], st['state']['inc']
+        words = [state >> 64, state & _MASK64, inc >> 64, inc & _MASK64,
+                 st['has_uint32'], st['uinteger']]
+    else:
+        words = (list(st['state']['counter']) + list(st['state']['key']) +
+                 list(st['buffer']) +
+                 [st['buffer_pos'], st['has_uint32'], st['uinteger']])
+    return np.array([int(w) for w in words], dtype=np.uint64)
+
+
+def _set_state_words(bit_generator, words):
+    words = [int(w) for w in words]
+    kind = type(bit_generator).__name__
+    if kind == 'PCG64':
+        st = {'bit_generator': kind,
+              'state': {'state': (words[0] << 64) | words[1],
+                        'inc': (words[2] << 64) | words[3]},
+              'has_uint32': words[4],
+              'uinteger': words[5]}
+    else:
+        st = {'bit_generator': kind,
+              'state': {'counter': np.array(words[0:4], dtype=np.uint64),
+                        'key': np.array(words[4:6], dtype=np.uint64)},
+              'buffer': np.array(words[6:10], dtype=np.uint64),
+              'buffer_pos': words[10],
+              'has_uint32': words[11],
+              'uinteger': words[12]}
+    bit_generator.state = st
+
+
+def _get_seed_words(bit_generator):
+    seed_seq = _get_seed_seq(bit_generator)
+    if seed_seq is None:
+        return np.empty(0, dtype=np.uint32)
+    entropy = _coerce_to_words(seed_seq.entropy)
+    spawn_key = _coerce_to_words(seed_seq.spawn_key)
+    words = [seed_seq.n_children_spawned, len(entropy)] + entropy + spawn_key
+    return np.array(words, dtype=np.uint32)
+
+
+def _as_bit_generator(obj):
+    if isinstance(obj, np.random.Generator):
+        return obj.bit_generator
+    return obj
+
+
+def _unbox_bit_generator(obj):
+    bit_generator = _as_bit_generator(obj)
+    return _get_state_words(bit_generator), _get_seed_words(bit_generator)
+
+
+def _reflect_bit_generator(obj, state, seed):
+    bit_generator = _as_bit_generator(obj)
+    _set_state_words(bit_generator, state)
+    seed_seq = _get_seed_seq(bit_generator)
+    if len(seed) and seed_seq is not None:
+        # SeedSequence attributes are read-only, catch up by spawning
+        spawned = int(seed[0]) - seed_seq.n_children_spawned
+        if spawned > 0:
+            seed_seq.spawn(spawned)
+
+
+def _box_bit_generator(kind, state, seed, as_generator):
+    if len(seed):
+        n_entropy = int(seed[1])
+        entropy = _words_to_entropy(seed[2:2 + n_entropy])
+        spawn_key = tuple(int(w) for w in seed[2 + n_entropy:])
+        seed_seq = np.random.SeedSequence(entropy, spawn_key=spawn_key,
+                                          n_children_spawned=int(seed[0]))
+    else:
+        seed_seq = None
+    bit_generator = getattr(np.random, kind)(seed_seq)
+    _set_state_words(bit_generator, state)
+    if as_generator:
+        return np.random.Generator(bit_generator)
+    return bit_generator
+
+
+def _call_helper(pyapi, helper, args):
+    fnobj = pyapi.unserialize(pyapi.serialize_object(helper))
+    res = pyapi.call_function_objargs(fnobj, args)
+    pyapi.decref(fnobj)
+    return res
+
+
+@unbox(types.NumPyRandomBitGeneratorType)
+@unbox(types.NumPyRandomGeneratorType)
+def unbox_bit_generator(typ, obj, c):
+    """
+    Convert a np.random.Generator or bit generator object to a native
+    structure holding copies of its state words.
+    """
+    inst = cgutils.create_struct_proxy(typ)(c.context, c.builder)
+    is_error = cgutils.alloca_once_value(c.builder, cgutils.true_bit)
+    res = _call_helper(c.pyapi, _unbox_bit_generator, (obj,))
+    with c.builder.if_then(cgutils.is_not_null(c.builder, res), likely=True):
+        state = c.unbox(state_array_type, c.pyapi.tuple_getitem(res, 0))
+        seed = c.unbox(seed_array_type, c.pyapi.tuple_getitem(res, 1))
+        c.pyapi.decref(res)
+        inst.state = state.value
+        inst.seed = seed.value
+        c.builder.store(c.builder.or_(state.is_error, seed.is_error),
+                        is_error)
+    # The parent is borrowed, as with reflected lists
+    inst.parent = obj
+    return NativeValue(inst._getvalue(), is_error=c.builder.load(is_error))
+
+
+def _write_back(typ, inst, c):
+    """
+    Store the native state of *inst* into its Python parent object.
+    Return the result of the helper call (NULL on error).
+    """
+    c.context.nrt.incref(c.builder, state_array_type, inst.state)
+    c.context.nrt.incref(c.builder, seed_array_type, inst.seed)
+    state = c.box(state_array_type, inst.state)
+    seed = c.box(seed_array_type, inst.seed)
+    res = _call_helper(c.pyapi, _reflect_bit_generator,
+                       (inst.parent, state, seed))
+    c.pyapi.decref(state)
+    c.pyapi.decref(seed)
+    return res
+
+
+@reflect(types.NumPyRandomBitGeneratorType)
+@reflect(types.NumPyRandomGeneratorType)
+def reflect_bit_generator(typ, val, c):
+    """
+    Reflect the native state onto the original Python object.
+    """
+    inst = cgutils.create_struct_proxy(typ)(c.context, c.builder, value=val)
+    with c.builder.if_then(cgutils.is_not_null(c.builder, inst.parent)):
+        res = _write_back(typ, inst, c)
+        with c.builder.if_then(cgutils.is_null(c.builder, res)):
+            c.set_error()
+        c.pyapi.decref(res)
+
+
+@box(types.NumPyRandomBitGeneratorType)
+@box(types.NumPyRandomGeneratorType)
+def box_bit_generator(typ, val, c):
+    """
+    Return the original object, updated with the native state, or create
+    a new one for generators created in nopython mode.
+    """
+    inst = cgutils.create_struct_proxy(typ)(c.context, c.builder, value=val)
+    ret = cgutils.alloca_once_value(c.builder, inst.parent)
+    with c.builder.if_else(cgutils.is_not_null(c.builder, inst.parent)) \
+            as (has_parent, otherwise):
+        with has_parent:
+            res = _write_back(typ, inst, c)
+            with c.builder.if_then(cgutils.is_not_null(c.builder, res),
+                                   likely=True):
+                c.pyapi.decref(res)
+                c.pyapi.incref(inst.parent)
+            with c.builder.if_then(cgutils.is_null(c.builder, res)):
+                c.builder.store(res, ret)
+            c.context.nrt.decref(c.builder, typ, val)
+        with otherwise:
+            if isinstance(typ, types.NumPyRandomGeneratorType):
+                kind = typ.bit_generator.kind
+            else:
+                kind = typ.kind
+            kindobj = c.pyapi.unserialize(c.pyapi.serialize_object(kind))
+            is_generator = isinstance(typ, types.NumPyRandomGeneratorType)
+            as_generator = c.pyapi.bool_from_bool(
+                cgutils.true_bit if is_generator else cgutils.false_bit)
+            # Boxing the arrays steals the references held by *val*
+            state = c.box(state_array_type, inst.state)
+            seed = c.box(seed_array_type, inst.seed)
+            res = _call_helper(c.pyapi, _box_bit_generator,
+                               (kindobj, state, seed, as_generator))
+            for obj in (kindobj, as_generator, state, seed):
+                c.pyapi.decref(obj)
+            c.builder.store(res, ret)
+    return c.builder.load(ret)
+
+
+def _make_constructor(kind, as_generator):
+    """
+    Make an intrinsic building a native bit generator (or Generator) of
+    the given *kind* from its state and seed arrays.
+    """
+    bit_generator = types.NumPyRandomBitGeneratorType(kind)
+    if as_generator:
+        retty = types.NumPyRandomGeneratorType(bit_generator)
+    else:
+        retty = bit_generator
+
+    @intrinsic
+    def construct(typingctx, state, seed):
+        if state != state_array_type or seed != seed_array_type:
+            return None
+
+        def codegen(context, builder, sig, args):
+            state, seed = args
+            inst = cgutils.create_struct_proxy(retty)(context, builder)
+            inst.state = state
+            inst.seed = seed
+            inst.parent = cgutils.get_null_value(inst.parent.type)
+            context.nrt.incref(builder, state_array_type, state)
+            context.nrt.incref(builder, seed_array_type, seed)
+            return inst._getvalue()
+
+        return retty(state, seed), codegen
+
+    return construct
+
+
+# ------------------------------------------------------------------------
+# Unsigned 64 and 128-bit arithmetic helpers.  Values are kept in uint64
+# variables throughout; 128-bit values are (high, low) pairs.
+
+_U0 = np.uint64(0)
+_U1 = np.uint64(1)
+_U11 = np.uint64(11)
+_U16 = np.uint64(16)
+_U32 = np.uint64(32)
+_U58 = np.uint64(58)
+_U63 = np.uint64(63)
+_U64 = np.uint64(64)
+_UMASK32 = np.uint64(0xFFFFFFFF)
+_DOUBLE_UNIT = 1.0 / 9007199254740992.0
+
+
+@register_jitable
+def mulhilo64(a, b):
+    """
+    Full 128-bit product of two uint64 values as a (high, low) pair.
+    """
+    a_lo = a & _UMASK32
+    a_hi = a >> _U32
+    b_lo = b & _UMASK32
+    b_hi = b >> _U32
+    lo_lo = a_lo * b_lo
+    hi_lo = a_hi * b_lo
+    lo_hi = a_lo * b_hi
+    cross = (lo_lo >> _U32) + (hi_lo & _UMASK32) + lo_hi
+    hi = a_hi * b_hi + (hi_lo >> _U32) + (cross >> _U32)
+    lo = (cross << _U32) | (lo_lo & _UMASK32)
+    return hi, lo
+
+
+@register_jitable
+def _mul128(a_hi, a_lo, b_hi, b_lo):
+    hi, lo = mulhilo64(a_lo, b_lo)
+    hi = hi + a_lo * b_hi + a_hi * b_lo
+    return hi, lo
+
+
+@register_jitable
+def _add128(a_hi, a_lo, b_hi, b_lo):
+    lo = a_lo + b_lo
+    hi = a_hi + b_hi
+    if lo < a_lo:
+        hi += _U1
+    return hi, lo
+
+
+@register_jitable
+def _rotr64(value, rot):
+    return (value >> rot) | (value << ((_U64 - rot) & _U63))
+
+
+# ------------------------------------------------------------------------
+# SeedSequence (the mixing algorithm of numpy.random.bit_generator)
+
+_POOL_SIZE = 4
+_INIT_A = np.uint64(0x43b0d7e5)
+_MULT_A = np.uint64(0x931e8875)
+_INIT_B = np.uint64(0x8b51f9dd)
+_MULT_B = np.uint64(0x58f38ded)
+_MIX_MULT_L = np.uint64(0xca01f9dd)
+_MIX_MULT_R = np.uint64(0x4973f715)
+
+
+@register_jitable
+def _hashmix(value, hash_const):
+    value = (value ^ hash_const) & _UMASK32
+    hash_const = (hash_const * _MULT_A) & _UMASK32
+    value = (value * hash_const) & _UMASK32
+    value ^= value >> _U16
+    return value, hash_const
+
+
+@register_jitable
+def _mix(x, y):
+    result = (_MIX_MULT_L * x - _MIX_MULT_R * y) & _UMASK32
+    result ^= result >> _U16
+    return result
+
+
+@register_jitable
+def seed_sequence_generate_state(seed, n_words):
+    """
+    Generate *n_words* uint64 words from the SeedSequence described by
+    the *seed* array, as SeedSequence.generate_state(n_words, np.uint64).
+    """
+    if len(seed) == 0:
+        raise ValueError("the bit generator has no SeedSequence")
+    n_entropy = np.intp(seed[1])
+    n_spawn = len(seed) - 2 - n_entropy
+    n_run = n_entropy
+    if n_spawn > 0 and n_run < _POOL_SIZE:
+        # Entropy is padded to the pool size when a spawn key is present
+        n_run = _POOL_SIZE
+    entropy = np.zeros(n_run + n_spawn, np.uint64)
+    for i in range(n_entropy):
+        entropy[i] = seed[2 + i]
+    for i in range(n_spawn):
+        entropy[n_run + i] = seed[2 + n_entropy + i]
+
+    pool = np.zeros(_POOL_SIZE, np.uint64)
+    hash_const = _INIT_A
+    for i in range(_POOL_SIZE):
+        value = entropy[i] if i < len(entropy) else _U0
+        value, hash_const = _hashmix(value, hash_const)
+        pool[i] = value
+    for i_src in range(_POOL_SIZE):
+        for i_dst in range(_POOL_SIZE):
+            if i_src != i_dst:
+                value, hash_const = _hashmix(pool[i_src], hash_const)
+                pool[i_dst] = _mix(pool[i_dst], value)
+    for i_src in range(_POOL_SIZE, len(entropy)):
+        for i_dst in range(_POOL_SIZE):
+            value, hash_const = _hashmix(entropy[i_src], hash_const)
+            pool[i_dst] = _mix(pool[i_dst], value)
+
+    out = np.empty(n_words, np.uint64)
+    hash_const = _INIT_B
+    for i in range(2 * n_words):
+        value = pool[i % _POOL_SIZE] ^ hash_const
+        hash_const = (hash_const * _MULT_B) & _UMASK32
+        value = (value * hash_const) & _UMASK32
+        value ^= value >> _U16
+        # uint32 words are combined little-endian
+        if i % 2 == 0:
+            out[i // 2] = value
+        else:
+            out[i // 2] |= value << _U32
+    return out
+
+
+@register_jitable
+def seed_words_from_int(seed):
+    """
+    The seed array of a SeedSequence created from the integer *seed*.
+    """
+    if seed < 0:
+        raise ValueError("expected non-negative integer")
+    value = np.uint64(seed)
+    hi = value >> _U32
+    n = 2 if hi != 0 else 1
+    words = np.empty(2 + n, np.uint32)
+    words[0] = 0
+    words[1] = n
+    words[2] = value & _UMASK32
+    if n == 2:
+        words[3] = hi
+    return words
+
+
+@register_jitable
+def spawn_seed_words(seed, n_children):
+    """
+    Return the seed arrays of *n_children* new children of the SeedSequence
+    described by *seed*, and update its spawn counter.
+    """
+    if len(seed) == 0:
+        raise TypeError("The underlying SeedSequence does not implement "
+                        "spawning.")
+    if n_children < 0:
+        raise ValueError("n_children must be non-negative")
+    children = []
+    for i in range(n_children):
+        child = np.empty(len(seed) + 1, np.uint32)
+        child[0] = 0
+        child[1:-1] = seed[1:]
+        child[-1] = seed[0] + i
+        children.append(child)
+    seed[0] += n_children
+    return children
+
+
+# ------------------------------------------------------------------------
+# PCG64 (XSL-RR 128/64).  State words:
+#   [state_hi, state_lo, inc_hi, inc_lo, has_uint32, uinteger]
+
+_PCG64_MULT_HI = np.uint64(0x2360ED051FC65DA4)
+_PCG64_MULT_LO = np.uint64(0x4385DF649FCCF645)
+_PCG64_JUMP_HI = np.uint64(0x9e3779b97f4a7c15)
+_PCG64_JUMP_LO = np.uint64(0xf39cc0605cedc835)
+
+
+@register_jitable
+def _pcg64_step(state):
+    hi, lo = _mul128(state[0], state[1], _PCG64_MULT_HI, _PCG64_MULT_LO)
+    hi, lo = _add128(hi, lo, state[2], state[3])
+    state[0] = hi
+    state[1] = lo
+
+
+@register_jitable
+def pcg64_next_uint64(state):
+    _pcg64_step(state)
+    hi = state[0]
+    return _rotr64(hi ^ state[1], hi >> _U58)
+
+
+@register_jitable
+def pcg64_fill_uint64(state, out):
+    # Keep the state in registers for the duration of the loop
+    hi, lo = state[0], state[1]
+    inc_hi, inc_lo = state[2], state[3]
+    for i in range(out.size):
+        hi, lo = _mul128(hi, lo, _PCG64_MULT_HI, _PCG64_MULT_LO)
+        hi, lo = _add128(hi, lo, inc_hi, inc_lo)
+        out[i] = _rotr64(hi ^ lo, hi >> _U58)
+    state[0] = hi
+    state[1] = lo
+
+
+@register_jitable
+def pcg64_seed(seed):
+    words = seed_sequence_generate_state(seed, 4)
+    state = np.zeros(6, np.uint64)
+    state[2] = (words[2] << _U1) | (words[3] >> _U63)
+    state[3] = (words[3] << _U1) | _U1
+    _pcg64_step(state)
+    hi, lo = _add128(state[0], state[1], words[0], words[1])
+    state[0] = hi
+    state[1] = lo
+    _pcg64_step(state)
+    return state
+
+
+@register_jitable
+def pcg64_jump(state, jumps):
+    # Advance by jumps * (phi - 1) * 2**128 steps, using Brown's algorithm
+    # for skipping ahead in a LCG.
+    delta_hi, delta_lo = _mul128(_PCG64_JUMP_HI, _PCG64_JUMP_LO,
+                                 _U0, np.uint64(jumps))
+    cur_mult_hi, cur_mult_lo = _PCG64_MULT_HI, _PCG64_MULT_LO
+    cur_plus_hi, cur_plus_lo = state[2], state[3]
+    acc_mult_hi, acc_mult_lo = _U0, _U1
+    acc_plus_hi, acc_plus_lo = _U0, _U0
+    while delta_hi != 0 or delta_lo != 0:
+        if delta_lo & _U1:
+            acc_mult_hi, acc_mult_lo = _mul128(acc_mult_hi, acc_mult_lo,
+                                               cur_mult_hi, cur_mult_lo)
+            acc_plus_hi, acc_plus_lo = _mul128(acc_plus_hi, acc_plus_lo,
+                                               cur_mult_hi, cur_mult_lo)
+            acc_plus_hi, acc_plus_lo = _add128(acc_plus_hi, acc_plus_lo,
+                                               cur_plus_hi, cur_plus_lo)
+        plus_hi, plus_lo = _add128(cur_mult_hi, cur_mult_lo, _U0, _U1)
+        cur_plus_hi, cur_plus_lo = _mul128(plus_hi, plus_lo,
+                                           cur_plus_hi, cur_plus_lo)
+        cur_mult_hi, cur_mult_lo = _mul128(cur_mult_hi, cur_mult_lo,
+                                           cur_mult_hi, cur_mult_lo)
+        delta_lo = (delta_lo >> _U1) | (delta_hi << _U63)
+        delta_hi = delta_hi >> _U1
+    hi, lo = _mul128(acc_mult_hi, acc_mult_lo, state[0], state[1])
+    hi, lo = _add128(hi, lo, acc_plus_hi, acc_plus_lo)
+    state[0] = hi
+    state[1] = lo
+    state[4] = 0
+    state[5] = 0
+
+
+# ------------------------------------------------------------------------
+# Philox4x64-10.  State words:
+#   [counter0..3, key0..1, buffer0..3, buffer_pos, has_uint32, uinteger]
+
+_PHILOX_M0 = np.uint64(0xD2E7470EE14C6C93)
+_PHILOX_M1 = np.uint64(0xCA5A826395121157)
+_PHILOX_W0 = np.uint64(0x9E3779B97F4A7C15)
+_PHILOX_W1 = np.uint64(0xBB67AE8584CAA73B)
+_PHILOX_BUFFER_SIZE = 4
+
+
+@register_jitable
+def _philox_round(c0, c1, c2, c3, k0, k1):
+    hi0, lo0 = mulhilo64(_PHILOX_M0, c0)
+    hi1, lo1 = mulhilo64(_PHILOX_M1, c2)
+    return hi1 ^ c1 ^ k0, lo1, hi0 ^ c3 ^ k1, lo0
+
+
+@register_jitable
+def _philox_generate(state):
+    """
+    Increment the 256-bit counter and fill the buffer with a new block.
+    """
+    for i in range(4):
+        state[i] += _U1
+        if state[i] != 0:
+            break
+    c0, c1, c2, c3 = state[0], state[1], state[2], state[3]
+    k0, k1 = state[4], state[5]
+    c0, c1, c2, c3 = _philox_round(c0, c1, c2, c3, k0, k1)
+    for _ in range(9):
+        k0 += _PHILOX_W0
+        k1 += _PHILOX_W1
+        c0, c1, c2, c3 = _philox_round(c0, c1, c2, c3, k0, k1)
+    state[6] = c0
+    state[7] = c1
+    state[8] = c2
+    state[9] = c3
+
+
+@register_jitable
+def philox_next_uint64(state):
+    pos = np.intp(state[10])
+    if pos < _PHILOX_BUFFER_SIZE:
+        state[10] = pos + 1
+        return state[6 + pos]
+    _philox_generate(state)
+    state[10] = 1
+    return state[6]
+
+
+@register_jitable
+def philox_fill_uint64(state, out):
+    n = out.size
+    i = 0
+    # Drain the buffer, then copy out whole blocks
+    while i < n and state[10] < _PHILOX_BUFFER_SIZE:
+        out[i] = philox_next_uint64(state)
+        i += 1
+    while n - i >= _PHILOX_BUFFER_SIZE:
+        _philox_generate(state)
+        for j in range(_PHILOX_BUFFER_SIZE):
+            out[i + j] = state[6 + j]
+        i += _PHILOX_BUFFER_SIZE
+    while i < n:
+        out[i] = philox_next_uint64(state)
+        i += 1
+
+
+@register_jitable
+def _philox_reset(state):
+    for i in range(6, 10):
+        state[i] = 0
+    state[10] = _PHILOX_BUFFER_SIZE
+    state[11] = 0
+    state[12] = 0
+
+
+@register_jitable
+def philox_seed(seed):
+    key = seed_sequence_generate_state(seed, 2)
+    state = np.zeros(13, np.uint64)
+    state[4] = key[0]
+    state[5] = key[1]
+    _philox_reset(state)
+    return state
+
+
+@register_jitable
+def philox_jump(state, jumps):
+    # Advance the counter by jumps * 2**128
+    step = np.uint64(jumps)
+    old = state[2]
+    state[2] += step
+    if state[2] < old:
+        state[3] += _U1
+    _philox_reset(state)
+
+
+# ------------------------------------------------------------------------
+# Generic accessors
+
+def _make_next_uint32(next_uint64, has_uint32):
+    uinteger = has_uint32 + 1
+
+    @register_jitable
+    def next_uint32(state):
+        if state[has_uint32]:
+            state[has_uint32] = 0
+            return state[uinteger]
+        value = next_uint64(state)
+        state[has_uint32] = 1
+        state[uinteger] = value >> _U32
+        return value & _UMASK32
+
+    return next_uint32
+
+
+def _make_next_double(next_uint64):
+    @register_jitable
+    def next_double(state):
+        return np.float64(next_uint64(state) >> _U11) * _DOUBLE_UNIT
+
+    return next_double
+
+
+# *fill_uint64(state, out)* draws out.size words at once, equivalent to
+# calling *next_uint64* for each element of the contiguous array *out*.
+BitGeneratorImpl = collections.namedtuple(
+    'BitGeneratorImpl',
+    ('next_uint64', 'next_uint32', 'next_double', 'fill_uint64', 'seed',
+     'jump', 'new_bit_generator', 'new_generator'))
+
+
+def _make_impl(kind, next_uint64, fill_uint64, seed, jump, has_uint32):
+    return BitGeneratorImpl(next_uint64,
+                            _make_next_uint32(next_uint64, has_uint32),
+                            _make_next_double(next_uint64),
+                            fill_uint64, seed, jump,
+                            _make_constructor(kind, False),
+                            _make_constructor(kind, True))
+
+
+_bit_generator_impls = {
+    'PCG64': _make_impl('PCG64', pcg64_next_uint64, pcg64_fill_uint64,
+                        pcg64_seed, pcg64_jump, 4),
+    'Philox': _make_impl('Philox', philox_next_uint64, philox_fill_uint64,
+                         philox_seed, philox_jump, 11),
+}
+
+
+def get_bit_generator_impl(typ):
+    """
+    Get the BitGeneratorImpl for a bit generator or Generator type, or
+    for a bit generator name.
+    """
+    if isinstance(typ, types.NumPyRandomGeneratorType):
+        typ = typ.bit_generator
+    if isinstance(typ, types.NumPyRandomBitGeneratorType):
+        typ = typ.kind
+    return _bit_generator_impls[typ]
@@ -0,0 +1,328 @@
+"""
+Construction of np.random.Generator and bit generator objects in nopython
+mode, and implementation of their methods.
+"""
+
+import numpy as np
+
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.core.extending import (overload, overload_attribute,
+                                  overload_method, register_jitable)
+from numba.np.numpy_support import is_nonelike
+from numba.np.random.generator_core import (get_bit_generator_impl,
+                                            seed_words_from_int,
+                                            spawn_seed_words)
+from numba.np.random import distributions
+
+
+_kinds = ('PCG64', 'Philox')
+
+_standard_normal = {}
+_standard_exponential = {}
+_bounded_uint64 = {}
+for _kind in _kinds:
+    _impl = get_bit_generator_impl(_kind)
+    _standard_normal[_kind] = distributions.make_standard_normal(_impl)
+    _standard_exponential[_kind] = \
+        distributions.make_standard_exponential(_impl)
+    _bounded_uint64[_kind] = distributions.make_bounded_uint64(_impl)
+
+
+def _kind_of(typ):
+    if isinstance(typ, types.NumPyRandomGeneratorType):
+        typ = typ.bit_generator
+    return typ.kind
+
+
+def _check_size(size, fname):
+    if isinstance(size, types.Integer):
+        return
+    if (isinstance(size, types.UniTuple) and
+            isinstance(size.dtype, types.Integer)):
+        return
+    raise TypingError("%s(): size must be None, an integer or a tuple of "
+                      "integers, got %s" % (fname, size))
+
+
+def _check_float(arg, name, fname):
+    if not isinstance(arg, (float, int, types.Float, types.Integer)):
+        raise TypingError("%s(): %s must be a real number, got %s"
+                          % (fname, name, arg))
+
+
+@register_jitable
+def _flat_view(out):
+    return out.reshape(out.size)
+
+
+# ------------------------------------------------------------------------
+# Construction
+
+def _overload_bit_generator_class(kind):
+    bitgen = get_bit_generator_impl(kind)
+    seed_state = bitgen.seed
+    new_bit_generator = bitgen.new_bit_generator
+
+    @overload(getattr(np.random, kind))
+    def ol_bit_generator(seed=None):
+        if not isinstance(seed, types.Integer):
+            raise TypingError("np.random.%s() in nopython mode requires an "
+                              "integer seed, got %s" % (kind, seed))
+
+        def impl(seed=None):
+            words = seed_words_from_int(seed)
+            return new_bit_generator(seed_state(words), words)
+        return impl
+
+
+if hasattr(np.random, 'Generator'):
+    for _kind in _kinds:
+        _overload_bit_generator_class(_kind)
+
+    @overload(np.random.Generator)
+    def ol_generator(bit_generator):
+        if not isinstance(bit_generator, types.NumPyRandomBitGeneratorType):
+            raise TypingError("np.random.Generator() expects a PCG64 or "
+                              "Philox bit generator, got %s" % bit_generator)
+        new_generator = get_bit_generator_impl(bit_generator).new_generator
+
+        def impl(bit_generator):
+            # The Generator shares the state of its bit generator
+            return new_generator(bit_generator._state, bit_generator._seed)
+        return impl
+
+    @overload(np.random.default_rng)
+    def ol_default_rng(seed=None):
+        if isinstance(seed, types.NumPyRandomGeneratorType):
+            def impl(seed=None):
+                return seed
+        elif isinstance(seed, types.NumPyRandomBitGeneratorType):
+            def impl(seed=None):
+                return np.random.Generator(seed)
+        elif isinstance(seed, types.Integer):
+            def impl(seed=None):
+                return np.random.Generator(np.random.PCG64(seed))
+        else:
+            raise TypingError("np.random.default_rng() in nopython mode "
+                              "requires an integer seed, a bit generator or "
+                              "a Generator, got %s" % (seed,))
+        return impl
+
+
+# ------------------------------------------------------------------------
+# Bit generator methods
+
+@overload_method(types.NumPyRandomBitGeneratorType, 'jumped')
+def ol_bit_generator_jumped(bit_generator, jumps=1):
+    if not isinstance(jumps, (int, types.Integer, types.Omitted)):
+        raise TypingError("jumped(): jumps must be an integer")
+    bitgen = get_bit_generator_impl(bit_generator)
+    jump = bitgen.jump
+    new_bit_generator = bitgen.new_bit_generator
+
+    def impl(bit_generator, jumps=1):
+        if jumps < 0:
+            raise ValueError("jumps must be non-negative")
+        state = bit_generator._state.copy()
+        jump(state, jumps)
+        return new_bit_generator(state, bit_generator._seed.copy())
+    return impl
+
+
+def _spawn(obj, n_children):
+    if not isinstance(n_children, types.Integer):
+        raise TypingError("spawn(): n_children must be an integer")
+    bitgen = get_bit_generator_impl(obj)
+    seed_state = bitgen.seed
+    if isinstance(obj, types.NumPyRandomGeneratorType):
+        new = bitgen.new_generator
+    else:
+        new = bitgen.new_bit_generator
+
+    def impl(obj, n_children):
+        children = []
+        for seed in spawn_seed_words(obj._seed, n_children):
+            children.append(new(seed_state(seed), seed))
+        return children
+    return impl
+
+
+@overload_method(types.NumPyRandomBitGeneratorType, 'spawn')
+def ol_bit_generator_spawn(bit_generator, n_children):
+    return _spawn(bit_generator, n_children)
+
+
+# ------------------------------------------------------------------------
+# Generator methods
+
+@overload_attribute(types.NumPyRandomGeneratorType, 'bit_generator')
+def ol_generator_bit_generator(rng):
+    new_bit_generator = get_bit_generator_impl(rng).new_bit_generator
+
+    def impl(rng):
+        return new_bit_generator(rng._state, rng._seed)
+    return impl
+
+
+@overload_method(types.NumPyRandomGeneratorType, 'spawn')
+def ol_generator_spawn(rng, n_children):
+    return _spawn(rng, n_children)
+
+
+@overload_method(types.NumPyRandomGeneratorType, 'random')
+def ol_generator_random(rng, size=None):
+    bitgen = get_bit_generator_impl(rng)
+    next_double = bitgen.next_double
+    fill_uint64 = bitgen.fill_uint64
+    if is_nonelike(size):
+        def impl(rng, size=None):
+            return next_double(rng._state)
+    else:
+        _check_size(size, 'random')
+
+        def impl(rng, size=None):
+            out = np.empty(size, np.float64)
+            flat = _flat_view(out)
+            # Draw all the words in one go, then convert them in place
+            bits = flat.view(np.uint64)
+            fill_uint64(rng._state, bits)
+            for i in range(flat.size):
+                flat[i] = np.float64(bits[i] >> np.uint64(11)) * \
+                    (1.0 / 9007199254740992.0)
+            return out
+    return impl
+
+
+@overload_method(types.NumPyRandomGeneratorType, 'standard_normal')
+def ol_generator_standard_normal(rng, size=None):
+    standard_normal = _standard_normal[_kind_of(rng)]
+    if is_nonelike(size):
+        def impl(rng, size=None):
+            return standard_normal(rng._state)
+    else:
+        _check_size(size, 'standard_normal')
+
+        def impl(rng, size=None):
+            out = np.empty(size, np.float64)
+            flat = _flat_view(out)
+            state = rng._state
+            for i in range(flat.size):
+                flat[i] = standard_normal(state)
+            return out
+    return impl
+
+
+@overload_method(types.NumPyRandomGeneratorType, 'normal')
+def ol_generator_normal(rng, loc=0.0, scale=1.0, size=None):
+    _check_float(loc, 'loc', 'normal')
+    _check_float(scale, 'scale', 'normal')
+    standard_normal = _standard_normal[_kind_of(rng)]
+    if is_nonelike(size):
+        def impl(rng, loc=0.0, scale=1.0, size=None):
+            if scale < 0:
+                raise ValueError("scale < 0")
+            return loc + scale * standard_normal(rng._state)
+    else:
+        _check_size(size, 'normal')
+
+        def impl(rng, loc=0.0, scale=1.0, size=None):
+            if scale < 0:
+                raise ValueError("scale < 0")
+            out = np.empty(size, np.float64)
+            flat = _flat_view(out)
+            state = rng._state
+            for i in range(flat.size):
+                flat[i] = loc + scale * standard_normal(state)
+            return out
+    return impl
+
+
+@overload_method(types.NumPyRandomGeneratorType, 'standard_exponential')
+def ol_generator_standard_exponential(rng, size=None):
+    standard_exponential = _standard_exponential[_kind_of(rng)]
+    if is_nonelike(size):
+        def impl(rng, size=None):
+            return standard_exponential(rng._state)
+    else:
+        _check_size(size, 'standard_exponential')
+
+        def impl(rng, size=None):
+            out = np.empty(size, np.float64)
+            flat = _flat_view(out)
+            state = rng._state
+            for i in range(flat.size):
+                flat[i] = standard_exponential(state)
+            return out
+    return impl
+
+
+@overload_method(types.NumPyRandomGeneratorType, 'exponential')
+def ol_generator_exponential(rng, scale=1.0, size=None):
+    _check_float(scale, 'scale', 'exponential')
+    standard_exponential = _standard_exponential[_kind_of(rng)]
+    if is_nonelike(size):
+        def impl(rng, scale=1.0, size=None):
+            if scale < 0:
+                raise ValueError("scale < 0")
+            return scale * standard_exponential(rng._state)
+    else:
+        _check_size(size, 'exponential')
+
+        def impl(rng, scale=1.0, size=None):
+            if scale < 0:
+                raise ValueError("scale < 0")
+            out = np.empty(size, np.float64)
+            flat = _flat_view(out)
+            state = rng._state
+            for i in range(flat.size):
+                flat[i] = scale * standard_exponential(state)
+            return out
+    return impl
+
+
+@register_jitable
+def _integers_range(low, high):
+    """
+    Return the offset and the (inclusive) width of the interval [low, high).
+    """
+    if low >= high:
+        raise ValueError("low >= high")
+    off = np.uint64(np.int64(low))
+    return off, np.uint64(np.int64(high)) - off - np.uint64(1)
+
+
+@register_jitable
+def _integers_range_from_zero(high, unused):
+    return _integers_range(0, high)
+
+
+@overload_method(types.NumPyRandomGeneratorType, 'integers')
+def ol_generator_integers(rng, low, high=None, size=None):
+    if not isinstance(low, types.Integer):
+        raise TypingError("integers(): low must be an integer")
+    if not (is_nonelike(high) or isinstance(high, types.Integer)):
+        raise TypingError("integers(): high must be None or an integer")
+    bounded_uint64 = _bounded_uint64[_kind_of(rng)]
+    if is_nonelike(high):
+        # integers(high) draws from [0, high)
+        bounds = _integers_range_from_zero
+    else:
+        bounds = _integers_range
+
+    if is_nonelike(size):
+        def impl(rng, low, high=None, size=None):
+            off, rng_width = bounds(low, high)
+            return np.int64(off + bounded_uint64(rng._state, rng_width))
+    else:
+        _check_size(size, 'integers')
+
+        def impl(rng, low, high=None, size=None):
+            off, rng_width = bounds(low, high)
+            out = np.empty(size, np.int64)
+            flat = _flat_view(out)
+            state = rng._state
+            for i in range(flat.size):
+                flat[i] = np.int64(off + bounded_uint64(state, rng_width))
+            return out
+    return impl
@@ -15,6 +15,49 @@ def _is_ufunc(func):
     return isinstance(func, (np.ufunc, DUFunc))
 
 
+class _ArrayReduction(object):
+    """
+    The root operator of an array expression whose elements are reduced to
+    a scalar instead of being stored into a new array. *kind* is one of
+    'sum', 'prod', 'min', 'max', 'mean' and 'dot', *dtype* is the type of
+    the elements being reduced.
+    """
+
+    def __init__(self, kind, dtype):
+        self.kind = kind
+        self.dtype = dtype
+
+    def __repr__(self):
+        return "reduce_{0}".format(self.kind)
+
+
+# Functions and methods reducing a whole array that can be folded into
+# a preceding array expression
+_reduction_functions = {
+    np.sum: 'sum',
+    np.prod: 'prod',
+    np.min: 'min',
+    np.amin: 'min',
+    np.max: 'max',
+    np.amax: 'max',
+    np.mean: 'mean',
+    np.dot: 'dot',
+}
+
+_reduction_methods = {
+    'array.sum': 'sum',
+    'array.prod': 'prod',
+    'array.min': 'min',
+    'array.max': 'max',
+    'array.mean': 'mean',
+}
+
+# Expressions that neither write memory nor have side effects
+_pure_expr_ops = frozenset(['binop', 'unary', 'getattr', 'getitem',
+                            'static_getitem', 'build_tuple', 'cast',
+                            'arrayexpr'])
+
+
 @rewrites.register_rewrite('after-inference')
 class RewriteArrayExprs(rewrites.Rewrite):
     '''The RewriteArrayExprs class is responsible for finding array
@@ -28,6 +71,9 @@ class RewriteArrayExprs(rewrites.Rewrite):
         special_ops = state.targetctx.special_ops
         if 'arrayexpr' not in special_ops:
             special_ops['arrayexpr'] = _lower_array_expr
+        # Reductions are left to the parfor pass in parallel mode, which
+        # turns them into parallel reductions.
+        self.fold_reductions = not state.flags.auto_parallel.enabled
 
     def match(self, func_ir, block, typemap, calltypes):
         """
@@ -42,23 +88,48 @@ class RewriteArrayExprs(rewrites.Rewrite):
 
         self.crnt_block = block
         self.typemap = typemap
+        self.func_ir = func_ir
         # { variable name: IR assignment (of a function call or operator) }
         self.array_assigns = OrderedDict()
         # { variable name: IR assignment (of a constant) }
         self.const_assigns = {}
-
-        assignments = block.find_insts(ir.Assign)
-        for instr in assignments:
+        # { variable name: IR assignment (copying a temporary array
+        #   expression into a user variable) }
+        self.copy_assigns = {}
+        # { variable name: IR assignment (of a reduction call) }
+        self.reduction_assigns = OrderedDict()
+        # { variable name: (reduction, operands, IR assignment of the bound
+        #   method or None) }
+        self.reductions = {}
+        # { IR assignment: position in the block }
+        self.positions = {}
+        # { variable name: original IR assignment in the block }
+        self.block_assigns = {}
+        self._use_counts = None
+
+        for pos, instr in enumerate(block.body):
+            self.positions[instr] = pos
+            if not isinstance(instr, ir.Assign):
+                continue
             target_name = instr.target.name
             expr = instr.value
+            self.block_assigns[target_name] = instr
             # Does it assign an expression to an array variable?
             if (isinstance(expr, ir.Expr) and
                 isinstance(typemap.get(target_name, None), types.Array)):
                 self._match_array_expr(instr, expr, target_name)
+            elif (isinstance(expr, ir.Expr) and expr.op == 'call' and
+                    self.fold_reductions):
+                self._match_reduction(instr, expr, target_name)
             elif isinstance(expr, ir.Const):
                 # Track constants since we might need them for an
                 # array expression.
                 self.const_assigns[target_name] = expr
+            elif (isinstance(expr, ir.Var) and expr.is_temp and
+                    expr.name in self.array_assigns):
+                # A user variable holding an array expression, it may be
+                # fused into its user if it is only used once.
+                self.copy_assigns[target_name] = instr
 
         return len(self.array_assigns) > 0
 
@@ -89,6 +160,136 @@ class RewriteArrayExprs(rewrites.Rewrite):
                         # If not, match it as a (sub)expression.
                         array_assigns[target_name] = instr
 
+    def _match_reduction(self, instr, expr, target_name):
+        """
+        Find whether the given assignment (*instr*) of a call (*expr*) to
+        variable *target_name* reduces an array expression to a scalar.
+        """
+        if not isinstance(self.typemap.get(target_name), types.Number):
+            return
+        if expr.kws or expr.vararg is not None:
+            return
+        func_type = self.typemap.get(expr.func.name)
+        method_assign = None
+        if isinstance(func_type, types.Function):
+            kind = _reduction_functions.get(func_type.typing_key)
+            operands = list(expr.args)
+        elif isinstance(func_type, types.BoundFunction):
+            kind = _reduction_methods.get(func_type.typing_key)
+            method_assign = self.block_assigns.get(expr.func.name)
+            if (method_assign is None or expr.args or
+                    not isinstance(method_assign.value, ir.Expr) or
+                    method_assign.value.op != 'getattr'):
+                return
+            operands = [method_assign.value.value]
+        else:
+            return
+        if kind is None:
+            return
+
+        arg_types = [self.typemap[op.name] for op in operands]
+        if not all(isinstance(ty, types.Array) for ty in arg_types):
+            return
+        if kind == 'dot':
+            if len(operands) != 2 or any(ty.ndim != 1 for ty in arg_types):
+                return
+            dtype = self.typemap[target_name]
+            if not isinstance(dtype, (types.Float, types.Complex)):
+                return
+        else:
+            if len(operands) != 1:
+                return
+            dtype = arg_types[0].dtype
+            allowed = ((types.Integer, types.Float) if kind in ('min', 'max')
+                       else types.Number)
+            if not isinstance(dtype, allowed):
+                return
+
+        self.reduction_assigns[target_name] = instr
+        self.reductions[target_name] = (_ArrayReduction(kind, dtype), operands,
+                                        method_assign)
+
+    def _get_use_counts(self):
+        """
+        Return a {variable name: (number of uses, number of definitions)}
+        map for the whole function.
+        """
+        if self._use_counts is None:
+            counts = defaultdict(lambda: [0, 0])
+            for blk in self.func_ir.blocks.values():
+                for stmt in blk.body:
+                    if isinstance(stmt, ir.Del):
+                        continue
+                    if isinstance(stmt, ir.Assign):
+                        counts[stmt.target.name][1] += 1
+                        used = stmt.value.list_vars()
+                    else:
+                        used = stmt.list_vars()
+                    for var in used:
+                        counts[var.name][0] += 1
+            self._use_counts = counts
+        return self._use_counts
+
+    def _is_pure_between(self, first, last, protected):
+        """
+        Whether the statements of the block strictly between the IR
+        instructions *first* and *last* neither write memory nor redefine
+        any of the *protected* variable names.
+        """
+        start = self.positions[first] + 1
+        stop = self.positions[last]
+        for stmt in self.crnt_block.body[start:stop]:
+            if isinstance(stmt, ir.Del):
+                continue
+            if not isinstance(stmt, ir.Assign):
+                return False
+            if stmt.target.name in protected:
+                return False
+            value = stmt.value
+            if isinstance(value, ir.Expr):
+                if value.op == 'call':
+                    if (stmt.target.name not in self.array_assigns and
+                            stmt.target.name not in self.reduction_assigns):
+                        return False
+                elif value.op not in _pure_expr_ops:
+                    return False
+        return True
+
+    def _find_fusable_child(self, operand_name, parent_instr):
+        """
+        Find the array expression computing the operand *operand_name* of
+        *parent_instr*. Return a (child assignment, removable instructions)
+        tuple, or None if there is no such array expression. The
+        instructions are those that can be removed once the child is fused
+        into its parent, an empty list means the child must be kept.
+        """
+        if operand_name in self.array_assigns:
+            child_assign = self.array_assigns[operand_name]
+            orig_assign = self.block_assigns[operand_name]
+            if child_assign.target.is_temp:
+                return child_assign, [child_assign]
+            removable = [orig_assign]
+        elif operand_name in self.copy_assigns:
+            copy_assign = self.copy_assigns[operand_name]
+            source_name = copy_assign.value.name
+            child_assign = self.array_assigns[source_name]
+            orig_assign = self.block_assigns[source_name]
+            removable = [child_assign, copy_assign]
+        else:
+            return None
+        # A user variable can only be fused if this is its only use, and
+        # the inputs of its expression are unchanged when *parent_instr*
+        # executes.
+        uses, defs = self._get_use_counts()[operand_name]
+        protected = set(var.name for var in child_assign.value.list_vars())
+        protected.add(operand_name)
+        if (uses == 1 and defs == 1 and
+                self._is_pure_between(orig_assign, parent_instr, protected)):
+            return child_assign, removable
+        if operand_name in self.array_assigns:
+            return child_assign, []
+        return None
+
     def _has_explicit_output(self, expr, func):
         """
         Return whether the *expr* call to *func* (a ufunc) features an
@@ -157,23 +358,66 @@ class RewriteArrayExprs(rewrites.Rewrite):
             self.array_assigns[instr.target.name] = new_instr
             for operand in self._get_operands(expr):
                 operand_name = operand.name
-                if operand_name in self.array_assigns:
-                    child_assign = self.array_assigns[operand_name]
-                    child_expr = child_assign.value
-                    child_operands = child_expr.list_vars()
-                    for operand in child_operands:
-                        used_vars[operand.name] += 1
-                    arr_inps.append(self._translate_expr(child_expr))
-                    if child_assign.target.is_temp:
-                        dead_vars.add(child_assign.target.name)
-                        replace_map[child_assign] = None
+                child = self._find_fusable_child(operand_name, instr)
+                if child is not None:
+                    self._fuse_child(operand_name, child, arr_inps,
+                                     replace_map, dead_vars, used_vars)
                 elif operand_name in self.const_assigns:
                     arr_inps.append(self.const_assigns[operand_name])
                 else:
                     used_vars[operand.name] += 1
                     arr_inps.append(operand)
+
+        for instr in self.reduction_assigns.values():
+            target_name = instr.target.name
+            reduction, operands, method_assign = self.reductions[target_name]
+            children = [self._find_fusable_child(operand.name, instr)
+                        for operand in operands]
+            # Only fold the reduction if it saves an array allocation
+            if not any(child is not None and child[1] for child in children):
+                continue
+            # The reduction loop iterates over the leaves of the expression
+            leaves = [var for op, child in zip(operands, children)
+                      for var in (child[0].value.list_vars()
+                                  if child is not None and child[1]
+                                  else [op])]
+            if not all(isinstance(self.typemap[var.name],
+                                  (types.Array, types.Number))
+                       for var in leaves):
+                continue
+            arr_inps = []
+            for operand, child in zip(operands, children):
+                if child is not None and child[1]:
+                    self._fuse_child(operand.name, child, arr_inps,
+                                     replace_map, dead_vars, used_vars)
+                else:
+                    used_vars[operand.name] += 1
+                    arr_inps.append(operand)
+            new_expr = ir.Expr(op='arrayexpr',
+                               loc=instr.value.loc,
+                               expr=(reduction, arr_inps),
+                               ty=self.typemap[target_name])
+            replace_map[instr] = ir.Assign(new_expr, instr.target, instr.loc)
+            if method_assign is not None:
+                dead_vars.add(method_assign.target.name)
+                replace_map[method_assign] = None
         return replace_map, dead_vars, used_vars
 
+    def _fuse_child(self, operand_name, child, arr_inps, replace_map,
+                    dead_vars, used_vars):
+        """
+        Append the expression tree of the *child* computing *operand_name*
+        to *arr_inps*, and record the instructions that become dead.
+        """
+        child_assign, removable = child
+        child_expr = child_assign.value
+        for var in child_expr.list_vars():
+            used_vars[var.name] += 1
+        arr_inps.append(self._translate_expr(child_expr))
+        for dead_instr in removable:
+            dead_vars.add(dead_instr.target.name)
+            replace_map[dead_instr] = None
+
     def _get_final_replacement(self, replacement_map, instr):
         '''Find the final replacement instruction for a given initial
         instruction by chasing instructions in a map from instructions
@@ -299,6 +543,16 @@ def _arr_expr_to_ast(expr):
         "Don't know how to translate array expression '%r'" % (expr,))
 
 
+def _list_tree_vars(expr):
+    '''Return the variables used by an array expression tree.
+    '''
+    if isinstance(expr, tuple):
+        return [var for arg in expr[1] for var in _list_tree_vars(arg)]
+    elif isinstance(expr, ir.Var):
+        return [expr]
+    return []
+
+
 @contextlib.contextmanager
 def _legalize_parameter_names(var_list):
     """
@@ -328,6 +582,9 @@ def _legalize_parameter_names(var_list):
 def _lower_array_expr(lowerer, expr):
     '''Lower an array expression built by RewriteArrayExprs.
     '''
+    if isinstance(expr.expr[0], _ArrayReduction):
+        return _lower_array_reduction(lowerer, expr)
+
     expr_name = "__numba_array_expr_%s" % (hex(hash(expr)).replace("-", "_"))
     expr_filename = expr.loc.filename
     expr_var_list = expr.list_vars()
@@ -395,3 +652,142 @@ def _lower_array_expr(lowerer, expr):
     args = [lowerer.loadvar(name) for name in expr_args]
     return npyimpl.numpy_ufunc_kernel(
         context, builder, outer_sig, args, ExprKernel, explicit_output=False)
+
+
+def _lower_array_reduction(lowerer, expr):
+    '''Lower an array expression built by RewriteArrayExprs whose result
+    is reduced to a scalar, without materializing the intermediate array.
+    '''
+    from numba.core import decorators
+    from numba.np import arraymath
+    from numba.np.arraymath import zero_dim_msg
+    from numba.np.numpy_support import as_dtype
+
+    reduction, operands = expr.expr
+    kind = reduction.kind
+    expr_name = "__numba_array_reduce_%s" % (
+        hex(hash(expr)).replace("-", "_"))
+    expr_filename = expr.loc.filename
+    expr_var_unique = sorted(set(expr.list_vars()), key=lambda var: var.name)
+    expr_args = [var.name for var in expr_var_unique]
+    arg_types = [lowerer.typeof(name) for name in expr_args]
+
+    # 1. Create the element-wise kernel from the array expression, the
+    # vector dot product being the sum of the element-wise products.
+    if kind == 'dot':
+        elem_expr = (operator.mul, operands)
+    else:
+        [elem_expr] = operands
+    with _legalize_parameter_names(expr_var_unique) as expr_params:
+        ast_module = ast.parse('def {0}(): return'.format(expr_name),
+                               expr_filename, 'exec')
+        ast_fn = ast_module.body[0]
+        ast_fn.args.args = [ast.arg(param_name, None)
+                            for param_name in expr_params]
+        ast_fn.body[0].value, namespace = _arr_expr_to_ast(elem_expr)
+        ast.fix_missing_locations(ast_module)
+        # The length of a dot product operand is the one of its (broadcast)
+        # 1-d leaves.
+        lengths = []
+        if kind == 'dot':
+            param_types = dict(zip(expr_params, arg_types))
+            for operand in operands:
+                names = sorted(set(
+                    var.name for var in _list_tree_vars(operand)
+                    if getattr(param_types[var.name], "ndim", 0) == 1))
+                lengths.append("max(%s)" % ", ".join(
+                    ["%s.shape[0]" % name for name in names] + ["0"]))
+
+    code_obj = compile(ast_module, expr_filename, 'exec')
+    exec(code_obj, namespace)
+    kernel = decorators.njit(namespace[expr_name], error_model='numpy')
+
+    # 2. Generate the reduction loop calling the kernel on each element.
+    params = ", ".join(expr_params)
+    items = ", ".join("v%d.item()" % i for i in range(len(expr_params)))
+    if len(expr_params) == 1:
+        iterator = "v0 in np.nditer(%s)" % params
+    else:
+        iterator = "%s in np.nditer((%s,))" % (
+            ", ".join("v%d" % i for i in range(len(expr_params))), params)
+    src = ["def reduce_array_expr(%s):" % params]
+    if kind == 'dot':
+        src += ["    if %s != %s:" % tuple(lengths),
+                "        raise ValueError(__dot_msg)"]
+    retty = expr.ty
+    # The float sums are pairwise like the ones of arrays, on blocks of
+    # kernel values, unless fastmath allows reassociating them
+    fastmath = lowerer.context.fastmath
+    pairwise = (kind in ('sum', 'mean', 'dot') and
+                isinstance(retty, (types.Float, types.Complex)) and
+                not (isinstance(retty, types.Float) and fastmath and
+                     fastmath.reductions_can_reassociate))
+    src += ["    acc = __init",
+            "    n = 0"]
+    if pairwise:
+        src += ["    block = np.empty(__blocksize, __dtype)",
+                "    partials = np.empty(64, __dtype)",
+                "    depth = 0",
+                "    k = 0"]
+    src += ["    for %s:" % iterator,
+            "        x = __kernel(%s)" % items]
+    if pairwise:
+        src += ["        block[k] = x",
+                "        k += 1",
+                "        if k == __blocksize:",
+                "            s = __sum_block(block, 0, k, __init)",
+                "            depth = __push(partials, depth, n // __blocksize, s)",
+                "            k = 0"]
+    elif kind in ('sum', 'mean', 'dot'):
+        src += ["        acc += x"]
+    elif kind == 'prod':
+        src += ["        acc *= x"]
+    else:
+        # NaNs propagate like in NumPy
+        cmp = '<' if kind == 'min' else '>'
+        src += ["        if x != x:",
+                "            return x",
+                "        if n == 0 or x %s acc:" % cmp,
+                "            acc = x"]
+    src += ["        n += 1"]
+    if pairwise:
+        src += ["    if k > 0:",
+                "        s = __sum_block(block, 0, k, __init)",
+                "        depth = __push(partials, depth, n // __blocksize, s)",
+                "    acc = __pop(partials, depth, __init)"]
+    if kind in ('min', 'max'):
+        src += ["    if n == 0:",
+                "        raise ValueError(__empty_msg)"]
+    if kind == 'mean':
+        src += ["    return acc / n"]
+    else:
+        src += ["    return acc"]
+
+    glbls = {
+        'np': np,
+        '__kernel': kernel,
+        '__init': retty(1 if kind == 'prod' else 0),
+        '__dot_msg': "incompatible array sizes for np.dot(a, b) "
+                     "(vector * vector)",
+        '__empty_msg': zero_dim_msg('minimum' if kind == 'min'
+                                    else 'maximum'),
+        '__blocksize': arraymath.PW_BLOCKSIZE,
+        '__dtype': as_dtype(retty) if pairwise else None,
+        '__sum_block': arraymath._pairwise_sum_block,
+        '__push': arraymath._pairwise_push,
+        '__pop': arraymath._pairwise_pop,
+    }
+    exec(compile("\n".join(src), expr_filename, 'exec'), glbls)
+    impl = glbls['reduce_array_expr']
+
+    # 3. Compile and call the reduction
+    flags = compiler.Flags()
+    flags.set('error_model', 'numpy')
+    sig = retty(*arg_types)
+    cres = lowerer.context.compile_subroutine(lowerer.builder, impl, sig,
+                                              flags=flags,
+                                              locals={'acc': retty},
+                                              caching=False)
+    args = [lowerer.loadvar(name) for name in expr_args]
+    return lowerer.context.call_internal(lowerer.builder, cres.fndesc, sig,
+                                         args)
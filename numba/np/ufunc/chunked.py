@@ -0,0 +1,114 @@
+"""
+Chunked execution of ufuncs and gufuncs over arrays too large to be held
+in memory, such as memory-mapped files.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from numba.np.ufunc.sigparse import parse_signature
+
+
+# Bytes of the inputs and outputs of a chunk, when the number of rows of the
+# chunks is not given
+CHUNK_BYTES = 1 << 26
+
+
+def _core_dims(ufunc):
+    if ufunc.signature is None:
+        return [()] * ufunc.nin, [()] * ufunc.nout
+    return parse_signature(ufunc.signature)
+
+
+def map_chunks(ufunc, inputs, out=None, chunk_rows=None, callback=None):
+    """
+    Apply the ufunc or gufunc *ufunc* to the arrays *inputs* by chunks of
+    *chunk_rows* rows along their first loop dimension.  The next chunk of
+    the inputs is read into memory while the current one is computed, and
+    the results of each chunk are written to the arrays *out* (e.g. an
+    output memmap, flushed after each chunk) and/or passed to
+    *callback(start, result)*, *start* being the first row of the chunk.
+
+    Inputs with fewer loop dimensions than the others, or a first loop
+    dimension of 1, are broadcast and passed whole to each chunk.  When
+    *chunk_rows* is None, the chunks hold about CHUNK_BYTES of inputs and
+    outputs.
+
+    Return *out*, or the results concatenated in memory if neither *out*
+    nor *callback* are given.
+    """
+    inputs = [np.asanyarray(a) for a in inputs]
+    if len(inputs) != ufunc.nin:
+        raise TypeError("map_chunks() needs %d inputs, got %d"
+                        % (ufunc.nin, len(inputs)))
+    sin, sout = _core_dims(ufunc)
+    loop_ndims = [a.ndim - len(core) for a, core in zip(inputs, sin)]
+    nloop = max(loop_ndims)
+    if nloop <= 0:
+        raise ValueError("map_chunks() needs inputs with loop dimensions")
+    chunked = [ndim == nloop and a.shape[0] != 1
+               for a, ndim in zip(inputs, loop_ndims)]
+    lengths = set(a.shape[0] for a, c in zip(inputs, chunked) if c)
+    if len(lengths) > 1:
+        raise ValueError("map_chunks(): mismatch in the first loop dimension "
+                         "of the inputs %s" % sorted(lengths))
+    nrows = lengths.pop() if lengths else 1
+
+    outs = None
+    if out is not None:
+        outs = out if isinstance(out, tuple) else (out,)
+        if len(outs) != ufunc.nout:
+            raise TypeError("map_chunks() needs %d outputs, got %d"
+                            % (ufunc.nout, len(outs)))
+        for o, core in zip(outs, sout):
+            if o.ndim != nloop + len(core) or o.shape[0] != nrows:
+                raise ValueError("map_chunks(): the outputs must have all "
+                                 "the %d rows of the loop dimensions"
+                                 % (nrows,))
+
+    if chunk_rows is None:
+        row_bytes = sum(a[:1].nbytes for a, c in zip(inputs, chunked) if c)
+        if outs is not None:
+            row_bytes += sum(o[:1].nbytes for o in outs)
+        chunk_rows = max(CHUNK_BYTES // max(row_bytes, 1), 1)
+    elif chunk_rows < 1:
+        raise ValueError("map_chunks(): chunk_rows must be positive")
+
+    def read(lo, hi):
+        # Copying the chunk faults its pages in, off the computing thread
+        return [np.array(a[lo:hi]) if c else a
+                for a, c in zip(inputs, chunked)]
+
+    results = []
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(read, 0, min(chunk_rows, nrows))
+        for lo in range(0, nrows, chunk_rows):
+            hi = min(lo + chunk_rows, nrows)
+            args = pending.result()
+            if hi < nrows:
+                pending = pool.submit(read, hi, min(hi + chunk_rows, nrows))
+            if outs is not None:
+                res = tuple(o[lo:hi] for o in outs)
+                ufunc(*args, out=res)
+                for o in outs:
+                    if isinstance(o, np.memmap):
+                        o.flush()
+                if ufunc.nout == 1:
+                    res = res[0]
+            else:
+                res = ufunc(*args)
+            if callback is not None:
+                callback(lo, res)
+            elif outs is None:
+                results.append(res)
+
+    if outs is not None:
+        return out
+    if callback is not None:
+        return None
+    if not results:
+        return ufunc(*inputs)
+    if ufunc.nout == 1:
+        return np.concatenate(results)
+    return tuple(np.concatenate(parts) for parts in zip(*results))
@@ -5,7 +5,7 @@ from numba.np.ufunc.ufuncbuilder import GUFuncBuilder
 from numba.np.ufunc.parallel import ParallelUFuncBuilder, ParallelGUFuncBuilder
 
 from numba.core.registry import TargetRegistry
-from numba.np.ufunc import dufunc
+from numba.np.ufunc import dufunc, gufunc
 
 
 class _BaseVectorize(object):
@@ -125,18 +125,21 @@ def vectorize(ftylist_or_function=(), **kws):
     return wrap
 
 
-def guvectorize(ftylist, signature, **kws):
+def guvectorize(ftylist, signature=None, **kws):
     """guvectorize(ftylist, signature, target='cpu', identity=None, **kws)
 
     A decorator to create numpy generialized-ufunc object from Numba compiled
-    code.
+    code.  When only the gufunc signature is given, guvectorize will return
+    a Numba dynamic gufunc (GUFunc) object, where compilation/specialization
+    may occur at call-time.
 
     Args
     -----
-    ftylist: iterable
+    ftylist: iterable or str
         An iterable of type signatures, which are either
         function type object or a string describing the
-        function type.
+        function type.  When *signature* is omitted, this is the
+        NumPy generialized-ufunc signature instead.
 
     signature: str
         A NumPy generialized-ufunc signature.
@@ -168,7 +171,27 @@ def guvectorize(ftylist, signature, **kws):
                 for j in range(c.shape[1]):
                     c[i, j] = a[i, j] + b[i, j]
 
+        @guvectorize('(n),()->(n)')
+        def add_scalar(a, b, c):
+            for i in range(c.shape[0]):
+                c[i] = a[i] + b
+
     """
+    if signature is None:
+        signature = ftylist
+
+        def wrap(func):
+            # The options are shared by all the functions decorated
+            options = dict(kws)
+            identity = GUVectorize.get_identity(options)
+            cache = GUVectorize.get_cache(options)
+            target = options.pop('target', 'cpu')
+            return gufunc.GUFunc(func, signature, identity=identity,
+                                 cache=cache, target=target,
+                                 targetoptions=options)
+
+        return wrap
+
     if isinstance(ftylist, str):
         # Common user mistake
         ftylist = [ftylist]
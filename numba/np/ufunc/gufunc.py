@@ -0,0 +1,373 @@
+"""
+Dynamic generalized universal functions (GUFunc), whose kernels are
+compiled for new argument types when they are first called, as DUFunc does
+for ufuncs.
+"""
+
+import numpy as np
+
+from numba.core import types, serialize
+from numba.core.errors import TypingError
+from numba.core.extending import register_jitable
+from numba.core.typing.templates import AbstractTemplate, signature
+from numba.np.numpy_support import as_dtype, from_dtype
+from numba.np.ufunc.chunked import map_chunks
+from numba.np.ufunc.ufuncbuilder import GUFuncBuilder
+
+
+def _ewise_type(ty):
+    """
+    Return the element type of the kernel argument type *ty*.
+    """
+    return ty.dtype if isinstance(ty, types.Array) else ty
+
+
+def _casts_to(sig, other):
+    """
+    Whether the arguments of the kernel signature *sig* safely cast to
+    those of *other*.
+    """
+    return all(np.can_cast(as_dtype(_ewise_type(a)),
+                           as_dtype(_ewise_type(b)), 'safe')
+               for a, b in zip(sig.args, other.args))
+
+
+@register_jitable
+def _broadcast_dim(size, dim):
+    """
+    Combine the loop dimension *dim* of an input with the loop *size*
+    broadcast so far.
+    """
+    if size == 1:
+        return dim
+    if dim != 1 and dim != size:
+        raise ValueError("gufunc: the loop dimensions of the inputs "
+                         "cannot be broadcast together")
+    return size
+
+
+class GUFunc(object):
+    """
+    Dynamic generalized universal function (GUFunc) intended to act like a
+    normal Numpy gufunc, but capable of call-time (just-in-time) compilation
+    of kernels specialized to the argument types.
+    """
+
+    def __init__(self, py_func, signature, identity=None, cache=False,
+                 target='cpu', targetoptions={}):
+        from numba.np.ufunc.parallel import ParallelGUFuncBuilder
+        builders = {'cpu': GUFuncBuilder, 'parallel': ParallelGUFuncBuilder}
+        try:
+            builder_class = builders[target]
+        except KeyError:
+            raise ValueError("Unsupported target for a dynamic gufunc: %s"
+                             % (target,))
+        self._builder = builder_class(py_func, signature, identity=identity,
+                                      cache=cache,
+                                      targetoptions=dict(targetoptions))
+        self._reduce_args = (identity, cache, target, dict(targetoptions))
+        self._frozen = False
+        self._ufunc = None
+        self._kernel = None
+        self._call_impls = {}
+        self.py_func = py_func
+        self.sin, self.sout = self._builder.sin, self._builder.sout
+        self.__name__ = py_func.__name__
+        self.__doc__ = py_func.__doc__
+        self._install_type()
+        self._install_cg()
+
+    def __reduce__(self):
+        identity, cache, target, targetoptions = self._reduce_args
+        siglist = list(self._builder._sigs)
+        return (serialize._rebuild_reduction,
+                (self.__class__, self._builder.nb_func, self.signature,
+                 identity, cache, target, targetoptions, self._frozen,
+                 siglist))
+
+    @classmethod
+    def _rebuild(cls, dispatcher, signature, identity, cache, target,
+                 targetoptions, frozen, siglist):
+        self = cls(dispatcher.py_func, signature, identity=identity,
+                   cache=cache, target=target, targetoptions=targetoptions)
+        for sig in siglist:
+            self.add(sig)
+        if frozen:
+            self.disable_compile()
+        return self
+
+    def __repr__(self):
+        return "<numba.GUFunc %r>" % (self.__name__,)
+
+    @property
+    def signature(self):
+        return self._builder.signature
+
+    @property
+    def ufunc(self):
+        """
+        The Numpy gufunc with the loops compiled so far.
+        """
+        if self._ufunc is None:
+            self._ufunc = self._builder.build_ufunc()
+        return self._ufunc
+
+    @property
+    def nin(self):
+        return len(self.sin)
+
+    @property
+    def nout(self):
+        return len(self.sout)
+
+    @property
+    def nargs(self):
+        return self.nin + self.nout
+
+    @property
+    def ntypes(self):
+        return self.ufunc.ntypes
+
+    @property
+    def types(self):
+        return self.ufunc.types
+
+    @property
+    def identity(self):
+        return self.ufunc.identity
+
+    def build_ufunc(self):
+        """
+        For compatibility with the various *UFuncBuilder classes.
+        """
+        return self
+
+    def disable_compile(self):
+        """
+        Disable the compilation of new signatures at call time.
+        """
+        # If disabling compilation then there must be at least one signature
+        assert len(self._builder._sigs) > 0
+        self._frozen = True
+
+    def add(self, sig):
+        """
+        Compile the GUFunc for the given signature.
+        """
+        if self._frozen:
+            raise RuntimeError("compilation disabled for %s" % (self,))
+        sigs = self._builder._sigs
+        cres = self._builder.add(sig)
+        # Numpy uses the first loop its arguments cast to, so the loops
+        # for narrower types come first
+        sig = sigs.pop()
+        pos = next((i for i, other in enumerate(sigs)
+                    if _casts_to(sig, other)), len(sigs))
+        sigs.insert(pos, sig)
+        self._ufunc = None
+        return cres
+
+    def _find_loop(self, ewise_types):
+        """
+        Return the kernel signature whose leading element types are
+        *ewise_types*, or None.
+        """
+        n = len(ewise_types)
+        for sig in self._builder._sigs:
+            if tuple(map(_ewise_type, sig.args[:n])) == ewise_types:
+                return sig
+        return None
+
+    def _kernel_signature(self, ewise_types):
+        """
+        Return the kernel signature for arguments of the given element
+        types.  Inputs with no core dimension are passed as scalars, and
+        outputs are always passed as arrays.
+        """
+        argtys = []
+        for core, ty in zip(self.sin, ewise_types):
+            argtys.append(types.Array(ty, len(core), 'A') if core else ty)
+        for core, ty in zip(self.sout, ewise_types[self.nin:]):
+            argtys.append(types.Array(ty, max(len(core), 1), 'A'))
+        return types.void(*argtys)
+
+    def __call__(self, *args, **kws):
+        if self._frozen:
+            return self.ufunc(*args, **kws)
+        all_args = args
+        if 'out' in kws:
+            out = kws['out']
+            all_args = args + (out if isinstance(out, tuple) else (out,))
+        ewise_types = tuple(from_dtype(np.asarray(arg).dtype)
+                            for arg in all_args)
+        if self._find_loop(ewise_types) is None:
+            if len(ewise_types) != self.nargs:
+                raise TypeError("%s() needs its %d output arrays to compile "
+                                "a kernel for new input types"
+                                % (self.__name__, self.nout))
+            self.add(self._kernel_signature(ewise_types))
+        return self.ufunc(*args, **kws)
+
+    def map_chunks(self, inputs, out=None, chunk_rows=None, callback=None):
+        """
+        Apply the GUFunc to *inputs* by chunks of rows, see
+        numba.np.ufunc.chunked.map_chunks().
+        """
+        return map_chunks(self, inputs, out=out, chunk_rows=chunk_rows,
+                          callback=callback)
+
+    # Support for calls in nopython mode, where the kernel is called on the
+    # core subarrays in a loop over the broadcast loop dimensions
+
+    def _install_type(self, typingctx=None):
+        """Constructs and installs a typing class for a GUFunc object in the
+        input typing context.  If no typing context is given, then
+        _install_type() installs into the typing context of the
+        dispatcher object (should be same default context used by
+        jit() and njit()).
+        """
+        if typingctx is None:
+            typingctx = self._builder.nb_func.targetdescr.typing_context
+        _ty_cls = type('GUFuncTyping_' + self.__name__,
+                       (AbstractTemplate,),
+                       dict(key=self, generic=self._type_me))
+        typingctx.insert_user_function(self, _ty_cls)
+
+    def _type_me(self, argtys, kwtys):
+        """
+        Implement AbstractTemplate.generic() for the typing class
+        built by GUFunc._install_type().
+
+        Return the call-site signature.  The kernel is compiled for the
+        argument types when the call is lowered.
+        """
+        if kwtys:
+            raise TypingError("%s() takes no keyword arguments in nopython "
+                              "mode" % (self.__name__,))
+        if len(argtys) != self.nargs:
+            raise TypingError("%s() needs all of its %d arguments, outputs "
+                              "included, in nopython mode"
+                              % (self.__name__, self.nargs))
+        loop_ndims = []
+        for i, (ty, core) in enumerate(zip(argtys, self.sin + self.sout)):
+            if isinstance(ty, types.Array):
+                if ty.ndim < len(core):
+                    raise TypingError("%s(): argument %d has fewer "
+                                      "dimensions than its core dimensions "
+                                      "%s" % (self.__name__, i, core))
+                loop_ndims.append(ty.ndim - len(core))
+            elif (i >= self.nin or core or
+                  not isinstance(ty, (types.Boolean, types.Number))):
+                raise TypingError("%s(): argument %d must be an array, got %s"
+                                  % (self.__name__, i, ty))
+            else:
+                loop_ndims.append(0)
+        if any(n != max(loop_ndims) for n in loop_ndims[self.nin:]):
+            raise TypingError("%s(): the outputs must have all the loop "
+                              "dimensions" % (self.__name__,))
+        ewise_types = tuple(map(_ewise_type, argtys))
+        if self._frozen and self._find_loop(ewise_types) is None:
+            raise TypingError("cannot call %s with types %s"
+                              % (self, argtys))
+        return signature(types.none, *argtys)
+
+    def _get_kernel(self):
+        if self._kernel is None:
+            from numba import njit
+            _, cache, _, targetoptions = self._reduce_args
+            options = {k: v for k, v in targetoptions.items()
+                       if k in ('fastmath', 'boundscheck')}
+            self._kernel = njit(cache=cache, **options)(self.py_func)
+        return self._kernel
+
+    def _get_call_impl(self, argtys):
+        """
+        Return a function calling the kernel on the core subarrays of
+        arguments of the types *argtys*, for all the broadcast loop
+        indices.
+        """
+        ndims = tuple(getattr(ty, 'ndim', 0) for ty in argtys)
+        try:
+            return self._call_impls[ndims]
+        except KeyError:
+            pass
+
+        cores = self.sin + self.sout
+        loop_ndims = [ndim - len(core) for ndim, core in zip(ndims, cores)]
+        nloop = max(loop_ndims)
+        argnames = ["a%d" % i for i in range(self.nargs)]
+        src = ["def gufunc_call(%s):" % ", ".join(argnames)]
+        # The loop shape, broadcast over the inputs
+        for j in range(nloop):
+            src.append("    s%d = 1" % j)
+        for i in range(self.nin):
+            for d in range(loop_ndims[i]):
+                j = nloop - loop_ndims[i] + d
+                src.append("    s%d = _broadcast_dim(s%d, a%d.shape[%d])"
+                           % (j, j, i, d))
+        loop_shape = "".join("s%d, " % j for j in range(nloop))
+        # The outputs must have the loop shape, and the core dimensions of
+        # the same name must agree
+        for i in range(self.nin, self.nargs):
+            if nloop == 0:
+                break
+            src.append("    if a%d.shape[:%d] != (%s):"
+                       % (i, nloop, loop_shape))
+            src.append("        raise ValueError('%s(): the outputs must "
+                       "have the broadcast loop dimensions')"
+                       % (self.__name__,))
+        first_seen = {}
+        for i, core in enumerate(cores):
+            for d, sym in enumerate(core):
+                dim = "a%d.shape[%d]" % (i, loop_ndims[i] + d)
+                if sym not in first_seen:
+                    first_seen[sym] = dim
+                else:
+                    src.append("    if %s != %s:" % (dim, first_seen[sym]))
+                    src.append("        raise ValueError('%s(): mismatch in "
+                               "core dimension %s')" % (self.__name__, sym))
+        # The loop nest
+        indent = "    "
+        for j in range(nloop):
+            src.append("%sfor i%d in range(s%d):" % (indent, j, j))
+            indent += "    "
+        call_args = []
+        for i in range(self.nargs):
+            idx = ["min(i%d, a%d.shape[%d] - 1)"
+                   % (nloop - loop_ndims[i] + d, i, d)
+                   for d in range(loop_ndims[i])]
+            if i >= self.nin and not cores[i]:
+                # Scalar outputs are passed as arrays of one element
+                if idx:
+                    idx[-1] = "%s:%s + 1" % (idx[-1], idx[-1])
+                    call_args.append("a%d[%s]" % (i, ", ".join(idx)))
+                else:
+                    call_args.append("a%d.reshape(1)" % (i,))
+            elif idx:
+                call_args.append("a%d[%s]" % (i, ", ".join(idx)))
+            else:
+                call_args.append("a%d" % (i,))
+        src.append("%skernel(%s)" % (indent, ", ".join(call_args)))
+        glbls = {'kernel': self._get_kernel(),
+                 '_broadcast_dim': _broadcast_dim}
+        exec("\n".join(src), glbls)
+        impl = glbls['gufunc_call']
+        self._call_impls[ndims] = impl
+        return impl
+
+    def _lower_call(self, context, builder, sig, args):
+        impl = self._get_call_impl(sig.args)
+        return context.compile_internal(builder, impl, sig, args)
+
+    def _install_cg(self, targetctx=None):
+        """
+        Install an implementation function for a GUFunc object in the
+        given target context.  If no target context is given, then
+        _install_cg() installs into the target context of the
+        dispatcher object (should be same default context used by
+        jit() and njit()).
+        """
+        if targetctx is None:
+            targetctx = self._builder.nb_func.targetdescr.target_context
+        sig = (types.Any,) * self.nargs
+        targetctx.insert_func_defn([(self._lower_call, self, sig)])
@@ -360,3 +360,123 @@ extern "C" void do_scheduling_unsigned(uintp num_dim, intp *starts, intp *ends,
     std::vector<RangeActual> ret = create_schedule(full_space, num_threads);
     flatten_schedule(ret, sched);
 }
+
+/*
+    Loop chunking for the kernels of parallel ufuncs and gufuncs.
+
+    A kernel is given the number of iterations of the broadcast loop in
+    dimensions[0], Numpy having coalesced the loop dimensions where the
+    strides allow it, followed by the core dimensions.  The loop is cut into
+    at least one chunk per thread, and into up to CHUNKS_PER_THREAD chunks
+    per thread when the work, estimated from the core dimensions, makes
+    chunks of at least MIN_CHUNK_WORK.  If it doesn't leave threads idle,
+    the chunks are made of whole cache lines of every array and start on a
+    cache line of the last (output) array, so that the threads don't write
+    to the same cache lines.
+*/
+
+#define CACHE_LINE_SIZE 64
+#define CHUNKS_PER_THREAD 4
+#define MIN_CHUNK_WORK 4096
+
+static size_t saturating_mul(size_t a, size_t b) {
+    if (a != 0 && b > (size_t)-1 / a) {
+        return (size_t)-1;
+    }
+    return a * b;
+}
+
+static size_t gcd(size_t a, size_t b) {
+    while (b != 0) {
+        size_t t = a % b;
+        a = b;
+        b = t;
+    }
+    return a;
+}
+
+static size_t count_chunks(size_t total, size_t lead, size_t chunk) {
+    // The first chunk is [0, lead + chunk), the next ones start at
+    // lead + i * chunk
+    if (total <= lead + chunk) {
+        return 1;
+    }
+    return (total - lead + chunk - 1) / chunk;
+}
+
+/*
+    total is the number of loop iterations.
+    core_dims are the core_ndim core dimensions of the (g)ufunc.
+    args and steps are the array_count array pointers and loop steps.
+    num_threads is the number of threads taking part.
+    plan is filled in with the chunks, whose bounds are then given by
+    loop_chunk_start().
+*/
+extern "C" void plan_loop_chunks(size_t total, size_t *core_dims, size_t core_ndim, char **args, size_t *steps, size_t array_count, size_t num_threads, loop_chunks *plan) {
+    plan->total = total;
+    plan->lead = 0;
+    plan->chunk = 0;
+    if (total == 0) {
+        plan->nchunks = 0;
+        return;
+    }
+    if (num_threads < 1) {
+        num_threads = 1;
+    }
+
+    size_t work = total;
+    for (size_t j = 0; j < core_ndim; j++) {
+        work = saturating_mul(work, core_dims[j]);
+    }
+    size_t min_chunks = std::min(total, num_threads);
+    size_t max_chunks = std::min(total, saturating_mul(num_threads, CHUNKS_PER_THREAD));
+    size_t nchunks = std::max(min_chunks, std::min(max_chunks, work / MIN_CHUNK_WORK));
+    plan->nchunks = nchunks;
+
+    // The number of iterations making whole cache lines of every array
+    size_t align = 1;
+    for (size_t j = 0; j < array_count; j++) {
+        ptrdiff_t step = (ptrdiff_t)steps[j];
+        size_t size = (size_t)(step < 0 ? -step : step);
+        if (size != 0) {
+            align = std::max(align, CACHE_LINE_SIZE / gcd(size, CACHE_LINE_SIZE));
+        }
+    }
+    if (align == 1 || array_count == 0) {
+        return;
+    }
+    size_t chunk = (total + nchunks - 1) / nchunks;
+    chunk = (chunk + align - 1) / align * align;
+    size_t lead = 0;
+    ptrdiff_t out_step = (ptrdiff_t)steps[array_count - 1];
+    if (out_step > 0 && CACHE_LINE_SIZE % out_step == 0) {
+        size_t misalign = (size_t)((uintp)args[array_count - 1] % CACHE_LINE_SIZE);
+        if (misalign % out_step == 0) {
+            lead = ((CACHE_LINE_SIZE - misalign) % CACHE_LINE_SIZE) / out_step;
+        }
+    }
+    if (count_chunks(total, lead, chunk) >= min_chunks) {
+        plan->lead = lead;
+        plan->chunk = chunk;
+        plan->nchunks = count_chunks(total, lead, chunk);
+    }
+}
+
+/*
+    Return the first loop iteration of the chunk i of the plan, or the
+    number of iterations if i is nchunks.
+*/
+extern "C" size_t loop_chunk_start(const loop_chunks *plan, size_t i) {
+    if (i == 0) {
+        return 0;
+    }
+    if (i >= plan->nchunks) {
+        return plan->total;
+    }
+    if (plan->chunk == 0) {
+        // Even split
+        size_t n = plan->nchunks;
+        return i * (plan->total / n) + i * (plan->total % n) / n;
+    }
+    return plan->lead + i * plan->chunk;
+}
@@ -33,6 +33,16 @@
     #define uintp unsigned
 #endif
 
+#include <stddef.h>
+
+/* The chunks of the loop of a parallel (g)ufunc kernel, see plan_loop_chunks() */
+typedef struct {
+    size_t total;    /* number of loop iterations */
+    size_t nchunks;  /* number of chunks */
+    size_t lead;     /* offset of the chunk boundaries, if chunk != 0 */
+    size_t chunk;    /* iterations per chunk, 0 for an even split */
+} loop_chunks;
+
 #ifdef __cplusplus
 extern "C"
 {
@@ -41,6 +51,9 @@ extern "C"
 void do_scheduling_signed(uintp num_dim, intp *starts, intp *ends, uintp num_threads, intp *sched, intp debug);
 void do_scheduling_unsigned(uintp num_dim, intp *starts, intp *ends, uintp num_threads, uintp *sched, intp debug);
 
+void plan_loop_chunks(size_t total, size_t *core_dims, size_t core_ndim, char **args, size_t *steps, size_t array_count, size_t num_threads, loop_chunks *plan);
+size_t loop_chunk_start(const loop_chunks *plan, size_t i);
+
 #ifdef __cplusplus
 }
 #endif
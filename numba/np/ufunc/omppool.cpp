@@ -128,8 +128,11 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     //     data = <ir.Argument '.4' of type i8*>
 
     const size_t arg_len = (inner_ndim + 1);
+    loop_chunks plan;
+    plan_loop_chunks(dimensions[0], dimensions + 1, inner_ndim, args, steps,
+                     array_count, num_threads, &plan);
     // index variable in OpenMP 'for' statement must have signed integral type for MSVC
-    const ptrdiff_t size = (ptrdiff_t)dimensions[0];
+    const ptrdiff_t size = (ptrdiff_t)plan.nchunks;
 
     // holds the shared variable for `num_threads`, this is a bit superfluous
     // but present to force thinking about the scope of validity
@@ -139,7 +142,8 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     {
         printf("inner_ndim: %lu\n",inner_ndim);
         printf("arg_len: %lu\n", arg_len);
-        printf("total: %ld\n", size);
+        printf("total: %lu\n", plan.total);
+        printf("nchunks: %ld\n", size);
         printf("dimensions: ");
         for(size_t j = 0; j < arg_len; j++)
             printf("%lu, ", ((size_t *)dimensions)[j]);
@@ -163,11 +167,13 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
         // tell the active thread team about the number of threads
         set_num_threads(agreed_nthreads);
 
-        #pragma omp for
-        for(ptrdiff_t r = 0; r < size; r++)
+        // A static schedule gives each thread a contiguous run of chunks
+        #pragma omp for schedule(static)
+        for(ptrdiff_t c = 0; c < size; c++)
         {
+            size_t begin = loop_chunk_start(&plan, c);
             memcpy(count_space, dimensions, arg_len * sizeof(size_t));
-            count_space[0] = 1;
+            count_space[0] = loop_chunk_start(&plan, c + 1) - begin;
 
             if(_DEBUG)
             {
@@ -181,7 +187,7 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
             {
                 char * base = args[j];
                 size_t step = steps[j];
-                ptrdiff_t offset = step * r;
+                ptrdiff_t offset = step * begin;
                 array_arg_space[j] = base + offset;
 
                 if(0&&_DEBUG)
@@ -63,7 +63,7 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
         type signature of the gufunc
 
     inner_ndim
-        inner dimension of the gufunc (this is len(sig.args) in the case of a
+        number of core dimensions of the gufunc (this is 0 in the case of a
         ufunc)
 
     Returns
@@ -92,6 +92,12 @@ def build_gufunc_kernel(library, ctx, info, sig, inner_ndim):
     simply adjusted reads/writes/domain sizes and is safe by virtue of the
     domain partitioning.
 
+    The items of work are chosen by `plan_loop_chunks()` in
+    gufunc_scheduler.cpp: the loop is cut into at least one chunk per thread,
+    into more chunks when the work given by the core dimensions makes them
+    worthwhile, and the chunks are aligned on cache lines of the output so
+    that threads don't write to the same cache lines.
+
     NOTE: The execution backend is passed the requested thread count, but it can
     choose to ignore it (TBB)!
     """
@@ -197,8 +203,8 @@ def build_ufunc_wrapper(library, ctx, fname, signature, cres):
     innerfunc = ufuncbuilder.build_ufunc_wrapper(library, ctx, fname,
                                                  signature, objmode=False,
                                                  cres=cres)
-    info = build_gufunc_kernel(library, ctx, innerfunc, signature,
-                               len(signature.args))
+    # A ufunc has no core dimensions
+    info = build_gufunc_kernel(library, ctx, innerfunc, signature, 0)
     return info
 
 # ---------------------------------------------------------------------------
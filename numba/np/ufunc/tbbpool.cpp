@@ -123,12 +123,16 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     //     data = <ir.Argument '.4' of type i8*>
 
     const size_t arg_len = (inner_ndim + 1);
+    loop_chunks plan;
+    plan_loop_chunks(dimensions[0], dimensions + 1, inner_ndim, args, steps,
+                     array_count, num_threads, &plan);
 
     if(_DEBUG && _TRACE_SPLIT)
     {
         printf("inner_ndim: %lu\n",inner_ndim);
         printf("arg_len: %lu\n", arg_len);
-        printf("total: %lu\n", dimensions[0]);
+        printf("total: %lu\n", plan.total);
+        printf("nchunks: %lu\n", plan.nchunks);
         printf("dimensions: ");
         for(size_t j = 0; j < arg_len; j++)
             printf("%lu, ", ((size_t *)dimensions)[j]);
@@ -157,12 +161,14 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
 
     limited.execute([&]{
         using range_t = tbb::blocked_range<size_t>;
-        tbb::parallel_for(range_t(0, dimensions[0]), [=](const range_t &range)
+        // The range is over the chunks, which TBB may run several at once
+        tbb::parallel_for(range_t(0, plan.nchunks), [=](const range_t &range)
         {
+            size_t begin = loop_chunk_start(&plan, range.begin());
             size_t * count_space = (size_t *)alloca(sizeof(size_t) * arg_len);
             char ** array_arg_space = (char**)alloca(sizeof(char*) * array_count);
             memcpy(count_space, dimensions, arg_len * sizeof(size_t));
-            count_space[0] = range.size();
+            count_space[0] = loop_chunk_start(&plan, range.end()) - begin;
 
             if(_DEBUG && _TRACE_SPLIT > 1)
             {
@@ -176,7 +182,7 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
             {
                 char * base = args[j];
                 size_t step = steps[j];
-                ptrdiff_t offset = step * range.begin();
+                ptrdiff_t offset = step * begin;
                 array_arg_space[j] = base + offset;
 
                 if(_DEBUG && _TRACE_SPLIT > 2)
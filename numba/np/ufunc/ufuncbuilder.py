@@ -299,6 +299,9 @@ class GUFuncBuilder(_BaseUFuncBuilder):
         self.cache = cache
         self._sigs = []
         self._cres = {}
+        # The wrapped loops of the signatures, built once so that the
+        # gufunc can be rebuilt cheaply when signatures are added
+        self._built = {}
 
     def _finalize_signature(self, cres, args, return_type):
         if not cres.objectmode and cres.signature.return_type != types.void:
@@ -320,7 +323,9 @@ class GUFuncBuilder(_BaseUFuncBuilder):
         keepalive = []
         for sig in self._sigs:
             cres = self._cres[sig]
-            dtypenums, ptr, env = self.build(cres)
+            if sig not in self._built:
+                self._built[sig] = self.build(cres)
+            dtypenums, ptr, env = self._built[sig]
             dtypelist.append(dtypenums)
             ptrlist.append(utils.longint(ptr))
             keepalive.append((cres.library, env))
@@ -344,7 +344,8 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
     char ** array_arg_space = NULL;
     const size_t arg_len = (inner_ndim + 1);
     int i; // induction var for chunking, thread count unlikely to overflow int
-    size_t j, count, remain, total;
+    size_t j, first, last, begin, ntasks;
+    loop_chunks plan;
 
     ptrdiff_t offset;
     char * base;
@@ -354,16 +355,18 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
 
     debug_marker();
 
-    total = *((size_t *)dimensions);
-    count = total / num_threads;
-    remain = total;
+    plan_loop_chunks(dimensions[0], dimensions + 1, inner_ndim, args, steps,
+                     array_count, num_threads, &plan);
+    // Each task runs a contiguous run of chunks
+    ntasks = plan.nchunks < (size_t)num_threads ? plan.nchunks : (size_t)num_threads;
 
     if(_DEBUG)
     {
         printf("inner_ndim: %ld\n",inner_ndim);
         printf("arg_len: %ld\n", arg_len);
-        printf("total: %ld\n", total);
-        printf("count: %ld\n", count);
+        printf("total: %ld\n", plan.total);
+        printf("nchunks: %ld\n", plan.nchunks);
+        printf("ntasks: %ld\n", ntasks);
 
         printf("dimensions: ");
         for(j = 0; j < arg_len; j++)
@@ -397,22 +400,16 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
 
     // This backend isn't threadsafe so just mutate the global
     old_queue_count = queue_count;
-    queue_count = num_threads;
+    queue_count = (int)ntasks;
 
-    for (i = 0; i < num_threads; i++)
+    for (i = 0; i < (int)ntasks; i++)
     {
+        first = i * plan.nchunks / ntasks;
+        last = (i + 1) * plan.nchunks / ntasks;
+        begin = loop_chunk_start(&plan, first);
         count_space = (size_t *)alloca(sizeof(size_t) * arg_len);
         memcpy(count_space, dimensions, arg_len * sizeof(size_t));
-        if(i == num_threads - 1)
-        {
-            // Last thread takes all leftover
-            count_space[0] = remain;
-        }
-        else
-        {
-            count_space[0] = count;
-            remain = remain - count;
-        }
+        count_space[0] = loop_chunk_start(&plan, last) - begin;
 
         if(_DEBUG)
         {
@@ -431,7 +428,7 @@ parallel_for(void *fn, char **args, size_t *dimensions, size_t *steps, void *dat
         {
             base = args[j];
             step = steps[j];
-            offset = step * count * i;
+            offset = step * begin;
             array_arg_space[j] = (char *)(base + offset);
 
             if(_DEBUG)
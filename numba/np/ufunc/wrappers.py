@@ -1,4 +1,5 @@
 from collections import namedtuple
+import itertools
 
 import numpy as np
 
@@ -11,6 +12,10 @@ from numba.core.caching import make_library_cache, NullCache
 
 _wrapper_info = namedtuple('_wrapper_info', ['library', 'env', 'name'])
 
+# Ufuncs with more inputs than this only get a specialized loop for
+# contiguous arguments, as there are 2 ** nin scalar-broadcast patterns
+MAX_SPECIALIZED_INPUTS = 3
+
 
 def _build_ufunc_loop_body(load, store, context, func, builder, arrays, out,
                            offsets, store_offset, signature, pyapi, env):
@@ -134,6 +139,39 @@ def build_fast_loop_body(context, func, builder, arrays, out, offsets,
                                   env=env)
 
 
+def build_broadcast_loop_body(context, func, builder, arrays, out, offsets,
+                              store_offset, signature, ind, scalars, pyapi,
+                              env):
+    """
+    Like build_fast_loop_body(), but the inputs whose value in *scalars* is
+    not None are zero-strided, and that value is used for all the
+    iterations.
+    """
+    def load():
+        elems = [ary.load_aligned(ind) if scalar is None else scalar
+                 for ary, scalar in zip(arrays, scalars)]
+        return elems
+
+    def store(retval):
+        out.store_aligned(retval, ind)
+
+    return _build_ufunc_loop_body(load, store, context, func, builder, arrays,
+                                  out, offsets, store_offset, signature, pyapi,
+                                  env=env)
+
+
+def _specialized_loop_patterns(nin):
+    """
+    Return the patterns of the inputs for which a ufunc loop is specialized,
+    as tuples of booleans telling whether each input is a broadcast scalar,
+    the others being contiguous.  The all-contiguous pattern comes first.
+    """
+    if nin > MAX_SPECIALIZED_INPUTS:
+        return [(False,) * nin]
+    return [pattern for pattern in itertools.product((False, True), repeat=nin)
+            if nin == 0 or not all(pattern)]
+
+
 def build_ufunc_wrapper(library, context, fname, signature, objmode, cres):
     """
     Wrap the scalar function with a loop that iterates over the arguments
@@ -201,10 +239,6 @@ def build_ufunc_wrapper(library, context, fname, signature, objmode, cres):
     store_offset = cgutils.alloca_once(builder, intp_t)
     builder.store(zero, store_offset)
 
-    unit_strided = cgutils.true_bit
-    for ary in arrays:
-        unit_strided = builder.and_(unit_strided, ary.is_unit_strided)
-
     pyapi = context.get_python_api(builder)
     if objmode:
         # General loop
@@ -218,23 +252,43 @@ def build_ufunc_wrapper(library, context, fname, signature, objmode, cres):
         builder.ret_void()
 
     else:
-        with builder.if_else(unit_strided) as (is_unit_strided, is_strided):
-            with is_unit_strided:
-                with cgutils.for_range(builder, loopcount, intp=intp_t) as loop:
-                    build_fast_loop_body(
-                        context, func, builder, arrays, out, offsets,
-                        store_offset, signature, loop.index, pyapi,
-                        env=envptr,
-                    )
-
-            with is_strided:
-                # General loop
-                with cgutils.for_range(builder, loopcount, intp=intp_t):
-                    build_slow_loop_body(
-                        context, func, builder, arrays, out, offsets,
-                        store_offset, signature, pyapi,
-                        env=envptr,
-                    )
+        # Dispatch on the steps to the loops specialized for contiguous and
+        # scalar-broadcast (zero-strided) inputs with a contiguous output,
+        # which LLVM can vectorize, the values of the scalars being loaded
+        # once before the loop
+        for pattern in _specialized_loop_patterns(len(arrays)):
+            matches = out.is_unit_strided
+            for ary, is_scalar in zip(arrays, pattern):
+                matches = builder.and_(matches, ary.is_zero_strided
+                                       if is_scalar else ary.is_unit_strided)
+            with builder.if_then(matches):
+                if not any(pattern):
+                    with cgutils.for_range(builder, loopcount,
+                                           intp=intp_t) as loop:
+                        build_fast_loop_body(
+                            context, func, builder, arrays, out, offsets,
+                            store_offset, signature, loop.index, pyapi,
+                            env=envptr,
+                        )
+                else:
+                    scalars = [ary.load_direct(zero) if is_scalar else None
+                               for ary, is_scalar in zip(arrays, pattern)]
+                    with cgutils.for_range(builder, loopcount,
+                                           intp=intp_t) as loop:
+                        build_broadcast_loop_body(
+                            context, func, builder, arrays, out, offsets,
+                            store_offset, signature, loop.index, scalars,
+                            pyapi, env=envptr,
+                        )
+                builder.ret_void()
+
+        # General loop
+        with cgutils.for_range(builder, loopcount, intp=intp_t):
+            build_slow_loop_body(
+                context, func, builder, arrays, out, offsets,
+                store_offset, signature, pyapi,
+                env=envptr,
+            )
 
         builder.ret_void()
     del builder
@@ -260,6 +314,8 @@ class UArrayArg(object):
         offseted_step = self.builder.gep(steps, [offset])
         self.step = self.builder.load(offseted_step)
         self.is_unit_strided = builder.icmp(ICMP_EQ, self.abisize, self.step)
+        self.is_zero_strided = builder.icmp(
+            ICMP_EQ, self.context.get_constant(types.intp, 0), self.step)
         self.builder = builder
 
     def load_direct(self, byteoffset):
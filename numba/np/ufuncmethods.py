@@ -0,0 +1,521 @@
+"""
+Implementation of the reduce(), accumulate(), at() and outer() methods of
+Numpy ufuncs and DUFuncs in nopython mode.
+
+The methods are typed on the types.Function of the ufunc, and call the
+ufunc on scalars, so that DUFuncs compile the loops they need as usual.
+Reductions reuse the (outer, n, inner) lanes of the axis reductions of
+arraymath.py; under parallel=True, the lanes are reduced in parallel and
+long lanes of the associative Numpy ufuncs are split across threads.
+"""
+
+import numpy as np
+
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.core.extending import (overload, overload_method,
+                                  register_jitable)
+from numba.core.typing.arraydecl import literal_flag
+from numba.np.arraymath import (REDUCE_BLOCKSIZE, _reduced_axes,
+                                _reduction_lanes, _reduction_shape)
+from numba.np.numpy_support import as_dtype, from_dtype, is_nonelike
+from numba.np.unsafe.ndarray import to_fixed_tuple
+
+
+# Lanes shorter than this are not split across threads
+SMALL_REDUCE_SPLIT = 1 << 14
+
+# The Numpy ufuncs whose reductions can be split and reordered
+_associative_ufuncs = frozenset([
+    np.add, np.multiply, np.maximum, np.minimum, np.fmax, np.fmin,
+    np.logical_and, np.logical_or, np.logical_xor, np.bitwise_and,
+    np.bitwise_or, np.bitwise_xor,
+])
+
+
+def _get_ufunc(func):
+    """
+    Return the Numpy ufunc or DUFunc typed as *func*, or None.
+    """
+    from numba.np.ufunc.dufunc import DUFunc
+    if isinstance(func, types.Function):
+        key = func.typing_key
+        if isinstance(key, (np.ufunc, DUFunc)):
+            return key
+    return None
+
+
+def _is_associative(ufunc):
+    # An identity doesn't make a DUFunc associative (e.g. a subtraction with
+    # identity=0), so the lanes of DUFuncs are never split
+    return isinstance(ufunc, np.ufunc) and ufunc in _associative_ufuncs
+
+
+def _check_binary(ufunc, what):
+    if ufunc.nin != 2 or ufunc.nout != 1:
+        raise TypingError("%s only supported for binary functions"
+                          % (what,))
+
+
+def _call_type(func, argtys):
+    """
+    Return the type of the result of calling the ufunc typed as *func* on
+    scalars of the types *argtys*.
+    """
+    from numba.core.registry import cpu_target
+    sig = func.get_call_type(cpu_target.typing_context, tuple(argtys), {})
+    return sig.return_type
+
+
+def _reduce_dtype(ufunc, arrty, dtype):
+    """
+    Return the type the elements of *arrty* are converted to before a
+    reduction or accumulation by *ufunc*, as Numpy does: the *dtype*
+    argument if given, otherwise the array dtype, at least a long for the
+    add and multiply of booleans and integers.
+    """
+    if not is_nonelike(dtype):
+        if not isinstance(dtype, types.DTypeSpec):
+            raise TypingError("dtype must be a Numpy dtype, got %s"
+                              % (dtype,))
+        return dtype.dtype
+    ty = arrty.dtype
+    if (ufunc.__name__ in ('add', 'multiply') and
+            isinstance(ty, (types.Boolean, types.Integer))):
+        if isinstance(ty, types.Boolean):
+            return from_dtype(np.dtype(np.int_))
+        if ty.bitwidth < np.dtype(np.int_).itemsize * 8:
+            return from_dtype(np.dtype(np.int_ if ty.signed else np.uint))
+    return ty
+
+
+def _check_no_out(out):
+    if not is_nonelike(out):
+        raise TypingError("the out argument of ufunc methods is not "
+                          "supported")
+
+
+#----------------------------------------------------------------------------
+# reduce() and accumulate()
+
+def _make_ufunc_reduce_impl(convert, combine, merge, associative, wrap,
+                            prange, get_num_threads):
+    """
+    Make a function reducing the (outer, n, inner) lanes of a 1d buffer
+    into *out*.  *convert(v)* converts an element to the accumulator type,
+    *combine(acc, v)* accumulates an element and *merge(acc, other)*
+    combines two accumulators.  Each lane starts from *start* if
+    *use_start* is true, otherwise from its first element.
+    """
+
+    @wrap
+    def reduce_lanes(src, outer, n, inner, out, use_start, start):
+        nblocks = (inner + REDUCE_BLOCKSIZE - 1) // REDUCE_BLOCKSIZE
+        first = 0 if use_start else 1
+        for t in prange(outer * nblocks):
+            o = t // nblocks
+            lo = o * inner + (t - o * nblocks) * REDUCE_BLOCKSIZE
+            hi = min(lo + REDUCE_BLOCKSIZE, (o + 1) * inner)
+            # The k-th element reduced into out[j] is src[base + k * inner + j]
+            base = o * (n - 1) * inner
+            for j in range(lo, hi):
+                if use_start:
+                    out[j] = start
+                else:
+                    out[j] = convert(src[base + j])
+            for k in range(first, n):
+                row = base + k * inner
+                for j in range(lo, hi):
+                    out[j] = combine(out[j], src[row + j])
+
+    @wrap
+    def reduce_split(src, outer, n, inner, out, use_start, start, nchunks):
+        # Each lane is cut into chunks, which are reduced separately and
+        # then merged in order
+        size = outer * inner
+        chunk = (n + nchunks - 1) // nchunks
+        nchunks = (n + chunk - 1) // chunk
+        partial = np.empty((nchunks, size), out.dtype)
+        for t in prange(nchunks * size):
+            c = t // size
+            j = t - c * size
+            base = (j // inner) * (n - 1) * inner + j
+            first = c * chunk
+            stop = min(first + chunk, n)
+            if c == 0 and use_start:
+                acc = start
+            else:
+                acc = convert(src[base + first * inner])
+                first += 1
+            for k in range(first, stop):
+                acc = combine(acc, src[base + k * inner])
+            partial[c, j] = acc
+        for j in prange(size):
+            acc = partial[0, j]
+            for c in range(1, nchunks):
+                acc = merge(acc, partial[c, j])
+            out[j] = acc
+
+    @register_jitable
+    def run(src, outer, n, inner, out, use_start, start):
+        nthreads = get_num_threads()
+        if (associative and nthreads > 1 and outer * inner < nthreads and
+                n >= SMALL_REDUCE_SPLIT):
+            nchunks = min(nthreads, n // (SMALL_REDUCE_SPLIT // 4))
+            reduce_split(src, outer, n, inner, out, use_start, start,
+                         nchunks)
+        else:
+            reduce_lanes(src, outer, n, inner, out, use_start, start)
+
+    return run
+
+
+@register_jitable
+def _single_thread():
+    return 1
+
+
+_reduce_impls = {}
+
+
+def get_ufunc_reduce_impl(func, array, axis, dtype, out, keepdims, initial,
+                          parallel=False):
+    """
+    Return a function computing ufunc.reduce() for the ufunc typed as
+    *func* and the argument types *array*, *axis*, *dtype*, *out*,
+    *keepdims* and *initial*, or None if they are not supported.  If
+    *parallel* is true, the reduction is computed in parallel.
+    """
+    ufunc = _get_ufunc(func)
+    if ufunc is None or not isinstance(array, types.Array):
+        return None
+    _check_binary(ufunc, "reduce")
+    _check_no_out(out)
+    keepdims = literal_flag(keepdims, 'keepdims')
+    if isinstance(axis, types.Omitted):
+        axis = axis.value
+    if isinstance(axis, (int, types.Integer)):
+        nreduced = 1
+    elif is_nonelike(axis):
+        nreduced = array.ndim
+    elif (isinstance(axis, types.BaseTuple) and
+          all(isinstance(ty, types.Integer) for ty in axis)):
+        nreduced = len(axis)
+    else:
+        raise TypingError("reduce(): axis must be None, an integer or a "
+                          "tuple of integers, got %s" % (axis,))
+    out_ndim = array.ndim if keepdims else array.ndim - nreduced
+    if out_ndim < 0:
+        raise TypingError("reduce(): too many axes for the array")
+
+    # "initial" omitted means starting from the identity, if any, while
+    # initial=None means starting from the first elements
+    if isinstance(initial, types.Omitted):
+        initial = initial.value
+    if initial is None:
+        has_identity = ufunc.identity is not None
+        identity = ufunc.identity
+    elif isinstance(initial, types.NoneType):
+        has_identity = False
+        identity = None
+    elif isinstance(initial, (types.Boolean, types.Number)):
+        has_identity = True
+        identity = None
+    else:
+        raise TypingError("reduce(): initial must be a scalar, got %s"
+                          % (initial,))
+
+    conv_type = _reduce_dtype(ufunc, array, dtype)
+    acc_type = _call_type(func, (conv_type, conv_type))
+    key = (ufunc, array.dtype, array.ndim, conv_type, out_ndim, keepdims,
+           has_identity, identity, parallel)
+    try:
+        return _reduce_impls[key]
+    except KeyError:
+        pass
+
+    @register_jitable
+    def convert(v):
+        return acc_type(conv_type(v))
+
+    @register_jitable
+    def combine(acc, v):
+        return acc_type(ufunc(acc, conv_type(v)))
+
+    @register_jitable
+    def merge(acc, other):
+        return acc_type(ufunc(acc, other))
+
+    if parallel:
+        from numba import njit, prange, get_num_threads
+        # NOTE: wrap with njit(parallel=True) so that the prange loops run
+        #       on the threading layer, whatever the caller's options are
+        run = _make_ufunc_reduce_impl(convert, combine, merge,
+                                      _is_associative(ufunc),
+                                      njit(parallel=True), prange,
+                                      get_num_threads)
+    else:
+        run = _make_ufunc_reduce_impl(convert, combine, merge, False,
+                                      register_jitable, range,
+                                      _single_thread)
+
+    empty_msg = ("zero-size array to reduction operation %s which has no "
+                 "identity" % (ufunc.__name__,))
+    if not has_identity:
+        @register_jitable
+        def get_start(n, initial):
+            if n == 0:
+                raise ValueError(empty_msg)
+            return acc_type(0), False
+    elif identity is not None:
+        @register_jitable
+        def get_start(n, initial):
+            return acc_type(identity), True
+    else:
+        @register_jitable
+        def get_start(n, initial):
+            return acc_type(initial), True
+
+    np_dtype = as_dtype(acc_type)
+
+    @register_jitable
+    def reduce_into(array, axis, initial):
+        reduced = _reduced_axes(array.ndim, axis)
+        src, outer, n, inner = _reduction_lanes(array, reduced)
+        start, use_start = get_start(n, initial)
+        res = np.empty(outer * inner, np_dtype)
+        run(src, outer, n, inner, res, use_start, start)
+        return res, reduced
+
+    if out_ndim == 0:
+        @register_jitable
+        def reduce_impl(array, axis=0, dtype=None, out=None, keepdims=False,
+                        initial=None):
+            res, reduced = reduce_into(array, axis, initial)
+            return res[0]
+    else:
+        @register_jitable
+        def reduce_impl(array, axis=0, dtype=None, out=None, keepdims=False,
+                        initial=None):
+            res, reduced = reduce_into(array, axis, initial)
+            shape = _reduction_shape(array.shape, reduced, keepdims)
+            return res.reshape(to_fixed_tuple(shape, out_ndim))
+
+    _reduce_impls[key] = reduce_impl
+    return reduce_impl
+
+
+@overload_method(types.Function, 'reduce')
+def ufunc_reduce(func, array, axis=0, dtype=None, out=None, keepdims=False,
+                 initial=None):
+    reduce_impl = get_ufunc_reduce_impl(func, array, axis, dtype, out,
+                                        keepdims, initial)
+    if reduce_impl is None:
+        return
+
+    def ufunc_reduce_impl(func, array, axis=0, dtype=None, out=None,
+                          keepdims=False, initial=None):
+        return reduce_impl(array, axis, dtype, out, keepdims, initial)
+    return ufunc_reduce_impl
+
+
+@overload_method(types.Function, 'accumulate')
+def ufunc_accumulate(func, array, axis=0, dtype=None, out=None):
+    ufunc = _get_ufunc(func)
+    if ufunc is None or not isinstance(array, types.Array):
+        return
+    _check_binary(ufunc, "accumulate")
+    _check_no_out(out)
+    if isinstance(axis, types.Omitted):
+        axis = axis.value
+    if not isinstance(axis, (int, types.Integer)):
+        raise TypingError("accumulate(): axis must be an integer, got %s"
+                          % (axis,))
+    if array.ndim == 0:
+        raise TypingError("accumulate(): cannot accumulate on a scalar")
+    conv_type = _reduce_dtype(ufunc, array, dtype)
+    acc_type = _call_type(func, (conv_type, conv_type))
+    np_dtype = as_dtype(acc_type)
+
+    def ufunc_accumulate_impl(func, array, axis=0, dtype=None, out=None):
+        reduced = _reduced_axes(array.ndim, axis)
+        src, outer, n, inner = _reduction_lanes(array, reduced)
+        res = np.empty(src.size, np_dtype)
+        # The lanes are laid out in the C order of the array
+        for o in range(outer):
+            base = o * n * inner
+            for j in range(inner):
+                if n > 0:
+                    res[base + j] = acc_type(conv_type(src[base + j]))
+            for k in range(1, n):
+                row = base + k * inner
+                for j in range(inner):
+                    res[row + j] = acc_type(ufunc(res[row - inner + j],
+                                                  conv_type(src[row + j])))
+        return res.reshape(array.shape)
+    return ufunc_accumulate_impl
+
+
+#----------------------------------------------------------------------------
+# at() and outer()
+
+def _at_count(n, idx):
+    """
+    Return the number of indices of the index *idx* combined with the
+    *n* of the other indices, arrays of one index broadcasting.
+    """
+    raise NotImplementedError
+
+
+@overload(_at_count)
+def _ol_at_count(n, idx):
+    if isinstance(idx, types.Integer):
+        def impl(n, idx):
+            return n
+    else:
+        def impl(n, idx):
+            m = len(idx)
+            if m == 1 or m == n:
+                return n
+            if n == 1:
+                return m
+            raise ValueError("at(): shape mismatch in the indices and "
+                             "values")
+    return impl
+
+
+def _at_item(idx, k):
+    """
+    Return the *k*-th item of the index or value *idx*, broadcast if it
+    is a scalar or an array of one item.
+    """
+    raise NotImplementedError
+
+
+@overload(_at_item)
+def _ol_at_item(idx, k):
+    if isinstance(idx, (types.Boolean, types.Number)):
+        def impl(idx, k):
+            return idx
+    else:
+        def impl(idx, k):
+            if len(idx) == 1:
+                return idx[0]
+            return idx[k]
+    return impl
+
+
+@register_jitable
+def _at_normalize(i, size):
+    if i < 0:
+        i += size
+    if i < 0 or i >= size:
+        raise IndexError("at(): index out of bounds")
+    return i
+
+
+_at_impls = {}
+
+
+def get_ufunc_at_impl(func, a, indices, b):
+    """
+    Return a function computing ufunc.at() for the ufunc typed as *func*
+    and the argument types *a*, *indices* and *b*, or None if they are not
+    supported.  Each index must select a single element of *a*.
+    """
+    ufunc = _get_ufunc(func)
+    if ufunc is None or not isinstance(a, types.Array):
+        return None
+    if ufunc.nout != 1 or ufunc.nin not in (1, 2):
+        raise TypingError("at() only supported for unary and binary "
+                          "functions")
+    if isinstance(b, types.Omitted):
+        b = b.value
+    if ufunc.nin == 2 and is_nonelike(b):
+        raise TypingError("at(): second operand needed for ufunc")
+    if ufunc.nin == 1 and not is_nonelike(b):
+        raise TypingError("at(): second operand provided when ufunc is "
+                          "unary")
+    if not (is_nonelike(b) or isinstance(b, (types.Boolean, types.Number)) or
+            (isinstance(b, types.Array) and b.ndim == 1)):
+        raise TypingError("at(): the values must be a scalar or a 1-D "
+                          "array, got %s" % (b,))
+
+    def is_index(ty):
+        return (isinstance(ty, types.Integer) or
+                (isinstance(ty, types.Array) and ty.ndim == 1 and
+                 isinstance(ty.dtype, types.Integer)))
+
+    if isinstance(indices, types.BaseTuple):
+        index_types = list(indices)
+        idx_exprs = ["indices[%d]" % d for d in range(len(indices))]
+    else:
+        index_types = [indices]
+        idx_exprs = ["indices"]
+    if len(index_types) != a.ndim or not all(map(is_index, index_types)):
+        raise TypingError("at(): the indices must be an integer or an "
+                          "integer array per dimension of the array")
+    key = ufunc, a, indices, b
+    try:
+        return _at_impls[key]
+    except KeyError:
+        pass
+
+    src = ["def at_impl(a, indices, b=None):", "    n = 1"]
+    idxs = []
+    for d in range(a.ndim):
+        src.append("    idx%d = %s" % (d, idx_exprs[d]))
+        src.append("    n = _at_count(n, idx%d)" % d)
+        idxs.append("i%d" % d)
+    if isinstance(b, types.Array):
+        src.append("    n = _at_count(n, b)")
+    src.append("    for k in range(n):")
+    for d in range(a.ndim):
+        src.append("        i%d = _at_normalize(_at_item(idx%d, k), "
+                   "a.shape[%d])" % (d, d, d))
+    item = "a[%s]" % ", ".join(idxs)
+    if ufunc.nin == 2:
+        src.append("        %s = ufunc(%s, _at_item(b, k))" % (item, item))
+    else:
+        src.append("        %s = ufunc(%s)" % (item, item))
+    glbls = {'ufunc': ufunc, '_at_count': _at_count, '_at_item': _at_item,
+             '_at_normalize': _at_normalize}
+    exec("\n".join(src), glbls)
+    at_impl = register_jitable(glbls['at_impl'])
+
+    _at_impls[key] = at_impl
+    return at_impl
+
+
+@overload_method(types.Function, 'at')
+def ufunc_at(func, a, indices, b=None):
+    at_impl = get_ufunc_at_impl(func, a, indices, b)
+    if at_impl is None:
+        return
+
+    def ufunc_at_impl(func, a, indices, b=None):
+        at_impl(a, indices, b)
+    return ufunc_at_impl
+
+
+@overload_method(types.Function, 'outer')
+def ufunc_outer(func, A, B):
+    ufunc = _get_ufunc(func)
+    if ufunc is None:
+        return
+    _check_binary(ufunc, "outer product")
+    if not (isinstance(A, types.Array) and isinstance(B, types.Array)):
+        raise TypingError("outer(): the operands must be arrays")
+    np_dtype = as_dtype(_call_type(func, (A.dtype, B.dtype)))
+
+    def ufunc_outer_impl(func, A, B):
+        a = A.ravel()
+        b = B.ravel()
+        nb = b.size
+        res = np.empty(a.size * nb, np_dtype)
+        for i in range(a.size):
+            x = a[i]
+            for j in range(nb):
+                res[i * nb + j] = ufunc(x, b[j])
+        return res.reshape(A.shape + B.shape)
+    return ufunc_outer_impl
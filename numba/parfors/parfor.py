@@ -26,11 +26,13 @@ import operator
 
 import numba.core.ir
 from numba.core import types, typing, utils, errors, ir, analysis, postproc, rewrites, typeinfer, config, ir_utils
-from numba import prange, pndindex
+from numba import prange, pndindex, reduction
 from numba.np.numpy_support import as_dtype
 from numba.core.typing.templates import infer_global, AbstractTemplate
 from numba.stencils.stencilparfor import StencilPass
 from numba.core.extending import register_jitable
+from numba.misc.radixsort import is_radix_sortable
+from numba.np import atomic
 
 
 from numba.core.ir_utils import (
@@ -58,6 +60,7 @@ from numba.core.ir_utils import (
     simplify_CFG,
     has_no_side_effect,
     canonicalize_array_math,
+    canonicalize_matmul,
     add_offset_to_labels,
     find_callname,
     find_build_sequence,
@@ -120,7 +123,30 @@ class internal_prange(object):
     def __new__(cls, *args):
         return range(*args)
 
-def min_parallel_impl(return_type, arg):
+def _axis_reduction_parallel_impl(name, return_type, arg, args):
+    """Parallel implementation of the reduction *name* along an axis, the
+    first of *args*, which may also be None.  The other arguments (dtype,
+    keepdims) only determine *return_type*.
+    """
+    if not isinstance(arg, types.npytypes.Array):
+        return None
+    from numba.np.arraymath import get_axis_reduction
+    reduce_axis = get_axis_reduction(name, arg, return_type, parallel=True)
+
+    if len(args) == 1:
+        def reduce_1(in_arr, axis):
+            return reduce_axis(in_arr, axis)
+    elif len(args) == 2:
+        def reduce_1(in_arr, axis, arg1):
+            return reduce_axis(in_arr, axis)
+    else:
+        def reduce_1(in_arr, axis, arg1, arg2):
+            return reduce_axis(in_arr, axis)
+    return reduce_1
+
+def min_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('min', return_type, arg, args)
     # XXX: use prange for 1D arrays since pndindex returns a 1-tuple instead of
     # integer. This causes type and fusion issues.
     if arg.ndim == 0:
@@ -144,7 +170,9 @@ def min_parallel_impl(return_type, arg):
             return val
     return min_1
 
-def max_parallel_impl(return_type, arg):
+def max_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('max', return_type, arg, args)
     if arg.ndim == 0:
         def max_1(in_arr):
             return in_arr[()]
@@ -166,27 +194,100 @@ def max_parallel_impl(return_type, arg):
             return val
     return max_1
 
-def argmin_parallel_impl(in_arr):
-    numba.parfors.parfor.init_prange()
-    argmin_checker(len(in_arr))
-    A = in_arr.ravel()
-    init_val = numba.cpython.builtins.get_type_max_value(A.dtype)
-    ival = typing.builtins.IndexValue(0, init_val)
-    for i in numba.parfors.parfor.internal_prange(len(A)):
-        curr_ival = typing.builtins.IndexValue(i, A[i])
-        ival = min(ival, curr_ival)
-    return ival.index
-
-def argmax_parallel_impl(in_arr):
-    numba.parfors.parfor.init_prange()
-    argmax_checker(len(in_arr))
-    A = in_arr.ravel()
-    init_val = numba.cpython.builtins.get_type_min_value(A.dtype)
-    ival = typing.builtins.IndexValue(0, init_val)
-    for i in numba.parfors.parfor.internal_prange(len(A)):
-        curr_ival = typing.builtins.IndexValue(i, A[i])
-        ival = max(ival, curr_ival)
-    return ival.index
+@register_jitable
+def ravel_index(shape, index):
+    """Return the position of the multi-dimensional *index* in the C-order
+    flattening of an array of the given *shape*.
+    """
+    flat = 0
+    for k in range(len(shape)):
+        flat = flat * shape[k] + index[k]
+    return flat
+
+@register_jitable
+def _scatter_buffer(out, start, stop):
+    """Allocate the copies of *out* accumulating the scatter updates of the
+    chunks of a parfor over range(start, stop), one per thread, or none if
+    they are larger than the loop.
+    """
+    nchunks = numba.get_num_threads()
+    if nchunks > 1 and out.size * nchunks <= stop - start:
+        return np.zeros((nchunks,) + out.shape, out.dtype)
+    return np.zeros((0,) + out.shape, out.dtype)
+
+@register_jitable
+def _scatter_add(buf, out, index, val, it, start, stop):
+    """Add *val* to out[index] in iteration *it* of a parfor over
+    range(start, stop), through the copy of *out* of the iteration's chunk
+    if there are copies.  Threads may share a chunk, so the update is atomic
+    in any case.
+    """
+    if buf.shape[0] == 0:
+        atomic.add(out, index, val)
+    else:
+        chunk = ((np.intp(it) - np.intp(start)) * buf.shape[0]
+                 // (np.intp(stop) - np.intp(start)))
+        atomic.add(buf[chunk], index, val)
+
+@register_jitable
+def _scatter_merge(buf, out):
+    for k in range(buf.shape[0]):
+        out += buf[k]
+
+# argmin/argmax iterate over the input array directly (without ravel()) so
+# that the reduction loop has the same shape as the loop producing the
+# array, and both can be fused.
+def argmin_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('argmin', return_type, arg, args)
+    if arg.ndim == 1:
+        def argmin_1(in_arr):
+            numba.parfors.parfor.init_prange()
+            argmin_checker(len(in_arr))
+            init_val = numba.cpython.builtins.get_type_max_value(in_arr.dtype)
+            ival = typing.builtins.IndexValue(0, init_val)
+            for i in numba.parfors.parfor.internal_prange(len(in_arr)):
+                curr_ival = typing.builtins.IndexValue(i, in_arr[i])
+                ival = min(ival, curr_ival)
+            return ival.index
+    else:
+        def argmin_1(in_arr):
+            numba.parfors.parfor.init_prange()
+            argmin_checker(in_arr.size)
+            init_val = numba.cpython.builtins.get_type_max_value(in_arr.dtype)
+            ival = typing.builtins.IndexValue(0, init_val)
+            for i in numba.pndindex(in_arr.shape):
+                flat = numba.parfors.parfor.ravel_index(in_arr.shape, i)
+                curr_ival = typing.builtins.IndexValue(flat, in_arr[i])
+                ival = min(ival, curr_ival)
+            return ival.index
+    return argmin_1
+
+def argmax_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('argmax', return_type, arg, args)
+    if arg.ndim == 1:
+        def argmax_1(in_arr):
+            numba.parfors.parfor.init_prange()
+            argmax_checker(len(in_arr))
+            init_val = numba.cpython.builtins.get_type_min_value(in_arr.dtype)
+            ival = typing.builtins.IndexValue(0, init_val)
+            for i in numba.parfors.parfor.internal_prange(len(in_arr)):
+                curr_ival = typing.builtins.IndexValue(i, in_arr[i])
+                ival = max(ival, curr_ival)
+            return ival.index
+    else:
+        def argmax_1(in_arr):
+            numba.parfors.parfor.init_prange()
+            argmax_checker(in_arr.size)
+            init_val = numba.cpython.builtins.get_type_min_value(in_arr.dtype)
+            ival = typing.builtins.IndexValue(0, init_val)
+            for i in numba.pndindex(in_arr.shape):
+                flat = numba.parfors.parfor.ravel_index(in_arr.shape, i)
+                curr_ival = typing.builtins.IndexValue(flat, in_arr[i])
+                ival = max(ival, curr_ival)
+            return ival.index
+    return argmax_1
 
 def dotvv_parallel_impl(a, b):
     numba.parfors.parfor.init_prange()
@@ -230,11 +331,38 @@ def dotmv_parallel_impl(a, b):
         c[i] = s
     return c
 
+def _generic_dot_parallel_impl(atyp, btyp):
+    # products of integer or mixed dtypes run the blocked kernels in parallel
+    from numba.np.linalg import get_generic_dot_impl
+    dot_impl = get_generic_dot_impl(atyp, btyp, parallel=True)
+
+    def dot_1(a, b):
+        return dot_impl(a, b)
+    return dot_1
+
+def matmul_parallel_impl(return_type, atyp, btyp):
+    # the products of the matrices of stacks are computed in parallel
+    from numba.np.linalg import is_blas_product
+    if (isinstance(atyp, types.npytypes.Array) and
+        isinstance(btyp, types.npytypes.Array)):
+        if max(atyp.ndim, btyp.ndim) > 2:
+            from numba.np.linalg import get_matmul_impl
+            matmul_impl = get_matmul_impl(atyp, btyp, parallel=True)
+
+            def matmul_1(a, b):
+                return matmul_impl(a, b)
+            return matmul_1
+        elif not is_blas_product(atyp, btyp):
+            return _generic_dot_parallel_impl(atyp, btyp)
+
 def dot_parallel_impl(return_type, atyp, btyp):
-    # Note that matrix matrix multiply is not translated.
+    # Note that matrix matrix multiply is not translated for BLAS dtypes.
+    from numba.np.linalg import is_blas_product
     if (isinstance(atyp, types.npytypes.Array) and
         isinstance(btyp, types.npytypes.Array)):
-        if atyp.ndim == btyp.ndim == 1:
+        if not is_blas_product(atyp, btyp):
+            return _generic_dot_parallel_impl(atyp, btyp)
+        elif atyp.ndim == btyp.ndim == 1:
             return dotvv_parallel_impl
         # TODO: evaluate support for dotvm and enable
         #elif atyp.ndim == 1 and btyp.ndim == 2:
@@ -242,7 +370,9 @@ def dot_parallel_impl(return_type, atyp, btyp):
         elif atyp.ndim == 2 and btyp.ndim == 1:
             return dotmv_parallel_impl
 
-def sum_parallel_impl(return_type, arg):
+def sum_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('sum', return_type, arg, args)
     zero = return_type(0)
 
     if arg.ndim == 0:
@@ -264,7 +394,9 @@ def sum_parallel_impl(return_type, arg):
             return val
     return sum_1
 
-def prod_parallel_impl(return_type, arg):
+def prod_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('prod', return_type, arg, args)
     one = return_type(1)
 
     if arg.ndim == 0:
@@ -287,7 +419,9 @@ def prod_parallel_impl(return_type, arg):
     return prod_1
 
 
-def mean_parallel_impl(return_type, arg):
+def mean_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('mean', return_type, arg, args)
     # can't reuse sum since output type is different
     zero = return_type(0)
 
@@ -310,14 +444,16 @@ def mean_parallel_impl(return_type, arg):
             return val/in_arr.size
     return mean_1
 
-def var_parallel_impl(return_type, arg):
+def var_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('var', return_type, arg, args)
     if arg.ndim == 0:
         def var_1(in_arr):
             return 0
     elif arg.ndim == 1:
         def var_1(in_arr):
             # Compute the mean
-            m = in_arr.mean()
+            m = np.mean(in_arr)
             # Compute the sum of square diffs
             numba.parfors.parfor.init_prange()
             ssd = 0
@@ -328,7 +464,7 @@ def var_parallel_impl(return_type, arg):
     else:
         def var_1(in_arr):
             # Compute the mean
-            m = in_arr.mean()
+            m = np.mean(in_arr)
             # Compute the sum of square diffs
             numba.parfors.parfor.init_prange()
             ssd = 0
@@ -338,7 +474,55 @@ def var_parallel_impl(return_type, arg):
             return ssd / in_arr.size
     return var_1
 
-def std_parallel_impl(return_type, arg):
+def any_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('any', return_type, arg, args)
+    # count the non-zero elements so that the loop is a plain reduction
+    if arg.ndim == 0:
+        def any_1(in_arr):
+            return in_arr[()] != 0
+    elif arg.ndim == 1:
+        def any_1(in_arr):
+            numba.parfors.parfor.init_prange()
+            count = 0
+            for i in numba.parfors.parfor.internal_prange(len(in_arr)):
+                count += in_arr[i] != 0
+            return count != 0
+    else:
+        def any_1(in_arr):
+            numba.parfors.parfor.init_prange()
+            count = 0
+            for i in numba.pndindex(in_arr.shape):
+                count += in_arr[i] != 0
+            return count != 0
+    return any_1
+
+def all_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('all', return_type, arg, args)
+    # count the zero elements so that the loop is a plain reduction
+    if arg.ndim == 0:
+        def all_1(in_arr):
+            return in_arr[()] != 0
+    elif arg.ndim == 1:
+        def all_1(in_arr):
+            numba.parfors.parfor.init_prange()
+            count = 0
+            for i in numba.parfors.parfor.internal_prange(len(in_arr)):
+                count += in_arr[i] == 0
+            return count == 0
+    else:
+        def all_1(in_arr):
+            numba.parfors.parfor.init_prange()
+            count = 0
+            for i in numba.pndindex(in_arr.shape):
+                count += in_arr[i] == 0
+            return count == 0
+    return all_1
+
+def std_parallel_impl(return_type, arg, *args):
+    if args:
+        return _axis_reduction_parallel_impl('std', return_type, arg, args)
     def std_1(in_arr):
         return in_arr.var() ** 0.5
     return std_1
@@ -411,9 +595,227 @@ def linspace_parallel_impl(return_type, *args):
     else:
         raise ValueError("parallel linspace with types {}".format(args))
 
+def _parallel_sort_func(arg, is_argsort, flatten=False):
+    # The parallel sorts run their own parallel loops, so they are called
+    # rather than inlined: 1D arrays use a sample sort, N-D arrays have
+    # their lanes sorted in parallel
+    if not isinstance(arg, types.npytypes.Array):
+        return None
+    from numba.np.arrayobj import get_sort_func, get_lane_sort_func
+    is_float = isinstance(arg.dtype, types.Float)
+    if arg.ndim == 1 or flatten:
+        if not is_radix_sortable(arg.dtype):
+            return None
+        return get_sort_func('parallel', is_float, is_argsort)
+    return get_lane_sort_func('quicksort', is_float, is_argsort,
+                              parallel=True)
+
+def sort_parallel_impl(return_type, arg, axis=None):
+    # an explicit sort kind is honoured by not replacing the call
+    flatten = isinstance(axis, types.NoneType)
+    sort_func = _parallel_sort_func(arg, False, flatten)
+    if sort_func is None:
+        return None
+
+    if axis is None and arg.ndim == 1:
+        def sort_1(in_arr):
+            res = in_arr.copy()
+            sort_func(res)
+            return res
+    elif axis is None:
+        def sort_1(in_arr):
+            res = in_arr.copy()
+            sort_func(res, -1)
+            return res
+    elif flatten:
+        def sort_1(in_arr, axis):
+            res = in_arr.flatten()
+            sort_func(res)
+            return res
+    elif isinstance(axis, types.Integer) and arg.ndim > 1:
+        def sort_1(in_arr, axis):
+            res = in_arr.copy()
+            sort_func(res, axis)
+            return res
+    else:
+        return None
+    return sort_1
+
+def argsort_parallel_impl(return_type, arg, axis=None):
+    flatten = isinstance(axis, types.NoneType)
+    argsort_func = _parallel_sort_func(arg, True, flatten)
+    if argsort_func is None:
+        return None
+
+    if axis is None and arg.ndim == 1:
+        def argsort_1(in_arr):
+            return argsort_func(in_arr)
+    elif axis is None:
+        def argsort_1(in_arr):
+            return argsort_func(in_arr, -1)
+    elif flatten:
+        def argsort_1(in_arr, axis):
+            return argsort_func(in_arr.flatten())
+    elif isinstance(axis, types.Integer) and arg.ndim > 1:
+        def argsort_1(in_arr, axis):
+            return argsort_func(in_arr, axis)
+    else:
+        return None
+    return argsort_1
+
+def unique_parallel_impl(return_type, arg, *args):
+    # the elements are grouped in parallel, by hashing for integers
+    if not isinstance(arg, types.npytypes.Array):
+        return None
+    from numba.core.typing.arraydecl import literal_flag
+    from numba.np.arrayobj import get_unique_impl
+    names = ('return_index', 'return_inverse', 'return_counts')
+    flags = [literal_flag(typ, name) for typ, name in zip(args, names)]
+    flags += [False] * (len(names) - len(flags))
+    unique_impl = get_unique_impl(arg, tuple(flags), parallel=True)
+
+    if len(args) == 0:
+        def unique_1(in_arr):
+            return unique_impl(in_arr)
+    elif len(args) == 1:
+        def unique_1(in_arr, arg1):
+            return unique_impl(in_arr)
+    elif len(args) == 2:
+        def unique_1(in_arr, arg1, arg2):
+            return unique_impl(in_arr)
+    else:
+        def unique_1(in_arr, arg1, arg2, arg3):
+            return unique_impl(in_arr)
+    return unique_1
+
+def _call_forwarder(impl, nargs):
+    """Return a function forwarding its array argument and *nargs* other
+    arguments to *impl*.
+    """
+    if nargs == 0:
+        def forward_1(in_arr):
+            return impl(in_arr)
+    elif nargs == 1:
+        def forward_1(in_arr, arg1):
+            return impl(in_arr, arg1)
+    elif nargs == 2:
+        def forward_1(in_arr, arg1, arg2):
+            return impl(in_arr, arg1, arg2)
+    elif nargs == 3:
+        def forward_1(in_arr, arg1, arg2, arg3):
+            return impl(in_arr, arg1, arg2, arg3)
+    elif nargs == 4:
+        def forward_1(in_arr, arg1, arg2, arg3, arg4):
+            return impl(in_arr, arg1, arg2, arg3, arg4)
+    else:
+        def forward_1(in_arr, arg1, arg2, arg3, arg4, arg5):
+            return impl(in_arr, arg1, arg2, arg3, arg4, arg5)
+    return forward_1
+
+def _default_args(args, defaults):
+    return list(args) + list(defaults[len(args):])
+
+def bincount_parallel_impl(return_type, arg, *args):
+    # each thread counts a chunk in private bins, summed at the end
+    if not isinstance(arg, types.npytypes.Array):
+        return None
+    from numba.np.arraymath import get_bincount_impl
+    weights, = _default_args(args[:1], (None,))
+    bincount_impl = get_bincount_impl(arg, weights, parallel=True)
+    if bincount_impl is None:
+        return None
+    return _call_forwarder(bincount_impl, len(args))
+
+def histogram_parallel_impl(return_type, arg, *args):
+    # each thread bins a chunk in private bins, summed at the end
+    from numba.np.arraymath import get_histogram_impl
+    histogram_impl = get_histogram_impl(
+        arg, *_default_args(args, (10, None, None, None)), parallel=True)
+    if histogram_impl is None:
+        return None
+    return _call_forwarder(histogram_impl, len(args))
+
+def histogramdd_parallel_impl(return_type, arg, *args):
+    from numba.np.arraymath import get_histogramdd_impl
+    histogramdd_impl = get_histogramdd_impl(
+        arg, *_default_args(args, (10, None, None, None)), parallel=True)
+    if histogramdd_impl is None:
+        return None
+    return _call_forwarder(histogramdd_impl, len(args))
+
+def histogram2d_parallel_impl(return_type, arg, *args):
+    from numba.np.arraymath import get_histogram2d_impl
+    if len(args) == 0:
+        return None
+    histogram2d_impl = get_histogram2d_impl(
+        arg, *_default_args(args, (None, 10, None, None, None)),
+        parallel=True)
+    if histogram2d_impl is None:
+        return None
+    return _call_forwarder(histogram2d_impl, len(args))
+
+def _ufunc_reduce_parallel_impl(func):
+    """Return the replacement of the reduce() method of the ufunc typed as
+    *func*, whose lanes are reduced in parallel.
+    """
+    def ufunc_reduce_parallel_impl(return_type, arg, *args):
+        from numba.np.ufuncmethods import get_ufunc_reduce_impl
+        reduce_impl = get_ufunc_reduce_impl(
+            func, arg, *_default_args(args, (0, None, None, False, None)),
+            parallel=True)
+        if reduce_impl is None:
+            return None
+        return _call_forwarder(reduce_impl, len(args))
+    return ufunc_reduce_parallel_impl
+
+def _fft_parallel_impl(name):
+    """Return the replacement of np.fft.<name>, whose 1-D transforms are
+    computed in parallel.
+    """
+    def fft_parallel_impl(return_type, arg, *args):
+        if not isinstance(arg, types.npytypes.Array):
+            return None
+        from numba.np.fft import get_fft_impl
+        fft_impl = getattr(get_fft_impl(parallel=True), name)
+
+        if len(args) == 0:
+            def fft_1(in_arr):
+                return fft_impl(in_arr)
+        elif len(args) == 1:
+            def fft_1(in_arr, arg1):
+                return fft_impl(in_arr, arg1)
+        elif len(args) == 2:
+            def fft_1(in_arr, arg1, arg2):
+                return fft_impl(in_arr, arg1, arg2)
+        else:
+            def fft_1(in_arr, arg1, arg2, arg3):
+                return fft_impl(in_arr, arg1, arg2, arg3)
+        return fft_1
+    return fft_parallel_impl
+
+def _fold_call_args(pysig, args, kws):
+    """Return the positional arguments equivalent to the *args* and *kws*
+    of a call to a function of signature *pysig*, or None if that is not
+    possible, e.g. if an argument before a keyword one is omitted.
+    """
+    if pysig is None:
+        return None
+    try:
+        bound = pysig.bind(*args, **dict(kws))
+    except TypeError:
+        return None
+    folded = []
+    for name in pysig.parameters:
+        if name not in bound.arguments:
+            break
+        folded.append(bound.arguments[name])
+    if len(folded) != len(bound.arguments):
+        return None
+    return folded
+
 replace_functions_map = {
-    ('argmin', 'numpy'): lambda r,a: argmin_parallel_impl,
-    ('argmax', 'numpy'): lambda r,a: argmax_parallel_impl,
+    ('argmin', 'numpy'): argmin_parallel_impl,
+    ('argmax', 'numpy'): argmax_parallel_impl,
     ('min', 'numpy'): min_parallel_impl,
     ('max', 'numpy'): max_parallel_impl,
     ('amin', 'numpy'): min_parallel_impl,
@@ -423,11 +825,25 @@ replace_functions_map = {
     ('mean', 'numpy'): mean_parallel_impl,
     ('var', 'numpy'): var_parallel_impl,
     ('std', 'numpy'): std_parallel_impl,
+    ('any', 'numpy'): any_parallel_impl,
+    ('all', 'numpy'): all_parallel_impl,
     ('dot', 'numpy'): dot_parallel_impl,
+    ('matmul', 'numpy'): matmul_parallel_impl,
     ('arange', 'numpy'): arange_parallel_impl,
     ('linspace', 'numpy'): linspace_parallel_impl,
+    ('sort', 'numpy'): sort_parallel_impl,
+    ('argsort', 'numpy'): argsort_parallel_impl,
+    ('unique', 'numpy'): unique_parallel_impl,
+    ('bincount', 'numpy'): bincount_parallel_impl,
+    ('histogram', 'numpy'): histogram_parallel_impl,
+    ('histogram2d', 'numpy'): histogram2d_parallel_impl,
+    ('histogramdd', 'numpy'): histogramdd_parallel_impl,
 }
 
+for _name in ('fft', 'ifft', 'rfft', 'irfft', 'fft2', 'ifft2', 'fftn',
+              'ifftn'):
+    replace_functions_map[(_name, 'numpy.fft')] = _fft_parallel_impl(_name)
+
 def fill_parallel_impl(return_type, arr, val):
     """Parallel implemention of ndarray.fill.  The array on
        which to operate is retrieved from get_call_name and
@@ -447,8 +863,35 @@ def fill_parallel_impl(return_type, arr, val):
             return None
     return fill_1
 
+def sort_inplace_parallel_impl(return_type, arr, axis=None):
+    """Parallel implementation of ndarray.sort, see sort_parallel_impl.
+    """
+    if arr.ndim > 1 and arr.layout != 'C':
+        return None
+    sort_func = _parallel_sort_func(arr, False)
+    if sort_func is None:
+        return None
+
+    if axis is None and arr.ndim == 1:
+        def sort_1(in_arr):
+            sort_func(in_arr)
+            return None
+    elif axis is None:
+        def sort_1(in_arr):
+            sort_func(in_arr, -1)
+            return None
+    elif isinstance(axis, types.Integer) and arr.ndim > 1:
+        def sort_1(in_arr, axis):
+            sort_func(in_arr, axis)
+            return None
+    else:
+        return None
+    return sort_1
+
 replace_functions_ndarray = {
     'fill': fill_parallel_impl,
+    'sort': sort_inplace_parallel_impl,
+    'argsort': argsort_parallel_impl,
 }
 
 @register_jitable
@@ -1369,6 +1812,9 @@ class PreParforPass(object):
         # e.g. convert A.sum() to np.sum(A) for easier match and optimization
         canonicalize_array_math(self.func_ir, self.typemap,
                                 self.calltypes, self.typingctx)
+        # e.g. convert A @ B to np.matmul(A, B) for stacks of matrices
+        canonicalize_matmul(self.func_ir, self.typemap,
+                            self.calltypes, self.typingctx)
         if self.options.numpy:
             self._replace_parallel_functions(self.func_ir.blocks)
         self.func_ir.blocks = simplify_CFG(self.func_ir.blocks)
@@ -1395,6 +1841,7 @@ class PreParforPass(object):
                             func_def = get_definition(self.func_ir, expr.func)
                             callname = find_callname(self.func_ir, expr)
                             repl_func = replace_functions_map.get(callname, None)
+                            method_arr = None
                             # Handle method on array type
                             if (repl_func is None and
                                 len(callname) == 2 and
@@ -1403,16 +1850,38 @@ class PreParforPass(object):
                                            types.npytypes.Array)):
                                 repl_func = replace_functions_ndarray.get(callname[0], None)
                                 if repl_func is not None:
-                                    # Add the array that the method is on to the arg list.
-                                    expr.args.insert(0, callname[1])
+                                    method_arr = callname[1]
+                            # Handle methods of ufuncs, e.g. np.add.reduce
+                            if (repl_func is None and
+                                    isinstance(func_def, ir.Expr) and
+                                    func_def.op == 'getattr' and
+                                    func_def.attr == 'reduce' and
+                                    isinstance(self.typemap.get(
+                                        func_def.value.name), types.Function)):
+                                repl_func = _ufunc_reduce_parallel_impl(
+                                    self.typemap[func_def.value.name])
 
                             require(repl_func is not None)
-                            typs = tuple(self.typemap[x.name] for x in expr.args)
+                            args = expr.args
+                            if expr.kws:
+                                # fold keyword arguments into positional
+                                # ones, as the parallel implementations
+                                # only take the latter
+                                require(method_arr is None)
+                                pysig = self.calltypes[expr].pysig
+                                args = _fold_call_args(pysig, args, expr.kws)
+                                require(args is not None)
+                            if method_arr is not None:
+                                # Add the array that the method is on to the arg list.
+                                args = [method_arr] + args
+                            typs = tuple(self.typemap[x.name] for x in args)
                             try:
                                 new_func =  repl_func(lhs_typ, *typs)
                             except:
                                 new_func = None
                             require(new_func is not None)
+                            expr.args = args
+                            expr.kws = []
                             g = copy.copy(self.func_ir.func_id.func.__globals__)
                             g['numba'] = numba
                             g['np'] = numpy
@@ -2521,6 +2990,405 @@ class ConvertLoopPass:
                               for v in ind_def_node.items]
 
 
+class ConvertScatterPass:
+    """
+    Make the scatter updates ``A[j] += x`` in the bodies of parfors atomic,
+    when the index ``j`` may refer to the same element in different
+    iterations (e.g. ``j = idx[i]``).  If the parfor does not otherwise use
+    ``A``, the updates go to per-thread copies of ``A`` added to it after
+    the parfor, when the copies are small compared to the loop.
+    """
+    def __init__(self, pass_states):
+        self.pass_states = pass_states
+
+    def run(self, blocks):
+        pass_states = self.pass_states
+        self.alias_map, _ = find_potential_aliases(
+            blocks, pass_states.func_ir.arg_names, pass_states.typemap,
+            pass_states.func_ir)
+        for label, block in blocks.items():
+            new_body = []
+            for instr in block.body:
+                if isinstance(instr, Parfor):
+                    pre, post = self._convert_parfor(instr, block.scope)
+                    new_body.extend(pre)
+                    new_body.append(instr)
+                    new_body.extend(post)
+                else:
+                    new_body.append(instr)
+            block.body = new_body
+
+    def _convert_parfor(self, parfor, scope, outer_indices=frozenset()):
+        """Rewrite the scatter updates of *parfor* and return the statements
+        to insert before and after it.  *outer_indices* are the loop indices
+        of the parfors enclosing *parfor*, whose iterations run in parallel.
+        """
+        index_names = {l.index_variable.name for l in parfor.loop_nests}
+        # the nested parfors run in each iteration of this one
+        for block in parfor.loop_body.values():
+            new_body = []
+            for stmt in block.body:
+                if isinstance(stmt, Parfor):
+                    pre, post = self._convert_parfor(
+                        stmt, block.scope, outer_indices | index_names)
+                    new_body.extend(pre)
+                    new_body.append(stmt)
+                    new_body.extend(post)
+                else:
+                    new_body.append(stmt)
+            block.body = new_body
+        index_names |= outer_indices
+
+        defs = defaultdict(list)
+        uses = defaultdict(int)
+        for block in parfor.loop_body.values():
+            for stmt in block.body:
+                if isinstance(stmt, ir.Assign):
+                    defs[stmt.target.name].append(stmt.value)
+                    used = stmt.value.list_vars()
+                else:
+                    used = stmt.list_vars()
+                for v in used:
+                    uses[v.name] += 1
+        defs = dict(defs)
+
+        scatters = []
+        for block in parfor.loop_body.values():
+            positions = {}
+            for i, stmt in enumerate(block.body):
+                if is_setitem(stmt):
+                    match = guard(self._match_scatter, parfor, block, i,
+                                  positions, defs, uses, index_names)
+                    if match is not None:
+                        scatters.append((block, i) + match)
+                elif isinstance(stmt, ir.Assign):
+                    positions[stmt.target.name] = i
+        if not scatters:
+            return [], []
+
+        # The arrays only updated by scatters in the parfor, and not through
+        # aliases either, can be privatized.  The copies of a nested parfor
+        # would be merged concurrently by the enclosing iterations, so its
+        # updates are only made atomic.
+        nscatters = defaultdict(int)
+        for block, i, get_pos, add_pos, val in scatters:
+            nscatters[block.body[i].target.name] += 1
+        private = {name for name, n in nscatters.items()
+                   if not outer_indices and uses[name] == 2 * n and
+                   not any(uses[a] for a in self.alias_map.get(name, ()))}
+
+        pass_states = self.pass_states
+        loc = parfor.loc
+        loop = parfor.loop_nests[0]
+        pre, post = [], []
+        bounds = []
+        for bound in (loop.start, loop.stop):
+            if isinstance(bound, int):
+                var = ir.Var(scope, mk_unique_var("$scatter_bound"), loc)
+                pass_states.typemap[var.name] = types.intp
+                pre.append(ir.Assign(ir.Const(bound, loc), var, loc))
+                bound = var
+            bounds.append(bound)
+        buffers = {}
+
+        removed = defaultdict(set)
+        replaced = {}
+        for block, i, get_pos, add_pos, val in scatters:
+            setitem = block.body[i]
+            arr = setitem.target
+            index = index_var_of_get_setitem(setitem)
+            if arr.name in private:
+                if arr.name not in buffers:
+                    buf, stmts = self._mk_call(_scatter_buffer,
+                                               [arr] + bounds, scope, loc)
+                    pre.extend(stmts)
+                    post.extend(self._mk_call(_scatter_merge, [buf, arr],
+                                              scope, loc)[1])
+                    buffers[arr.name] = buf
+                args = ([buffers[arr.name], arr, index, val,
+                         loop.index_variable] + bounds)
+                _, stmts = self._mk_call(_scatter_add, args, block.scope,
+                                         setitem.loc)
+            else:
+                _, stmts = self._mk_call(atomic.add, [arr, index, val],
+                                         block.scope, setitem.loc)
+            removed[id(block)].update((get_pos, add_pos))
+            replaced[(id(block), i)] = stmts
+
+        for block in parfor.loop_body.values():
+            new_body = []
+            for i, stmt in enumerate(block.body):
+                if i in removed[id(block)]:
+                    continue
+                new_body.extend(replaced.get((id(block), i), [stmt]))
+            block.body = new_body
+        if config.DEBUG_ARRAY_OPT >= 1:
+            print("scatter updates made atomic in parfor", parfor.id,
+                  "privatized arrays:", sorted(buffers))
+        return pre, post
+
+    def _match_scatter(self, parfor, block, pos, positions, defs, uses,
+                       index_names):
+        """Match the scatter update ``A[j] = A[j] + x`` ending with the
+        setitem at *pos* in *block* and return the positions of the getitem
+        and of the addition, and ``x``.
+        """
+        typemap = self.pass_states.typemap
+        setitem = block.body[pos]
+        arr = setitem.target
+        index = index_var_of_get_setitem(setitem)
+        require(index is not None)
+        arrty = typemap[arr.name]
+        require(isinstance(arrty, types.Array) and arrty.mutable)
+        require(isinstance(arrty.dtype, (types.Integer, types.Float)))
+        require(arr.name not in defs)
+        indexty = typemap[index.name]
+        if isinstance(indexty, types.BaseTuple):
+            require(len(indexty) == arrty.ndim)
+            require(all(isinstance(t, types.Integer) for t in indexty))
+        else:
+            require(isinstance(indexty, types.Integer) and arrty.ndim == 1)
+
+        # the new value is the sum of the element and x, both used once
+        new = setitem.value
+        require(uses[new.name] == 1 and len(defs.get(new.name, ())) == 1)
+        require(new.name in positions)
+        add_pos = positions[new.name]
+        expr = block.body[add_pos].value
+        require(isinstance(expr, ir.Expr))
+        if expr.op == 'inplace_binop':
+            require(expr.fn == operator.iadd)
+            candidates = [(expr.lhs, expr.rhs)]
+        else:
+            require(expr.op == 'binop' and expr.fn == operator.add)
+            candidates = [(expr.lhs, expr.rhs), (expr.rhs, expr.lhs)]
+        for old, val in candidates:
+            get_pos = positions.get(old.name)
+            if (get_pos is None or uses[old.name] != 1 or
+                    len(defs.get(old.name, ())) != 1):
+                continue
+            getitem = block.body[get_pos]
+            if (is_getitem(getitem) and getitem.value.value.name == arr.name
+                    and index_var_of_get_setitem(getitem) is not None
+                    and index_var_of_get_setitem(getitem).name == index.name):
+                break
+        else:
+            raise GuardException
+        require(typemap[old.name] == arrty.dtype)
+        # atomic.add() converts x to the element type, e.g. float64 values
+        # added to a float32 array
+        for v in (new, val):
+            vty = typemap[v.name]
+            require(isinstance(vty, (types.Number, types.Boolean)) and
+                    not isinstance(vty, types.Complex))
+        # nothing else may access the array between the load and the store
+        for stmt in block.body[get_pos + 1:pos]:
+            require(all(v.name != arr.name for v in stmt.list_vars()))
+        # the updates of distinct iterations to distinct elements are safe
+        require(not self._is_distinct_index(parfor, index, defs,
+                                            index_names))
+        return get_pos, add_pos, val
+
+    def _is_distinct_index(self, parfor, index, defs, index_names):
+        """Whether *index* refers to a different element in each iteration
+        of *parfor* and of the parfors enclosing it, i.e. it is made of the
+        loop indices *index_names* plus invariants.
+        """
+        if index.name == parfor.index_var.name:
+            # unless the parfor is nested in another one
+            return len(index_names) == len(parfor.loop_nests)
+        items = [index]
+        if len(defs.get(index.name, ())) == 1:
+            index_def = defs[index.name][0]
+            if (isinstance(index_def, ir.Expr) and
+                    index_def.op == 'build_tuple'):
+                items = index_def.items
+        covered = set()
+        for item in items:
+            name = self._affine_loop_index(item, defs, index_names)
+            if name is not None:
+                covered.add(name)
+        return covered == index_names
+
+    def _affine_loop_index(self, var, defs, index_names):
+        """Return the loop index that *var* is equal to plus an invariant,
+        or None.
+        """
+        def invariant(v):
+            # a variable with several constant definitions, e.g. in two
+            # branches, may differ between iterations
+            v_defs = defs.get(v.name, ())
+            return (len(v_defs) <= 1 and
+                    all(isinstance(d, ir.Const) for d in v_defs))
+
+        seen = set()
+        while var.name not in index_names:
+            if var.name in seen or len(defs.get(var.name, ())) != 1:
+                return None
+            seen.add(var.name)
+            var_def = defs[var.name][0]
+            if isinstance(var_def, ir.Var):
+                var = var_def
+            elif (isinstance(var_def, ir.Expr) and var_def.op == 'binop'
+                    and var_def.fn in (operator.add, operator.sub)
+                    and invariant(var_def.rhs)):
+                var = var_def.lhs
+            elif (isinstance(var_def, ir.Expr) and var_def.op == 'binop'
+                    and var_def.fn == operator.add
+                    and invariant(var_def.lhs)):
+                var = var_def.rhs
+            else:
+                return None
+        return var.name
+
+    def _mk_call(self, func, args, scope, loc):
+        """Return the result variable and the statements of a typed call of
+        the jitted function *func* with the variables *args*.
+        """
+        pass_states = self.pass_states
+        fn_var = ir.Var(scope, mk_unique_var("$scatter_func"), loc)
+        fnty = pass_states.typingctx.resolve_value_type(func)
+        pass_states.typemap[fn_var.name] = fnty
+        call = ir.Expr.call(fn_var, args, (), loc)
+        sig = pass_states.typingctx.resolve_function_type(
+            fnty, tuple(pass_states.typemap[a.name] for a in args), {})
+        pass_states.calltypes[call] = sig
+        res = ir.Var(scope, mk_unique_var("$scatter_res"), loc)
+        pass_states.typemap[res.name] = sig.return_type
+        fn_assign = ir.Assign(ir.Global(func.__name__, func, loc), fn_var, loc)
+        return res, [fn_assign, ir.Assign(call, res, loc)]
+
+
+class CollapseParforNestPass:
+    """
+    Merge perfectly nested parfors, e.g. of the loops::
+
+        for i in prange(n):
+            for j in prange(m):
+                ...
+
+    into a single parfor over the multi-dimensional iteration space of the
+    loops, which the gufunc scheduler splits between the threads along all
+    the dimensions.  Otherwise only the outer loop is parallel and the
+    inner ones run sequentially, so short outer loops leave threads idle.
+    """
+    def __init__(self, pass_states):
+        self.pass_states = pass_states
+
+    def run(self, blocks):
+        pass_states = self.pass_states
+        call_table, _ = get_call_table(pass_states.func_ir.blocks)
+        for block in blocks.values():
+            for parfor in block.body:
+                if not isinstance(parfor, Parfor):
+                    continue
+                # variables used outside of the parfor
+                outside = set()
+                for b in pass_states.func_ir.blocks.values():
+                    for stmt in b.body:
+                        if stmt is not parfor:
+                            outside.update(v.name for v in stmt.list_vars())
+                while guard(self._collapse, parfor, outside, call_table):
+                    pass
+
+    def _is_pure(self, rhs, call_table):
+        if isinstance(rhs, (ir.Var, ir.Const, ir.Global, ir.FreeVar)):
+            return True
+        if isinstance(rhs, ir.Expr):
+            if rhs.op == 'call':
+                return call_table.get(rhs.func.name) == [len]
+            return rhs.op in ('getattr', 'getitem', 'static_getitem',
+                              'binop', 'unary', 'build_tuple', 'cast')
+        return False
+
+    def _may_raise(self, rhs):
+        # indexing arrays out of bounds can't be hoisted out of a loop that
+        # may not run
+        return (isinstance(rhs, ir.Expr) and
+                rhs.op in ('getitem', 'static_getitem') and
+                not isinstance(self.pass_states.typemap[rhs.value.name],
+                               types.BaseTuple))
+
+    def _is_scalar(self, typ):
+        # values that are cheap to recompute for each element, as opposed
+        # to e.g. array views whose meminfo is reference counted
+        if isinstance(typ, types.BaseTuple):
+            return all(self._is_scalar(t) for t in typ)
+        return isinstance(typ, (types.Number, types.Boolean))
+
+    def _collapse(self, parfor, outside, call_table):
+        """Merge into *parfor* the parfor that is its whole body, if any.
+        """
+        typemap = self.pass_states.typemap
+        require(len(parfor.loop_body) == 1)
+        block, = parfor.loop_body.values()
+        positions = [i for i, stmt in enumerate(block.body)
+                     if isinstance(stmt, Parfor)]
+        require(len(positions) == 1 and positions[0] == len(block.body) - 1)
+        inner = block.body[-1]
+        pre = block.body[:-1]
+
+        index_typ = typemap[parfor.loop_nests[0].index_variable.name]
+        require(all(typemap[l.index_variable.name] == index_typ
+                    for l in parfor.loop_nests + inner.loop_nests))
+
+        # The statements around the inner loop must be pure and private to
+        # the outer one.  Those independent of the outer iteration are
+        # computed once before the loops, the others in each iteration of
+        # the inner loop, so they must be scalar.
+        inner_defs = set()
+        for b in inner.loop_body.values():
+            inner_defs.update(stmt.target.name for stmt in b.body
+                              if isinstance(stmt, ir.Assign))
+        variant = {l.index_variable.name for l in parfor.loop_nests}
+        hoisted = []
+        kept = []
+        for stmt in pre:
+            require(isinstance(stmt, ir.Assign))
+            require(self._is_pure(stmt.value, call_table))
+            require(stmt.target.name not in outside)
+            require(stmt.target.name not in inner_defs)
+            used = {v.name for v in stmt.list_vars()} - {stmt.target.name}
+            if used & variant or self._may_raise(stmt.value):
+                require(self._is_scalar(typemap[stmt.target.name]))
+                variant.add(stmt.target.name)
+                kept.append(stmt)
+            else:
+                hoisted.append(stmt)
+
+        # The inner iteration space must not depend on the outer iteration
+        for l in inner.loop_nests:
+            for bound in (l.start, l.stop, l.step):
+                require(not isinstance(bound, ir.Var) or
+                        bound.name not in variant)
+        for stmt in inner.init_block.body:
+            require(isinstance(stmt, ir.Assign))
+            require(self._is_pure(stmt.value, call_table))
+            used = {v.name for v in stmt.list_vars()} - {stmt.target.name}
+            require(not (used & variant))
+
+        loc = parfor.loc
+        scope = block.scope
+        parfor.init_block.body.extend(hoisted + inner.init_block.body)
+        parfor.loop_nests = parfor.loop_nests + inner.loop_nests
+        index_vars = [l.index_variable for l in parfor.loop_nests]
+        index_var = ir.Var(scope, mk_unique_var("$parfor_index_tuple_var"),
+                           loc)
+        typemap[index_var.name] = types.UniTuple(index_typ, len(index_vars))
+        index_assign = ir.Assign(ir.Expr.build_tuple(index_vars, loc),
+                                 index_var, loc)
+        entry_block = inner.loop_body[min(inner.loop_body.keys())]
+        entry_block.body = [index_assign] + kept + entry_block.body
+        parfor.loop_body = inner.loop_body
+        parfor.index_var = index_var
+        parfor.races = parfor.races | inner.races
+        parfor.no_sequential_lowering |= inner.no_sequential_lowering
+        self.pass_states.diagnostics.fusion_info[parfor.id].append(inner.id)
+        if config.DEBUG_ARRAY_OPT >= 1:
+            print("collapsed parfor", inner.id, "into parfor", parfor.id)
+        return True
+
+
 def _find_mask(typemap, func_ir, arr_def):
     """check if an array is of B[...M...], where M is a
     boolean array, and other indices (if available) are ints.
@@ -2617,6 +3485,9 @@ class ParforPass(ParforPassStates):
         # apply_copies_parfor depends on set order for creating dummy assigns)
         simplify(self.func_ir, self.typemap, self.calltypes)
 
+        if self.options.collapse:
+            CollapseParforNestPass(self).run(self.func_ir.blocks)
+
         if self.options.fusion:
             self.func_ir._definitions = build_definitions(self.func_ir.blocks)
             self.array_analysis.equiv_sets = dict()
@@ -2633,6 +3504,10 @@ class ParforPass(ParforPassStates):
             # try fuse again after maximize
             self.fuse_parfors(self.array_analysis, self.func_ir.blocks)
             dprint_func_ir(self.func_ir, "after fusion")
+            self.report_unfused_reductions(self.func_ir.blocks)
+        if self.options.prange:
+            # make the updates of array elements shared by iterations atomic
+            ConvertScatterPass(self).run(self.func_ir.blocks)
         # simplify again
         simplify(self.func_ir, self.typemap, self.calltypes)
         # push function call variables inside parfors so gufunc function
@@ -2760,6 +3635,62 @@ class ParforPass(ParforPassStates):
                 block.body = new_body
         return
 
+    def report_unfused_reductions(self, blocks):
+        """
+        Explain in the fusion reports why a reduction loop could not be
+        fused with the loop producing the array it reduces, in which case
+        the intermediate array is materialized.
+        """
+        call_table, _ = get_call_table(blocks)
+        alias_map, _ = find_potential_aliases(blocks, self.func_ir.arg_names,
+                                              self.typemap, self.func_ir)
+        for block in blocks.values():
+            # { array name: index in the block of the parfor writing it }
+            producers = {}
+            for i, stmt in enumerate(block.body):
+                if not isinstance(stmt, Parfor):
+                    continue
+                if has_parfor_reduction(stmt):
+                    used = {v.name for v in stmt.list_vars()}
+                    for arr, j in sorted(producers.items()):
+                        if arr not in used:
+                            continue
+                        producer = block.body[j]
+                        reason = self._get_unfused_reason(
+                            block.body, j, i, call_table, alias_map)
+                        msg = ("- fusion failed: reduction parallel loop #%s "
+                               "reads array %s written by parallel loop #%s, "
+                               "which is materialized because %s.")
+                        msg = msg % (stmt.id, arr, producer.id, reason)
+                        self.diagnostics.fusion_reports.append(
+                            FusionReport(producer.id, stmt.id, msg))
+                for arr in get_parfor_setitem_arrays(stmt):
+                    producers[arr] = i
+
+    def _get_unfused_reason(self, body, first, second, call_table, alias_map):
+        """
+        Return why the parfors at indices *first* and *second* of *body*
+        were not fused.
+        """
+        producer = body[first]
+        writes = get_parfor_writes(producer)
+        for stmt in body[first + 1:second]:
+            if isinstance(stmt, Parfor):
+                return "parallel loop #%s is in between" % stmt.id
+            if _can_reorder_stmts(producer, stmt, self.func_ir, call_table,
+                                  alias_map):
+                continue
+            uses = {v.name for v in stmt.list_vars()}
+            if writes & uses:
+                return ("'%s' (%s) depends on the result of parallel loop #%s"
+                        % (stmt, stmt.loc.short(), producer.id))
+            return ("'%s' (%s) cannot be moved across the loops"
+                    % (stmt, stmt.loc.short()))
+        for report in self.diagnostics.fusion_reports:
+            if report.first == producer.id and report.second == body[second].id:
+                return "of the loops: %s" % report.message.lstrip("- ")
+        return "the loops are not compatible"
+
     def fuse_recursive_parfor(self, parfor, equiv_set):
         blocks = wrap_parfor_blocks(parfor)
         maximize_fusion(self.func_ir, blocks, self.typemap)
@@ -3324,7 +4255,7 @@ def get_parfor_reductions(func_ir, parfor, parfor_params, calltypes, reductions=
             if reduce_nodes is not None:
                 reduce_varnames.append(param_name)
                 check_conflicting_reduction_operators(param, reduce_nodes)
-                gri_out = guard(get_reduction_init, reduce_nodes)
+                gri_out = guard(get_reduction_init, reduce_nodes, func_ir)
                 if gri_out is not None:
                     init_val, redop = gri_out
                 else:
@@ -3353,17 +4284,22 @@ def check_conflicting_reduction_operators(param, nodes):
                            "reduction operators." % param.unversioned_name)
                     raise errors.UnsupportedRewriteError(msg, node.loc)
 
-def get_reduction_init(nodes):
+def get_reduction_init(nodes, func_ir=None):
     """
     Get initial value for known reductions.
-    Currently, only += and *= are supported. We assume the inplace_binop node
-    is followed by an assignment.
+    Currently, only +=, *= and user-defined reductions (numba.reduction) are
+    supported. We assume the inplace_binop node or the call is followed by
+    an assignment.
     """
     require(len(nodes) >=2)
     require(isinstance(nodes[-1].value, ir.Var))
     require(nodes[-2].target.name == nodes[-1].value.name)
     acc_expr = nodes[-2].value
-    require(isinstance(acc_expr, ir.Expr) and acc_expr.op=='inplace_binop')
+    require(isinstance(acc_expr, ir.Expr))
+    if acc_expr.op == 'call' and func_ir is not None:
+        red = get_user_reduction(acc_expr, func_ir)
+        return red.init, red
+    require(acc_expr.op=='inplace_binop')
     if acc_expr.fn == operator.iadd or acc_expr.fn == operator.isub:
         return 0, acc_expr.fn
     if (  acc_expr.fn == operator.imul
@@ -3372,6 +4308,15 @@ def get_reduction_init(nodes):
         return 1, acc_expr.fn
     return None, None
 
+def get_user_reduction(call, func_ir):
+    """
+    Get the numba.reduction object called by *call*.
+    """
+    func_def = get_definition(func_ir, call.func)
+    require(isinstance(func_def, (ir.Global, ir.FreeVar)))
+    require(isinstance(func_def.value, reduction))
+    return func_def.value
+
 def supported_reduction(x, func_ir):
     if x.op == 'inplace_binop' or x.op == 'binop':
         return True
@@ -3379,6 +4324,8 @@ def supported_reduction(x, func_ir):
         callname = guard(find_callname, func_ir, x)
         if callname == ('max', 'builtins') or callname == ('min', 'builtins'):
             return True
+        if guard(get_user_reduction, x, func_ir) is not None:
+            return True
     return False
 
 def get_reduce_nodes(reduction_node, nodes, func_ir):
@@ -3664,6 +4611,35 @@ def get_parfor_writes(parfor):
                 writes.update(get_parfor_writes(stmt))
     return writes
 
+def get_parfor_setitem_arrays(parfor):
+    """Return the names of the arrays whose elements are written by the
+    body of *parfor*.
+    """
+    arrays = set()
+    for block in parfor.loop_body.values():
+        for stmt in block.body:
+            if isinstance(stmt, (ir.SetItem, ir.StaticSetItem)):
+                arrays.add(stmt.target.name)
+            elif isinstance(stmt, Parfor):
+                arrays.update(get_parfor_setitem_arrays(stmt))
+    return arrays
+
+def has_parfor_reduction(parfor):
+    """Check whether an iteration of *parfor* uses a value computed by the
+    previous one, i.e. whether the loop is a reduction.
+    """
+    entry_label = min(parfor.loop_body.keys())
+    blocks = wrap_parfor_blocks(parfor)
+    cfg = compute_cfg_from_blocks(blocks)
+    usedefs = compute_use_defs(blocks)
+    live_map = compute_live_map(cfg, blocks, usedefs.usemap, usedefs.defmap)
+    unwrap_parfor_blocks(parfor)
+    body_defs = set()
+    for label, defs in usedefs.defmap.items():
+        if label != 0:
+            body_defs |= defs
+    return not live_map[entry_label].isdisjoint(body_defs)
+
 FusionReport = namedtuple('FusionReport', ['first', 'second', 'message'])
 
 def try_fuse(equiv_set, parfor1, parfor2):
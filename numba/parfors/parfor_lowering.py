@@ -174,7 +174,13 @@ def _lower_parfor_parallel(lowerer, parfor):
 
             init_val = parfor_reddict[parfor_redvars[i]][0]
             if init_val is not None:
-                if isinstance(redvar_typ, types.npytypes.Array):
+                if redtyp_is_tuple(redvar_typ):
+                    redtoset = pfbdr.make_const_variable(
+                        cval=init_val,
+                        typ=redvar_typ,
+                        name="redtoset",
+                    )
+                elif isinstance(redvar_typ, types.npytypes.Array):
                     # Create an array of identity values for the reduction.
                     # First, create a variable for np.full.
                     full_func_node = pfbdr.bind_global_function(
@@ -218,7 +224,12 @@ def _lower_parfor_parallel(lowerer, parfor):
                 index_var = pfbdr.make_const_variable(
                     cval=j, typ=types.uintp, name="index_var",
                 )
-                pfbdr.setitem(obj=redarr_var, index=index_var, val=redtoset)
+                if redtyp_is_tuple(redvar_typ):
+                    _set_tuple_redarr_item(pfbdr, redarr_var, index_var,
+                                           redtoset, redvar_typ, loc)
+                else:
+                    pfbdr.setitem(obj=redarr_var, index=index_var,
+                                  val=redtoset)
 
     # compile parfor body as a separate function to be used with GUFuncWrapper
     flags = copy.copy(parfor.flags)
@@ -324,14 +335,18 @@ def _lower_parfor_parallel(lowerer, parfor):
                 )
 
                 # Read that element from the array into oneelem.
-                oneelemgetitem = pfbdr.getitem(
-                    obj=redarr, index=index_var, typ=redvar_typ,
-                )
-                oneelem = pfbdr.assign(
-                    rhs=oneelemgetitem,
-                    typ=redvar_typ,
-                    name="redelem",
-                )
+                if redtyp_is_tuple(redvar_typ):
+                    oneelem = _get_tuple_redarr_item(
+                        pfbdr, redarr, index_var, redvar_typ, loc)
+                else:
+                    oneelemgetitem = pfbdr.getitem(
+                        obj=redarr, index=index_var, typ=redvar_typ,
+                    )
+                    oneelem = pfbdr.assign(
+                        rhs=oneelemgetitem,
+                        typ=redvar_typ,
+                        name="redelem",
+                    )
 
                 init_var = pfbdr.assign_inplace(
                     rhs=oneelem, typ=redvar_typ, name=name + "#init",
@@ -394,6 +409,23 @@ def _lower_parfor_parallel(lowerer, parfor):
                             lowerer.fndesc.calltypes.pop(rhs)
                             # Add calltype back in for the expr with updated signature.
                             lowerer.fndesc.calltypes[rhs] = ct
+                        elif (isinstance(rhs, ir.Expr) and rhs.op == 'call' and
+                              init_var.name in [a.name for a in rhs.args]):
+                            # The combining function of a reduction, e.g.
+                            # min() or a numba.reduction, may have been typed
+                            # for a value of another type than the reduction
+                            # variable, so retype it for the per-worker result.
+                            ct = lowerer.fndesc.calltypes[rhs]
+                            ctargs = tuple(
+                                redvar_typ if arg.name == init_var.name else argty
+                                for arg, argty in zip(rhs.args, ct.args))
+                            if ctargs != ct.args:
+                                fnty = typemap[rhs.func.name]
+                                newct = typingctx.resolve_function_type(
+                                    fnty, ctargs, {})
+                                if newct is not None:
+                                    lowerer.fndesc.calltypes.pop(rhs)
+                                    lowerer.fndesc.calltypes[rhs] = newct
                     lowerer.lower_inst(inst)
                     # Only process reduction statements post-gufunc execution
                     # until we see an assignment with a left-hand side to the
@@ -764,13 +796,61 @@ def hoist(parfor_params, loop_body, typemap, wrapped_blocks):
 def redtyp_is_scalar(redtype):
     return not isinstance(redtype, types.npytypes.Array)
 
+def redtyp_is_tuple(redtype):
+    """Tuples of numbers, e.g. a minimum and its index, are reduced in arrays
+       of records with a field for each item of the tuple.
+    """
+    return (isinstance(redtype, types.BaseTuple) and
+            not isinstance(redtype, types.BaseNamedTuple) and
+            len(redtype) > 0 and
+            all(isinstance(t, types.Number) for t in redtype))
+
+def redtyp_to_record(redtype):
+    return types.Record.make_c_struct(
+        [("f%d" % i, t) for i, t in enumerate(redtype)])
+
+def _get_tuple_redarr_item(pfbdr, redarr, index_var, redtyp, loc):
+    """Read the tuple of a tuple reduction from its record in *redarr*.
+    """
+    rectyp = redtyp_to_record(redtyp)
+    rec = pfbdr.assign(
+        rhs=pfbdr.getitem(obj=redarr, index=index_var, typ=rectyp),
+        typ=rectyp,
+        name="redrec",
+    )
+    items = [pfbdr.assign(rhs=ir.Expr.getattr(rec, "f%d" % i, loc),
+                          typ=t, name="redrecitem")
+             for i, t in enumerate(redtyp)]
+    return pfbdr.assign(
+        rhs=ir.Expr.build_tuple(items, loc), typ=redtyp, name="redelem",
+    )
+
+def _set_tuple_redarr_item(pfbdr, redarr, index_var, val, redtyp, loc):
+    """Store the tuple *val* of a tuple reduction into its record in *redarr*.
+    """
+    rectyp = redtyp_to_record(redtyp)
+    rec = pfbdr.assign(
+        rhs=pfbdr.getitem(obj=redarr, index=index_var, typ=rectyp),
+        typ=rectyp,
+        name="redrec",
+    )
+    for i, t in enumerate(redtyp):
+        item = pfbdr.assign(
+            rhs=ir.Expr.static_getitem(val, i, None, loc),
+            typ=t,
+            name="redtupleitem",
+        )
+        pfbdr.setattr(obj=rec, attr="f%d" % i, val=item)
+
 def redtyp_to_redarraytype(redtyp):
     """Go from a reducation variable type to a reduction array type used to hold
        per-worker results.
     """
     redarrdim = 1
+    if redtyp_is_tuple(redtyp):
+        redtyp = redtyp_to_record(redtyp)
     # If the reduction type is an array then allocate reduction array with ndim+1 dimensions.
-    if isinstance(redtyp, types.npytypes.Array):
+    elif isinstance(redtyp, types.npytypes.Array):
         redarrdim += redtyp.ndim
         # We don't create array of array but multi-dimensional reduciton array with same dtype.
         redtyp = redtyp.dtype
@@ -1107,7 +1187,12 @@ def _create_gufunc_for_parfor_body(
     for arr, var in zip(parfor_redarrs, parfor_redvars):
         # If reduction variable is a scalar then save current value to
         # temp and accumulate on that temp to prevent false sharing.
-        if redtyp_is_scalar(typemap[var]):
+        if redtyp_is_tuple(typemap[var]):
+            # Tuples are read from the fields of a record.
+            gufunc_txt += "    " + param_dict[var] + "=(" + "".join(
+                param_dict[arr] + "[0].f%d," % k
+                for k in range(len(typemap[var]))) + ")\n"
+        elif redtyp_is_scalar(typemap[var]):
             gufunc_txt += "    " + param_dict[var] + \
                  "=" + param_dict[arr] + "[0]\n"
         else:
@@ -1149,7 +1234,12 @@ def _create_gufunc_for_parfor_body(
     redargstartdim = {}
     for arr, var in zip(parfor_redarrs, parfor_redvars):
         # After the gufunc loops, copy the accumulated temp value back to reduction array.
-        if redtyp_is_scalar(typemap[var]):
+        if redtyp_is_tuple(typemap[var]):
+            for k in range(len(typemap[var])):
+                gufunc_txt += "    " + param_dict[arr] + \
+                    "[0].f%d = " % k + param_dict[var] + "[%d]\n" % k
+            redargstartdim[arr] = 1
+        elif redtyp_is_scalar(typemap[var]):
             gufunc_txt += "    " + param_dict[arr] + \
                 "[0] = " + param_dict[var] + "\n"
             redargstartdim[arr] = 1
@@ -1603,13 +1693,13 @@ def call_parallel_gufunc(lowerer, cres, gu_signature, outer_sig, expr_args, expr
             if i < num_inps:
                 # Scalar input, need to store the value in an array of size 1
                 typ = context.get_data_type(
-                    aty) if aty != types.boolean else lc.Type.int(1)
+                    aty) if not isinstance(aty, types.Boolean) else lc.Type.int(1)
                 ptr = cgutils.alloca_once(builder, typ)
                 builder.store(arg, ptr)
             else:
                 # Scalar output, must allocate
                 typ = context.get_data_type(
-                    aty) if aty != types.boolean else lc.Type.int(1)
+                    aty) if not isinstance(aty, types.Boolean) else lc.Type.int(1)
                 ptr = cgutils.alloca_once(builder, typ)
             builder.store(builder.bitcast(ptr, byte_ptr_t), dst)
 
@@ -188,6 +188,31 @@ class ParforLoweringBuilder:
         self._lowerer.lower_inst(setitem)
         return setitem
 
+    def setattr(self, obj, attr, val) -> ir.SetAttr:
+        """Makes a setattr call
+
+        Parameters
+        ----------
+        obj : ir.Var
+            the object whose attribute is set
+        attr : str
+            the attribute name
+        val : ir.Var
+            the value to be stored
+
+        Returns
+        -------
+        res : ir.SetAttr
+        """
+        loc = self._loc
+        tm = self._typemap
+        setattr = ir.SetAttr(obj, attr, val, loc=loc)
+        self._lowerer.fndesc.calltypes[setattr] = signature(
+            types.none, tm[obj.name], tm[val.name]
+        )
+        self._lowerer.lower_inst(setattr)
+        return setattr
+
     def getitem(self, obj, index, typ) -> ir.Expr:
         """Makes a getitem call
 
@@ -25,8 +25,14 @@ class StencilFuncLowerer(object):
         self.stencilFunc = sf
 
     def __call__(self, context, builder, sig, args):
+        from numba.parfors import parfor
+        # In the body of a parfor, e.g. a tile of fused stencils, the
+        # stencil function runs sequentially.
+        parallel = context.auto_parallel
+        if parfor.sequential_parfor_lowering:
+            parallel = False
         cres = self.stencilFunc.compile_for_argtys(sig.args, {},
-                    sig.return_type, None)
+                    sig.return_type, None, parallel=parallel)
         res = context.call_internal(builder, cres.fndesc, sig, args)
         context.add_linking_libs([cres.library])
         return res
@@ -45,6 +51,39 @@ def raise_if_incompatible_array_sizes(a, *args):
                                  "smaller the same dimension in the first "
                                  "stencil input.")
 
+@register_jitable
+def _reflect_index(i, n):
+    # Half-sample symmetric: d c b a | a b c d | d c b a
+    i = i % (2 * n)
+    if i >= n:
+        i = 2 * n - 1 - i
+    return i
+
+@register_jitable
+def _wrap_index(i, n):
+    return i % n
+
+@register_jitable
+def _nearest_index(i, n):
+    return min(max(i, 0), n - 1)
+
+# The functions mapping the out-of-bounds indices of the boundary kernels
+# back into the array, by boundary mode
+_boundary_index_funcs = {
+    'reflect': _reflect_index,
+    'wrap': _wrap_index,
+    'nearest': _nearest_index,
+}
+
+supported_modes = ('constant',) + tuple(_boundary_index_funcs)
+
+# Number of elements of the last dimension in the tiles of the interior, so
+# that the rows accessed by the kernel stay in cache along a tile
+TILE_SIZE = 512
+
+# Bytes of the slabs of rows iterated together by StencilFunc.iterate()
+ITERATE_SLAB_BYTES = 1 << 18
+
 def slice_addition(the_slice, addend):
     """ Called by stencil in Python mode to add the loop index to a
         user-specified slice.
@@ -74,6 +113,7 @@ class StencilFunc(object):
         self._install_type(self._typingctx)
         self.neighborhood = self.options.get("neighborhood")
         self._type_cache = {}
+        self._py_cache = {}
         self._lower_me = StencilFuncLowerer(self)
 
     def replace_return_with_setitem(self, blocks, index_vars, out_name):
@@ -119,12 +159,32 @@ class StencilFunc(object):
             block.body = new_body
         return ret_blocks
 
+    def fold_index(self, new_body, index_var, size_name, scope, loc):
+        """
+        Append to new_body the statements mapping index_var, which may be
+        out of the bounds of a dimension of size size_name, back into the
+        array as the boundary mode does.  Returns the folded index.
+        """
+        fold_func = _boundary_index_funcs[self.mode]
+        func_var = ir.Var(scope, ir_utils.mk_unique_var("stencil_fold"), loc)
+        new_body.append(ir.Assign(ir.Global(fold_func.__name__, fold_func,
+                                            loc), func_var, loc))
+        size_var = ir.Var(scope, size_name, loc)
+        folded = ir.Var(scope, ir_utils.mk_unique_var("stencil_index"), loc)
+        fold_call = ir.Expr.call(func_var, [index_var, size_var], (), loc)
+        new_body.append(ir.Assign(fold_call, folded, loc))
+        return folded
+
     def add_indices_to_kernel(self, kernel, index_names, ndim,
-                              neighborhood, standard_indexed, typemap, calltypes):
+                              neighborhood, standard_indexed, typemap, calltypes,
+                              size_names=None):
         """
         Transforms the stencil kernel as specified by the user into one
         that includes each dimension's index variable as part of the getitem
-        calls.  So, in effect array[-1] becomes array[index0-1].
+        calls.  So, in effect array[-1] becomes array[index0-1].  If the
+        names of the variables holding the size of each dimension are given
+        in size_names, the indices are also folded back into the array as
+        the boundary mode does, for the kernel applied to the border.
         """
         const_dict = {}
         kernel_consts = []
@@ -205,6 +265,11 @@ class StencilFunc(object):
                         # If the array is indexed with a slice then we
                         # have to add the index value with a call to
                         # slice_addition.
+                        if (size_names is not None and
+                                isinstance(stmt_index_var_typ,
+                                           types.misc.SliceType)):
+                            raise ValueError("Slice indexing is not supported "
+                                "in stencil kernels with mode " + self.mode)
                         if isinstance(stmt_index_var_typ, types.misc.SliceType):
                             sa_var = ir.Var(scope, ir_utils.mk_unique_var("slice_addition"), loc)
                             sa_func = numba.njit(slice_addition)
@@ -222,6 +287,10 @@ class StencilFunc(object):
                             acc_call = ir.Expr.binop(operator.add, stmt_index_var,
                                                      index_var, loc)
                             new_body.append(ir.Assign(acc_call, tmpvar, loc))
+                            if size_names is not None:
+                                tmpvar = self.fold_index(new_body, tmpvar,
+                                                         size_names[0],
+                                                         scope, loc)
                             new_body.append(ir.Assign(
                                            ir.Expr.getitem(stmt.value.value, tmpvar, loc),
                                            stmt.target, loc))
@@ -264,6 +333,12 @@ class StencilFunc(object):
                             # If the array is indexed with a slice then we
                             # have to add the index value with a call to
                             # slice_addition.
+                            if (size_names is not None and
+                                    isinstance(one_index_typ,
+                                               types.misc.SliceType)):
+                                raise ValueError("Slice indexing is not "
+                                    "supported in stencil kernels with mode " +
+                                    self.mode)
                             if isinstance(one_index_typ, types.misc.SliceType):
                                 sa_var = ir.Var(scope, ir_utils.mk_unique_var("slice_addition"), loc)
                                 sa_func = numba.njit(slice_addition)
@@ -278,6 +353,10 @@ class StencilFunc(object):
                                 acc_call = ir.Expr.binop(operator.add, getitemvar,
                                                          index_vars[dim], loc)
                                 new_body.append(ir.Assign(acc_call, tmpvar, loc))
+                                if size_names is not None:
+                                    ind_stencils[-1] = self.fold_index(
+                                        new_body, tmpvar, size_names[dim],
+                                        scope, loc)
 
                         tuple_call = ir.Expr.build_tuple(ind_stencils, loc)
                         new_body.append(ir.Assign(tuple_call, s_index_var, loc))
@@ -358,11 +437,13 @@ class StencilFunc(object):
                        dict(key=self, generic=self._type_me))
         typingctx.insert_user_function(self, _ty_cls)
 
-    def compile_for_argtys(self, argtys, kwtys, return_type, sigret):
+    def compile_for_argtys(self, argtys, kwtys, return_type, sigret,
+                           parallel=False):
         # look in the type cache to find if result array is passed
         (_, result, typemap, calltypes) = self._type_cache[argtys]
         new_func = self._stencil_wrapper(result, sigret, return_type,
-                                         typemap, calltypes, *argtys)
+                                         typemap, calltypes, *argtys,
+                                         parallel=parallel)
         return new_func
 
     def _type_me(self, argtys, kwtys):
@@ -432,7 +513,69 @@ class StencilFunc(object):
             kernel_copy.blocks[block_label] = new_block
         return (kernel_copy, copy_calltypes)
 
-    def _stencil_wrapper(self, result, sigret, return_type, typemap, calltypes, *args):
+    def insert_kernel(self, stencil_ir, sentinel_name, kernel, ret_blocks):
+        """
+        Replace the assignment to sentinel_name in stencil_ir with the
+        blocks of the kernel IR, whose blocks in ret_blocks then jump to
+        the statements following the sentinel.
+        """
+        stencil_stub_last_label = max(stencil_ir.blocks.keys()) + 1
+
+        # Shift labels in the kernel copy so they are guaranteed unique
+        # and don't conflict with any labels in the stencil_ir.
+        kernel.blocks = ir_utils.add_offset_to_labels(
+                                kernel.blocks, stencil_stub_last_label)
+        new_label = max(kernel.blocks.keys()) + 1
+        # Adjust ret_blocks to account for addition of the offset.
+        ret_blocks = [x + stencil_stub_last_label for x in ret_blocks]
+
+        if config.DEBUG_ARRAY_OPT >= 1:
+            print("ret_blocks w/ offsets", ret_blocks, stencil_stub_last_label)
+            print("before replace sentinel stencil_ir")
+            ir_utils.dump_blocks(stencil_ir.blocks)
+            print("before replace sentinel kernel_copy")
+            ir_utils.dump_blocks(kernel.blocks)
+
+        # Search all the block in the stencil outline for the sentinel.
+        for label, block in stencil_ir.blocks.items():
+            for i, inst in enumerate(block.body):
+                if (isinstance( inst, ir.Assign) and
+                    inst.target.name == sentinel_name):
+                    # We found the sentinel assignment.
+                    loc = inst.loc
+                    scope = block.scope
+                    # split block across __sentinel__
+                    # A new block is allocated for the statements prior to the
+                    # sentinel but the new block maintains the current block
+                    # label.
+                    prev_block = ir.Block(scope, loc)
+                    prev_block.body = block.body[:i]
+                    # The current block is used for statements after sentinel.
+                    block.body = block.body[i + 1:]
+                    # But the current block gets a new label.
+                    body_first_label = min(kernel.blocks.keys())
+
+                    # The previous block jumps to the minimum labelled block of
+                    # the parfor body.
+                    prev_block.append(ir.Jump(body_first_label, loc))
+                    # Add all the parfor loop body blocks to the gufunc
+                    # function's IR.
+                    for (l, b) in kernel.blocks.items():
+                        stencil_ir.blocks[l] = b
+
+                    stencil_ir.blocks[new_label] = block
+                    stencil_ir.blocks[label] = prev_block
+                    # Add a jump from all the blocks that previously contained
+                    # a return in the stencil kernel to the block
+                    # containing statements after the sentinel.
+                    for ret_block in ret_blocks:
+                        stencil_ir.blocks[ret_block].append(
+                            ir.Jump(new_label, loc))
+                    return
+        raise AssertionError("stencil sentinel %s not found" % sentinel_name)
+
+    def _stencil_wrapper(self, result, sigret, return_type, typemap, calltypes, *args,
+                         parallel=False):
         # Overall approach:
         # 1) Construct a string containing a function definition for the stencil function
         #    that will execute the stencil kernel.  This function definition includes a
@@ -516,6 +659,17 @@ class StencilFunc(object):
             raise ValueError("Standard indexing requested for an array name "
                              "not present in the stencil kernel definition.")
 
+        # The kernel applied to the border of the output array in the modes
+        # other than constant folds its indices back into the input array,
+        # so it is copied before the indices are added.
+        border = self.mode != 'constant'
+        if border:
+            border_copy, _ = self.copy_ir_with_calltypes(kernel_copy,
+                                                         copy_calltypes)
+        size_names = [ir_utils.get_unused_var_name("size" + str(i),
+                                                   name_var_table)
+                      for i in range(the_array.ndim)]
+
         # Add index variables to getitems in the IR to transition the accesses
         # in the kernel from relative to regular Python indexing.  Returns the
         # computed size of the stencil kernel and a list of the relatively indexed
@@ -525,6 +679,10 @@ class StencilFunc(object):
                 self.neighborhood, standard_indexed, typemap, copy_calltypes)
         if self.neighborhood is None:
             self.neighborhood = kernel_size
+        if border:
+            self.add_indices_to_kernel(border_copy, index_vars,
+                the_array.ndim, kernel_size, standard_indexed, typemap,
+                copy_calltypes, size_names)
 
         if config.DEBUG_ARRAY_OPT >= 1:
             print("After add_indices_to_kernel")
@@ -534,6 +692,9 @@ class StencilFunc(object):
         # particular point in the iteration space.
         ret_blocks = self.replace_return_with_setitem(kernel_copy.blocks,
                                                       index_vars, out_name)
+        if border:
+            border_ret_blocks = self.replace_return_with_setitem(
+                border_copy.blocks, index_vars, out_name)
 
         if config.DEBUG_ARRAY_OPT >= 1:
             print("After replace_return_with_setitem", ret_blocks)
@@ -573,11 +734,15 @@ class StencilFunc(object):
 
         # If we have to allocate the output array (the out argument was not used)
         # then us numpy.full if the user specified a cval stencil decorator option
-        # or np.zeros if they didn't to allocate the array.
+        # or np.zeros if they didn't to allocate the array.  In the other
+        # modes, the kernel is applied to every element so np.empty is used.
         if result is None:
             return_type_name = numpy_support.as_dtype(
                                return_type.dtype).type.__name__
-            if "cval" in self.options:
+            if border:
+                out_init ="{} = np.empty({}, dtype=np.{})\n".format(
+                            out_name, shape_name, return_type_name)
+            elif "cval" in self.options:
                 cval = self.options["cval"]
                 if return_type.dtype != typing.typeof.typeof(cval):
                     raise ValueError(
@@ -588,7 +753,7 @@ class StencilFunc(object):
                 out_init ="{} = np.zeros({}, dtype=np.{})\n".format(
                             out_name, shape_name, return_type_name)
             func_text += "    " + out_init
-        else: # result is present, if cval is set then use it
+        elif not border: # result is present, if cval is set then use it
             if "cval" in self.options:
                 cval = self.options["cval"]
                 cval_ty = typing.typeof.typeof(cval)
@@ -598,35 +763,122 @@ class StencilFunc(object):
                 out_init = "{}[:] = {}\n".format(out_name, cval)
                 func_text += "    " + out_init
 
-        offset = 1
-        # Add the loop nests to the new function.
+        # Compute the bounds of the interior in each dimension, where the
+        # kernel accesses no element outside the input array.
+        # ranges[i][0] is the minimum index used in the i'th dimension
+        # but minimum's greater than 0 don't preclude any entry in the array.
+        # So, take the minimum of 0 and the minimum index found in the kernel
+        # and this will be a negative number (potentially -0).  Then, we do
+        # unary - on that to get the positive offset in this dimension whose
+        # use is precluded.
+        # ranges[i][1] is the maximum of 0 and the observed maximum index
+        # in this dimension because negative maximums would not cause us to
+        # preclude any entry in the array from being used.
+        lo_names = []
+        hi_names = []
         for i in range(the_array.ndim):
-            for j in range(offset):
-                func_text += "    "
-            # ranges[i][0] is the minimum index used in the i'th dimension
-            # but minimum's greater than 0 don't preclude any entry in the array.
-            # So, take the minimum of 0 and the minimum index found in the kernel
-            # and this will be a negative number (potentially -0).  Then, we do
-            # unary - on that to get the positive offset in this dimension whose
-            # use is precluded.
-            # ranges[i][1] is the maximum of 0 and the observed maximum index
-            # in this dimension because negative maximums would not cause us to
-            # preclude any entry in the array from being used.
-            func_text += ("for {} in range(-min(0,{}),"
-                          "{}[{}]-max(0,{})):\n").format(
-                            index_vars[i],
-                            ranges[i][0],
-                            shape_name,
-                            i,
-                            ranges[i][1])
-            offset += 1
-
-        for j in range(offset):
-            func_text += "    "
+            lo_name = ir_utils.get_unused_var_name("lo" + str(i),
+                                                   name_var_table)
+            hi_name = ir_utils.get_unused_var_name("hi" + str(i),
+                                                   name_var_table)
+            func_text += "    {} = {}[{}]\n".format(size_names[i], shape_name,
+                                                    i)
+            func_text += "    {} = -min(0, {})\n".format(lo_name,
+                                                         ranges[i][0])
+            func_text += "    {} = max({}, {} - max(0, {}))\n".format(
+                            hi_name, lo_name, size_names[i], ranges[i][1])
+            lo_names.append(lo_name)
+            hi_names.append(hi_name)
+
+        # Add the loop nests over the interior to the new function.  With
+        # several dimensions, the last one is split in tiles which are
+        # iterated over in the outer loop, so that the rows of the tile
+        # accessed by the kernel stay in cache from one row to the next.
+        # The tiles and the rows of the first dimension are iterated by a
+        # single loop, which is a prange when the stencil is compiled for a
+        # parallel function: its chunks are runs of rows of the same tile.
+        range_name = "numba.prange" if parallel and parallel.stencil else \
+                     "range"
+        last = the_array.ndim - 1
+        bounds = list(zip(lo_names, hi_names))
+        indent = "    "
+        if last > 0:
+            ntiles_name = ir_utils.get_unused_var_name("ntiles",
+                                                       name_var_table)
+            nrows_name = ir_utils.get_unused_var_name("nrows", name_var_table)
+            t_name = ir_utils.get_unused_var_name("t", name_var_table)
+            tile_name = ir_utils.get_unused_var_name("tile", name_var_table)
+            tile_end_name = ir_utils.get_unused_var_name("tile_end",
+                                                         name_var_table)
+            func_text += "{}{} = ({} - {} + {}) // {}\n".format(indent,
+                            ntiles_name, hi_names[last], lo_names[last],
+                            TILE_SIZE - 1, TILE_SIZE)
+            func_text += "{}{} = {} - {}\n".format(indent, nrows_name,
+                            hi_names[0], lo_names[0])
+            func_text += "{}for {} in {}({} * {}):\n".format(indent, t_name,
+                            range_name, ntiles_name, nrows_name)
+            indent += "    "
+            func_text += "{}{} = {} + {} // {} * {}\n".format(indent,
+                            tile_name, lo_names[last], t_name, nrows_name,
+                            TILE_SIZE)
+            func_text += "{}{} = min({} + {}, {})\n".format(indent,
+                            tile_end_name, tile_name, TILE_SIZE,
+                            hi_names[last])
+            func_text += "{}{} = {} + {} % {}\n".format(indent,
+                            index_vars[0], lo_names[0], t_name, nrows_name)
+            bounds[last] = (tile_name, tile_end_name)
+        else:
+            func_text += "{}for {} in {}({}, {}):\n".format(indent,
+                            index_vars[0], range_name, bounds[0][0],
+                            bounds[0][1])
+            indent += "    "
+        for i in range(1, the_array.ndim):
+            func_text += "{}for {} in range({}, {}):\n".format(indent,
+                            index_vars[i], bounds[i][0], bounds[i][1])
+            indent += "    "
         # Put a sentinel in the code so we can locate it in the IR.  We will
         # remove this sentinel assignment and replace it with the IR for the
         # stencil kernel body.
-        func_text += "{} = 0\n".format(sentinel_name)
+        func_text += "{}{} = 0\n".format(indent, sentinel_name)
+
+        # Add the loop nest over the border, that is every element outside
+        # the interior, for the kernel folding its indices into the array.
+        # The loop over the last dimension skips the interior when all the
+        # outer indices are in the interior.  The rows of the first
+        # dimension are iterated in parallel like the interior, unless the
+        # border is a few elements of a 1-D array.
+        if border:
+            border_sentinel_name = ir_utils.get_unused_var_name(
+                                    "__border_sentinel__", name_var_table)
+            indent = "    "
+            inner_name = None
+            for i in range(last):
+                func_text += "{}for {} in {}({}):\n".format(indent,
+                                index_vars[i],
+                                range_name if i == 0 else "range",
+                                size_names[i])
+                indent += "    "
+                cond = "{} <= {} < {}".format(lo_names[i], index_vars[i],
+                                              hi_names[i])
+                if inner_name is not None:
+                    cond = "{} and {}".format(inner_name, cond)
+                inner_name = ir_utils.get_unused_var_name("inner" + str(i),
+                                                          name_var_table)
+                func_text += "{}{} = {}\n".format(indent, inner_name, cond)
+            skip_name = ir_utils.get_unused_var_name("skip", name_var_table)
+            k_name = ir_utils.get_unused_var_name("k", name_var_table)
+            skip = "{} - {}".format(hi_names[last], lo_names[last])
+            if inner_name is not None:
+                skip = "{} if {} else 0".format(skip, inner_name)
+            func_text += "{}{} = {}\n".format(indent, skip_name, skip)
+            func_text += "{}for {} in range({} - {}):\n".format(indent,
+                            k_name, size_names[last], skip_name)
+            indent += "    "
+            func_text += "{}{} = {} + {} if {} >= {} else {}\n".format(indent,
+                            index_vars[last], k_name, skip_name, k_name,
+                            lo_names[last], k_name)
+            func_text += "{}{} = 0\n".format(indent, border_sentinel_name)
+
         func_text += "    return {}\n".format(out_name)
 
         if config.DEBUG_ARRAY_OPT >= 1:
@@ -648,68 +900,19 @@ class StencilFunc(object):
         var_table = ir_utils.get_name_var_table(stencil_ir.blocks)
         new_var_dict = {}
         reserved_names = ([sentinel_name, out_name, neighborhood_name,
-                           shape_name] + kernel_copy.arg_names + index_vars)
+                           shape_name] + kernel_copy.arg_names + index_vars +
+                          size_names)
+        if border:
+            reserved_names.append(border_sentinel_name)
         for name, var in var_table.items():
             if not name in reserved_names:
                 new_var_dict[name] = ir_utils.mk_unique_var(name)
         ir_utils.replace_var_names(stencil_ir.blocks, new_var_dict)
 
-        stencil_stub_last_label = max(stencil_ir.blocks.keys()) + 1
-
-        # Shift labels in the kernel copy so they are guaranteed unique
-        # and don't conflict with any labels in the stencil_ir.
-        kernel_copy.blocks = ir_utils.add_offset_to_labels(
-                                kernel_copy.blocks, stencil_stub_last_label)
-        new_label = max(kernel_copy.blocks.keys()) + 1
-        # Adjust ret_blocks to account for addition of the offset.
-        ret_blocks = [x + stencil_stub_last_label for x in ret_blocks]
-
-        if config.DEBUG_ARRAY_OPT >= 1:
-            print("ret_blocks w/ offsets", ret_blocks, stencil_stub_last_label)
-            print("before replace sentinel stencil_ir")
-            ir_utils.dump_blocks(stencil_ir.blocks)
-            print("before replace sentinel kernel_copy")
-            ir_utils.dump_blocks(kernel_copy.blocks)
-
-        # Search all the block in the stencil outline for the sentinel.
-        for label, block in stencil_ir.blocks.items():
-            for i, inst in enumerate(block.body):
-                if (isinstance( inst, ir.Assign) and
-                    inst.target.name == sentinel_name):
-                    # We found the sentinel assignment.
-                    loc = inst.loc
-                    scope = block.scope
-                    # split block across __sentinel__
-                    # A new block is allocated for the statements prior to the
-                    # sentinel but the new block maintains the current block
-                    # label.
-                    prev_block = ir.Block(scope, loc)
-                    prev_block.body = block.body[:i]
-                    # The current block is used for statements after sentinel.
-                    block.body = block.body[i + 1:]
-                    # But the current block gets a new label.
-                    body_first_label = min(kernel_copy.blocks.keys())
-
-                    # The previous block jumps to the minimum labelled block of
-                    # the parfor body.
-                    prev_block.append(ir.Jump(body_first_label, loc))
-                    # Add all the parfor loop body blocks to the gufunc
-                    # function's IR.
-                    for (l, b) in kernel_copy.blocks.items():
-                        stencil_ir.blocks[l] = b
-
-                    stencil_ir.blocks[new_label] = block
-                    stencil_ir.blocks[label] = prev_block
-                    # Add a jump from all the blocks that previously contained
-                    # a return in the stencil kernel to the block
-                    # containing statements after the sentinel.
-                    for ret_block in ret_blocks:
-                        stencil_ir.blocks[ret_block].append(
-                            ir.Jump(new_label, loc))
-                    break
-            else:
-                continue
-            break
+        self.insert_kernel(stencil_ir, sentinel_name, kernel_copy, ret_blocks)
+        if border:
+            self.insert_kernel(stencil_ir, border_sentinel_name, border_copy,
+                               border_ret_blocks)
 
         stencil_ir.blocks = ir_utils.rename_labels(stencil_ir.blocks)
         ir_utils.remove_dels(stencil_ir.blocks)
@@ -724,14 +927,19 @@ class StencilFunc(object):
             ir_utils.dump_blocks(stencil_ir.blocks)
 
         # Compile the combined stencil function with the replaced loop
-        # body in it.
+        # body in it, with the parallel options of the caller if any.
+        flags = compiler.DEFAULT_FLAGS
+        if parallel and parallel.stencil:
+            flags = compiler.Flags()
+            flags.set('nrt')
+            flags.set('auto_parallel', parallel)
         new_func = compiler.compile_ir(
             self._typingctx,
             self._targetctx,
             stencil_ir,
             new_stencil_param_types,
             None,
-            compiler.DEFAULT_FLAGS,
+            flags,
             {})
         return new_func
 
@@ -759,15 +967,74 @@ class StencilFunc(object):
         if config.DEBUG_ARRAY_OPT >= 1:
             print("__call__", array_types, args, kwargs)
 
-        (real_ret, typemap, calltypes) = self.get_return_type(array_types)
-        new_func = self._stencil_wrapper(result, None, real_ret, typemap,
-                                         calltypes, *array_types_full)
+        # look in the cache of the stencil functions compiled for calls
+        # from Python first
+        key = (array_types_full, result is None)
+        new_func = self._py_cache.get(key)
+        if new_func is None:
+            (real_ret, typemap, calltypes) = self.get_return_type(array_types)
+            new_func = self._stencil_wrapper(result, None, real_ret, typemap,
+                                             calltypes, *array_types_full)
+            self._py_cache[key] = new_func
 
         if result is None:
             return new_func.entry_point(*args)
         else:
             return new_func.entry_point(*(args+(result,)))
 
+    def iterate(self, a, nsteps, slab_rows=None):
+        """
+        Apply the stencil nsteps times, to the array a and then to the
+        result of the previous step, and return the last result.  The
+        stencil kernel must take a single argument.
+
+        Unless the mode is 'wrap', the steps are blocked in time: slabs of
+        slab_rows rows of the first dimension, extended by the rows the
+        steps of the slab depend on, go through several steps at once while
+        they are in cache.
+        """
+        if len(self.kernel_ir.arg_names) != 1:
+            raise ValueError("Only stencil kernels with a single argument "
+                             "can be iterated.")
+        if nsteps < 1:
+            raise ValueError("The number of stencil iterations must be "
+                             "positive.")
+        # The first step also computes the neighborhood if it is not known.
+        cur = self(a)
+        nsteps -= 1
+        n = cur.shape[0]
+        radius = max(-min(0, self.neighborhood[0][0]),
+                     max(0, self.neighborhood[0][1]))
+        if slab_rows is None:
+            slab_rows = max(ITERATE_SLAB_BYTES // max(cur[:1].nbytes, 1), 1)
+        if self.mode == 'wrap' or radius == 0 or n <= slab_rows:
+            for _ in range(nsteps):
+                cur = self(cur)
+            return cur
+
+        # The rows within radius of the edge of a slab that is not the edge
+        # of the array are wrong after a step, so a slab going through
+        # several steps is extended by that many radiuses.  Block as many
+        # steps as keep the extended rows fewer than the rows of the slab.
+        depth = max(min(nsteps, slab_rows // (2 * radius)), 1)
+        while nsteps > 0:
+            steps = min(depth, nsteps)
+            halo = steps * radius
+            out = None
+            for r0 in range(0, n, slab_rows):
+                r1 = min(r0 + slab_rows, n)
+                s0 = max(r0 - halo, 0)
+                s1 = min(r1 + halo, n)
+                slab = cur[s0:s1]
+                for _ in range(steps):
+                    slab = self(slab)
+                if out is None:
+                    out = np.empty(cur.shape, slab.dtype)
+                out[r0:r1] = slab[r0 - s0:r1 - s0]
+            cur = out
+            nsteps -= steps
+        return cur
+
 def stencil(func_or_mode='constant', **options):
     # called on function without specifying mode style
     if not isinstance(func_or_mode, str):
@@ -787,7 +1054,7 @@ def stencil(func_or_mode='constant', **options):
     return wrapper
 
 def _stencil(mode, options):
-    if mode != 'constant':
+    if mode not in supported_modes:
         raise ValueError("Unsupported mode style " + mode)
 
     def decorated(func):
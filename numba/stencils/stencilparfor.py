@@ -11,8 +11,10 @@ import operator
 
 import numpy as np
 
+import numba
 import numba.parfors.parfor
 from numba.core import types, ir, rewrites, config, ir_utils
+from numba.np import numpy_support
 from numba.core.typing.templates import infer_global, AbstractTemplate
 from numba.core.typing import signature
 from numba.core import  utils, typing
@@ -22,6 +24,47 @@ from numba.core.ir_utils import (get_call_table, mk_unique_var,
 from numba.core.utils import OPERATORS_TO_BUILTINS
 
 
+# Bytes of the rows of the input of a fused chain of stencils computed
+# together, so that the intermediate results of a tile stay in cache
+FUSED_TILE_BYTES = 1 << 18
+
+
+def _mk_fused_stencils(stencil_funcs, halo_lo, halo_hi, out_type):
+    """
+    Make the function applying the chain of stencil_funcs, each to the
+    result of the previous one.  The rows of the first dimension are
+    split in tiles computed in parallel, each from the slab of the input
+    extended by halo_lo and halo_hi rows, which the intermediate results
+    of the tile are computed on.
+    """
+    stencil_names = ["__stencil%d" % i for i in range(len(stencil_funcs))]
+    func_text = """def __numba_fused_stencils(a):
+    n = a.shape[0]
+    row_size = a.size // n if n > 0 else 1
+    tile_rows = max(FUSED_TILE_BYTES // max(row_size * a.itemsize, 1),
+                    halo_lo + halo_hi, 1)
+    ntiles = (n + tile_rows - 1) // tile_rows
+    out = np.empty(a.shape, out_type)
+    for t in numba.prange(ntiles):
+        r0 = t * tile_rows
+        r1 = min(r0 + tile_rows, n)
+        s0 = max(r0 - halo_lo, 0)
+        s1 = min(r1 + halo_hi, n)
+        x0 = a[s0:s1]
+"""
+    for i, name in enumerate(stencil_names):
+        func_text += "        x{} = {}(x{})\n".format(i + 1, name, i)
+    func_text += """        out[r0:r1] = x{}[r0 - s0:r1 - s0]
+    return out
+""".format(len(stencil_names))
+    glbls = {'np': np, 'numba': numba, 'FUSED_TILE_BYTES': FUSED_TILE_BYTES,
+             'halo_lo': halo_lo, 'halo_hi': halo_hi, 'out_type': out_type}
+    glbls.update(zip(stencil_names, stencil_funcs))
+    loc = {}
+    exec(func_text, glbls, loc)
+    return loc['__numba_fused_stencils'], glbls
+
+
 def _compute_last_ind(dim_size, index_const):
     if index_const > 0:
         return dim_size - index_const
@@ -55,6 +98,15 @@ class StencilPass(object):
         if not stencil_calls:
             return  # return early if no stencil calls found
 
+        # Fuse the chains of stencils first.  The calls to stencils in the
+        # fused code have new names, so they are not converted to parfors
+        # below but run sequentially in each tile.
+        fused = False
+        while self._fuse_stencil_chain(stencil_dict):
+            fused = True
+        if fused:
+            self.array_analysis.run(self.func_ir.blocks)
+
         # find and transform stencil calls
         for label, block in self.func_ir.blocks.items():
             for i, stmt in reversed(list(enumerate(block.body))):
@@ -79,6 +131,12 @@ class StencilPass(object):
 
                     # Get the StencilFunc object corresponding to this call.
                     sf = stencil_dict[stmt.value.func.name]
+                    # The modes other than constant also apply the kernel to
+                    # the border, which is left to the stencil function.  It
+                    # is compiled with the parallel options of this function
+                    # and iterates its tiles and border rows with prange.
+                    if sf.mode != 'constant':
+                        continue
                     stencil_ir, rt, arg_to_arr_dict = get_stencil_ir(sf,
                             self.typingctx, arg_typemap,
                             block.scope, block.loc, input_dict,
@@ -97,6 +155,101 @@ class StencilPass(object):
                     # remove dummy stencil() call
                     stmt.value = ir.Const(0, stmt.loc)
 
+    def _fusable_stencil(self, stmt, stencil_dict):
+        """
+        Return the StencilFunc called by stmt if the call can be part of a
+        fused chain of stencils, that is a call of a stencil in constant
+        mode taking a single array, else None.
+        """
+        if not (isinstance(stmt, ir.Assign)
+                and isinstance(stmt.value, ir.Expr)
+                and stmt.value.op == 'call'
+                and stmt.value.func.name in stencil_dict
+                and len(stmt.value.args) == 1
+                and not stmt.value.kws):
+            return None
+        sf = stencil_dict[stmt.value.func.name]
+        argty = self.typemap[stmt.value.args[0].name]
+        if (sf.mode != 'constant' or len(sf.kernel_ir.arg_names) != 1 or
+                not isinstance(argty, types.npytypes.Array)):
+            return None
+        if sf.neighborhood is None:
+            # Compiling the stencil computes its neighborhood.
+            sf.compile_for_argtys((argty,), {},
+                                  self.typemap[stmt.target.name], None)
+        if not all(isinstance(x, int) for x in sf.neighborhood[0]):
+            return None
+        return sf
+
+    def _fuse_stencil_chain(self, stencil_dict):
+        """
+        Find a chain of calls of stencils in a block, each applied to the
+        result of the previous one and nothing else, and replace it with
+        the tiled computation of the chain so that the intermediate arrays
+        are never materialized.  Returns whether a chain was fused.
+        """
+        from numba.core.inline_closurecall import inline_closure_call
+        uses = {}
+        for block in self.func_ir.blocks.values():
+            for stmt in block.body:
+                for var in stmt.list_vars():
+                    uses[var.name] = uses.get(var.name, 0) + 1
+
+        def is_safe(stmt):
+            # The statements between the calls of a chain may not change
+            # its input, which is read later when the chain is fused.
+            return (isinstance(stmt, ir.Assign) and
+                    isinstance(stmt.value, (ir.Global, ir.FreeVar, ir.Const)))
+
+        for label, block in self.func_ir.blocks.items():
+            # chains[name] is (stencils, input var, statement indices) of the
+            # chain computing the variable name.
+            chains = {}
+            absorbed = set()
+            for i, stmt in enumerate(block.body):
+                sf = self._fusable_stencil(stmt, stencil_dict)
+                if sf is None:
+                    continue
+                arg = stmt.value.args[0]
+                prev = chains.get(arg.name)
+                # The intermediate array is only defined and used here.
+                if (prev is not None and uses[arg.name] == 2 and
+                        all(is_safe(x)
+                            for x in block.body[prev[2][-1] + 1:i])):
+                    chains[stmt.target.name] = (prev[0] + [sf], prev[1],
+                                                prev[2] + [i])
+                    absorbed.add(arg.name)
+                else:
+                    chains[stmt.target.name] = ([sf], arg, [i])
+            for name, (sfs, in_var, indices) in chains.items():
+                if len(sfs) > 1 and name not in absorbed:
+                    break
+            else:
+                continue
+
+            halo_lo = sum(max(0, -sf.neighborhood[0][0]) for sf in sfs)
+            halo_hi = sum(max(0, sf.neighborhood[0][1]) for sf in sfs)
+            out_type = numpy_support.as_dtype(self.typemap[name].dtype).type
+            fused_func, glbls = _mk_fused_stencils(sfs, halo_lo, halo_hi,
+                                                   out_type)
+            if config.DEBUG_ARRAY_OPT >= 1:
+                print("fusing stencil chain", sfs, "halo", halo_lo, halo_hi)
+
+            # Remove the calls computing the intermediate arrays, and inline
+            # the fused chain in place of the last call.
+            i = indices[-1]
+            call = block.body[i].value
+            call.args = [in_var]
+            for j in reversed(indices[:-1]):
+                del block.body[j]
+            i -= len(indices) - 1
+            inline_closure_call(self.func_ir, glbls, block, i, fused_func,
+                                self.typingctx,
+                                (self.typemap[in_var.name],),
+                                self.typemap, self.calltypes)
+            return True
+        return False
+
     def replace_return_with_setitem(self, blocks, exit_value_var,
                                     parfor_body_exit_label):
         """
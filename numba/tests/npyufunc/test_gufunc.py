@@ -1,9 +1,14 @@
+import os
+import pickle
+
 import numpy as np
 import numpy.core.umath_tests as ut
 
-from numba import void, float32, jit, guvectorize
-from numba.np.ufunc import GUVectorize
-from numba.tests.support import tag, TestCase
+from numba import void, float32, jit, njit, guvectorize
+from numba.core.errors import TypingError
+from numba.np.ufunc import GUVectorize, map_chunks
+from numba.np.ufunc.gufunc import GUFunc
+from numba.tests.support import tag, TestCase, temp_directory
 import unittest
 
 
@@ -21,6 +26,11 @@ def axpy(a, x, y, out):
     out[0] = a * x  + y
 
 
+def add_rows(a, b, out):
+    for i in range(out.shape[0]):
+        out[i] = a[i] + b
+
+
 class TestGUFunc(TestCase):
     target = 'cpu'
 
@@ -166,5 +176,209 @@ class TestGUVectorizeScalarParallel(TestGUVectorizeScalar):
     target = 'parallel'
 
 
+class TestDynamicGUFunc(TestCase):
+    target = 'cpu'
+
+    def make_gufunc(self, pyfunc, signature):
+        return guvectorize(signature, target=self.target)(pyfunc)
+
+    def test_guvectorize_decor(self):
+        gufunc = self.make_gufunc(matmulcore, '(m,n),(n,p)->(m,p)')
+        self.assertIsInstance(gufunc, GUFunc)
+        self.assertEqual(gufunc.nin, 2)
+        self.assertEqual(gufunc.nout, 1)
+        self.assertEqual(gufunc.ntypes, 0)
+
+        A = np.arange(30, dtype=np.float32).reshape((5, 2, 3))
+        B = np.arange(60, dtype=np.float32).reshape((5, 3, 4))
+        with self.assertRaises(TypeError) as raises:
+            gufunc(A, B)
+        self.assertIn("needs its 1 output arrays", str(raises.exception))
+
+        C = np.empty((5, 2, 4), dtype=np.float32)
+        gufunc(A, B, C)
+        Gold = ut.matrix_multiply(A, B)
+        np.testing.assert_allclose(C, Gold, rtol=1e-5, atol=1e-8)
+        self.assertEqual(gufunc.ntypes, 1)
+        # Once compiled, the outputs can be omitted
+        np.testing.assert_allclose(gufunc(A, B), Gold, rtol=1e-5, atol=1e-8)
+
+        A64, B64 = A.astype(np.float64), B.astype(np.float64)
+        C64 = np.empty((5, 2, 4))
+        gufunc(A64, B64, out=C64)
+        self.assertEqual(gufunc.ntypes, 2)
+        np.testing.assert_allclose(C64, ut.matrix_multiply(A64, B64))
+
+    def test_scalar_input(self):
+        gufunc = self.make_gufunc(add_rows, '(n),()->(n)')
+        a = np.arange(12, dtype=np.int64).reshape((3, 4))
+        out = np.empty_like(a)
+        gufunc(a, 5, out)
+        self.assertPreciseEqual(out, a + 5)
+
+        # The loop for the narrower types comes first, otherwise Numpy
+        # would cast int32 arguments to use the int64 loop
+        a32 = a.astype(np.int32)
+        out32 = np.empty_like(a32)
+        gufunc(a32, np.int32(5), out32)
+        self.assertPreciseEqual(out32, a32 + np.int32(5))
+        expected = ['%s%s->%s' % ((np.dtype(ty).char,) * 3)
+                    for ty in (np.int32, np.int64)]
+        self.assertEqual(gufunc.types, expected)
+        self.assertPreciseEqual(gufunc(a32, np.int32(5)), out32)
+
+    def test_decorator_reuse(self):
+        # The options of the decorator apply to every decorated function
+        dec = guvectorize('(n),()->(n)', target=self.target, identity=0)
+        first = dec(add_rows)
+        second = dec(add_rows)
+        self.assertEqual(second._reduce_args, first._reduce_args)
+        self.assertEqual(second._reduce_args[0], 0)
+        self.assertEqual(second._reduce_args[2], self.target)
+        a = np.arange(4.0)
+        out = np.empty(4)
+        second(a, 1.0, out)
+        self.assertPreciseEqual(out, a + 1.0)
+        self.assertEqual(second.ufunc.identity, 0)
+
+    def test_disable_compile(self):
+        gufunc = self.make_gufunc(add_rows, '(n),()->(n)')
+        a = np.arange(4.0)
+        gufunc(a, 1.0, np.empty(4))
+        gufunc.disable_compile()
+        self.assertPreciseEqual(gufunc(a, 1.0), a + 1.0)
+        with self.assertRaises(RuntimeError):
+            gufunc.add('void(int32[:], int32, int32[:])')
+
+    def test_pickle(self):
+        gufunc = self.make_gufunc(add_rows, '(n),()->(n)')
+        a = np.arange(4.0)
+        gufunc(a, 1.0, np.empty(4))
+        rebuilt = pickle.loads(pickle.dumps(gufunc))
+        self.assertIsInstance(rebuilt, GUFunc)
+        self.assertEqual(rebuilt.signature, gufunc.signature)
+        self.assertEqual(rebuilt.ntypes, 1)
+        self.assertPreciseEqual(rebuilt(a, 2.0), a + 2.0)
+
+    def test_npm_call(self):
+        gufunc = self.make_gufunc(add_rows, '(n),()->(n)')
+
+        @njit
+        def npmadd(a, b, out):
+            gufunc(a, b, out)
+
+        a = np.arange(12.0).reshape((3, 4))
+        out = np.zeros_like(a)
+        npmadd(a, 2.5, out)
+        self.assertPreciseEqual(out, a + 2.5)
+
+        # The loop dimensions of the inputs are broadcast
+        b = np.arange(2.0).reshape((2, 1))
+        out = np.zeros((2, 3, 4))
+        npmadd(a, b, out)
+        self.assertPreciseEqual(out, a + b[:, :, None])
+
+    def test_npm_errors(self):
+        gufunc = self.make_gufunc(add_rows, '(n),()->(n)')
+
+        @njit
+        def missing_output(a, b):
+            gufunc(a, b)
+
+        with self.assertRaises(TypingError) as raises:
+            missing_output(np.ones(3), 1.0)
+        self.assertIn("needs all of its 3 arguments", str(raises.exception))
+
+        @njit
+        def call(a, b, out):
+            gufunc(a, b, out)
+
+        with self.assertRaises(ValueError) as raises:
+            call(np.ones((2, 3)), np.ones(2), np.ones((3, 3)))
+        self.assertIn("the outputs must have the broadcast loop dimensions",
+                      str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            call(np.ones((2, 3)), np.ones(2), np.ones((2, 4)))
+        self.assertIn("mismatch in core dimension n", str(raises.exception))
+
+
+class TestDynamicGUFuncParallel(TestDynamicGUFunc):
+    _numba_parallel_test_ = False
+    target = 'parallel'
+
+
+class TestMapChunks(TestCase):
+    target = 'parallel'
+
+    def setUp(self):
+        self.tempdir = temp_directory('test_map_chunks')
+        self.gufunc = guvectorize(['void(float64[:], float64, float64[:])'],
+                                  '(n),()->(n)',
+                                  target=self.target)(add_rows)
+
+    def memmap(self, name, shape, mode='w+'):
+        return np.memmap(os.path.join(self.tempdir, name), dtype=np.float64,
+                         mode=mode, shape=shape)
+
+    def test_memmap(self):
+        a = self.memmap('a.dat', (1000, 8))
+        a[:] = np.arange(8000.0).reshape((1000, 8))
+        a.flush()
+        a = self.memmap('a.dat', (1000, 8), mode='r')
+        out = self.memmap('out.dat', (1000, 8))
+        for chunk_rows in (1, 7, 128, 1000, 5000, None):
+            out[:] = 0
+            got = map_chunks(self.gufunc, [a, 2.0], out=out,
+                             chunk_rows=chunk_rows)
+            self.assertIs(got, out)
+            np.testing.assert_array_equal(out, a + 2.0)
+        # The results were written to the file
+        del out
+        out = self.memmap('out.dat', (1000, 8), mode='r')
+        np.testing.assert_array_equal(out, a + 2.0)
+
+    def test_callback(self):
+        a = np.arange(50.0).reshape((10, 5))
+        # The scalar input is broadcast, the other chunked
+        b = np.arange(10.0)
+        chunks = []
+
+        def callback(start, res):
+            chunks.append((start, res.copy()))
+
+        self.assertIsNone(map_chunks(self.gufunc, [a, b], chunk_rows=4,
+                                     callback=callback))
+        self.assertEqual([start for start, _ in chunks], [0, 4, 8])
+        got = np.concatenate([res for _, res in chunks])
+        np.testing.assert_array_equal(got, a + b[:, None])
+        # Without output nor callback, the results are returned
+        got = map_chunks(self.gufunc, [a, b], chunk_rows=3)
+        np.testing.assert_array_equal(got, a + b[:, None])
+        # Ufuncs are chunked too
+        got = map_chunks(np.add, [a, 1.0], chunk_rows=3)
+        np.testing.assert_array_equal(got, a + 1.0)
+
+    def test_dynamic_gufunc(self):
+        gufunc = guvectorize('(n),()->(n)', target=self.target)(add_rows)
+        a = np.arange(50.0).reshape((10, 5))
+        out = np.empty_like(a)
+        gufunc.map_chunks([a, 1.0], out=out, chunk_rows=3)
+        np.testing.assert_array_equal(out, a + 1.0)
+
+    def test_errors(self):
+        a = np.ones((10, 5))
+        with self.assertRaises(TypeError) as raises:
+            map_chunks(self.gufunc, [a])
+        self.assertIn("needs 2 inputs, got 1", str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            map_chunks(self.gufunc, [a, np.ones(4)])
+        self.assertIn("mismatch in the first loop dimension",
+                      str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            map_chunks(self.gufunc, [a, 1.0], out=np.ones((9, 5)))
+        self.assertIn("the outputs must have all the 10 rows",
+                      str(raises.exception))
+
+
 if __name__ == '__main__':
     unittest.main()
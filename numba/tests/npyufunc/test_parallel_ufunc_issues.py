@@ -123,6 +123,39 @@ class TestParGUfuncIssues(unittest.TestCase):
             self.assertEqual(got_output, expected_output)
             np.testing.assert_equal(got, 2 * acopy)
 
+    def test_loop_chunking(self):
+        """
+        Every iteration of the loop must be run exactly once, whatever the
+        number of iterations and the alignment of the output.
+        """
+        @guvectorize(['void(int8[:], int8[:])', 'void(int64[:], int64[:])'],
+                     "()->()", target='parallel', nopython=True)
+        def visit(x, out):
+            out[0] += x[0]
+
+        for dtype in (np.int8, np.int64):
+            for nelem in [1, 3, 63, 64, 65, 1000, 100003]:
+                for offset in range(3):
+                    buf = np.zeros(nelem + 4, dtype=dtype)
+                    out = buf[offset:offset + nelem]
+                    visit(np.ones(nelem, dtype=dtype), out)
+                    np.testing.assert_equal(out, 1)
+                    self.assertEqual(buf.sum(dtype=np.int64), nelem)
+
+    def test_core_dims_chunking(self):
+        @guvectorize(['void(float64[:], float64[:])'], "(n)->()",
+                     target='parallel', nopython=True)
+        def rowsum(x, out):
+            acc = 0.
+            for i in range(x.shape[0]):
+                acc += x[i]
+            out[0] = acc
+
+        for shape in [(4, 100000), (100000, 3), (3, 5), (1000, 1000)]:
+            x = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+            np.testing.assert_allclose(rowsum(x), x.sum(axis=1))
+            np.testing.assert_allclose(rowsum(x.T), x.T.sum(axis=1))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -97,6 +97,35 @@ class TestUFuncs(TestCase):
             self.assertPreciseEqual(ufunc(a, broadcasting_b),
                                     a + broadcasting_b)
 
+    def test_loop_specializations(self):
+        # The loops specialized for contiguous and scalar (zero-strided)
+        # inputs, and the general loop for the other step patterns
+        for v in vectorizers:
+            vectorizer = v(add)
+            vectorizer.add(float32(float32, float32))
+            ufunc = vectorizer.build_ufunc()
+
+            x = a.ravel()
+            y = b.ravel()[::-1]
+            s = dtype(3)
+            for args in [(x, x), (x, s), (s, x), (x, y), (x[::2], s),
+                         (s, y[::3]), (a, b[:1]), (a[:, :1], b[:1]),
+                         (d, s), (c, d)]:
+                expected = args[0] + args[1]
+                self.assertPreciseEqual(ufunc(*args), expected, msg=args)
+                # Strided output
+                out = np.moveaxis(np.zeros((2,) + expected.shape, dtype),
+                                  0, -1)
+                ufunc(*args, out=out[..., 1])
+                self.assertPreciseEqual(out[..., 1], expected)
+                self.assertPreciseEqual(out[..., 0], np.zeros_like(expected))
+
+            vectorizer = v(add_multiple_args)
+            vectorizer.add(float32(float32, float32, float32, float32))
+            ufunc = vectorizer.build_ufunc()
+            self.assertPreciseEqual(ufunc(x, s, x, s), x + s + x + s)
+            self.assertPreciseEqual(ufunc(x, x, x, x), x + x + x + x)
+
     def test_ufunc_exception_on_write_to_readonly(self):
         z = np.ones(10)
         z.flags.writeable = False # flip write bit
@@ -60,6 +60,21 @@ def variable_name_reuse(a, b, c, d):
     u = u * c + d
     return u
 
+def fused_temporaries(a, b, c):
+    t = a * b
+    u = t + c
+    return u
+
+def reduce_sum_expr(a, b):
+    return np.sum(a * b + 1.)
+
+def reduce_max_method(a, b):
+    t = a - b
+    return t.max()
+
+def reduce_dot_expr(a, b, c):
+    return np.dot(a + b, c)
+
 
 # From issue #1264
 def distance_matrix(vectors):
@@ -374,6 +389,69 @@ class TestArrayExpressions(MemoryLeakMixin, TestCase):
         self._assert_no_rewrite(ns.control_pipeline.state.func_ir.blocks,
                                 ns.test_pipeline.state.func_ir.blocks)
 
+    def test_fused_temporaries(self):
+        """
+        Check that an array expression stored into a variable used only
+        once is fused into its user.
+        """
+        arrs = [np.random.random(10) for _ in range(3)]
+        arg_tys = [typeof(arg) for arg in arrs]
+        control_pipeline, control_cfunc, test_pipeline, test_cfunc = \
+            self._compile_function(fused_temporaries, arg_tys)
+        np.testing.assert_array_equal(control_cfunc(*arrs),
+                                      test_cfunc(*arrs))
+        array_exprs = list(self._get_array_exprs(
+            test_pipeline.state.func_ir.blocks[0].body))
+        self.assertEqual(len(array_exprs), 1)
+
+    def _check_folded_reduction(self, fn, *args):
+        arg_tys = [typeof(arg) for arg in args]
+        control_pipeline, control_cfunc, test_pipeline, test_cfunc = \
+            self._compile_function(fn, arg_tys)
+        self.assertPreciseEqual(control_cfunc(*args), test_cfunc(*args),
+                                prec='double')
+        # The whole function is a single reduction
+        array_exprs = list(self._get_array_exprs(
+            test_pipeline.state.func_ir.blocks[0].body))
+        self.assertEqual(len(array_exprs), 1)
+        self.assertIsInstance(array_exprs[0].value.ty, types.Number)
+        return test_cfunc
+
+    def test_folded_reductions(self):
+        """
+        Check that reductions of array expressions are computed without
+        allocating the intermediate array.
+        """
+        a = np.random.random(10)
+        b = np.random.random(10)
+        c = np.random.random(10)
+        self._check_folded_reduction(reduce_sum_expr, a, b)
+        dot_cfunc = self._check_folded_reduction(reduce_dot_expr, a, b, c)
+        with self.assertRaises(ValueError) as raises:
+            dot_cfunc(a, b, c[1:])
+        self.assertIn("incompatible array sizes", str(raises.exception))
+
+        cfunc = self._check_folded_reduction(reduce_max_method, a, b)
+
+        a[3] = np.nan
+        self.assertTrue(np.isnan(cfunc(a, b)))
+        with self.assertRaises(ValueError) as raises:
+            cfunc(a[:0], b[:0])
+        self.assertIn("zero-size array", str(raises.exception))
+
+    def test_folded_sum_pairwise(self):
+        """
+        Check that folded float sums are pairwise, like the sums of the
+        materialized arrays.
+        """
+        a = np.random.random((101, 99)) * 1e8
+        b = np.random.random((101, 99))
+        for x, y in [(a, b), (a.ravel(), b.ravel())]:
+            arg_tys = [typeof(x), typeof(y)]
+            control_pipeline, control_cfunc, test_pipeline, test_cfunc = \
+                self._compile_function(reduce_sum_expr, arg_tys)
+            self.assertPreciseEqual(control_cfunc(x, y), test_cfunc(x, y))
+
 
 class TestRewriteIssues(MemoryLeakMixin, TestCase):
 
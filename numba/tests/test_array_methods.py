@@ -238,6 +238,21 @@ def array_conjugate(a):
 def np_unique(a):
     return np.unique(a)
 
+def np_unique_index(a):
+    return np.unique(a, return_index=True)
+
+def np_unique_inverse(a):
+    return np.unique(a, return_inverse=True)
+
+def np_unique_counts(a):
+    return np.unique(a, return_counts=True)
+
+def np_unique_all(a):
+    return np.unique(a, True, True, True)
+
+def np_unique_flag(a, flag):
+    return np.unique(a, return_counts=flag)
+
 
 def array_dot(a, b):
     return a.dot(b)
@@ -1149,12 +1164,12 @@ class TestArrayMethods(MemoryLeakMixin, TestCase):
         # BAD: axis > dimensions
         with self.assertRaises(ValueError):
             cfunc(b, 2)
-        # BAD: negative axis
+        # BAD: negative axis < -dimensions
         with self.assertRaises(ValueError):
-            cfunc(a, -1)
-        # BAD: axis greater than 3
-        with self.assertRaises(ValueError):
-            cfunc(a, 4)
+            cfunc(b, -3)
+        # OK: negative axis and axis greater than 3
+        self.assertPreciseEqual(cfunc(a, -1), pyfunc(a, -1))
+        self.assertPreciseEqual(cfunc(a, 4), pyfunc(a, 4))
 
     def test_sum_const_negative(self):
         # Exceptions leak references
@@ -1333,6 +1348,32 @@ class TestArrayMethods(MemoryLeakMixin, TestCase):
         check(np.array([[3.1, 3.1], [1.7, 2.29], [3.3, 1.7]]))
         check(np.array([]))
 
+    def test_unique_options(self):
+        pyfuncs = (np_unique, np_unique_index, np_unique_inverse,
+                   np_unique_counts, np_unique_all)
+        rng = np.random.RandomState(42)
+        arrays = [rng.randint(-50, 50, size=1000),
+                  rng.randint(0, 100, size=(30, 20)).astype(np.uint8),
+                  rng.randint(-2**62, 2**62, size=500),
+                  (rng.randint(0, 2**10, size=300) * 2**50).astype(np.uint64),
+                  rng.randint(0, 2, size=50).astype(np.bool_),
+                  rng.randint(0, 10, size=200) / 4.0,
+                  (rng.randint(0, 5, size=100) +
+                   1j * rng.randint(0, 5, size=100)),
+                  rng.randint(-5, 5, size=(20, 30))[::2, ::-3],
+                  np.zeros(0, np.int32),
+                  np.zeros(0)]
+        for pyfunc in pyfuncs:
+            cfunc = jit(nopython=True)(pyfunc)
+            for a in arrays:
+                np.testing.assert_equal(cfunc(a), pyfunc(a))
+
+        cfunc = jit(nopython=True)(np_unique_flag)
+        with self.assertRaises(TypingError) as raises:
+            cfunc(np.arange(3), True)
+        self.assertIn("return_counts must be a constant boolean",
+                      str(raises.exception))
+
     @needs_blas
     def test_array_dot(self):
         # just ensure that the dot impl dispatches correctly, do
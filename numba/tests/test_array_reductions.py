@@ -134,6 +134,76 @@ def array_quantile_global(arr, q):
 def array_nanquantile_global(arr, q):
     return np.nanquantile(arr, q)
 
+def array_sum_axis(arr, axis):
+    return arr.sum(axis=axis)
+
+def array_sum_axis_keepdims_global(arr, axis):
+    return np.sum(arr, axis=axis, keepdims=True)
+
+def array_prod_axis(arr, axis):
+    return arr.prod(axis=axis)
+
+def array_prod_axis_keepdims_global(arr, axis):
+    return np.prod(arr, axis=axis, keepdims=True)
+
+def array_mean_axis(arr, axis):
+    return arr.mean(axis=axis)
+
+def array_mean_axis_keepdims_global(arr, axis):
+    return np.mean(arr, axis=axis, keepdims=True)
+
+def array_var_axis(arr, axis):
+    return arr.var(axis=axis)
+
+def array_var_axis_keepdims_global(arr, axis):
+    return np.var(arr, axis=axis, keepdims=True)
+
+def array_std_axis(arr, axis):
+    return arr.std(axis=axis)
+
+def array_std_axis_keepdims_global(arr, axis):
+    return np.std(arr, axis=axis, keepdims=True)
+
+def array_min_axis(arr, axis):
+    return arr.min(axis=axis)
+
+def array_min_axis_keepdims_global(arr, axis):
+    return np.min(arr, axis=axis, keepdims=True)
+
+def array_max_axis(arr, axis):
+    return arr.max(axis=axis)
+
+def array_max_axis_keepdims_global(arr, axis):
+    return np.max(arr, axis=axis, keepdims=True)
+
+def array_argmin_axis(arr, axis):
+    return arr.argmin(axis=axis)
+
+def array_argmax_axis(arr, axis):
+    return arr.argmax(axis=axis)
+
+def array_all_axis(arr, axis):
+    return arr.all(axis=axis)
+
+def array_all_axis_keepdims_global(arr, axis):
+    return np.all(arr, axis=axis, keepdims=True)
+
+def array_any_axis(arr, axis):
+    return arr.any(axis=axis)
+
+def array_any_axis_keepdims_global(arr, axis):
+    return np.any(arr, axis=axis, keepdims=True)
+
+def array_reduce_axis(name):
+    """
+    Return the functions calling the reduction *name* along an axis, as a
+    method and as a NumPy function keeping the reduced axes.
+    """
+    g = globals()
+    return (g['array_%s_axis' % name],
+            g.get('array_%s_axis_keepdims_global' % name))
+
+
 def base_test_arrays(dtype):
     if dtype == np.bool_:
         def factory(n):
@@ -618,6 +688,21 @@ class TestArrayReductions(MemoryLeakMixin, TestCase):
         npr, nbr = run_comparative(pyfunc, arr)
         self.assertPreciseEqual(npr, nbr)
 
+    def test_sum_pairwise(self):
+        # Floating point sums are computed pairwise, the error is much
+        # smaller than the one of a naive accumulation
+        cfunc = jit(nopython=True)(array_sum)
+        for n in (7, 100, 128, 129, 1000, 100003):
+            arr = np.random.random(n).astype(np.float32) + 1
+            exact = sum(arr.astype(np.float64).tolist())
+            self.assertLess(abs(cfunc(arr) - exact) / exact, 1e-5)
+        # Contiguous arrays of any dimension
+        arr = np.random.random((30, 50))
+        for a in (arr, arr.T, arr[::2]):
+            self.assertPreciseEqual(cfunc(a), a.sum(), prec='double')
+        arr = arr + 1j * arr[::-1]
+        self.assertPreciseEqual(cfunc(arr), arr.sum(), prec='double')
+
     def test_sum_magnitude(self):
         self.check_aggregation_magnitude(array_sum)
         self.check_aggregation_magnitude(array_sum_global)
@@ -652,6 +737,100 @@ class TestArrayReductions(MemoryLeakMixin, TestCase):
         self.check_aggregation_magnitude(array_std)
         self.check_aggregation_magnitude(array_std_global)
 
+    def check_reduce_axis(self, name, arrays, axes, keepdims=True, **kws):
+        pyfunc, pyfunc_keepdims = array_reduce_axis(name)
+        funcs = [pyfunc]
+        if keepdims:
+            funcs.append(pyfunc_keepdims)
+        for fn in funcs:
+            cfunc = jit(nopython=True)(fn)
+            for arr, axis in product(arrays, axes):
+                expected = fn(arr, axis)
+                got = cfunc(arr, axis)
+                # The summation order may differ from NumPy's
+                self.assertPreciseEqual(got, expected, **kws)
+
+    def reduce_axis_arrays(self, dtype):
+        arr = np.arange(1, 61).reshape((3, 4, 5)) % 7
+        if dtype == np.bool_:
+            arr = arr > 3
+        else:
+            arr = arr.astype(dtype)
+            if np.issubdtype(dtype, np.complexfloating):
+                arr = arr + 1j * arr[::-1]
+            elif np.issubdtype(dtype, np.floating):
+                arr = arr / dtype(7)
+        # Contiguous, transposed and strided arrays
+        return [arr, arr.T, arr[::2, :, 1:]]
+
+    def test_reduce_axis(self):
+        axes = [0, 1, 2, -1, (0, 2), (1, 2), (2, 0), (), None]
+
+        def check(names, dtypes, axes, keepdims=True):
+            for name, dtype in product(names, dtypes):
+                prec = 'single' if dtype == np.float32 else 'double'
+                self.check_reduce_axis(name, self.reduce_axis_arrays(dtype),
+                                       axes, keepdims=keepdims, prec=prec,
+                                       ulps=4)
+
+        numeric = [np.float64, np.float32, np.int32]
+        check(['sum', 'min', 'max', 'all', 'any'], numeric + [np.bool_], axes)
+        check(['prod', 'mean', 'var', 'std'], numeric + [np.complex128], axes)
+        check(['sum'], [np.complex128], axes)
+        check(['argmin', 'argmax'], numeric + [np.bool_], [0, 1, -1, None],
+              keepdims=False)
+
+    def test_reduce_axis_nan(self):
+        arr = np.arange(24.).reshape((4, 6))
+        arr[1, 2] = np.nan
+        arr[3, 0] = np.nan
+        for name in ('sum', 'mean', 'min', 'max', 'argmin', 'argmax'):
+            self.check_reduce_axis(name, [arr, arr.T], [0, 1],
+                                   keepdims=False)
+
+    def test_reduce_axis_large(self):
+        # Lanes longer than a block of results, and than the pairwise
+        # summation's unrolled block
+        arr = np.random.random((3, 2500, 7))
+        for name in ('sum', 'mean', 'var'):
+            pyfunc, _ = array_reduce_axis(name)
+            cfunc = jit(nopython=True)(pyfunc)
+            for axis in (0, 1, 2, (0, 2)):
+                np.testing.assert_allclose(cfunc(arr, axis),
+                                           pyfunc(arr, axis), rtol=1e-12)
+
+    def test_reduce_axis_sum_dtype(self):
+        cfunc = jit(nopython=True)(lambda a, axis: a.sum(axis=axis,
+                                                         dtype=np.float32))
+        arr = np.arange(12, dtype=np.int64).reshape((3, 4))
+        for axis in (0, 1, None):
+            self.assertPreciseEqual(cfunc(arr, axis),
+                                    arr.sum(axis=axis, dtype=np.float32))
+
+    def test_reduce_axis_exceptions(self):
+        # Exceptions leak references
+        self.disable_leak_check()
+        pyfunc, _ = array_reduce_axis('sum')
+        cfunc = jit(nopython=True)(pyfunc)
+        arr = np.ones((2, 3))
+        with self.assertRaises(ValueError) as raises:
+            cfunc(arr, 2)
+        self.assertIn("axis is out of bounds", str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            cfunc(arr, (0, -2))
+        self.assertIn("duplicate value in 'axis'", str(raises.exception))
+
+        for name, msg in [('min', "zero-size array to reduction operation"),
+                          ('argmax', "attempt to get argmax of an empty")]:
+            pyfunc, _ = array_reduce_axis(name)
+            cfunc = jit(nopython=True)(pyfunc)
+            with self.assertRaises(ValueError) as raises:
+                cfunc(np.ones((0, 3)), 0)
+            self.assertIn(msg, str(raises.exception))
+            # Reducing along a non-empty axis is fine
+            self.assertPreciseEqual(cfunc(np.ones((0, 3)), 1),
+                                    pyfunc(np.ones((0, 3)), 1))
+
     def _do_check_nptimedelta(self, pyfunc, arr):
         arrty = typeof(arr)
         cfunc = jit(nopython=True)(pyfunc)
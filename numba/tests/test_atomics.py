@@ -0,0 +1,157 @@
+"""
+Tests for the atomic operations on array elements of numba.atomic.
+"""
+
+import numpy as np
+
+import unittest
+from numba import atomic, njit, prange
+from numba.core.errors import TypingError
+from numba.tests.support import (MemoryLeakMixin, TestCase,
+                                 skip_parfors_unsupported)
+
+
+def atomic_add(ary, idx, val):
+    return atomic.add(ary, idx, val)
+
+
+def atomic_max(ary, idx, val):
+    return atomic.max(ary, idx, val)
+
+
+def atomic_min(ary, idx, val):
+    return atomic.min(ary, idx, val)
+
+
+def atomic_cas(ary, idx, old, val):
+    return atomic.cas(ary, idx, old, val)
+
+
+def histogram(idx, nbins):
+    out = np.zeros(nbins, np.int64)
+    for i in prange(idx.size):
+        atomic.add(out, idx[i], 1)
+    return out
+
+
+def weighted_histogram(idx, weights, nbins):
+    out = np.zeros(nbins)
+    for i in prange(idx.size):
+        atomic.add(out, idx[i], weights[i])
+    return out
+
+
+def bin_extremes(idx, vals, nbins):
+    hi = np.full(nbins, -np.inf)
+    lo = np.full(nbins, np.inf)
+    for i in prange(idx.size):
+        atomic.max(hi, idx[i], vals[i])
+        atomic.min(lo, idx[i], vals[i])
+    return lo, hi
+
+
+def first_claims(owners, claims):
+    for i in prange(claims.size):
+        atomic.cas(owners, claims[i], -1, i)
+    return owners
+
+
+class TestAtomics(MemoryLeakMixin, TestCase):
+
+    def check(self, pyfunc, ary, *args):
+        expected = ary.copy()
+        got = ary.copy()
+        expected_old = pyfunc(expected, *args)
+        got_old = njit(pyfunc)(got, *args)
+        self.assertPreciseEqual(got_old, expected_old)
+        self.assertPreciseEqual(got, expected)
+
+    def test_add(self):
+        for dtype in (np.int32, np.int64, np.uint8, np.float32, np.float64):
+            a = np.arange(10, dtype=dtype)
+            self.check(atomic_add, a, 3, 5)
+            self.check(atomic_add, a, -1, 2)
+        self.check(atomic_add, np.arange(10.0), 4, 0.25)
+        self.check(atomic_add, np.arange(12.0).reshape((3, 4)), (1, 2), 7)
+        # the value is converted to the type of the array elements
+        self.check(atomic_add, np.arange(5, dtype=np.int16), 2, True)
+
+    def test_max_min(self):
+        for pyfunc in (atomic_max, atomic_min):
+            for dtype in (np.int32, np.uint64, np.float32, np.float64):
+                a = np.array([3, 8, 1, 5], dtype=dtype)
+                self.check(pyfunc, a, 1, 4)
+                self.check(pyfunc, a, 2, 4)
+            self.check(pyfunc, np.array([-2, 7, 0]), 0, -5)
+            self.check(pyfunc, np.array([1.5, np.nan]), 0, np.nan)
+            self.check(pyfunc, np.array([1.5, np.nan]), 1, 3.0)
+            self.check(pyfunc, np.arange(6.0).reshape((2, 3)), (1, -1), 4.5)
+
+    def test_cas(self):
+        for dtype in (np.int32, np.int64, np.uint32):
+            a = np.array([3, 8, 1, 5], dtype=dtype)
+            self.check(atomic_cas, a, 1, 8, 0)
+            self.check(atomic_cas, a, 1, 7, 0)
+        self.check(atomic_cas, np.zeros((2, 2), np.int64), (0, 1), 0, 3)
+
+    def test_index_errors(self):
+        with self.assertRaises(IndexError) as raises:
+            njit(boundscheck=True)(atomic_add)(np.zeros(3), 3, 1.0)
+        self.assertIn("index is out of bounds", str(raises.exception))
+
+    def test_typing_errors(self):
+        cases = [
+            (atomic_add, (np.zeros(3, np.complex128), 0, 1.0),
+             "only supports arrays of integers and floats"),
+            (atomic_add, (np.zeros((2, 2)), 0, 1.0),
+             "1 indices given for an array of 2 dimensions"),
+            (atomic_max, (np.zeros(3), 1.5, 1.0),
+             "the index must be an integer or a tuple of integers"),
+            (atomic_min, (np.zeros(3), 0, (1, 2)),
+             "needs numeric values"),
+            (atomic_cas, (np.zeros(3), 0, 0.0, 1.0),
+             "atomic.cas() only supports arrays of integers"),
+        ]
+        for pyfunc, args, msg in cases:
+            with self.assertRaises(TypingError) as raises:
+                njit(pyfunc)(*args)
+            self.assertIn(msg, str(raises.exception))
+        a = np.zeros(3)
+        a.setflags(write=False)
+        with self.assertRaises(TypingError) as raises:
+            njit(atomic_add)(a, 0, 1.0)
+        self.assertIn("cannot update a read-only array",
+                      str(raises.exception))
+
+
+@skip_parfors_unsupported
+class TestAtomicsPrange(TestCase):
+
+    def test_add(self):
+        idx = np.arange(100000) % 13
+        expected = np.bincount(idx)
+        got = njit(parallel=True)(histogram)(idx, 13)
+        self.assertPreciseEqual(got, expected)
+        weights = np.arange(100000.0)
+        expected = np.bincount(idx, weights)
+        got = njit(parallel=True)(weighted_histogram)(idx, weights, 13)
+        self.assertPreciseEqual(got, expected)
+
+    def test_max_min(self):
+        idx = np.arange(100000) % 13
+        vals = np.sin(np.arange(100000.0))
+        lo, hi = njit(parallel=True)(bin_extremes)(idx, vals, 13)
+        for k in range(13):
+            self.assertEqual(lo[k], vals[idx == k].min())
+            self.assertEqual(hi[k], vals[idx == k].max())
+
+    def test_cas(self):
+        claims = np.arange(100000) % 13
+        owners = np.full(13, -1)
+        got = njit(parallel=True)(first_claims)(owners, claims)
+        # each slot is claimed by exactly one of its claimants
+        self.assertPreciseEqual(claims[got], np.arange(13))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -77,6 +77,20 @@ class TestFastMath(unittest.TestCase):
             str(raises.exception),
         )
 
+    def test_jit_reassoc_reductions(self):
+        def foo(arr):
+            return np.sum(arr)
+        fastfoo = njit(fastmath={'reassoc_reductions'})(foo)
+        slowfoo = njit(foo)
+        arr = np.arange(1000.)
+        self.assertEqual(fastfoo(arr), slowfoo(arr))
+        fastllvm = fastfoo.inspect_llvm(fastfoo.signatures[0])
+        slowllvm = slowfoo.inspect_llvm(slowfoo.signatures[0])
+        # Only the reduction may be reassociated
+        self.assertIn('fadd reassoc', fastllvm)
+        self.assertNotIn('fadd fast', fastllvm)
+        self.assertNotIn('fadd reassoc', slowllvm)
+
     def test_vectorize(self):
         def foo(x):
             return x + math.sin(x)
@@ -0,0 +1,201 @@
+"""
+Tests for the np.fft functions in nopython mode.
+"""
+
+import numpy as np
+
+import unittest
+from numba import njit
+from numba.core.errors import TypingError
+from numba.np.numpy_support import numpy_version
+from numba.tests.support import TestCase
+
+
+def fft(a):
+    return np.fft.fft(a)
+
+
+def fft_n(a, n):
+    return np.fft.fft(a, n)
+
+
+def fft_axis(a, n, axis):
+    return np.fft.fft(a, n, axis)
+
+
+def fft_norm(a, norm):
+    return np.fft.fft(a, norm=norm)
+
+
+def ifft(a):
+    return np.fft.ifft(a)
+
+
+def ifft_axis_norm(a, n, axis, norm):
+    return np.fft.ifft(a, n, axis, norm)
+
+
+def rfft(a):
+    return np.fft.rfft(a)
+
+
+def rfft_n(a, n):
+    return np.fft.rfft(a, n)
+
+
+def irfft(a):
+    return np.fft.irfft(a)
+
+
+def irfft_n(a, n):
+    return np.fft.irfft(a, n)
+
+
+def irfft_axis_norm(a, n, axis, norm):
+    return np.fft.irfft(a, n, axis, norm)
+
+
+def fft2(a):
+    return np.fft.fft2(a)
+
+
+def ifft2_axes(a, axes):
+    return np.fft.ifft2(a, axes=axes)
+
+
+def fftn(a):
+    return np.fft.fftn(a)
+
+
+def fftn_s(a, s):
+    return np.fft.fftn(a, s)
+
+
+def fftn_s_axes(a, s, axes):
+    return np.fft.fftn(a, s, axes)
+
+
+def ifftn_norm(a, norm):
+    return np.fft.ifftn(a, norm=norm)
+
+
+# The "backward" and "forward" normalizations appeared in Numpy 1.20
+if numpy_version >= (1, 20):
+    norms = (None, "backward", "ortho", "forward")
+else:
+    norms = (None, "ortho")
+
+
+class TestFFT(TestCase):
+
+    # Powers of two, sizes with small prime factors and sizes with a large
+    # prime factor, which use Bluestein's algorithm
+    sizes = (1, 2, 3, 4, 5, 6, 8, 12, 15, 16, 30, 49, 64, 97, 100, 128, 303,
+             1000)
+
+    def sample(self, shape, dtype):
+        rng = np.random.RandomState(42)
+        if np.issubdtype(dtype, np.complexfloating):
+            a = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+        elif dtype == np.bool_:
+            a = rng.randint(0, 2, size=shape)
+        elif np.issubdtype(dtype, np.integer):
+            a = rng.randint(-100, 100, size=shape)
+        else:
+            a = rng.standard_normal(shape)
+        return np.asarray(a).astype(dtype)
+
+    def check(self, pyfunc, *args):
+        cfunc = njit(pyfunc)
+        expected = pyfunc(*args)
+        got = cfunc(*args)
+        self.assertEqual(got.dtype, expected.dtype)
+        self.assertEqual(got.shape, expected.shape)
+        atol = 1e-12 * max(1.0, np.abs(expected).max(initial=0.0))
+        np.testing.assert_allclose(got, expected, rtol=1e-9, atol=atol)
+
+    def test_fft(self):
+        for n in self.sizes:
+            for dtype in (np.float64, np.complex128):
+                a = self.sample(n, dtype)
+                self.check(fft, a)
+                self.check(ifft, a)
+        for dtype in (np.float32, np.complex64, np.int32, np.bool_):
+            self.check(fft, self.sample(30, dtype))
+            self.check(ifft, self.sample(30, dtype))
+        # Non-contiguous
+        self.check(fft, self.sample(60, np.complex128)[::3])
+
+    def test_fft_n_axis_norm(self):
+        a = self.sample((6, 10, 7), np.complex128)
+        for n in (3, 10, 16, 97):
+            self.check(fft_n, a, n)
+            for axis in (0, 1, -1, -3):
+                self.check(fft_axis, a, n, axis)
+                for norm in (None, "ortho"):
+                    self.check(ifft_axis_norm, a, n, axis, norm)
+        for norm in norms:
+            self.check(fft_norm, a, norm)
+            self.check(ifft_axis_norm, a, None, -1, norm)
+
+    def test_rfft(self):
+        for n in self.sizes:
+            a = self.sample(n, np.float64)
+            self.check(rfft, a)
+            spectrum = np.fft.rfft(a)
+            if n > 1:
+                self.check(irfft, spectrum)
+            self.check(irfft_n, spectrum, n)
+        a = self.sample((5, 12), np.float64)
+        self.check(rfft, a)
+        self.check(rfft, a.T)
+        self.check(rfft, self.sample(12, np.int16))
+        for n in (7, 8, 20):
+            self.check(rfft_n, a, n)
+            self.check(irfft_n, np.fft.rfft(a), n)
+        spectrum = self.sample((4, 6, 5), np.complex128)
+        for axis in (0, 1, 2):
+            for norm in norms:
+                self.check(irfft_axis_norm, spectrum, 9, axis, norm)
+
+    def test_fftn(self):
+        for shape in [(8,), (6, 10), (3, 4, 5), (7, 97)]:
+            a = self.sample(shape, np.complex128)
+            self.check(fftn, a)
+            self.check(ifftn_norm, a, "ortho")
+            if len(shape) >= 2:
+                self.check(fft2, a)
+        a = self.sample((4, 6, 5), np.float64)
+        self.check(fft2, a)
+        self.check(ifft2_axes, a, (0, 2))
+        self.check(fftn_s, a, (3, 8))
+        self.check(fftn_s_axes, a, (5, 2), (0, -1))
+        self.check(fftn_s_axes, a, (3, 4, 7), (2, 0, 1))
+
+    def test_errors(self):
+        cfunc = njit(fft_n)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.ones(4), 0)
+        self.assertIn("Invalid number of FFT data points",
+                      str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            njit(fft_axis)(np.ones(4), 4, 1)
+        self.assertIn("axis out of bounds", str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            njit(fft_norm)(np.ones(4), "bogus")
+        self.assertIn("Invalid norm value", str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            njit(fftn_s_axes)(np.ones((4, 4)), (4, 4), (0,))
+        self.assertIn("Shape and axes have different lengths",
+                      str(raises.exception))
+        with self.assertRaises(TypingError) as raises:
+            njit(rfft)(np.ones(4, np.complex128))
+        self.assertIn("np.fft.rfft() not supported on complex128 arrays",
+                      str(raises.exception))
+        with self.assertRaises(TypingError) as raises:
+            njit(fft)(np.float64(1.0))
+        self.assertIn("requires an array", str(raises.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -28,6 +28,22 @@ def vdot(a, b):
     return np.vdot(a, b)
 
 
+def np_matmul(a, b):
+    return np.matmul(a, b)
+
+
+def tensordot2(a, b):
+    return np.tensordot(a, b)
+
+
+def tensordot3(a, b, axes):
+    return np.tensordot(a, b, axes)
+
+
+def tensordot_axes1(a, b):
+    return np.tensordot(a, b, 1)
+
+
 class TestProduct(TestCase):
     """
     Tests for dot products.
@@ -119,7 +135,7 @@ class TestProduct(TestCase):
                       % (func_name,),
                       str(raises.exception))
 
-    def check_dot_vv(self, pyfunc, func_name):
+    def check_dot_vv(self, pyfunc, func_name, mixed_dtypes=True):
         n = 3
         cfunc = jit(nopython=True)(pyfunc)
         for dtype in self.dtypes:
@@ -136,7 +152,11 @@ class TestProduct(TestCase):
         # Mismatching dtypes
         a = self.sample_vector(n, np.float32)
         b = self.sample_vector(n, np.float64)
-        self.assert_mismatching_dtypes(cfunc, (a, b), func_name=func_name)
+        if mixed_dtypes:
+            self.check_func(pyfunc, cfunc, (a, b))
+        else:
+            self.assert_mismatching_dtypes(cfunc, (a, b),
+                                           func_name=func_name)
 
     @needs_blas
     def test_dot_vv(self):
@@ -150,7 +170,7 @@ class TestProduct(TestCase):
         """
         Test np.vdot()
         """
-        self.check_dot_vv(vdot, "np.vdot()")
+        self.check_dot_vv(vdot, "np.vdot()", mixed_dtypes=False)
 
     def check_dot_vm(self, pyfunc2, pyfunc3, func_name):
         m, n = 2, 3
@@ -196,7 +216,8 @@ class TestProduct(TestCase):
         # Mismatching dtypes
         a = self.sample_matrix(m, n, np.float32)
         b = self.sample_vector(n, np.float64)
-        self.assert_mismatching_dtypes(cfunc2, (a, b), func_name)
+        self.check_func(pyfunc2, cfunc2, (a, b))
+        self.check_func(pyfunc2, cfunc2, (b, a.T))
         if pyfunc3 is not None:
             a = self.sample_matrix(m, n, np.float64)
             b = self.sample_vector(n, np.float64)
@@ -260,7 +281,7 @@ class TestProduct(TestCase):
         # Mismatching dtypes
         a = self.sample_matrix(m, k, np.float32)
         b = self.sample_matrix(k, n, np.float64)
-        self.assert_mismatching_dtypes(cfunc2, (a, b), func_name)
+        self.check_func(pyfunc2, cfunc2, (a, b))
         if pyfunc3 is not None:
             a = self.sample_matrix(m, k, np.float64)
             b = self.sample_matrix(k, n, np.float64)
@@ -295,6 +316,195 @@ class TestProduct(TestCase):
         """
         self.check_dot_mm(matmul_usecase, None, "'@'")
 
+    def sample_array(self, shape, dtype):
+        return self.sample_vector(int(np.prod(shape)), dtype).reshape(shape)
+
+    @needs_blas
+    def test_matmul_stacks(self):
+        """
+        Test stacks of matrices with '@' and np.matmul()
+        """
+        shapes = [((4, 2, 3), (4, 3, 5)),
+                  ((4, 2, 3), (3, 5)),
+                  ((2, 3), (4, 3, 5)),
+                  ((2, 1, 2, 3), (4, 3, 5)),
+                  ((4, 2, 3), (3,)),
+                  ((3,), (2, 2, 3, 5)),
+                  ((0, 2, 3), (3, 4)),
+                  ((4, 2, 0), (4, 0, 5))]
+        for pyfunc in (matmul_usecase, np_matmul):
+            cfunc = jit(nopython=True)(pyfunc)
+            for dtype in self.dtypes:
+                for ashape, bshape in shapes:
+                    a = self.sample_array(ashape, dtype)
+                    b = self.sample_array(bshape, dtype)
+                    self.check_func(pyfunc, cfunc, (a, b))
+                # Non-contiguous
+                a = self.sample_array((3, 4, 5), dtype)
+                self.check_func(pyfunc, cfunc,
+                                (a[:, ::2], a.transpose(0, 2, 1)))
+
+            # Mismatching sizes
+            a = self.sample_array((2, 3, 4), np.float64)
+            with self.assertRaises(ValueError) as raises:
+                cfunc(a, self.sample_array((2, 3, 4), np.float64))
+            self.assertIn("mismatch in the core dimension",
+                          str(raises.exception))
+            with self.assertRaises(ValueError) as raises:
+                cfunc(a, self.sample_array((3, 4, 2), np.float64))
+            self.assertIn("could not be broadcast", str(raises.exception))
+
+    def sample_int_array(self, shape, dtype):
+        if dtype == np.bool_:
+            return np.arange(np.prod(shape)).reshape(shape) % 3 == 0
+        info = np.iinfo(dtype)
+        rng = np.random.RandomState(42)
+        return rng.randint(max(info.min, -100), min(info.max, 100),
+                           size=shape).astype(dtype)
+
+    def test_dot_integer(self):
+        """
+        Test np.dot() and '@' of integer and boolean arrays, which do not
+        use BLAS
+        """
+        dtypes = [(np.int8, np.int8), (np.int16, np.int16),
+                  (np.int32, np.int32), (np.int64, np.int64),
+                  (np.uint8, np.uint8), (np.bool_, np.bool_),
+                  (np.int8, np.int16), (np.uint8, np.int8),
+                  (np.int32, np.bool_)]
+        # Sizes crossing the blocks of the generic matrix product
+        shapes = [((2, 3), (3, 4)),
+                  ((70, 130), (130, 300)),
+                  ((3, 0), (0, 4)),
+                  ((5, 3), (3,)),
+                  ((3,), (3, 5)),
+                  ((200,), (200,))]
+        for pyfunc in (dot2, matmul_usecase):
+            cfunc = jit(nopython=True)(pyfunc)
+            for adtype, bdtype in dtypes:
+                for ashape, bshape in shapes:
+                    a = self.sample_int_array(ashape, adtype)
+                    b = self.sample_int_array(bshape, bdtype)
+                    self.check_func(pyfunc, cfunc, (a, b))
+                # Non-contiguous
+                a = self.sample_int_array((6, 8), adtype)
+                b = self.sample_int_array((8, 4), bdtype)
+                self.check_func(pyfunc, cfunc, (a[::2].T, b[:, ::-1].T))
+
+            # Mismatching sizes
+            a = self.sample_int_array((2, 3), np.int32)
+            b = self.sample_int_array((4, 2), np.int32)
+            self.assert_mismatching_sizes(cfunc, (a, b))
+
+    @needs_blas
+    def test_dot_mixed(self):
+        """
+        Test np.dot() of integer and float arrays
+        """
+        cfunc = jit(nopython=True)(dot2)
+        a = self.sample_int_array((4, 5), np.int8)
+        b = self.sample_matrix(5, 3, np.float32)
+        self.check_func(dot2, cfunc, (a, b))
+        self.check_func(dot2, cfunc, (b.T, a.T))
+        self.check_func(dot2, cfunc, (a, b[:, 0].astype(np.complex128)))
+
+    def test_matmul_stacks_integer(self):
+        """
+        Test stacks of integer matrices with np.matmul()
+        """
+        cfunc = jit(nopython=True)(np_matmul)
+        for adtype, bdtype in [(np.int16, np.int16), (np.int8, np.int64)]:
+            for ashape, bshape in [((4, 2, 3), (4, 3, 5)),
+                                   ((2, 1, 2, 3), (4, 3, 5)),
+                                   ((4, 2, 0), (4, 0, 5))]:
+                a = self.sample_int_array(ashape, adtype)
+                b = self.sample_int_array(bshape, bdtype)
+                self.check_func(np_matmul, cfunc, (a, b))
+
+    @needs_blas
+    def test_tensordot(self):
+        """
+        Test np.tensordot()
+        """
+        cfunc2 = jit(nopython=True)(tensordot2)
+        cfunc3 = jit(nopython=True)(tensordot3)
+        cfunc_axes1 = jit(nopython=True)(tensordot_axes1)
+        for dtype in self.dtypes + (np.int64,):
+            a = self.sample_array((3, 4, 5), dtype)
+            b = self.sample_array((4, 5, 2), dtype)
+            self.check_func(tensordot2, cfunc2, (a, b))
+            self.check_func(tensordot_axes1, cfunc_axes1,
+                            (a, self.sample_array((5, 2), dtype)))
+            for axes in [((1, 2), (0, 1)), ((2, 1), (1, 0)), (1, 0),
+                         ((-1,), (1,))]:
+                b = self.sample_array((4, 5, 5), dtype)
+                self.check_func(tensordot3, cfunc3, (a, b, axes))
+            # Non-contiguous
+            self.check_func(tensordot2, cfunc2,
+                            (a.T, self.sample_array((4, 3, 2), dtype)))
+
+        a = self.sample_array((3, 4), np.float64)
+        with self.assertRaises(ValueError) as raises:
+            cfunc3(a, a, ((0,), (1,)))
+        self.assertIn("shape-mismatch for sum", str(raises.exception))
+
+    @needs_blas
+    def test_einsum(self):
+        """
+        Test np.einsum()
+        """
+        cases = [
+            ('ij,jk->ik', [(2, 3), (3, 4)]),
+            ('ij,jk', [(2, 3), (3, 4)]),
+            ('bij,bjk->bik', [(5, 2, 3), (5, 3, 4)]),
+            ('ijk,jil->kl', [(2, 3, 4), (3, 2, 5)]),
+            ('ij,jk,kl->il', [(2, 3), (3, 4), (4, 5)]),
+            ('ij,jk,kl->li', [(2, 3), (3, 4), (4, 5)]),
+            ('i,i', [(5,), (5,)]),
+            ('i,j->ij', [(3,), (4,)]),
+            ('ii', [(4, 4)]),
+            ('ii->i', [(4, 4)]),
+            ('ij->ji', [(3, 4)]),
+            ('ij->', [(3, 4)]),
+            ('ijk->j', [(2, 3, 4)]),
+            ('iij,jk->k', [(3, 3, 4), (4, 2)]),
+            ('ij,k->', [(2, 3), (4,)]),
+            ('ab,bc,cd,de->ae', [(2, 3), (3, 4), (4, 5), (5, 2)]),
+        ]
+        for subscripts, shapes in cases:
+            ns = {'np': np}
+            nargs = ', '.join('a%d' % i for i in range(len(shapes)))
+            exec("def pyfunc(%s):\n"
+                 "    return np.einsum(%r, %s)" % (nargs, subscripts, nargs),
+                 ns)
+            pyfunc = ns['pyfunc']
+            cfunc = jit(nopython=True)(pyfunc)
+            def check(args):
+                expected = pyfunc(*args)
+                if isinstance(expected, np.ndarray):
+                    # Numpy may return views of the operands
+                    expected = np.ascontiguousarray(expected)
+                got = cfunc(*args)
+                self.assertPreciseEqual(got, expected, prec='double',
+                                        ignore_sign_on_zero=True)
+
+            for dtype in self.dtypes + (np.int64,):
+                check([self.sample_array(shape, dtype) for shape in shapes])
+            # Mixed dtypes
+            check([self.sample_array(shape, np.float64 if i else np.int32)
+                   for i, shape in enumerate(shapes)])
+
+        cfunc = jit(nopython=True)(lambda a, b: np.einsum('ij,jk->ik', a, b))
+        a = self.sample_array((2, 3), np.float64)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(a, a)
+        self.assertIn("could not be broadcast", str(raises.exception))
+        cfunc = jit(nopython=True)(lambda a: np.einsum('ij,jk->ik', a))
+        with self.assertRaises(errors.TypingError) as raises:
+            cfunc(a)
+        self.assertIn("1 operands given but the subscripts describe 2",
+                      str(raises.exception))
+
     @needs_blas
     def test_contiguity_warnings(self):
         m, k, n = 2, 3, 4
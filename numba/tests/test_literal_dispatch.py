@@ -29,6 +29,7 @@ class TestLiteralDispatch(TestCase):
     def test_literal_basic(self):
         self.check_literal_basic([123, 321])
         self.check_literal_basic(["abc", "cb123"])
+        self.check_literal_basic([True, False])
 
     def test_literal_nested(self):
         @njit
@@ -69,6 +69,10 @@ def bincount2(a, w):
     return np.bincount(a, weights=w)
 
 
+def bincount3(a, w, minlength):
+    return np.bincount(a, w, minlength)
+
+
 def searchsorted(a, v):
     return np.searchsorted(a, v)
 
@@ -89,6 +93,30 @@ def histogram(*args):
     return np.histogram(*args)
 
 
+def histogram_weights(a, bins, weights):
+    return np.histogram(a, bins, weights=weights)
+
+
+def histogram_density(a, bins, range, weights):
+    return np.histogram(a, bins, range, weights=weights, density=True)
+
+
+def histogram2d(*args):
+    return np.histogram2d(*args)
+
+
+def histogram2d_density(x, y, bins, weights):
+    return np.histogram2d(x, y, bins, weights=weights, density=True)
+
+
+def histogramdd(*args):
+    return np.histogramdd(*args)
+
+
+def histogramdd_density(sample, bins, range):
+    return np.histogramdd(sample, bins, range, density=True)
+
+
 def machar(*args):
     return np.MachAr()
 
@@ -217,6 +245,10 @@ def partition(a, kth):
     return np.partition(a, kth)
 
 
+def argpartition(a, kth):
+    return np.argpartition(a, kth)
+
+
 def cov(m, y=None, rowvar=True, bias=False, ddof=None):
     return np.cov(m, y, rowvar, bias, ddof)
 
@@ -749,6 +781,25 @@ class TestNPFunctions(MemoryLeakMixin, TestCase):
         self.assertIn("weights and list don't have the same length",
                       str(raises.exception))
 
+    def test_bincount3(self):
+        pyfunc = bincount3
+        cfunc = jit(nopython=True)(pyfunc)
+        for seq in self.bincount_sequences():
+            for minlength in (0, 3, 150):
+                for weights in (None, np.sqrt(seq)):
+                    expected = pyfunc(seq, weights, minlength)
+                    got = cfunc(seq, weights, minlength)
+                    self.assertPreciseEqual(expected, got)
+
+        # Large enough to be counted in chunks
+        a = self.rnd.randint(0, 1000, size=100000)
+        self.assertPreciseEqual(pyfunc(a, None, 0), cfunc(a, None, 0))
+
+        self.disable_leak_check()
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.arange(3), None, -1)
+        self.assertIn("minlength must be non-negative", str(raises.exception))
+
     def test_searchsorted(self):
         pyfunc = searchsorted
         cfunc = jit(nopython=True)(pyfunc)
@@ -888,6 +939,120 @@ class TestNPFunctions(MemoryLeakMixin, TestCase):
 
         check_values(values)
 
+    def test_histogram_weights_density(self):
+        values = self.rnd.standard_normal(1000)
+        weights = self.rnd.random_sample(1000)
+        bins = np.float64([-2, -0.5, 0, 0.1, 1, 3])
+
+        cfunc = jit(nopython=True)(histogram_weights)
+        for b in (bins, 15):
+            for w in (weights, (weights * 10).astype(np.int64)):
+                expected = histogram_weights(values, b, w)
+                got = cfunc(values, b, w)
+                # Numpy sums the weights in another order for explicit bins
+                self.assertEqual(expected[0].dtype, got[0].dtype)
+                np.testing.assert_allclose(got[0], expected[0], rtol=1e-12)
+                self.assertPreciseEqual(expected[1], got[1], prec='double',
+                                        ulps=2)
+            got = cfunc(values.reshape((20, 50)), b,
+                        weights.reshape((20, 50)))
+            np.testing.assert_allclose(got[0], histogram_weights(values, b,
+                                                                 weights)[0])
+
+        cfunc = jit(nopython=True)(histogram_density)
+        for b, r in ((bins, None), (15, None), (8, (-1.0, 1.0))):
+            expected = histogram_density(values, b, r, weights)
+            got = cfunc(values, b, r, weights)
+            np.testing.assert_allclose(got[0], expected[0], rtol=1e-12)
+            np.testing.assert_allclose(got[1], expected[1], rtol=1e-12)
+
+        # Large enough to be binned in chunks
+        values = self.rnd.standard_normal(100000)
+        cfunc = jit(nopython=True)(histogram)
+        self.assertPreciseEqual(histogram(values, 100)[0],
+                                cfunc(values, 100)[0])
+
+        self.disable_leak_check()
+        cfunc = jit(nopython=True)(histogram_weights)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(values, 10, np.ones(10))
+        self.assertIn("weights should have the same shape as a",
+                      str(raises.exception))
+
+    def check_histogramdd(self, pyfunc, *args):
+        cfunc = jit(nopython=True)(pyfunc)
+        expected = pyfunc(*args)
+        got = cfunc(*args)
+        np.testing.assert_allclose(got[0], expected[0], rtol=1e-12)
+        if pyfunc in (histogramdd, histogramdd_density):
+            # Numpy returns a list of edges, Numba a tuple
+            self.assertEqual(len(got[1]), len(expected[1]))
+            got, expected = got[1], expected[1]
+        else:
+            got, expected = got[1:], expected[1:]
+        for got_edges, expected_edges in zip(got, expected):
+            np.testing.assert_allclose(got_edges, expected_edges, rtol=1e-12)
+
+    def test_histogram2d(self):
+        x = self.rnd.standard_normal(500)
+        y = self.rnd.standard_normal(500) * 2.0
+        weights = self.rnd.random_sample(500)
+        edges = np.float64([-3, -1, 0, 0.5, 4])
+        for bins in (10, (5, 7), edges, (edges, edges[:3]), (4, edges)):
+            self.check_histogramdd(histogram2d, x, y, bins)
+            self.check_histogramdd(histogram2d_density, x, y, bins,
+                                   weights)
+        self.check_histogramdd(histogram2d, x, y.astype(np.float32), 8,
+                               ((-1, 1), (0, 3)))
+        self.check_histogramdd(histogram2d, x, y, 8, ((-1, 1), (0, 3)),
+                               None, weights)
+        self.check_histogramdd(histogram2d, np.zeros(0), np.zeros(0), 3)
+        # a pair gives the number of bins of each dimension, other 1-D
+        # arrays the edges along both, and the rows of a 2-D array the
+        # edges of each dimension
+        for bins in (np.array([5, 7]), np.array([-2, 0, 3]),
+                     np.vstack((edges, edges * 2))):
+            self.check_histogramdd(histogram2d, x, y, bins)
+
+        cfunc = jit(nopython=True)(histogram2d)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(x, y, np.float64([5, 7]))
+        self.assertIn("should be an integer", str(raises.exception))
+
+    def test_histogramdd(self):
+        sample = self.rnd.standard_normal((1000, 3))
+        edges = np.float64([-3, -1, 0, 0.5, 4])
+        for bins in ((4, 5, 6), (edges, 3, edges)):
+            self.check_histogramdd(histogramdd, sample, bins)
+            self.check_histogramdd(histogramdd,
+                                   (sample[:, 0], sample[:, 1]), bins[:2])
+        self.check_histogramdd(histogramdd, (sample[:, 0], sample[:, 1]), 6)
+        self.check_histogramdd(histogramdd,
+                               (sample[:, 0], sample[:, 1].astype(np.int64)),
+                               6)
+        self.check_histogramdd(histogramdd_density, sample, 4,
+                               ((-1, 1), (-2, 2), (0, 3)))
+        self.check_histogramdd(histogramdd, sample[:, :1], (4,),
+                               ((1, 1),))
+        # an array gives the bins of each dimension, like a sequence
+        xy = (sample[:, 0], sample[:, 1])
+        self.check_histogramdd(histogramdd, xy, np.array([3, 5]))
+        self.check_histogramdd(histogramdd, xy, np.vstack((edges, edges)))
+
+        cfunc = jit(nopython=True)(histogramdd)
+        with self.assertTypingError() as raises:
+            cfunc(sample, 5)
+        self.assertIn("must be given by a tuple of bins or ranges",
+                      str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            cfunc(xy, np.array([3, 4, 5]))
+        self.assertIn("the dimension of bins must be equal",
+                      str(raises.exception))
+        with self.assertTypingError() as raises:
+            cfunc(xy, np.float64([3, 5]))
+        self.assertIn("bins should be an integer or a sequence",
+                      str(raises.exception))
+
     def _test_correlate_convolve(self, pyfunc):
         cfunc = jit(nopython=True)(pyfunc)
         # only 1d arrays are accepted, test varying lengths
@@ -1710,6 +1875,44 @@ class TestNPFunctions(MemoryLeakMixin, TestCase):
             for kth in True, False, -1, 0, 1:
                 self.partition_sanity_check(pyfunc, cfunc, d, kth)
 
+    def test_argpartition(self):
+        pyfunc = argpartition
+        cfunc = jit(nopython=True)(pyfunc)
+
+        def check(a, kth):
+            got = cfunc(a, kth)
+            self.assertEqual(got.shape, np.shape(a))
+            # The indices partition the values like np.partition() does
+            expected = np.partition(a, kth)
+            values = np.take_along_axis(np.asarray(a), got, axis=-1)
+            kths = np.atleast_1d(kth)
+            self.assertPreciseEqual(values[..., kths], expected[..., kths])
+            for s in np.ndindex(got.shape[:-1]):
+                self.assertPreciseEqual(np.sort(got[s]),
+                                        np.arange(got.shape[-1]))
+
+        d = np.arange(40) % 7
+        self.rnd.shuffle(d)
+        for kth in (0, 5, -1, (3, 20), [1, 2, 39]):
+            check(d, kth)
+            check(d.tolist(), kth)
+
+        a = np.linspace(1, 10, 48)
+        a[4:7] = np.nan
+        a[8] = -np.inf
+        a = a.reshape((4, 3, 4))
+        for arr in (a, a.T, np.asfortranarray(a)):
+            for k in range(-3, 3):
+                check(arr, k)
+
+        self.assertEqual(cfunc(np.array([]), 0).shape, (0,))
+
+        # Exceptions leak references
+        self.disable_leak_check()
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.arange(10), 10)
+        self.assertIn("kth out of bounds", str(raises.exception))
+
     @needs_blas
     def test_cov_invalid_ddof(self):
         pyfunc = cov
@@ -6,7 +6,7 @@ import re
 
 import numpy as np
 
-from numba import njit
+from numba import njit, typed
 from numba.core import typing, types
 from numba.core.compiler import compile_isolated, Flags
 from numba.core.runtime import (
@@ -482,6 +482,80 @@ br i1 %.294, label %B42, label %B160
         # no other lines
         self.assertEqual(len(list(pruned_lines.splitlines())), len(combined))
 
+    def test_refct_pruning_across_blocks(self):
+        input_ir = nrtopt._remove_redundant_nrt_refct(self.sample_llvm_ir)
+        output_ir, removed = nrtopt._prune_refct_across_blocks(input_ir)
+        # the increfs in the entry block are matched by the decrefs in the
+        # only exit block, B160
+        self.assertEqual(removed, 6)
+        self.assertNotIn('NRT_incref', output_ir)
+        self.assertNotIn('NRT_decref', output_ir)
+
+    def test_refct_pruning_across_blocks_unsafe(self):
+        template = '''
+define i32 @"MyFunction"(i8* %arg.x, i1 %arg.c) {{
+entry:
+  tail call void @NRT_incref(i8* %arg.x)
+  br i1 %arg.c, label %B1, label %B2
+
+B1:
+  {}
+  br label %B2
+
+B2:
+  tail call void @NRT_decref(i8* %arg.x)
+  ret i32 0
+}}
+'''
+
+        def prune(stmt):
+            return nrtopt._prune_refct_across_blocks(template.format(stmt))
+
+        # no intervening call, the pair is removed
+        output_ir, removed = prune('%.1 = add i32 1, 2')
+        self.assertEqual(removed, 2)
+        self.assertNotIn('NRT_', output_ir)
+        # an opaque call may decref an alias, the pair is kept
+        output_ir, removed = prune('call void @foo(i8* %arg.x)')
+        self.assertEqual(removed, 0)
+        # so may an explicit decref
+        output_ir, removed = prune('tail call void @NRT_decref(i8* %arg.y)')
+        self.assertEqual(removed, 0)
+
+    def test_refct_pruning_across_blocks_loop(self):
+        input_ir = '''
+define i32 @"MyFunction"(i8* %arg.x, i1 %arg.c) {
+entry:
+  br label %B1
+
+B1:
+  tail call void @NRT_incref(i8* %arg.x)
+  br i1 %arg.c, label %B1, label %B2
+
+B2:
+  tail call void @NRT_decref(i8* %arg.x)
+  ret i32 0
+}
+'''
+        # the incref is re-entered without the decref, the pair is kept
+        output_ir, removed = nrtopt._prune_refct_across_blocks(input_ir)
+        self.assertEqual(removed, 0)
+        self.assertIn('NRT_incref', output_ir)
+
+    def test_refprune_stats(self):
+        @njit
+        def foo(arr):
+            acc = 0.
+            for i in range(arr.size):
+                acc += arr[i]
+            return acc
+
+        nrtopt.reset_refprune_stats()
+        foo(np.arange(10.))
+        stats = nrtopt.get_refprune_stats()
+        self.assertGreater(stats.total, 0)
+        self.assertEqual(stats.total, stats.basicblock + stats.diamond)
+
     @unittest.skip("Pass removed as it was buggy. Re-enable when fixed.")
     def test_refct_pruning_with_branches(self):
         '''testcase from #2350'''
@@ -550,6 +624,70 @@ br i1 %.294, label %B42, label %B160
         self.assertEqual(foo(10), 22) # expect (10 + 1) * 2 = 22
 
 
+class TestThreadLocalRefct(MemoryLeakMixin, TestCase):
+    """
+    Test the use of non-atomic refcount operations on objects that never
+    leave the current thread.
+    """
+
+    def get_refct_calls(self, cfunc):
+        llvmir = cfunc.inspect_llvm(cfunc.signatures[0])
+        return set(re.findall(r'call void @(NRT_(?:in|de)cref\w*)\(', llvmir))
+
+    def test_local_temporary(self):
+        @njit
+        def foo(n):
+            acc = 0.
+            for i in range(n):
+                tmp = np.ones(3)
+                acc += tmp.sum()
+            return acc
+
+        self.assertPreciseEqual(foo(10), 30.)
+        self.assertIn('NRT_decref_local', self.get_refct_calls(foo))
+
+    def test_local_alias(self):
+        @njit
+        def foo(n):
+            acc = 0.
+            for i in range(n):
+                tmp = np.ones(3)
+                view = tmp[1:]
+                acc += view.sum()
+            return acc
+
+        self.assertPreciseEqual(foo(10), 20.)
+        self.assertIn('NRT_decref_local', self.get_refct_calls(foo))
+
+    def test_escaping_objects(self):
+        @njit
+        def returned(n):
+            a = np.ones(n)
+            b = a[1:]
+            return b
+
+        @njit
+        def stored(lst, n):
+            a = np.ones(n)
+            lst.append(a)
+
+        @njit
+        def argument(arr):
+            b = arr[1:]
+            return b.sum()
+
+        self.assertPreciseEqual(returned(3), np.ones(2))
+        self.assertNotIn('NRT_decref_local', self.get_refct_calls(returned))
+
+        lst = typed.List()
+        lst.append(np.zeros(1))
+        stored(lst, 3)
+        self.assertNotIn('NRT_decref_local', self.get_refct_calls(stored))
+
+        self.assertPreciseEqual(argument(np.ones(3)), 2.)
+        self.assertNotIn('NRT_decref_local', self.get_refct_calls(argument))
+
+
 @unittest.skipUnless(cffi_support.SUPPORTED, "cffi required")
 class TestNrtExternalCFFI(MemoryLeakMixin, TestCase):
     """Testing the use of externally compiled C code that use NRT
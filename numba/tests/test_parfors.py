@@ -50,6 +50,26 @@ _GLOBAL_INT_FOR_TESTING2 = 5
 
 TestNamedTuple = namedtuple('TestNamedTuple', ('part0', 'part1'))
 
+def _argmin_combine(a, b):
+    # the minimum value and its first index
+    if b[0] < a[0] or (b[0] == a[0] and b[1] < a[1]):
+        return b
+    return a
+
+argmin_reduction = numba.reduction((np.inf, -1), _argmin_combine)
+
+def _welford_combine(a, b):
+    # count, mean and sum of squared deviations of two samples
+    n = a[0] + b[0]
+    if n == 0:
+        return a
+    delta = b[1] - a[1]
+    mean = a[1] + delta * b[0] / n
+    m2 = a[2] + b[2] + delta * delta * a[0] * b[0] / n
+    return (n, mean, m2)
+
+welford_reduction = numba.reduction((0, 0.0, 0.0), _welford_combine)
+
 class TestParforsBase(TestCase):
     """
     Base class for testing parfors.
@@ -558,6 +578,22 @@ class TestParfors(TestParforsBase):
             self.assertTrue(countParfors(test_impl, (types.int64, )) == 1)
             self.assertTrue(countArrays(test_impl, (types.intp,)) == 0)
 
+    @skip_parfors_unsupported
+    def test_fuse_map_reduce(self):
+        # the array expression and the reduction run in a single loop,
+        # without allocating the intermediate array
+        for op in [np.sum, np.prod, np.min, np.max, np.argmin, np.argmax,
+                   np.any, np.all, np.mean]:
+            def test_impl(a, b):
+                return op(a * b + 1.)
+            for shape in [(40,), (8, 5)]:
+                a = np.random.ranf(shape)
+                b = np.random.ranf(shape)
+                self.check(test_impl, a, b)
+                argtys = (numba.typeof(a), numba.typeof(b))
+                self.assertEqual(countParfors(test_impl, argtys), 1)
+                self.assertEqual(countArrayAllocs(test_impl, argtys), 0)
+
     @skip_parfors_unsupported
     def test_blackscholes(self):
         # blackscholes takes 5 1D float array args
@@ -1523,6 +1559,107 @@ class TestParfors(TestParforsBase):
         self.check(test_impl, x)
         self.assertTrue(countParfors(test_impl, (types.Array(types.float64, 2, 'C'),)) == 1)
 
+    @skip_parfors_unsupported
+    def test_np_sort(self):
+        def test_impl(a):
+            return np.sort(a), np.argsort(a)
+        np.random.seed(0)
+        # distinct values, so that the argsort is unambiguous
+        a = np.random.permutation(200000).astype(np.float64)
+        self.check(test_impl, a, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    def test_np_sort_axis(self):
+        def test_impl(a):
+            return np.sort(a), np.sort(a, 0), np.sort(a, None)
+        np.random.seed(0)
+        a = np.random.random((300, 200))
+        self.check(test_impl, a, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    @needs_blas
+    def test_matmul_stacks(self):
+        def test_impl(a, b):
+            return a @ b, np.matmul(a, b[0])
+        np.random.seed(0)
+        a = np.random.random((20, 30, 40))
+        b = np.random.random((20, 40, 10))
+        self.check(test_impl, a, b, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    def test_dot_integer(self):
+        def test_impl(a, b, v):
+            return a @ b, np.dot(a, v), np.dot(b.T, v), np.dot(v, a.T), v @ v
+        np.random.seed(0)
+        a = np.random.randint(-100, 100, size=(150, 300)).astype(np.int8)
+        b = np.random.randint(-100, 100, size=(300, 70)).astype(np.int16)
+        v = np.random.randint(-100, 100, size=300).astype(np.int32)
+        self.check(test_impl, a, b, v, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    def test_fft(self):
+        def test_impl(a):
+            return (np.fft.fft(a), np.fft.ifft(a, axis=0),
+                    np.fft.irfft(np.fft.rfft(a)), np.fft.fft2(a, norm="ortho"))
+        np.random.seed(0)
+        a = np.random.random((200, 97))
+        self.check(test_impl, a, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    def test_unique(self):
+        def test_impl(a, b):
+            return (np.unique(a, return_index=True, return_inverse=True,
+                              return_counts=True),
+                    np.unique(b, return_counts=True))
+        np.random.seed(0)
+        a = np.random.randint(-1000, 1000, size=200000)
+        b = np.random.randint(0, 50, size=1000) / 8.0
+        self.check(test_impl, a, b, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    def test_histogram(self):
+        def test_impl(a, b, w):
+            return (np.histogram(a, 50, weights=w),
+                    np.histogram(a, np.linspace(-2, 2, 7), density=True),
+                    np.histogram2d(a, b, (20, 30)),
+                    np.histogramdd((a, b, w), (4, 5, 6))[0],
+                    np.bincount(np.abs(b * 10).astype(np.intp), weights=w))
+        np.random.seed(0)
+        a = np.random.standard_normal(100000)
+        b = np.random.standard_normal(100000)
+        w = np.random.random(100000)
+        self.check(test_impl, a, b, w, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    def test_ufunc_reduce(self):
+        def test_impl(a, b):
+            return (np.add.reduce(a), np.maximum.reduce(a, axis=1),
+                    np.multiply.reduce(b, (0, 2), keepdims=True),
+                    np.minimum.reduce(a.ravel(), initial=0.5))
+        np.random.seed(0)
+        a = np.random.random((20, 50000))
+        b = np.random.random((30, 40, 50)) + 0.5
+        self.check(test_impl, a, b, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    def test_reduce_axis(self):
+        def test_impl(a):
+            return (np.sum(a, axis=0), a.mean(axis=1), np.max(a, axis=-1),
+                    np.std(a, 1, keepdims=True), a.argmin(axis=0),
+                    np.any(a > 0.5, axis=(0, 1)), np.prod(a, None))
+        np.random.seed(0)
+        a = np.random.random((30, 40, 50))
+        self.check(test_impl, a, check_scheduling=False)
+
+    @skip_parfors_unsupported
+    def test_ndarray_sort(self):
+        def test_impl(a):
+            a.sort()
+            return a
+        np.random.seed(0)
+        a = np.random.randint(-1000, 1000, size=200000)
+        self.check(test_impl, a, check_scheduling=False)
+
     @skip_parfors_unsupported
     def test_0d_array(self):
         def test_impl(n):
@@ -2534,6 +2671,238 @@ class TestPrange(TestPrangeBase):
         image = np.zeros((3, 3), dtype=np.int32)
         self.prange_tester(test_impl, image, 0, 0)
 
+    def get_parfor_globals(self, pyfunc, argtys):
+        """Return the globals used in the bodies of the parfors of the
+        prange version of *pyfunc*.
+        """
+        pfunc = self.generate_prange_func(pyfunc, None)
+        test_ir, tp = get_optimized_numba_ir(pfunc, argtys)
+        found = set()
+
+        def visit(blocks, in_parfor):
+            for block in blocks.values():
+                for inst in block.body:
+                    if isinstance(inst, numba.parfors.parfor.Parfor):
+                        visit(inst.loop_body, True)
+                    elif (in_parfor and isinstance(inst, ir.Assign) and
+                            isinstance(inst.value, ir.Global)):
+                        found.add(inst.value.value)
+
+        visit(test_ir.blocks, False)
+        return found
+
+    def get_loop_nest_dims(self, pyfunc, argtys):
+        """Return the number of loop nests of each top-level parfor of the
+        prange loops of the prange version of *pyfunc*.
+        """
+        pfunc = self.generate_prange_func(pyfunc, None)
+        test_ir, tp = get_optimized_numba_ir(pfunc, argtys)
+        return [len(stmt.loop_nests) for block in test_ir.blocks.values()
+                for stmt in block.body
+                if isinstance(stmt, numba.parfors.parfor.Parfor)
+                and stmt.patterns[0][0] == 'prange']
+
+    @skip_parfors_unsupported
+    def test_prange_collapse(self):
+        def test_impl1(a):
+            out = np.empty_like(a)
+            for i in range(a.shape[0]):
+                for j in range(a.shape[1]):
+                    out[i, j] = a[i, j] * i + j
+            return out
+
+        def test_impl2(a):
+            out = np.empty_like(a)
+            for i in range(a.shape[0]):
+                s = i * 2 + 1
+                for j in range(a.shape[1]):
+                    out[i, j] = a[i, j] * s
+            return out
+
+        def test_impl3(a):
+            acc = 0.
+            for i in range(a.shape[0]):
+                for j in range(a.shape[1]):
+                    acc += a[i, j] * (i + 1)
+            return acc
+
+        argtys = (types.float64[:, ::1],)
+        a = np.arange(3 * 1000.0).reshape((3, 1000))
+        for impl in (test_impl1, test_impl2, test_impl3):
+            self.assertEqual(self.get_loop_nest_dims(impl, argtys), [2])
+            self.prange_tester(impl, a)
+
+    @skip_parfors_unsupported
+    def test_prange_no_collapse(self):
+        # triangular iteration space
+        def test_impl1(a):
+            out = np.zeros_like(a)
+            for i in range(a.shape[0]):
+                for j in range(i):
+                    out[i, j] = a[i, j]
+            return out
+
+        # work between the loops
+        def test_impl2(a):
+            out = np.zeros(a.shape[0])
+            for i in range(a.shape[0]):
+                tmp = np.empty(a.shape[1])
+                for j in range(a.shape[1]):
+                    tmp[j] = a[i, j] * 2
+                out[i] = tmp.sum()
+            return out
+
+        # array view between the loops, which would be created for each
+        # element of the collapsed loop
+        def test_impl3(a):
+            out = np.empty_like(a)
+            for i in range(a.shape[0]):
+                row = a[i]
+                for j in range(a.shape[1]):
+                    out[i, j] = row[j] + 1
+            return out
+
+        argtys = (types.float64[:, ::1],)
+        a = np.arange(5 * 30.0).reshape((5, 30))
+        for impl in (test_impl1, test_impl2, test_impl3):
+            self.assertEqual(self.get_loop_nest_dims(impl, argtys), [1])
+            self.prange_tester(impl, a)
+
+    @skip_parfors_unsupported
+    def test_prange_scatter_add(self):
+        def test_impl(idx, vals, n):
+            out = np.zeros(n)
+            for i in range(idx.size):
+                out[idx[i]] += vals[i]
+            return out
+
+        argtys = (types.int64[::1], types.float64[::1], types.int64)
+        self.assertIn(numba.parfors.parfor._scatter_add,
+                      self.get_parfor_globals(test_impl, argtys))
+        idx = np.arange(10000) % 7
+        vals = np.arange(10000.0)
+        # few elements: accumulated in per-thread copies of the output
+        self.prange_tester(test_impl, idx, vals, 7)
+        # as many elements as iterations: atomic updates of the output
+        self.prange_tester(test_impl, idx, vals, 10000)
+
+    @skip_parfors_unsupported
+    def test_prange_scatter_add_shared(self):
+        # the output is otherwise used by the loop, so it is updated
+        # atomically in place
+        def test_impl(idx):
+            out = np.zeros((3, 5), np.int64)
+            for i in range(idx.size):
+                out[i % 3, idx[i] % out.shape[1]] += i
+                out[0, 0] = out[0, 0] + 1
+            return out
+
+        found = self.get_parfor_globals(test_impl, (types.int64[::1],))
+        self.assertIn(numba.atomic.add, found)
+        self.assertNotIn(numba.parfors.parfor._scatter_add, found)
+        self.prange_tester(test_impl, np.arange(10000) * 7)
+
+    @skip_parfors_unsupported
+    def test_prange_scatter_add_convert(self):
+        # the added values are converted to the element type
+        def test_impl(idx, vals):
+            out = np.zeros(7, np.float32)
+            counts = np.zeros(7, np.int64)
+            for i in range(idx.size):
+                out[idx[i]] += vals[i]
+                counts[idx[i]] += 0.5
+            return out, counts
+
+        argtys = (types.int64[::1], types.float64[::1])
+        self.assertIn(numba.parfors.parfor._scatter_add,
+                      self.get_parfor_globals(test_impl, argtys))
+        self.prange_tester(test_impl, np.arange(10000) % 7,
+                           np.arange(10000.0) % 3)
+
+    @skip_parfors_unsupported
+    def test_prange_scatter_add_branches(self):
+        # the offset has a constant value in each branch, but it varies
+        # between iterations
+        def test_impl(a):
+            out = np.zeros(a.size + 1)
+            for i in range(a.size):
+                if a[i] > 0.5:
+                    c = 1
+                else:
+                    c = 0
+                out[i + c] += a[i]
+            return out
+
+        self.assertIn(numba.parfors.parfor._scatter_add,
+                      self.get_parfor_globals(test_impl,
+                                              (types.float64[::1],)))
+        self.prange_tester(test_impl, np.arange(1000.0) % 3 / 2)
+
+    @skip_parfors_unsupported
+    def test_prange_scatter_add_nested(self):
+        # the inner index is distinct within the inner parfor, but the
+        # iterations of the outer one update the same elements
+        def test_impl(a):
+            out = np.zeros(a.shape[1])
+            for i in range(a.shape[0]):
+                s = a[i, 0]
+                for j in range(a.shape[1]):
+                    out[j] += a[i, j] + s
+            return out
+
+        found = self.get_parfor_globals(test_impl, (types.float64[:, ::1],))
+        self.assertIn(numba.atomic.add, found)
+        self.prange_tester(test_impl, np.arange(3000.0).reshape(300, 10))
+
+    @skip_parfors_unsupported
+    def test_prange_distinct_updates(self):
+        # the iterations update distinct elements, no atomics are needed
+        def test_impl(a):
+            out = np.zeros((a.size + 1, 2))
+            for i in range(a.size):
+                out[i + 1, 1] += a[i]
+            return out
+
+        found = self.get_parfor_globals(test_impl, (types.float64[::1],))
+        self.assertNotIn(numba.atomic.add, found)
+        self.assertNotIn(numba.parfors.parfor._scatter_add, found)
+        self.prange_tester(test_impl, np.arange(100.0))
+
+    @skip_parfors_unsupported
+    def test_prange_tuple_reduction(self):
+        def test_impl(a):
+            best = (np.inf, -1)
+            for i in range(a.size):
+                best = argmin_reduction(best, (a[i], i))
+            return best
+
+        a = np.cos(np.arange(10000.0))
+        self.prange_tester(test_impl, a)
+        # the value of the variable before the loop takes part in the
+        # reduction
+        def test_impl2(a):
+            best = (-2.0, 7)
+            for i in range(a.size):
+                best = argmin_reduction(best, (a[i], i))
+            return best
+
+        self.prange_tester(test_impl2, a)
+
+    @skip_parfors_unsupported
+    def test_prange_user_reduction(self):
+        def test_impl(a):
+            acc = (0, 0.0, 0.0)
+            for i in range(a.size):
+                acc = welford_reduction(acc, (1, a[i], 0.0))
+            n, mean, m2 = acc
+            return n, mean, m2 / n
+
+        self.prange_tester(test_impl, np.arange(10000.0) % 17)
+        # outside of prange loops, the reduction calls its combine function
+        self.assertEqual(welford_reduction((1, 2.0, 0.0), (1, 4.0, 0.0)),
+                         (2, 3.0, 2.0))
+        self.assertTrue(numba.extending.is_jitted(welford_reduction.combine))
+
 
 @skip_parfors_unsupported
 @x86_only
@@ -3604,6 +3973,15 @@ class TestParforsDiagnostics(TestParforsBase):
         self.check(test_impl,)
         cpfunc = self.compile_parallel(test_impl, ())
         diagnostics = cpfunc.metadata['parfor_diagnostics']
+        # the nested loops are collapsed into one
+        self.assert_diagnostics(diagnostics, parfors_count=1,
+                                fusion_info={2: [1]})
+
+        flags = Flags()
+        flags.set('auto_parallel', cpu.ParallelOptions({'collapse': False}))
+        flags.set('nrt')
+        cpfunc = self._compile_this(test_impl, (), flags)
+        diagnostics = cpfunc.metadata['parfor_diagnostics']
         self.assert_diagnostics(diagnostics, parfors_count=2,
                                 nested_fusion_info={2: [1]})
 
@@ -3635,6 +4013,22 @@ class TestParforsDiagnostics(TestParforsBase):
         diagnostics = cpfunc.metadata['parfor_diagnostics']
         self.assert_diagnostics(diagnostics, parfors_count=2)
 
+    def test_unfused_reduction(self):
+        def test_impl(a):
+            return np.var(a + 1.)
+
+        a = np.arange(10.)
+        self.check(test_impl, a)
+        cpfunc = self.compile_parallel(test_impl, (numba.typeof(a),))
+        diagnostics = cpfunc.metadata['parfor_diagnostics']
+        self.assert_diagnostics(diagnostics, parfors_count=2)
+        # the deviations need the mean, the array expression is therefore
+        # materialized for the second pass
+        msgs = [r.message for r in diagnostics.fusion_reports
+                if r is not None and 'materialized' in r.message]
+        self.assertEqual(len(msgs), 1)
+        self.assertIn("depends on the result of parallel loop", msgs[0])
+
     def test_setitem(self):
         def test_impl():
             n = 10
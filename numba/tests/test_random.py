@@ -942,6 +942,38 @@ class TestRandomArrays(BaseTest):
                 expected = expected.astype(got.dtype)
             self.assertPreciseEqual(expected, got, prec='double', ulps=5)
 
+    def test_numpy_bulk_sizes(self):
+        # Sized draws of these distributions are generated in bulk; check
+        # that sizes spanning several regenerations of the state give
+        # the same values as Numpy.
+        for funcname, scalar_args in [("random", ()),
+                                      ("uniform", (0.1, 0.4)),
+                                      ("standard_normal", ()),
+                                      ("normal", (0.5, 2.0)),
+                                      ("standard_exponential", ()),
+                                      ("exponential", (1.5,))]:
+            cfunc = self._compile_array_dist(funcname, len(scalar_args) + 1)
+            r = self._follow_numpy(get_np_state_ptr())
+            pyfunc = getattr(r, funcname)
+            for size in (1, 7, 1001, (3, 417)):
+                args = scalar_args + (size,)
+                self.assertPreciseEqual(cfunc(*args), pyfunc(*args),
+                                        prec='double', ulps=5)
+
+    def test_numpy_bulk_normal_cached(self):
+        # The value cached by a scalar standard_normal() call is the first
+        # one used by a sized draw, and an odd sized draw leaves one cached
+        cscalar = jit_nullary("np.random.standard_normal")
+        carray = self._compile_array_dist("standard_normal", 1)
+        r = self._follow_numpy(get_np_state_ptr())
+        for size in (4, 5, 1, 6):
+            self.assertPreciseEqual(cscalar(), r.standard_normal(),
+                                    prec='double', ulps=5)
+            self.assertPreciseEqual(carray(size), r.standard_normal(size),
+                                    prec='double', ulps=5)
+        self.assertPreciseEqual(cscalar(), r.standard_normal(),
+                                prec='double', ulps=5)
+
     def test_numpy_randint(self):
         cfunc = self._compile_array_dist("randint", 3)
         low, high = 1000, 10000
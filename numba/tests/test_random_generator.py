@@ -0,0 +1,252 @@
+"""
+Tests for np.random.Generator support in nopython mode.
+"""
+
+import numpy as np
+
+import unittest
+from numba import njit, prange
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.np.numpy_support import numpy_version
+from numba.tests.support import TestCase
+
+
+def generator_random(rng):
+    return rng.random()
+
+
+def generator_random_size(rng, size):
+    return rng.random(size)
+
+
+def generator_standard_normal_size(rng, size):
+    return rng.standard_normal(size)
+
+
+def generator_normal(rng, loc, scale, size):
+    return rng.normal(loc, scale, size)
+
+
+def generator_standard_exponential_size(rng, size):
+    return rng.standard_exponential(size)
+
+
+def generator_exponential(rng, scale, size):
+    return rng.exponential(scale, size)
+
+
+def generator_integers(rng, low, high):
+    return rng.integers(low, high)
+
+
+def generator_integers_size(rng, low, high, size):
+    return rng.integers(low, high, size)
+
+
+def default_rng_random(seed, size):
+    return np.random.default_rng(seed).random(size)
+
+
+def bit_generator_random(seed, size):
+    rng = np.random.Generator(np.random.Philox(seed))
+    return rng.random(size)
+
+
+def make_default_rng(seed):
+    return np.random.default_rng(seed)
+
+
+def jumped_random(bit_generator, jumps, size):
+    return np.random.Generator(bit_generator.jumped(jumps)).random(size)
+
+
+def spawn_random(rng, n_children, size):
+    out = np.empty((n_children, size))
+    children = rng.spawn(n_children)
+    for i in range(n_children):
+        out[i] = children[i].random(size)
+    return out
+
+
+def spawn_random_parallel(rng, n_children, size):
+    out = np.empty((n_children, size))
+    children = rng.spawn(n_children)
+    for i in prange(n_children):
+        out[i] = children[i].random(size)
+    return out
+
+
+@unittest.skipIf(numpy_version < (1, 17), "requires NumPy 1.17 or later")
+class TestGenerator(TestCase):
+
+    bit_generators = ('PCG64', 'Philox')
+
+    def make_generators(self, kind, seed=42):
+        """
+        Return two identical generators.
+        """
+        return [np.random.Generator(getattr(np.random, kind)(seed))
+                for i in range(2)]
+
+    def check_same_state(self, got, expected):
+        # Same future stream, including the buffered 32-bit word
+        self.assertPreciseEqual(got.integers(0, 1000, size=5),
+                                expected.integers(0, 1000, size=5))
+        self.assertPreciseEqual(got.random(10), expected.random(10))
+
+    def test_typeof(self):
+        for kind in self.bit_generators:
+            rng, _ = self.make_generators(kind)
+            ty = types.NumPyRandomGeneratorType(
+                types.NumPyRandomBitGeneratorType(kind))
+            cfunc = njit(generator_random)
+            cfunc(rng)
+            self.assertEqual(cfunc.nopython_signatures[0].args, (ty,))
+
+    def test_random(self):
+        pyfunc = generator_random
+        cfunc = njit(pyfunc)
+        pyfunc_size = generator_random_size
+        cfunc_size = njit(pyfunc_size)
+        for kind in self.bit_generators:
+            got, expected = self.make_generators(kind)
+            for i in range(3):
+                self.assertPreciseEqual(cfunc(got), pyfunc(expected))
+            # Odd sizes exercise the Philox buffer
+            for size in (1, 7, 100, (3, 5)):
+                self.assertPreciseEqual(cfunc_size(got, size),
+                                        pyfunc_size(expected, size))
+            self.check_same_state(got, expected)
+
+    def test_integers(self):
+        pyfunc = generator_integers
+        cfunc = njit(pyfunc)
+        pyfunc_size = generator_integers_size
+        cfunc_size = njit(pyfunc_size)
+        bounds = [(0, 1), (0, 10), (-5, 5), (0, 2**32), (-2**40, 2**40),
+                  (-2**63, 2**63 - 1), (0, 2**32 + 1)]
+        for kind in self.bit_generators:
+            got, expected = self.make_generators(kind)
+            for low, high in bounds:
+                self.assertPreciseEqual(cfunc(got, low, high),
+                                        pyfunc(expected, low, high))
+                self.assertPreciseEqual(cfunc_size(got, low, high, 33),
+                                        pyfunc_size(expected, low, high, 33))
+            self.check_same_state(got, expected)
+
+        rng, _ = self.make_generators('PCG64')
+        with self.assertRaises(ValueError) as raises:
+            cfunc(rng, 5, 5)
+        self.assertIn("low >= high", str(raises.exception))
+
+    def test_normal(self):
+        pyfunc = generator_standard_normal_size
+        cfunc = njit(pyfunc)
+        pyfunc_normal = generator_normal
+        cfunc_normal = njit(pyfunc_normal)
+        for kind in self.bit_generators:
+            got, expected = self.make_generators(kind)
+            self.assertPreciseEqual(cfunc(got, 1000), pyfunc(expected, 1000),
+                                    prec='double')
+            self.assertPreciseEqual(cfunc_normal(got, 2.0, 3.0, (10, 10)),
+                                    pyfunc_normal(expected, 2.0, 3.0,
+                                                  (10, 10)),
+                                    prec='double')
+            self.check_same_state(got, expected)
+
+        rng, _ = self.make_generators('PCG64')
+        with self.assertRaises(ValueError) as raises:
+            cfunc_normal(rng, 0.0, -1.0, 3)
+        self.assertIn("scale < 0", str(raises.exception))
+
+    def test_exponential(self):
+        pyfunc = generator_standard_exponential_size
+        cfunc = njit(pyfunc)
+        pyfunc_exponential = generator_exponential
+        cfunc_exponential = njit(pyfunc_exponential)
+        for kind in self.bit_generators:
+            got, expected = self.make_generators(kind)
+            self.assertPreciseEqual(cfunc(got, 1000), pyfunc(expected, 1000),
+                                    prec='double')
+            self.assertPreciseEqual(cfunc_exponential(got, 2.5, (10, 10)),
+                                    pyfunc_exponential(expected, 2.5,
+                                                       (10, 10)),
+                                    prec='double')
+            self.check_same_state(got, expected)
+
+    def test_create_in_jit(self):
+        cfunc = njit(default_rng_random)
+        for seed in (0, 1, 12345, 2**40 + 3):
+            self.assertPreciseEqual(cfunc(seed, 10),
+                                    default_rng_random(seed, 10))
+        cfunc = njit(bit_generator_random)
+        self.assertPreciseEqual(cfunc(7, 10), bit_generator_random(7, 10))
+
+        with self.assertRaises(ValueError) as raises:
+            njit(default_rng_random)(-1, 10)
+        self.assertIn("expected non-negative integer", str(raises.exception))
+
+        with self.assertRaises(TypingError) as raises:
+            njit(default_rng_random)(1.5, 10)
+        self.assertIn("requires an integer seed", str(raises.exception))
+
+    def test_box(self):
+        cfunc = njit(make_default_rng)
+        got = cfunc(1234)
+        self.assertIsInstance(got, np.random.Generator)
+        self.assertIsInstance(got.bit_generator, np.random.PCG64)
+        expected = make_default_rng(1234)
+        self.check_same_state(got, expected)
+        # The boxed generator can be spawned from like the original
+        self.assertEqual(got.bit_generator._seed_seq.entropy, 1234)
+
+        # Generators passed in are returned as is
+        rng, _ = self.make_generators('Philox')
+        self.assertIs(njit(lambda r: r)(rng), rng)
+
+    def test_jumped(self):
+        cfunc = njit(jumped_random)
+        for kind in self.bit_generators:
+            for jumps in (1, 3):
+                bit_generator = getattr(np.random, kind)(5)
+                got = cfunc(bit_generator, jumps, 10)
+                bit_generator = getattr(np.random, kind)(5)
+                expected = np.random.Generator(
+                    bit_generator.jumped(jumps)).random(10)
+                self.assertPreciseEqual(got, expected)
+
+    def test_spawn(self):
+        cfunc = njit(spawn_random)
+        for kind in self.bit_generators:
+            rng = np.random.Generator(getattr(np.random, kind)(99))
+            got = cfunc(rng, 3, 5)
+            got_more = cfunc(rng, 2, 5)
+            seed_seq = np.random.SeedSequence(99)
+            expected = [np.random.Generator(getattr(np.random, kind)(s))
+                        for s in seed_seq.spawn(5)]
+            expected = np.array([g.random(5) for g in expected])
+            self.assertPreciseEqual(np.concatenate((got, got_more)), expected)
+            # The spawn counter is reflected to the original object
+            self.assertEqual(rng.bit_generator._seed_seq.n_children_spawned,
+                             5)
+
+    def test_spawn_parallel(self):
+        cfunc = njit(spawn_random_parallel, parallel=True)
+        rng = np.random.default_rng(3)
+        got = cfunc(rng, 8, 100)
+        expected = njit(spawn_random)(np.random.default_rng(3), 8, 100)
+        self.assertPreciseEqual(got, expected)
+
+    def test_state_reflected(self):
+        cfunc = njit(generator_random_size)
+        for kind in self.bit_generators:
+            got, expected = self.make_generators(kind)
+            cfunc(got, 11)
+            expected.random(11)
+            self.assertEqual(str(got.bit_generator.state),
+                             str(expected.bit_generator.state))
+
+
+if __name__ == '__main__':
+    unittest.main()
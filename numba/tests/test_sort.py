@@ -68,6 +68,45 @@ def np_argsort_kind_usecase(val, is_stable=False):
     else:
         return np.argsort(val, kind='quicksort')
 
+def np_sort_radix_usecase(val):
+    return np.sort(val, kind='radixsort')
+
+def np_sort_parallel_usecase(val):
+    return np.sort(val, kind='parallel')
+
+def np_argsort_radix_usecase(val):
+    return np.argsort(val, kind='radixsort')
+
+def argsort_parallel_usecase(val):
+    return val.argsort(kind='parallel')
+
+def np_sort_heapsort_usecase(val):
+    return np.sort(val, kind='heapsort')
+
+def np_sort_axis_usecase(val, axis):
+    return np.sort(val, axis)
+
+def np_sort_axis_stable_usecase(val, axis):
+    return np.sort(val, axis, kind='stable')
+
+def np_sort_axis_parallel_usecase(val, axis):
+    return np.sort(val, axis, kind='parallel')
+
+def np_argsort_axis_usecase(val, axis):
+    return np.argsort(val, axis)
+
+def np_argsort_axis_stable_usecase(val, axis):
+    return np.argsort(val, axis, kind='stable')
+
+def argsort_axis_parallel_usecase(val, axis):
+    return val.argsort(axis=axis, kind='parallel')
+
+def sort_axis_usecase(val, axis):
+    val.sort(axis=axis, kind='mergesort')
+
+def lexsort_usecase(keys):
+    return np.lexsort(keys)
+
 def list_sort_usecase(n):
     np.random.seed(42)
     l = []
@@ -845,6 +884,148 @@ class TestNumpySort(TestCase):
         check(np_argsort_kind_usecase, is_stable=False)
 
 
+class TestRadixAndParallelSort(TestCase):
+    """
+    Test the 'radixsort' and 'parallel' sort kinds, both of which are
+    stable.
+    """
+
+    def setUp(self):
+        np.random.seed(42)
+
+    def arrays(self, size):
+        for dtype in (np.int8, np.uint8, np.int16, np.int32, np.uint32,
+                      np.int64, np.uint64):
+            info = np.iinfo(dtype)
+            yield np.random.randint(info.min, info.max, size=size,
+                                    dtype=dtype)
+            # Many duplicates
+            yield np.random.randint(0, 5, size=size).astype(dtype)
+        yield np.random.random(size) < 0.5
+        for dtype in (np.float32, np.float64):
+            orig = (np.random.random(size) - 0.5).astype(dtype)
+            orig[np.random.random(size) < 0.1] = np.nan
+            orig[np.random.random(size) < 0.1] = -0.0
+            orig[np.random.random(size) < 0.1] = 0.0
+            orig[np.random.random(size) < 0.01] = -np.inf
+            orig[np.random.random(size) < 0.01] = np.inf
+            yield orig
+
+    def check(self, sort_usecase, argsort_usecase, sizes):
+        sort_func = njit(sort_usecase)
+        argsort_func = njit(argsort_usecase)
+        for size in sizes:
+            for orig in self.arrays(size):
+                val = orig.copy()
+                self.assertPreciseEqual(sort_func(val),
+                                        np.sort(orig, kind='mergesort'))
+                self.assertPreciseEqual(argsort_func(val),
+                                        np.argsort(orig, kind='mergesort'))
+                # The original wasn't mutated
+                self.assertPreciseEqual(val, orig)
+
+    def test_radixsort(self):
+        self.check(np_sort_radix_usecase, np_argsort_radix_usecase,
+                   (0, 1, 5, 50, 500, 5000))
+
+    def test_parallel(self):
+        # The largest size exercises the parallel sample sort
+        self.check(np_sort_parallel_usecase, argsort_parallel_usecase,
+                   (0, 5, 500, 300000))
+
+    def test_unsupported(self):
+        with self.assertRaises(errors.TypingError) as raises:
+            njit(np_sort_parallel_usecase)(np.arange(5) * 1j)
+        self.assertIn("Sort kind 'parallel' is not supported for arrays of "
+                      "complex128", str(raises.exception))
+        with self.assertRaises(errors.TypingError) as raises:
+            njit(np_sort_heapsort_usecase)(np.arange(5))
+        self.assertIn("Unsupported sort kind: 'heapsort'",
+                      str(raises.exception))
+
+
+class TestNumpySortAxis(TestCase):
+
+    def setUp(self):
+        np.random.seed(42)
+
+    def arrays(self):
+        a = np.random.randint(0, 10, size=(6, 5, 7))
+        for arr in (a, a.astype(np.float64)):
+            yield arr[0]
+            yield arr[0].T
+            yield arr
+            yield arr[:, ::2, 1:]
+        b = np.random.random((4, 9))
+        b[b < 0.2] = np.nan
+        yield b
+
+    def axes(self, arr):
+        return list(range(-arr.ndim, arr.ndim)) + [None]
+
+    def test_np_sort(self):
+        for pyfunc in (np_sort_axis_usecase, np_sort_axis_stable_usecase,
+                       np_sort_axis_parallel_usecase):
+            cfunc = njit(pyfunc)
+            for arr in self.arrays():
+                for axis in self.axes(arr):
+                    expected = np.sort(arr, axis, kind='mergesort')
+                    self.assertPreciseEqual(cfunc(arr, axis), expected)
+
+    def test_np_argsort(self):
+        # Stable kinds give the same results as Numpy's
+        for pyfunc in (np_argsort_axis_stable_usecase,
+                       argsort_axis_parallel_usecase):
+            cfunc = njit(pyfunc)
+            for arr in self.arrays():
+                for axis in self.axes(arr):
+                    expected = np.argsort(arr, axis, kind='mergesort')
+                    self.assertPreciseEqual(cfunc(arr, axis), expected)
+
+        cfunc = njit(np_argsort_axis_usecase)
+        for arr in self.arrays():
+            for axis in self.axes(arr)[:-1]:
+                got = cfunc(arr, axis)
+                self.assertPreciseEqual(np.take_along_axis(arr, got, axis),
+                                        np.sort(arr, axis))
+
+    def test_array_sort(self):
+        cfunc = njit(sort_axis_usecase)
+        for arr in self.arrays():
+            for axis in self.axes(arr)[:-1]:
+                expected = arr.copy()
+                expected.sort(axis=axis, kind='mergesort')
+                got = arr.copy()
+                cfunc(got, axis)
+                self.assertPreciseEqual(got, expected)
+                # Inplace on a non-contiguous view
+                got = arr.copy().T
+                cfunc(got, axis)
+                expected = arr.copy().T
+                expected.sort(axis=axis, kind='mergesort')
+                self.assertPreciseEqual(got, expected)
+
+    def test_axis_out_of_bounds(self):
+        cfunc = njit(np_sort_axis_usecase)
+        with self.assertRaises(ValueError) as raises:
+            cfunc(np.zeros((2, 3)), 2)
+        self.assertIn("axis is out of bounds", str(raises.exception))
+
+    def test_lexsort(self):
+        cfunc = njit(lexsort_usecase)
+        a = np.random.randint(0, 3, size=50)
+        b = np.random.random(50).round(1)
+        c = np.random.randint(0, 5, size=50).astype(np.int8)
+        for keys in ((a,), (a, b), (b, a, c), np.stack((a, a[::-1], a))):
+            self.assertPreciseEqual(cfunc(keys), np.lexsort(keys))
+        self.assertPreciseEqual(cfunc(a), np.lexsort(a))
+
+        with self.assertRaises(ValueError) as raises:
+            cfunc((a, a[:10]))
+        self.assertIn("all keys need to be the same shape",
+                      str(raises.exception))
+
+
 class TestPythonSort(TestCase):
 
     def test_list_sort(self):
@@ -582,6 +582,146 @@ class TestStencil(TestStencilBase):
             else:
                 raise AssertionError("Expected error was not raised")
 
+    @skip_unsupported
+    def test_stencil_chain_fusion(self):
+        """Tests chains of stencils, which are fused in parallel mode.
+        """
+        def test_chain_2d(a):
+            b = stencil1_kernel(a)
+            c = stencil3_kernel(b)
+            return stencil1_kernel(c)
+
+        def test_chain_1d(a):
+            b = stencil2_kernel(a)
+            return stencil2_kernel(b)
+
+        def test_chain_used(a):
+            # b is used after the chain, so is not fused away
+            b = stencil1_kernel(a)
+            c = stencil3_kernel(b)
+            return c + b
+
+        # Enough rows for several tiles
+        a = np.arange(600 * 100, dtype=np.float64).reshape((600, 100)) % 7
+        self.check(test_chain_2d, test_chain_2d, a)
+        self.check(test_chain_used, test_chain_used, a)
+        self.check(test_chain_1d, test_chain_1d, np.arange(70000.0) % 11)
+        for n in (1, 3, 5):
+            a = np.arange(n * 4, dtype=np.float64).reshape((n, 4))
+            cpfunc = self.compile_parallel(test_chain_2d, (numba.typeof(a),))
+            np.testing.assert_almost_equal(cpfunc.entry_point(a),
+                                           test_chain_2d(a))
+
+
+def modes_kernel_1d(a):
+    return a[-2] + 2 * a[0] + 3 * a[1]
+
+
+def modes_kernel_2d(a):
+    return a[-2, 0] + 2 * a[0, 1] + 3 * a[1, -1]
+
+
+class TestStencilModes(TestStencilBase):
+
+    # The equivalent np.pad() modes
+    np_modes = {'reflect': 'symmetric', 'wrap': 'wrap', 'nearest': 'edge'}
+
+    def expected_1d(self, a, mode):
+        p = np.pad(a, 2, mode=self.np_modes[mode])
+        n = a.shape[0]
+        return p[0:n] + 2 * p[2:n + 2] + 3 * p[3:n + 3]
+
+    def expected_2d(self, a, mode):
+        p = np.pad(a, 2, mode=self.np_modes[mode])
+        n, m = a.shape
+        return (p[0:n, 2:m + 2] + 2 * p[2:n + 2, 3:m + 3] +
+                3 * p[3:n + 3, 1:m + 1])
+
+    def check_modes(self, kernel, expected, a):
+        for mode in self.np_modes:
+            stencil_fn = numba.stencil(mode)(kernel)
+
+            def wrapped(a):
+                return stencil_fn(a)
+
+            def wrapped_out(a):
+                out = np.ones_like(a)
+                stencil_fn(a, out=out)
+                return out
+
+            exp = expected(a, mode)
+            np.testing.assert_allclose(stencil_fn(a), exp)
+            sig = (numba.typeof(a),)
+            for fn in (wrapped, wrapped_out):
+                for impl in (self.compile_njit(fn, sig),
+                             self.compile_parallel(fn, sig)):
+                    np.testing.assert_allclose(impl.entry_point(a), exp)
+
+    @skip_unsupported
+    def test_modes_1d(self):
+        for n in (1, 3, 10):
+            self.check_modes(modes_kernel_1d, self.expected_1d,
+                             np.arange(n, dtype=np.float64) ** 2)
+
+    @skip_unsupported
+    def test_modes_2d(self):
+        for shape in ((2, 2), (6, 5), (5, 1100)):
+            a = np.arange(np.prod(shape), dtype=np.float64).reshape(shape)
+            self.check_modes(modes_kernel_2d, self.expected_2d, a ** 2)
+
+    @skip_unsupported
+    def test_modes_parallel(self):
+        # The stencil function compiled for a parallel caller iterates the
+        # tiles of the interior and the rows of the border with prange
+        stencil_fn = numba.stencil('reflect')(modes_kernel_2d)
+
+        def wrapped(a):
+            return stencil_fn(a)
+
+        a = np.arange(6 * 1100, dtype=np.float64).reshape((6, 1100))
+        sig = (numba.typeof(a),)
+        self.compile_parallel(wrapped, sig)
+        return_type = stencil_fn._type_cache[sig][0].return_type
+        cres = stencil_fn.compile_for_argtys(sig, {}, return_type, None,
+                                             parallel=ParallelOptions(True))
+        diagnostics = cres.metadata['parfor_diagnostics']
+        self.assertEqual(diagnostics.count_parfors(), 2)
+        np.testing.assert_allclose(cres.entry_point(a),
+                                   self.expected_2d(a, 'reflect'))
+
+    def test_tiled_interior(self):
+        # Rows longer than a tile of the interior
+        a = np.arange(3 * 1100, dtype=np.float64).reshape((3, 1100))
+        stencil_fn = numba.stencil(lambda a: a[-1, 1] - a[1, -1])
+        expected = np.zeros_like(a)
+        expected[1:-1, 1:-1] = a[:-2, 2:] - a[2:, :-2]
+        np.testing.assert_allclose(stencil_fn(a), expected)
+
+    def test_unsupported_mode(self):
+        with self.assertRaises(ValueError) as raises:
+            numba.stencil('mirror')(modes_kernel_1d)
+        self.assertIn("Unsupported mode style mirror", str(raises.exception))
+        stencil_fn = numba.stencil('wrap', neighborhood=((0, 2),))(
+            lambda a: a[0:2].sum())
+        with self.assertRaises(ValueError) as raises:
+            stencil_fn(np.ones(10))
+        self.assertIn("Slice indexing is not supported", str(raises.exception))
+
+    def test_iterate(self):
+        for mode in ('constant', 'reflect', 'wrap', 'nearest'):
+            stencil_fn = numba.stencil(mode)(
+                lambda a: 0.25 * (a[-1, 0] + a[1, 0] + a[0, -1] + a[0, 1]))
+            a = np.random.RandomState(0).random_sample((40, 7))
+            expected = a
+            for _ in range(6):
+                expected = stencil_fn(expected)
+            for slab_rows in (3, 5, 40, None):
+                got = stencil_fn.iterate(a, 6, slab_rows=slab_rows)
+                np.testing.assert_allclose(got, expected)
+        with self.assertRaises(ValueError) as raises:
+            stencil_fn.iterate(a, 0)
+        self.assertIn("must be positive", str(raises.exception))
+
 
 class pyStencilGenerator:
     """
@@ -0,0 +1,212 @@
+"""
+Tests for the reduce(), accumulate(), at() and outer() methods of ufuncs
+and DUFuncs in nopython mode.
+"""
+
+import numpy as np
+
+import unittest
+from numba import njit, vectorize
+from numba.core.errors import TypingError
+from numba.tests.support import (MemoryLeakMixin, TestCase,
+                                 skip_parfors_unsupported)
+
+
+@vectorize(["int64(int64, int64)", "float64(float64, float64)"],
+           identity=0)
+def vadd(a, b):
+    return a + b
+
+
+@vectorize(["int64(int64, int64)", "float64(float64, float64)"])
+def vmax(a, b):
+    return a if a >= b else b
+
+
+@vectorize(["int64(int64, int64)", "float64(float64, float64)"],
+           identity=0)
+def vsub(a, b):
+    return a - b
+
+
+def add_reduce(a):
+    return np.add.reduce(a)
+
+
+def vsub_reduce(a):
+    return vsub.reduce(a)
+
+
+def add_reduce_axis(a, axis):
+    return np.add.reduce(a, axis)
+
+
+def add_reduce_keepdims(a, axis):
+    return np.add.reduce(a, axis, keepdims=True)
+
+
+def add_reduce_initial(a, initial):
+    return np.add.reduce(a, 0, None, None, False, initial)
+
+
+def maximum_reduce(a):
+    return np.maximum.reduce(a)
+
+
+def maximum_reduce_axis(a, axis):
+    return np.maximum.reduce(a, axis=axis)
+
+
+def vadd_reduce_axis(a, axis):
+    return vadd.reduce(a, axis)
+
+
+def vmax_reduce(a):
+    return vmax.reduce(a)
+
+
+def add_accumulate(a):
+    return np.add.accumulate(a)
+
+
+def multiply_accumulate_axis(a, axis):
+    return np.multiply.accumulate(a, axis)
+
+
+def vadd_accumulate_axis(a, axis):
+    return vadd.accumulate(a, axis)
+
+
+def add_at(a, indices, b):
+    np.add.at(a, indices, b)
+
+
+def negative_at(a, indices):
+    np.negative.at(a, indices)
+
+
+def vadd_at(a, indices, b):
+    vadd.at(a, indices, b)
+
+
+def add_outer(a, b):
+    return np.add.outer(a, b)
+
+
+def vmax_outer(a, b):
+    return vmax.outer(a, b)
+
+
+class TestUfuncMethods(MemoryLeakMixin, TestCase):
+
+    def check(self, pyfunc, *args):
+        cfunc = njit(pyfunc)
+        expected = pyfunc(*args)
+        got = cfunc(*args)
+        self.assertPreciseEqual(got, expected, prec='double')
+
+    def check_inplace(self, pyfunc, a, *args):
+        expected = a.copy()
+        got = a.copy()
+        pyfunc(expected, *args)
+        njit(pyfunc)(got, *args)
+        np.testing.assert_array_equal(got, expected)
+
+    def test_reduce(self):
+        a = np.arange(24, dtype=np.float64).reshape((2, 3, 4))
+        for axis in (0, 1, 2, -1, None, (0, 2), (1,)):
+            self.check(add_reduce_axis, a, axis)
+            self.check(add_reduce_keepdims, a, axis)
+            self.check(maximum_reduce_axis, a, axis)
+        self.check(add_reduce, a)
+        self.check(maximum_reduce, a[:, ::2, :])
+        # Booleans and small integers are added as longs
+        self.check(add_reduce, np.arange(10, dtype=np.int8))
+        self.check(add_reduce, np.arange(10) % 3 == 0)
+        self.check(add_reduce, np.ones((0, 3)))
+        self.check(add_reduce_initial, np.arange(5.0), 10.0)
+        self.check(add_reduce_initial, np.arange(5.0), None)
+
+    def test_reduce_dufunc(self):
+        a = np.arange(20, dtype=np.int64).reshape((4, 5))
+        for axis in (0, 1, None):
+            self.check(vadd_reduce_axis, a, axis)
+            self.check(vadd_reduce_axis, a.astype(np.float64), axis)
+        self.check(vadd_reduce_axis, np.zeros((0, 5), np.int64), 0)
+        self.check(vmax_reduce, np.array([3.0, -1.0, 7.5, 2.0]))
+
+    @skip_parfors_unsupported
+    def test_reduce_dufunc_parallel(self):
+        # An identity doesn't make the DUFunc associative: the long lane
+        # must not be split and reassociated across threads
+        a = np.arange(100000.0)
+        cfunc = njit(parallel=True)(vsub_reduce)
+        self.assertPreciseEqual(cfunc(a), vsub.reduce(a))
+        self.assertPreciseEqual(cfunc(a.reshape((2, -1))),
+                                vsub.reduce(a.reshape((2, -1))))
+
+    def test_reduce_empty(self):
+        for pyfunc, arg in [(maximum_reduce, np.ones(0)),
+                            (vmax_reduce, np.ones(0, np.int64)),
+                            (add_reduce_initial, np.ones(0))]:
+            args = (arg, None) if pyfunc is add_reduce_initial else (arg,)
+            with self.assertRaises(ValueError) as raises:
+                njit(pyfunc)(*args)
+            self.assertIn("zero-size array to reduction operation",
+                          str(raises.exception))
+
+    def test_accumulate(self):
+        self.check(add_accumulate, np.arange(10.0))
+        self.check(add_accumulate, np.arange(10, dtype=np.int16))
+        a = np.arange(1, 25, dtype=np.float64).reshape((2, 3, 4))
+        for axis in (0, 1, 2, -1):
+            self.check(multiply_accumulate_axis, a, axis)
+            self.check(vadd_accumulate_axis, a, axis)
+        self.check(add_accumulate, np.ones(0))
+
+    def test_at(self):
+        a = np.arange(10.0)
+        self.check_inplace(add_at, a, np.array([0, 1, 1, 3, -1]), 1.0)
+        self.check_inplace(add_at, a, np.array([2, 2, 5]),
+                           np.array([1.0, 2.0, 3.0]))
+        self.check_inplace(add_at, a, 4, np.array([5.0]))
+        self.check_inplace(negative_at, a, np.array([0, 3, 3]))
+        self.check_inplace(vadd_at, np.arange(6, dtype=np.int64),
+                           np.array([1, 1, 4]), 7)
+        b = np.zeros((3, 4))
+        indices = (np.array([0, 2, 2]), np.array([1, 3, 3]))
+        self.check_inplace(add_at, b, indices, np.array([1.0, 2.0, 4.0]))
+        self.check_inplace(add_at, b, (1, np.array([0, 1, 0])), 2.5)
+
+        with self.assertRaises(IndexError) as raises:
+            njit(add_at)(np.zeros(3), np.array([3]), 1.0)
+        self.assertIn("index out of bounds", str(raises.exception))
+        with self.assertRaises(ValueError) as raises:
+            njit(add_at)(np.zeros(3), np.array([0, 1]), np.ones(3))
+        self.assertIn("shape mismatch", str(raises.exception))
+
+    def test_outer(self):
+        a = np.arange(6.0).reshape((2, 3))
+        b = np.arange(4, dtype=np.int64)
+        self.check(add_outer, a, b)
+        self.check(add_outer, b, a)
+        self.check(vmax_outer, b, b[::-1].copy())
+
+    def test_errors(self):
+        with self.assertRaises(TypingError) as raises:
+            njit(lambda a: np.negative.reduce(a))(np.ones(3))
+        self.assertIn("reduce only supported for binary functions",
+                      str(raises.exception))
+        with self.assertRaises(TypingError) as raises:
+            cfunc = njit(lambda a, o: np.add.reduce(a, 0, None, o))
+            cfunc(np.ones(3), np.ones(1))
+        self.assertIn("the out argument of ufunc methods is not supported",
+                      str(raises.exception))
+        with self.assertRaises(TypingError) as raises:
+            njit(lambda a: np.add.at(a, 0))(np.ones(3))
+        self.assertIn("second operand needed for ufunc",
+                      str(raises.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()